@@ -29,6 +29,7 @@ from ..llm.reasoning import normalise_reasoning_segments
 from ..llm.types import LLMReasoningSegment, LLMResponse, LLMToolCall
 from ..llm.validation import ToolValidationError
 from ..mcp.client import MCPClient
+from ..mcp.tool_registry import read_only_tool_names
 from ..mcp.utils import exception_to_mcp_error
 from ..settings import AppSettings
 from ..telemetry import log_debug_payload, log_event
@@ -200,6 +201,10 @@ class _AgentRunRecorder:
         self._agent_stop_reason: Mapping[str, Any] | None = None
         self._exclude_from_results: set[str] = set()
 
+    @property
+    def tool_schemas(self) -> Mapping[str, Any]:
+        return self._tool_schemas
+
     # ------------------------------------------------------------------
     def record_llm_step(
         self,
@@ -502,6 +507,7 @@ class LocalAgent:
 
     DEFAULT_MAX_THOUGHT_STEPS: int | None = None
     DEFAULT_MAX_CONSECUTIVE_TOOL_ERRORS: int | None = 5
+    DEFAULT_MAX_PARALLEL_TOOL_CALLS: int = 4
     _MESSAGE_PREVIEW_LIMIT = 400
     _REQUIREMENT_SUMMARY_FIELDS: tuple[str, str] = ("title", "statement")
 
@@ -516,6 +522,7 @@ class LocalAgent:
         | None = None,
         max_thought_steps: int | None = None,
         max_consecutive_tool_errors: int | None = None,
+        max_parallel_tool_calls: int | None = None,
     ) -> None:
         """Initialize agent with optional settings or prebuilt clients."""
         if settings is not None:
@@ -537,6 +544,8 @@ class LocalAgent:
                 max_consecutive_tool_errors = (
                     settings.agent.max_consecutive_tool_errors
                 )
+            if max_parallel_tool_calls is None:
+                max_parallel_tool_calls = settings.agent.max_parallel_tool_calls
         if llm is None or mcp is None:
             raise TypeError("settings or clients must be provided")
         if not isinstance(llm, SupportsAgentLLM):
@@ -559,6 +568,9 @@ class LocalAgent:
         self._max_consecutive_tool_errors: int | None = (
             self._normalise_max_consecutive_tool_errors(max_consecutive_tool_errors)
         )
+        if max_parallel_tool_calls is None:
+            max_parallel_tool_calls = self.DEFAULT_MAX_PARALLEL_TOOL_CALLS
+        self._max_parallel_tool_calls = max(1, int(max_parallel_tool_calls))
 
     # ------------------------------------------------------------------
     def check_llm(self) -> Mapping[str, Any]:
@@ -923,18 +935,106 @@ class LocalAgent:
         """Return limit of consecutive tool failures before aborting a run."""
         return self._max_consecutive_tool_errors
 
+    @property
+    def max_parallel_tool_calls(self) -> int:
+        """Return how many read-only tool calls may run at the same time."""
+        return self._max_parallel_tool_calls
+
     # ------------------------------------------------------------------
     @staticmethod
-    def _run_sync(coro: Awaitable[Any]) -> Any:
+    def _is_read_only_tool(
+        name: str, tool_schemas: Mapping[str, Any] | None = None
+    ) -> bool:
+        """Return whether tool ``name`` is declared read-only.
+
+        The flag published by the server in ``tool_schemas`` wins; otherwise
+        the local tool registry decides.
+        """
+        schema = (tool_schemas or {}).get(name)
+        if isinstance(schema, Mapping) and isinstance(schema.get("read_only"), bool):
+            return schema["read_only"]
+        return name in read_only_tool_names()
+
+    def _tool_call_groups(
+        self,
+        tool_calls: Sequence[LLMToolCall],
+        tool_schemas: Mapping[str, Any] | None = None,
+    ) -> list[list[LLMToolCall]]:
+        """Split ``tool_calls`` into groups executed one after another.
+
+        Consecutive read-only calls share a group whose members may run
+        concurrently; every other call forms a group of its own.
+        """
+        groups: list[list[LLMToolCall]] = []
+        previous_read_only = False
+        for call in tool_calls:
+            read_only = (
+                self._max_parallel_tool_calls > 1
+                and self._is_read_only_tool(call.name, tool_schemas)
+            )
+            if read_only and previous_read_only:
+                groups[-1].append(call)
+            else:
+                groups.append([call])
+            previous_read_only = read_only
+        return groups
+
+    async def _call_tool(self, call: LLMToolCall) -> Any:
+        call_result = self._mcp.call_tool_async(call.name, call.arguments)
+        if inspect.isawaitable(call_result):
+            return await call_result
+        return call_result
+
+    async def _gather_tool_calls(
+        self, tool_calls: Sequence[LLMToolCall]
+    ) -> list[Any]:
+        """Run ``tool_calls`` concurrently and return results in call order.
+
+        At most :attr:`max_parallel_tool_calls` calls are in flight; failures
+        are returned as exception objects in place of results.
+        """
+        if len(tool_calls) == 1:
+            try:
+                return [await self._call_tool(tool_calls[0])]
+            except Exception as exc:
+                return [exc]
+        semaphore = asyncio.Semaphore(self._max_parallel_tool_calls)
+
+        async def _limited(call: LLMToolCall) -> Any:
+            async with semaphore:
+                return await self._call_tool(call)
+
+        results = await asyncio.gather(
+            *(_limited(call) for call in tool_calls), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+        return results
+
+    # ------------------------------------------------------------------
+    def _run_sync(self, coro: Awaitable[Any]) -> Any:
         try:
             asyncio.get_running_loop()
         except RuntimeError:
-            return asyncio.run(coro)
+            return asyncio.run(self._run_and_release(coro))
         raise RuntimeError(
             "Synchronous LocalAgent methods cannot run inside an active "
             "asyncio event loop; use the async variants instead."
         )
 
+    async def _run_and_release(self, coro: Awaitable[Any]) -> Any:
+        """Await ``coro`` and close client connections bound to the temporary loop."""
+        try:
+            return await coro
+        finally:
+            for client in (self._llm, self._mcp):
+                aclose = getattr(client, "aclose", None)
+                if callable(aclose):
+                    result = aclose()
+                    if inspect.isawaitable(result):
+                        await result
+
     # ------------------------------------------------------------------
     @staticmethod
     def _raise_if_cancelled(cancellation: CancellationEvent | None) -> None:
@@ -1115,62 +1215,69 @@ class LocalAgent:
         messages: list[Mapping[str, Any]] = []
         successful_results: list[Mapping[str, Any]] = []
         error_payload: Mapping[str, Any] | None = None
-        for call in tool_calls:
-            arguments = self._normalise_tool_arguments(call)
-            log_event(
-                "AGENT_TOOL_CALL",
-                {"call_id": call.id, "tool_name": call.name, "arguments": call.arguments},
-            )
-            log_debug_payload(
-                "AGENT_TOOL_CALL_DETAIL",
-                {"call_id": call.id, "tool_name": call.name, "arguments": arguments},
-            )
+        for group in self._tool_call_groups(tool_calls):
+            for call in group:
+                arguments = self._normalise_tool_arguments(call)
+                log_event(
+                    "AGENT_TOOL_CALL",
+                    {"call_id": call.id, "tool_name": call.name, "arguments": call.arguments},
+                )
+                log_debug_payload(
+                    "AGENT_TOOL_CALL_DETAIL",
+                    {"call_id": call.id, "tool_name": call.name, "arguments": arguments},
+                )
             try:
                 await self._mcp.ensure_ready_async()
-                result = await self._mcp.call_tool_async(call.name, call.arguments)
             except Exception as exc:
-                error_payload = self._extract_mcp_error(exc)
-                log_event("ERROR", {"error": error_payload})
-                detail = self._conversation_payload_from_error(call, error_payload)
-                messages.append(self._tool_message(call, detail))
-                break
-            log_debug_payload(
-                "AGENT_TOOL_RESULT_DETAIL",
-                {
-                    "call_id": call.id,
-                    "tool_name": call.name,
-                    "ok": True,
-                    "result": dict(result),
-                },
-            )
-            if result.get("ok") is True:
-                successful_results.append(dict(result))
-                detail = self._conversation_tool_payload(call, result)
-                messages.append(self._tool_message(call, detail))
-                continue
-            error_payload_candidate = result.get("error")
-            if not isinstance(error_payload_candidate, Mapping):
-                error_payload_candidate = {
-                    "code": "UNKNOWN",
-                    "message": "Tool returned failure without error payload",
-                }
-            error_payload = error_payload_candidate
-            log_event("ERROR", {"error": error_payload})
-            log_debug_payload(
-                "AGENT_TOOL_RESULT_DETAIL",
-                {
-                    "call_id": call.id,
-                    "tool_name": call.name,
-                    "ok": False,
-                    "result": {
+                results: list[Any] = [exc] * len(group)
+            else:
+                results = await self._gather_tool_calls(group)
+            for call, result in zip(group, results, strict=True):
+                if isinstance(result, Exception):
+                    failure = self._extract_mcp_error(result)
+                    log_event("ERROR", {"error": failure})
+                    detail = self._conversation_payload_from_error(call, failure)
+                    messages.append(self._tool_message(call, detail))
+                    error_payload = error_payload or failure
+                    continue
+                log_debug_payload(
+                    "AGENT_TOOL_RESULT_DETAIL",
+                    {
+                        "call_id": call.id,
+                        "tool_name": call.name,
+                        "ok": True,
+                        "result": dict(result),
+                    },
+                )
+                if result.get("ok") is True:
+                    successful_results.append(dict(result))
+                    detail = self._conversation_tool_payload(call, result)
+                    messages.append(self._tool_message(call, detail))
+                    continue
+                failure = result.get("error")
+                if not isinstance(failure, Mapping):
+                    failure = {
+                        "code": "UNKNOWN",
+                        "message": "Tool returned failure without error payload",
+                    }
+                log_event("ERROR", {"error": failure})
+                log_debug_payload(
+                    "AGENT_TOOL_RESULT_DETAIL",
+                    {
+                        "call_id": call.id,
+                        "tool_name": call.name,
                         "ok": False,
-                        "error": dict(error_payload),
+                        "result": {
+                            "ok": False,
+                            "error": dict(failure),
+                        },
                     },
-                },
-            )
-            detail = self._conversation_payload_from_error(call, error_payload)
-            messages.append(self._tool_message(call, detail))
-            break
+                )
+                detail = self._conversation_payload_from_error(call, failure)
+                messages.append(self._tool_message(call, detail))
+                error_payload = error_payload or failure
+            if error_payload is not None:
+                break
         return _ToolExecutionBatchResult(
             messages=messages,
             successful_results=successful_results,
@@ -1254,12 +1361,16 @@ class AgentLoopRunner:
 
         messages: list[Mapping[str, Any]] = []
         first_error: Mapping[str, Any] | None = None
-        for call in response.tool_calls:
+        groups = self._agent._tool_call_groups(
+            response.tool_calls, self._recorder.tool_schemas
+        )
+        for group in groups:
             self._agent._raise_if_cancelled(self._cancellation)
-            outcome = await self._run_single_tool_call(call)
-            messages.append(outcome.message)
-            if outcome.error_payload is not None:
-                first_error = outcome.error_payload
+            for outcome in await self._run_tool_call_group(group):
+                messages.append(outcome.message)
+                if first_error is None and outcome.error_payload is not None:
+                    first_error = outcome.error_payload
+            if first_error is not None:
                 break
             self._agent._raise_if_cancelled(self._cancellation)
         self._conversation.extend(messages)
@@ -1270,9 +1381,30 @@ class AgentLoopRunner:
             final_payload=None,
         )
 
-    async def _run_single_tool_call(
-        self, call: LLMToolCall
-    ) -> _ToolExecutionOutcome:
+    async def _run_tool_call_group(
+        self, calls: Sequence[LLMToolCall]
+    ) -> list[_ToolExecutionOutcome]:
+        """Execute ``calls`` concurrently and record them in call order.
+
+        Every call is started before the group runs and finished afterwards in
+        the original order, so the conversation and the recorder do not depend
+        on which request completes first.
+        """
+        for call in calls:
+            self._begin_tool_call(call)
+        try:
+            ready_result = self._agent._mcp.ensure_ready_async()
+            if inspect.isawaitable(ready_result):
+                await ready_result
+        except Exception as exc:
+            return [self._fail_not_ready(call, exc) for call in calls]
+        results = await self._agent._gather_tool_calls(calls)
+        return [
+            self._finish_tool_call(call, result)
+            for call, result in zip(calls, results, strict=True)
+        ]
+
+    def _begin_tool_call(self, call: LLMToolCall) -> None:
         arguments = self._agent._normalise_tool_arguments(call)
         snapshot = self._recorder.begin_tool(call, arguments=arguments)
         self._agent._emit_tool_snapshot(self._on_tool_result, snapshot)
@@ -1292,31 +1424,27 @@ class AgentLoopRunner:
                 "arguments": arguments,
             },
         )
-        try:
-            ready_result = self._agent._mcp.ensure_ready_async()
-            if inspect.isawaitable(ready_result):
-                await ready_result
-        except Exception as exc:
-            error_payload = self._agent._extract_mcp_error(exc)
-            snapshot = self._recorder.mark_tool_failed(
-                call,
-                error_payload,
-                include_in_results=False,
-            )
-            self._agent._emit_tool_snapshot(self._on_tool_result, snapshot)
-            log_event("ERROR", {"error": error_payload})
-            prepared = self._agent._conversation_payload_from_error(call, error_payload)
-            message = self._agent._tool_message(call, prepared)
-            return _ToolExecutionOutcome(message=message, error_payload=prepared["error"])
-        try:
-            call_result = self._agent._mcp.call_tool_async(call.name, call.arguments)
-            result = (
-                await call_result
-                if inspect.isawaitable(call_result)
-                else call_result
-            )
-        except Exception as exc:
-            error_payload = self._agent._extract_mcp_error(exc)
+
+    def _fail_not_ready(
+        self, call: LLMToolCall, exc: Exception
+    ) -> _ToolExecutionOutcome:
+        error_payload = self._agent._extract_mcp_error(exc)
+        snapshot = self._recorder.mark_tool_failed(
+            call,
+            error_payload,
+            include_in_results=False,
+        )
+        self._agent._emit_tool_snapshot(self._on_tool_result, snapshot)
+        log_event("ERROR", {"error": error_payload})
+        prepared = self._agent._conversation_payload_from_error(call, error_payload)
+        message = self._agent._tool_message(call, prepared)
+        return _ToolExecutionOutcome(message=message, error_payload=prepared["error"])
+
+    def _finish_tool_call(
+        self, call: LLMToolCall, result: Any
+    ) -> _ToolExecutionOutcome:
+        if isinstance(result, Exception):
+            error_payload = self._agent._extract_mcp_error(result)
             snapshot = self._recorder.mark_tool_failed(call, error_payload)
             self._agent._emit_tool_snapshot(self._on_tool_result, snapshot)
             log_event("ERROR", {"error": error_payload})
@@ -13,7 +13,7 @@ from .confirm import (
 )
 from .mcp.controller import MCPController
 from .services.requirements import RequirementsService
-from .settings import AppSettings
+from .settings import AppSettings, StorageSettings
 
 if TYPE_CHECKING:  # pragma: no cover - type checking only
     from .agent import LocalAgent
@@ -91,6 +91,7 @@ class ApplicationContext:
         self._config: ConfigManager | None = None
         self._requirement_model: RequirementModel | None = None
         self._requirements_service_factory: RequirementsServiceFactory | None = None
+        self._storage_settings = StorageSettings()
         self._local_agent_factory: LocalAgentFactory | None = None
         self._mcp_controller_factory: MCPControllerFactory | None = None
 
@@ -111,6 +112,15 @@ class ApplicationContext:
             self._requirement_model = self._requirement_model_factory()
         return self._requirement_model
 
+    @property
+    def storage_settings(self) -> StorageSettings:
+        """Return storage settings applied to new requirements services."""
+        return self._storage_settings
+
+    def configure_storage(self, settings: StorageSettings) -> None:
+        """Use ``settings`` for requirements services created from now on."""
+        self._storage_settings = settings.model_copy(deep=True)
+
     @property
     def requirements_service_factory(self) -> RequirementsServiceFactory:
         """Return factory constructing :class:`RequirementsService` objects."""
@@ -118,7 +128,14 @@ class ApplicationContext:
             service_cls = self._requirements_service_cls
 
             def _factory(root: Path | str) -> RequirementsService:
-                return service_cls(Path(root))
+                storage = self._storage_settings
+                options: dict[str, object] = {}
+                if storage.use_index:
+                    options["use_index"] = True
+                if storage.load_workers > 1:
+                    options["load_workers"] = storage.load_workers
+                    options["load_executor"] = storage.load_executor
+                return service_cls(Path(root), **options)
 
             self._requirements_service_factory = _factory
         return self._requirements_service_factory
@@ -159,7 +176,11 @@ class ApplicationContext:
             controller_cls = self._mcp_controller_cls
 
             def _factory() -> MCPController:
-                return controller_cls()
+                controller = controller_cls()
+                configure_storage = getattr(controller, "configure_storage", None)
+                if callable(configure_storage):
+                    configure_storage(self._storage_settings)
+                return controller
 
             self._mcp_controller_factory = _factory
         return self._mcp_controller_factory
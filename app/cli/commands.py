@@ -41,13 +41,15 @@ from app.core.trace_matrix import (
     build_trace_matrix,
 )
 from app.core.trace_index import (
+    CACHE_ENCODINGS,
     TraceIndex,
     TraceIndexConfig,
     build_artifact_trace_matrix,
     build_trace_index,
-    render_artifact_matrix_csv,
-    render_artifact_matrix_html,
-    render_trace_index_report_html,
+    write_artifact_links_csv,
+    write_artifact_matrix_csv,
+    write_artifact_matrix_html,
+    write_trace_index_report_html,
     write_trace_index_cache,
 )
 from app.core.requirement_export import (
@@ -57,6 +59,7 @@ from app.core.requirement_export import (
     render_requirements_markdown,
     render_requirements_pdf,
 )
+from app.core.requirement_sorting import CARD_SORT_MODES
 from app.i18n import _
 
 REQ_TYPE_CHOICES = [e.value for e in RequirementType]
@@ -267,17 +270,10 @@ def _build_axis_config(args: argparse.Namespace, axis: str) -> TraceMatrixAxisCo
 
 
 def _sorted_cell_links(matrix: TraceMatrix) -> list[TraceMatrixLinkView]:
-    row_order = {entry.rid: index for index, entry in enumerate(matrix.rows)}
-    column_order = {entry.rid: index for index, entry in enumerate(matrix.columns)}
     links: list[TraceMatrixLinkView] = []
-    for _pair, cell in sorted(
-        matrix.cells.items(),
-        key=lambda pair_cell: (
-            row_order.get(pair_cell[0][0], 10**9),
-            column_order.get(pair_cell[0][1], 10**9),
-        ),
-    ):
-        links.extend(cell.links)
+    for row in matrix.rows:
+        for column_rid in matrix.linked_columns(row.rid):
+            links.extend(matrix.cells[(row.rid, column_rid)].links)
     return links
 
 
@@ -300,14 +296,29 @@ def _write_trace_matrix_csv(out: TextIO, matrix: TraceMatrix) -> None:
             row.document.title,
             row.requirement.status.value,
         ]
-        cells: list[str] = []
-        for column in matrix.columns:
-            cell = matrix.cells.get((row.rid, column.rid))
-            if not cell or not cell.links:
-                cells.append("")
-            else:
-                cells.append("suspect" if cell.suspect else "linked")
-        writer.writerow(base + cells)
+        writer.writerow(base + _trace_row_markers(matrix, row.rid))
+
+
+def _write_trace_links_csv(out: TextIO, matrix: TraceMatrix) -> None:
+    writer = csv.writer(out)
+    writer.writerow(["rid", "column", "marker"])
+    for row in matrix.rows:
+        for column_rid in matrix.linked_columns(row.rid):
+            cell = matrix.cells[(row.rid, column_rid)]
+            writer.writerow([row.rid, column_rid, "suspect" if cell.suspect else "linked"])
+
+
+def _trace_row_markers(matrix: TraceMatrix, row_rid: str) -> list[str]:
+    """Return the dense ``linked``/``suspect``/empty markers of one row."""
+    markers = [""] * len(matrix.columns)
+    linked = matrix.linked_columns(row_rid)
+    if linked:
+        linked_set = set(linked)
+        for position, column in enumerate(matrix.columns):
+            if column.rid in linked_set:
+                cell = matrix.cells[(row_rid, column.rid)]
+                markers[position] = "suspect" if cell.suspect else "linked"
+    return markers
 
 
 def _write_trace_matrix_html(out: TextIO, matrix: TraceMatrix) -> None:
@@ -340,14 +351,11 @@ def _write_trace_matrix_html(out: TextIO, matrix: TraceMatrix) -> None:
         out.write(f"<td>{html.escape(row.requirement.title)}</td>")
         out.write(f"<td>{html.escape(row.document.title)}</td>")
         out.write(f"<td>{html.escape(row.requirement.status.value)}</td>")
-        for column in matrix.columns:
-            cell = matrix.cells.get((row.rid, column.rid))
-            if not cell or not cell.links:
+        for marker in _trace_row_markers(matrix, row.rid):
+            if not marker:
                 out.write("<td></td>")
-                continue
-            cls = "suspect" if cell.suspect else "linked"
-            label = "suspect" if cell.suspect else "linked"
-            out.write(f"<td class='{cls}'>{html.escape(label)}</td>")
+            else:
+                out.write(f"<td class='{marker}'>{html.escape(marker)}</td>")
         out.write("</tr>\n")
     out.write("</tbody>\n</table>\n")
     summary = matrix.summary
@@ -955,6 +963,7 @@ def cmd_item_list(
             per_page=args.per_page,
             status=args.status,
             labels=labels,
+            sort=args.sort,
         )
     except DocumentNotFoundError:
         sys.stdout.write(
@@ -1036,6 +1045,11 @@ def add_item_arguments(p: argparse.ArgumentParser) -> None:
     list_p.add_argument("--per-page", type=int, default=50, help=_("items per page"))
     list_p.add_argument("--status", choices=STATUS_CHOICES, help=_("filter by status"))
     list_p.add_argument("--labels", help=_("comma-separated labels"))
+    list_p.add_argument(
+        "--sort",
+        choices=CARD_SORT_MODES,
+        help=_("order items before pagination"),
+    )
     list_p.add_argument(
         "--show-links",
         action="store_true",
@@ -1201,13 +1215,15 @@ def cmd_trace(
     output_path = getattr(args, "output", None)
     out, close_out = _open_trace_output(
         output_path,
-        encoding=_encoding_for_text_output(output_path, excel_compatible=(fmt == "matrix-csv")),
+        encoding=_encoding_for_text_output(output_path, excel_compatible=(fmt in {"matrix-csv", "links-csv"})),
     )
     try:
         if fmt == "pairs":
             _write_trace_pairs(out, matrix)
         elif fmt == "matrix-csv":
             _write_trace_matrix_csv(out, matrix)
+        elif fmt == "links-csv":
+            _write_trace_links_csv(out, matrix)
         elif fmt == "matrix-html":
             _write_trace_matrix_html(out, matrix)
         elif fmt == "matrix-json":
@@ -1319,6 +1335,7 @@ def _trace_index_config_from_args(args: argparse.Namespace) -> TraceIndexConfig:
         result_globs=tuple(args.result_glob) if args.result_glob is not None else None,
         exclude_globs=tuple(args.exclude_glob) if args.exclude_glob is not None else None,
         module_filter=args.module,
+        cache_encoding=getattr(args, "cache_encoding", "json"),
     )
 
 
@@ -1376,13 +1393,69 @@ def _trace_index_exit_code(index: TraceIndex, fail_on: str) -> int:
     return 0
 
 
+def _export_trace_index(args: argparse.Namespace, index: TraceIndex) -> int:
+    view = getattr(args, "view", "index")
+    export_format = getattr(args, "format", "json")
+    matrix = None
+    if view == "artifact-matrix":
+        matrix = build_artifact_trace_matrix(index)
+    elif view == "report":
+        if export_format != "html":
+            sys.stdout.write(
+                _("trace-index view 'report' supports only html format\n")
+            )
+            return 1
+        matrix = build_artifact_trace_matrix(index)
+    elif export_format != "json":
+        sys.stdout.write(
+            _("trace-index view 'index' supports only json format\n")
+        )
+        return 1
+
+    output_path = getattr(args, "output", None)
+    if output_path:
+        path = Path(output_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        out: TextIO = path.open("w", encoding="utf-8")
+    else:
+        out = sys.stdout
+    # Writers stream row by row so large matrices never exist as one string.
+    try:
+        if view == "report":
+            write_trace_index_report_html(index, matrix, out)
+        elif matrix is None:
+            json.dump(index.to_dict(), out, ensure_ascii=False, indent=2)
+            out.write("\n")
+        elif export_format == "csv":
+            write_artifact_matrix_csv(matrix, out)
+        elif export_format == "links-csv":
+            write_artifact_links_csv(matrix, out)
+        elif export_format == "html":
+            write_artifact_matrix_html(matrix, out)
+        else:
+            json.dump(matrix.to_dict(), out, ensure_ascii=False, indent=2)
+            out.write("\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 0
+
+
 def cmd_trace_index(args: argparse.Namespace, context: ApplicationContext) -> int:
     """Build, check or export the external evidence trace index."""
     del context
     config = _trace_index_config_from_args(args)
-    index = build_trace_index(config)
+    # Only ``refresh`` may write under ``.cookareq``; ``check`` and ``export``
+    # stay read-only.
+    index = build_trace_index(
+        config,
+        incremental=args.trace_index_command == "refresh",
+        jobs=args.jobs,
+    )
     if args.trace_index_command == "refresh":
-        path = write_trace_index_cache(index, config.req_root)
+        path = write_trace_index_cache(
+            index, config.req_root, encoding=config.cache_encoding
+        )
         _write_trace_index_summary(sys.stdout, index)
         sys.stdout.write(f"Cache: {path.as_posix()}\n")
         return _trace_index_exit_code(index, args.fail_on)
@@ -1390,42 +1463,7 @@ def cmd_trace_index(args: argparse.Namespace, context: ApplicationContext) -> in
         _write_trace_index_summary(sys.stdout, index)
         return _trace_index_exit_code(index, args.fail_on)
     if args.trace_index_command == "export":
-        view = getattr(args, "view", "index")
-        export_format = getattr(args, "format", "json")
-        if view == "artifact-matrix":
-            matrix = build_artifact_trace_matrix(index)
-            if export_format == "csv":
-                payload = render_artifact_matrix_csv(matrix)
-            elif export_format == "html":
-                payload = render_artifact_matrix_html(matrix)
-            else:
-                payload = (
-                    json.dumps(matrix.to_dict(), ensure_ascii=False, indent=2) + "\n"
-                )
-        elif view == "report":
-            if export_format != "html":
-                sys.stdout.write(
-                    _("trace-index view 'report' supports only html format\n")
-                )
-                return 1
-            payload = render_trace_index_report_html(
-                index,
-                build_artifact_trace_matrix(index),
-            )
-        elif export_format == "json":
-            payload = json.dumps(index.to_dict(), ensure_ascii=False, indent=2) + "\n"
-        else:
-            sys.stdout.write(
-                _("trace-index view 'index' supports only json format\n")
-            )
-            return 1
-        if args.output:
-            output_path = Path(args.output)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_text(payload, encoding="utf-8")
-        else:
-            sys.stdout.write(payload)
-        return 0
+        return _export_trace_index(args, index)
     raise ValueError(f"unknown trace-index command: {args.trace_index_command}")
 
 def add_trace_arguments(p: argparse.ArgumentParser) -> None:
@@ -1521,9 +1559,9 @@ def add_trace_arguments(p: argparse.ArgumentParser) -> None:
     )
     p.add_argument(
         "--format",
-        choices=["pairs", "matrix-csv", "matrix-html", "matrix-json"],
+        choices=["pairs", "matrix-csv", "links-csv", "matrix-html", "matrix-json"],
         default="pairs",
-        help=_("output format"),
+        help=_("output format; links-csv writes one rid,column,marker row per linked cell"),
     )
     p.add_argument(
         "--direction",
@@ -1535,6 +1573,16 @@ def add_trace_arguments(p: argparse.ArgumentParser) -> None:
 
 
 
+def _trace_index_jobs(value: str) -> int:
+    try:
+        jobs = int(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from exc
+    if jobs < 1:
+        raise argparse.ArgumentTypeError(_("must be at least 1"))
+    return jobs
+
+
 def _add_trace_index_common_arguments(p: argparse.ArgumentParser) -> None:
     p.add_argument("req_root", help=_("requirements root"))
     p.add_argument("--project-root", help=_("project root for source/test/result globs"))
@@ -1543,6 +1591,18 @@ def _add_trace_index_common_arguments(p: argparse.ArgumentParser) -> None:
     p.add_argument("--test-glob", action="append", help=_("test source file glob"))
     p.add_argument("--result-glob", action="append", help=_("test result file glob"))
     p.add_argument("--exclude-glob", action="append", help=_("exclude file glob"))
+    p.add_argument(
+        "--cache-encoding",
+        choices=CACHE_ENCODINGS,
+        default="json",
+        help=_("trace-index cache encoding: diffable json or columnar compact"),
+    )
+    p.add_argument(
+        "--jobs",
+        type=_trace_index_jobs,
+        default=1,
+        help=_("number of worker processes used to parse input files"),
+    )
     p.add_argument(
         "--fail-on",
         choices=["high", "warning"],
@@ -1566,9 +1626,12 @@ def add_trace_index_arguments(p: argparse.ArgumentParser) -> None:
     _add_trace_index_common_arguments(export)
     export.add_argument(
         "--format",
-        choices=["json", "csv", "html"],
+        choices=["json", "csv", "links-csv", "html"],
         default="json",
-        help=_("export format"),
+        help=_(
+            "export format; links-csv writes one rid,column,marker,status row "
+            "per linked artifact-matrix cell"
+        ),
     )
     export.add_argument(
         "--view",
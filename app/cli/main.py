@@ -7,6 +7,7 @@ from pathlib import Path
 
 from app import i18n
 from app.application import ApplicationContext
+from app.core.constants import MAX_LOAD_WORKERS
 from app.i18n import _
 from app.log import configure_logging
 from app.runtime_dependencies import log_missing_startup_dependencies
@@ -20,6 +21,19 @@ LOCALE_DIR = Path(__file__).resolve().parent.parent / "locale"
 i18n.install(APP_NAME, LOCALE_DIR)
 
 
+def _load_workers(value: str) -> int:
+    """Parse ``--load-workers`` enforcing the supported range."""
+    try:
+        workers = int(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from exc
+    if not 1 <= workers <= MAX_LOAD_WORKERS:
+        raise argparse.ArgumentTypeError(
+            _("must be between 1 and {limit}").format(limit=MAX_LOAD_WORKERS)
+        )
+    return workers
+
+
 def build_parser() -> argparse.ArgumentParser:
     """Construct argument parser for CLI commands."""
     parser = argparse.ArgumentParser(description=_("CookaReq CLI"))
@@ -27,6 +41,22 @@ def build_parser() -> argparse.ArgumentParser:
         "--settings",
         help=_("path to JSON/TOML settings"),
     )
+    parser.add_argument(
+        "--load-workers",
+        type=_load_workers,
+        help=_("number of workers reading requirement files"),
+    )
+    parser.add_argument(
+        "--load-executor",
+        choices=["thread", "process"],
+        help=_("worker pool kind used with --load-workers"),
+    )
+    parser.add_argument(
+        "--use-index",
+        action="store_true",
+        default=None,
+        help=_("answer bulk requirement reads from the persistent index"),
+    )
     sub = parser.add_subparsers(dest="command", required=True)
     for name, cmd in COMMANDS.items():
         p = sub.add_parser(name, help=cmd.help)
@@ -45,6 +75,18 @@ def main(argv: list[str] | None = None) -> int:
     settings = AppSettings()
     if args.settings:
         settings = load_app_settings(args.settings)
+    storage = settings.storage
+    load_workers = getattr(args, "load_workers", None)
+    if load_workers is not None:
+        storage.load_workers = load_workers
+    load_executor = getattr(args, "load_executor", None)
+    if load_executor is not None:
+        storage.load_executor = load_executor
+    if getattr(args, "use_index", None):
+        storage.use_index = True
+    configure_storage = getattr(context, "configure_storage", None)
+    if callable(configure_storage):
+        configure_storage(storage)
     preferred_language = settings.ui.language
     if preferred_language:
         i18n.install(APP_NAME, LOCALE_DIR, [preferred_language])
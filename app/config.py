@@ -15,7 +15,13 @@ if TYPE_CHECKING:
     import wx
 
 from .columns import default_column_width, sanitize_columns
-from .settings import AppSettings, LLMSettings, MCPSettings, UISettings
+from .settings import (
+    AppSettings,
+    LLMSettings,
+    MCPSettings,
+    StorageSettings,
+    UISettings,
+)
 
 
 _FIRST_RUN_COLUMN_PRIORITY: tuple[str, ...] = (
@@ -59,7 +65,7 @@ def _default_config_path(app_name: str) -> Path:
 class FieldBinding:
     """Describe mapping between config field name and Pydantic settings."""
 
-    section: Literal["llm", "mcp", "ui"]
+    section: Literal["llm", "mcp", "ui", "storage"]
     attribute: str
 
 
@@ -134,6 +140,9 @@ FIELD_BINDINGS: dict[str, FieldBinding] = {
     "det_editor_x": FieldBinding("ui", "detached_editor_x"),
     "det_editor_y": FieldBinding("ui", "detached_editor_y"),
     "det_editor_max": FieldBinding("ui", "detached_editor_maximized"),
+    "storage_load_workers": FieldBinding("storage", "load_workers"),
+    "storage_load_executor": FieldBinding("storage", "load_executor"),
+    "storage_use_index": FieldBinding("storage", "use_index"),
 }
 
 
@@ -171,7 +180,12 @@ class ConfigManager:
         apply_first_run_defaults = not self._path.exists()
         self._path.parent.mkdir(parents=True, exist_ok=True)
         self._settings = AppSettings()
-        self._overrides: dict[str, dict[str, Any]] = {"llm": {}, "mcp": {}, "ui": {}}
+        self._overrides: dict[str, dict[str, Any]] = {
+            "llm": {},
+            "mcp": {},
+            "ui": {},
+            "storage": {},
+        }
         self._raw: dict[str, Any] = {}
         self._load()
         if apply_first_run_defaults:
@@ -272,6 +286,7 @@ class ConfigManager:
             "llm": base.llm.model_dump(mode="python"),
             "mcp": base.mcp.model_dump(mode="python"),
             "ui": base.ui.model_dump(mode="python"),
+            "storage": base.storage.model_dump(mode="python"),
         }
         for section, overrides in self._overrides.items():
             merged[section].update(overrides)
@@ -689,6 +704,16 @@ class ConfigManager:
         self._rebuild_settings()
         self.flush()
 
+    def get_storage_settings(self) -> StorageSettings:
+        """Return deep copy of requirement storage settings."""
+        return self._settings.storage.model_copy(deep=True)
+
+    def set_storage_settings(self, settings: StorageSettings) -> None:
+        """Persist storage *settings* and rebuild derived state."""
+        self._overrides["storage"] = settings.model_dump(mode="python")
+        self._rebuild_settings()
+        self.flush()
+
     def get_app_settings(self) -> AppSettings:
         """Return deep copy of the composite application settings."""
         return self._settings.model_copy(deep=True)
@@ -698,6 +723,7 @@ class ConfigManager:
         self.set_llm_settings(settings.llm)
         self.set_mcp_settings(settings.mcp)
         self.set_ui_settings(settings.ui)
+        self.set_storage_settings(settings.storage)
 
     # ------------------------------------------------------------------
     # sort settings
@@ -0,0 +1,4 @@
+"""Shared constants for requirement storage limits."""
+
+MAX_LOAD_WORKERS = 64
+"""Upper bound for worker pools decoding requirement files in bulk reads."""
@@ -29,6 +29,10 @@ from .documents import (
     stable_color,
     validate_labels,
 )
+from .bulk import LoadOptions
+from .cache import RequirementCache
+from .index import RequirementIndex
+from .revisions import RevisionTable, revision_table
 from .items import (
     create_requirement,
     delete_requirement,
@@ -69,6 +73,11 @@ __all__ = [
     "SharedArtifact",
     "Document",
     "RequirementPage",
+    "LoadOptions",
+    "RequirementCache",
+    "RequirementIndex",
+    "RevisionTable",
+    "revision_table",
     "bump_document_revision",
     "collect_label_defs",
     "collect_labels",
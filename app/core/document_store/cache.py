@@ -0,0 +1,97 @@
+"""Bounded in-memory cache of parsed requirements validated by file stat."""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import replace
+
+from ..model import Attachment, Link, Requirement
+
+__all__ = ["DEFAULT_REQUIREMENT_CACHE_SIZE", "RequirementCache", "StatKey"]
+
+DEFAULT_REQUIREMENT_CACHE_SIZE = 50_000
+
+StatKey = tuple[int, int]
+"""``(mtime_ns, size)`` pair identifying the item file version."""
+
+
+def _clone(requirement: Requirement) -> Requirement:
+    """Return a copy of ``requirement`` that shares no mutable containers."""
+    return replace(
+        requirement,
+        verification_methods=list(requirement.verification_methods),
+        labels=list(requirement.labels),
+        attachments=[
+            replace(attachment) if isinstance(attachment, Attachment) else attachment
+            for attachment in requirement.attachments
+        ],
+        context_docs=list(requirement.context_docs),
+        links=[
+            replace(link) if isinstance(link, Link) else link
+            for link in requirement.links
+        ],
+    )
+
+
+class RequirementCache:
+    """LRU cache of parsed :class:`Requirement` objects keyed by ``(prefix, id)``.
+
+    Every entry remembers the :data:`StatKey` of the file it was parsed from;
+    lookups with a different key miss so edits made outside the owning service
+    are picked up on the next read. Stored requirements hold the payload as
+    found on disk, before link suspicion refresh, and callers always receive
+    independent copies.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_REQUIREMENT_CACHE_SIZE) -> None:
+        """Create an empty cache holding at most ``max_entries`` requirements."""
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, int], tuple[StatKey, Requirement]] = (
+            OrderedDict()
+        )
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        """Return the number of cached requirements."""
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, prefix: str, item_id: int, stat: StatKey) -> Requirement | None:
+        """Return a copy of the cached requirement when ``stat`` still matches."""
+        key = (prefix, item_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] != stat:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return _clone(entry[1])
+
+    def put(
+        self, prefix: str, item_id: int, stat: StatKey, requirement: Requirement
+    ) -> None:
+        """Store a copy of ``requirement`` parsed from a file with ``stat``."""
+        key = (prefix, item_id)
+        with self._lock:
+            self._entries[key] = (stat, _clone(requirement))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, prefix: str, item_id: int | None = None) -> None:
+        """Forget ``item_id`` of ``prefix`` or the whole document when omitted."""
+        with self._lock:
+            if item_id is not None:
+                self._entries.pop((prefix, item_id), None)
+                return
+            for key in [key for key in self._entries if key[0] == prefix]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every cached requirement."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,459 @@
+"""Persistent SQLite index of requirement payloads stored under a root."""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable, Sequence
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+from ..model import Link
+from .bulk import LoadOptions, read_json_files
+from .layout import canonical_item_name
+
+__all__ = ["INDEX_RELATIVE_PATH", "RequirementIndex", "index_path", "scan_item_files"]
+
+logger = logging.getLogger(__name__)
+
+INDEX_RELATIVE_PATH = Path(".cookareq") / "requirements_index.sqlite"
+
+_SCHEMA_VERSION = 1
+
+
+def index_path(root: str | Path) -> Path:
+    """Return the requirement index database path for requirements ``root``."""
+    return Path(root) / INDEX_RELATIVE_PATH
+
+
+def _read_json(path: Path) -> dict:
+    with path.open(encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def _payload_revision(data: dict[str, Any]) -> int | None:
+    try:
+        revision = int(data.get("revision", 1))
+    except (TypeError, ValueError):
+        return None
+    return revision if revision > 0 else None
+
+
+def _payload_links(data: dict[str, Any]) -> list[Link]:
+    raw_links = data.get("links")
+    if not isinstance(raw_links, list):
+        return []
+    links: list[Link] = []
+    for entry in raw_links:
+        try:
+            links.append(Link.from_raw(entry))
+        except (TypeError, ValueError):
+            continue
+    return links
+
+
+def scan_item_files(directory: str | Path) -> dict[int, tuple[Path, int, int]]:
+    """Return ``item_id -> (path, mtime_ns, size)`` for ``directory/items``.
+
+    Only canonical ``<id>.json`` filenames are reported. Files removed while
+    scanning are skipped silently.
+    """
+    items_dir = Path(directory) / "items"
+    found: dict[int, tuple[Path, int, int]] = {}
+    if not items_dir.is_dir():
+        return found
+    with os.scandir(items_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            stem, dot, suffix = name.rpartition(".")
+            if not dot or suffix != "json" or not stem.isdigit():
+                continue
+            item_id = int(stem)
+            if name != canonical_item_name(item_id):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            found[item_id] = (Path(entry.path), stat.st_mtime_ns, stat.st_size)
+    return found
+
+
+class RequirementIndex:
+    """Cache parsed requirement payloads, revisions and links in SQLite.
+
+    Entries are validated against the ``mtime_ns``/``size`` pair of every item
+    file, so only files changed since the previous refresh are decoded again.
+    The database lives under ``<root>/.cookareq/`` and can be deleted at any
+    time; it is rebuilt lazily on the next read.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        """Bind the index to requirements ``root``."""
+        self.root = Path(root)
+        self._path = index_path(self.root)
+        self._lock = threading.RLock()
+
+    # ------------------------------------------------------------------
+    @property
+    def path(self) -> Path:
+        """Return the SQLite database path."""
+        return self._path
+
+    # ------------------------------------------------------------------
+    def load_payloads(
+        self, prefix: str, *, load_options: LoadOptions | None = None
+    ) -> list[tuple[int, dict[str, Any]]]:
+        """Return ``(item_id, payload)`` pairs of ``prefix`` sorted by id.
+
+        Changed and new item files are decoded (through a worker pool when
+        ``load_options`` asks for one) and written back to the index; entries
+        whose files disappeared are dropped. When the database cannot be used
+        the payloads are read straight from disk.
+        """
+        files = scan_item_files(self.root / prefix)
+        try:
+            return self._load_indexed(prefix, files, load_options)
+        except sqlite3.Error:
+            logger.warning(
+                "Requirement index %s is unavailable; reading %s from disk",
+                self._path,
+                prefix,
+                exc_info=True,
+            )
+            item_ids = sorted(files)
+            payloads = read_json_files(
+                [files[item_id][0] for item_id in item_ids], load_options
+            )
+            return list(zip(item_ids, payloads, strict=True))
+
+    def backlinks(
+        self, target_rid: str, prefixes: Sequence[str]
+    ) -> list[tuple[str, int, int | None]]:
+        """Return ``(prefix, item_id, revision)`` of items linking to ``target_rid``.
+
+        The index is first synchronised with the item files of ``prefixes``
+        (a stat-only pass decoding just the changed files); entries of other
+        prefixes are discarded as belonging to removed documents.
+        """
+        with self._lock, closing(self._connect()) as conn:
+            self._ensure_schema(conn)
+            self._sync(conn, prefixes)
+            rows = conn.execute(
+                """
+                SELECT prefix, item_id, revision FROM links
+                WHERE target_rid = ?
+                ORDER BY prefix, item_id
+                """,
+                (target_rid,),
+            ).fetchall()
+        return [(row["prefix"], row["item_id"], row["revision"]) for row in rows]
+
+    def referencing_items(
+        self, target_rids: Iterable[str], prefixes: Sequence[str]
+    ) -> list[tuple[str, int]]:
+        """Return ``(prefix, item_id)`` of items linking to any of ``target_rids``.
+
+        Like :meth:`backlinks` the index is synchronised once with ``prefixes``
+        before the lookup, however many targets are queried.
+        """
+        with self._lock, closing(self._connect()) as conn:
+            self._ensure_schema(conn)
+            self._sync(conn, prefixes)
+            conn.execute("CREATE TEMP TABLE targets (rid TEXT PRIMARY KEY)")
+            conn.executemany(
+                "INSERT OR IGNORE INTO targets (rid) VALUES (?)",
+                ((rid,) for rid in target_rids),
+            )
+            rows = conn.execute(
+                """
+                SELECT DISTINCT links.prefix, links.item_id FROM links
+                JOIN targets ON targets.rid = links.target_rid
+                ORDER BY links.prefix, links.item_id
+                """
+            ).fetchall()
+        return [(row["prefix"], row["item_id"]) for row in rows]
+
+    def linked_rids(self, prefixes: Sequence[str]) -> set[str]:
+        """Return every requirement id referenced by items of ``prefixes``."""
+        with self._lock, closing(self._connect()) as conn:
+            self._ensure_schema(conn)
+            self._sync(conn, prefixes)
+            rows = conn.execute("SELECT DISTINCT target_rid FROM links").fetchall()
+        return {row["target_rid"] for row in rows}
+
+    def record(
+        self, prefix: str, item_id: int, path: Path, payload: dict[str, Any]
+    ) -> None:
+        """Store ``payload`` just written to ``path`` without re-reading it."""
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            self.forget(prefix, item_id)
+            return
+        try:
+            with self._lock, closing(self._connect()) as conn:
+                self._ensure_schema(conn)
+                with conn:
+                    self._write_entries(
+                        conn,
+                        prefix,
+                        [(item_id, stat.st_mtime_ns, stat.st_size, payload)],
+                    )
+        except sqlite3.Error:
+            logger.warning(
+                "Failed to update requirement index %s", self._path, exc_info=True
+            )
+
+    def forget(self, prefix: str, item_id: int) -> None:
+        """Drop the entry of ``item_id`` in ``prefix`` after its file was removed."""
+        try:
+            with self._lock, closing(self._connect()) as conn:
+                self._ensure_schema(conn)
+                with conn:
+                    self._delete_entries(conn, prefix, [item_id])
+        except sqlite3.Error:
+            logger.warning(
+                "Failed to update requirement index %s", self._path, exc_info=True
+            )
+
+    def forget_document(self, prefix: str) -> None:
+        """Drop every entry of ``prefix`` after its document was removed."""
+        try:
+            with self._lock, closing(self._connect()) as conn, conn:
+                self._ensure_schema(conn)
+                conn.execute("DELETE FROM links WHERE prefix = ?", (prefix,))
+                conn.execute("DELETE FROM items WHERE prefix = ?", (prefix,))
+        except sqlite3.Error:
+            logger.warning(
+                "Failed to update requirement index %s", self._path, exc_info=True
+            )
+
+    def revisions(self) -> dict[tuple[str, int], int | None]:
+        """Return indexed ``(prefix, item_id) -> revision`` pairs."""
+        with self._lock, closing(self._connect()) as conn:
+            self._ensure_schema(conn)
+            rows = conn.execute("SELECT prefix, item_id, revision FROM items").fetchall()
+        return {(row["prefix"], row["item_id"]): row["revision"] for row in rows}
+
+    def revision_entries(self) -> dict[tuple[str, int], tuple[int, int, int | None]]:
+        """Return ``(prefix, item_id) -> (mtime_ns, size, revision)`` rows.
+
+        Returns an empty mapping when the database cannot be read.
+        """
+        try:
+            with self._lock, closing(self._connect()) as conn:
+                self._ensure_schema(conn)
+                rows = conn.execute(
+                    "SELECT prefix, item_id, mtime_ns, size, revision FROM items"
+                ).fetchall()
+        except sqlite3.Error:
+            logger.warning(
+                "Requirement index %s is unavailable", self._path, exc_info=True
+            )
+            return {}
+        return {
+            (row["prefix"], row["item_id"]): (
+                row["mtime_ns"],
+                row["size"],
+                row["revision"],
+            )
+            for row in rows
+        }
+
+    def clear(self) -> None:
+        """Drop every indexed entry forcing a full rebuild on the next read."""
+        with self._lock, closing(self._connect()) as conn, conn:
+            self._ensure_schema(conn)
+            conn.execute("DELETE FROM links")
+            conn.execute("DELETE FROM items")
+
+    # ------------------------------------------------------------------
+    def _load_indexed(
+        self,
+        prefix: str,
+        files: dict[int, tuple[Path, int, int]],
+        load_options: LoadOptions | None = None,
+    ) -> list[tuple[int, dict[str, Any]]]:
+        with self._lock, closing(self._connect()) as conn:
+            self._ensure_schema(conn)
+            rows = conn.execute(
+                "SELECT item_id, mtime_ns, size, payload FROM items WHERE prefix = ?",
+                (prefix,),
+            ).fetchall()
+            indexed = {row["item_id"]: row for row in rows}
+            payloads: dict[int, dict[str, Any]] = {}
+            stale: list[int] = []
+            for item_id in sorted(files):
+                _path, mtime_ns, size = files[item_id]
+                row = indexed.pop(item_id, None)
+                if row is not None and row["mtime_ns"] == mtime_ns and row["size"] == size:
+                    payloads[item_id] = json.loads(row["payload"])
+                else:
+                    stale.append(item_id)
+            changed: list[tuple[int, int, int, dict[str, Any]]] = []
+            decoded = read_json_files([files[item_id][0] for item_id in stale], load_options)
+            for item_id, data in zip(stale, decoded, strict=True):
+                _path, mtime_ns, size = files[item_id]
+                payloads[item_id] = data
+                changed.append((item_id, mtime_ns, size, data))
+            if changed or indexed:
+                with conn:
+                    self._write_entries(conn, prefix, changed)
+                    self._delete_entries(conn, prefix, indexed)
+            return [(item_id, payloads[item_id]) for item_id in sorted(payloads)]
+
+    def _sync(self, conn: sqlite3.Connection, prefixes: Sequence[str]) -> None:
+        known = set(prefixes)
+        stale_prefixes = [
+            row["prefix"]
+            for row in conn.execute("SELECT DISTINCT prefix FROM items").fetchall()
+            if row["prefix"] not in known
+        ]
+        with conn:
+            for prefix in stale_prefixes:
+                conn.execute("DELETE FROM links WHERE prefix = ?", (prefix,))
+                conn.execute("DELETE FROM items WHERE prefix = ?", (prefix,))
+            for prefix in prefixes:
+                files = scan_item_files(self.root / prefix)
+                rows = conn.execute(
+                    "SELECT item_id, mtime_ns, size FROM items WHERE prefix = ?",
+                    (prefix,),
+                ).fetchall()
+                indexed = {row["item_id"]: row for row in rows}
+                changed: list[tuple[int, int, int, dict[str, Any]]] = []
+                for item_id, (path, mtime_ns, size) in files.items():
+                    row = indexed.pop(item_id, None)
+                    if (
+                        row is not None
+                        and row["mtime_ns"] == mtime_ns
+                        and row["size"] == size
+                    ):
+                        continue
+                    try:
+                        data = _read_json(path)
+                    except FileNotFoundError:
+                        indexed[item_id] = row
+                        continue
+                    changed.append((item_id, mtime_ns, size, data))
+                self._write_entries(conn, prefix, changed)
+                self._delete_entries(conn, prefix, indexed)
+
+    @staticmethod
+    def _write_entries(
+        conn: sqlite3.Connection,
+        prefix: str,
+        entries: list[tuple[int, int, int, dict[str, Any]]],
+    ) -> None:
+        for item_id, mtime_ns, size, data in entries:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO items
+                    (prefix, item_id, mtime_ns, size, revision, payload)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    prefix,
+                    item_id,
+                    mtime_ns,
+                    size,
+                    _payload_revision(data),
+                    json.dumps(data, ensure_ascii=False, separators=(",", ":")),
+                ),
+            )
+            conn.execute(
+                "DELETE FROM links WHERE prefix = ? AND item_id = ?",
+                (prefix, item_id),
+            )
+            conn.executemany(
+                """
+                INSERT INTO links (prefix, item_id, target_rid, revision)
+                VALUES (?, ?, ?, ?)
+                """,
+                [
+                    (prefix, item_id, link.rid, link.revision)
+                    for link in _payload_links(data)
+                ],
+            )
+
+    @staticmethod
+    def _delete_entries(
+        conn: sqlite3.Connection, prefix: str, item_ids: Iterable[int]
+    ) -> None:
+        for item_id in item_ids:
+            conn.execute(
+                "DELETE FROM links WHERE prefix = ? AND item_id = ?",
+                (prefix, item_id),
+            )
+            conn.execute(
+                "DELETE FROM items WHERE prefix = ? AND item_id = ?",
+                (prefix, item_id),
+            )
+
+    # ------------------------------------------------------------------
+    def _connect(self) -> sqlite3.Connection:
+        path = self._path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(path), timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _ensure_schema(self, conn: sqlite3.Connection) -> None:
+        try:
+            row = conn.execute(
+                "SELECT value FROM metadata WHERE key = 'schema_version'"
+            ).fetchone()
+        except sqlite3.OperationalError:
+            row = None
+        if row is not None and row["value"] == str(_SCHEMA_VERSION):
+            return
+        with conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS metadata (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                )
+                """
+            )
+            if row is not None:
+                # The index is a disposable cache: rebuild instead of migrating.
+                conn.execute("DROP TABLE IF EXISTS links")
+                conn.execute("DROP TABLE IF EXISTS items")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS items (
+                    prefix TEXT NOT NULL,
+                    item_id INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    revision INTEGER,
+                    payload TEXT NOT NULL,
+                    PRIMARY KEY (prefix, item_id)
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS links (
+                    prefix TEXT NOT NULL,
+                    item_id INTEGER NOT NULL,
+                    target_rid TEXT NOT NULL,
+                    revision INTEGER
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS links_by_source ON links (prefix, item_id)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS links_by_target ON links (target_rid)"
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO metadata (key, value) VALUES ('schema_version', ?)",
+                (str(_SCHEMA_VERSION),),
+            )
+
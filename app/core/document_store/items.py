@@ -2,15 +2,18 @@
 from __future__ import annotations
 
 import json
+import logging
 import re
+import sqlite3
 from contextlib import suppress
 from dataclasses import fields
 from pathlib import Path
 from typing import Any
-from collections.abc import Callable, Mapping, Sequence
+from collections.abc import Callable, Collection, Iterator, Mapping, Sequence
 
 from ..markdown_utils import validate_markdown
 from ..model import Attachment, Link, Requirement
+from ..requirement_sorting import SortKeyCache, sort_requirements_for_cards
 from ...util.time import local_now_str
 from ..search import filter_by_labels, filter_by_status, search
 from .types import (
@@ -22,6 +25,10 @@ from .types import (
     ValidationError,
 )
 from .layout import canonical_item_name
+from .bulk import LoadOptions, read_json_files
+from .cache import RequirementCache
+from .index import RequirementIndex, _payload_revision, scan_item_files
+from .revisions import revision_table
 from .documents import (
     bump_document_revision,
     is_ancestor,
@@ -29,6 +36,8 @@ from .documents import (
     validate_labels,
 )
 
+logger = logging.getLogger(__name__)
+
 RID_RE = re.compile(r"^([A-Za-z][A-Za-z0-9_]*?)-?0*(\d+)$")
 KNOWN_REQUIREMENT_FIELDS = {f.name for f in fields(Requirement)}
 
@@ -88,21 +97,7 @@ def _load_revision_for_rid(
     if doc is None:
         cache[rid] = None
         return None
-    path = root / prefix
-    try:
-        data, _ = load_item(path, doc, item_id)
-    except FileNotFoundError:
-        cache[rid] = None
-        return None
-    raw_revision = data.get("revision", 1)
-    try:
-        revision = int(raw_revision)
-    except (TypeError, ValueError):
-        cache[rid] = None
-        return None
-    if revision <= 0:
-        cache[rid] = None
-        return None
+    revision = revision_table(root).revision(doc.prefix, item_id)
     cache[rid] = revision
     return revision
 
@@ -217,11 +212,14 @@ def save_item(
     data: Mapping[str, Any],
     *,
     docs: Mapping[str, Document] | None = None,
+    index: RequirementIndex | None = None,
 ) -> Path:
     """Save requirement ``data`` within ``doc`` and return file path.
 
     ``docs`` allows callers that already hold a document mapping to avoid an
     extra on-disk scan.  When omitted the mapping is reloaded from ``root``.
+    ``index`` receives the stored payload so its link table stays current
+    without decoding the file again.
     """
     root = Path(directory).parent
     docs_map = _ensure_documents(root, docs)
@@ -236,6 +234,9 @@ def save_item(
     path.parent.mkdir(parents=True, exist_ok=True)
     with path.open("w", encoding="utf-8") as fh:
         json.dump(payload, fh, ensure_ascii=False, indent=2, sort_keys=True)
+    revision_table(root).record_path(doc.prefix, item_id, path, payload)
+    if index is not None:
+        index.record(doc.prefix, item_id, path, payload)
     return path
 
 
@@ -273,34 +274,152 @@ def _ensure_documents(root: Path, docs: Mapping[str, Document] | None) -> Mappin
     return docs if docs is not None else load_documents(root)
 
 
+def _payload_links_to(data: Mapping[str, Any], rids: Collection[str]) -> bool:
+    links = data.get("links")
+    if not isinstance(links, list):
+        return False
+    for entry in links:
+        try:
+            link = Link.from_raw(entry)
+        except (TypeError, ValueError):  # pragma: no cover - defensive
+            continue
+        if link.rid in rids:
+            return True
+    return False
+
+
+def _iter_referencing_items(
+    root: Path,
+    rids: Collection[str],
+    docs: Mapping[str, Document],
+    index: RequirementIndex | None = None,
+) -> Iterator[tuple[str, Document, int, dict]]:
+    """Yield ``(prefix, doc, item_id, payload)`` of items linking to ``rids``.
+
+    Each item linking to any of ``rids`` is yielded once. With ``index`` only
+    the files recorded as referencing them are read; otherwise, or when the
+    index is unusable, every item of ``docs`` is scanned.
+    """
+    if index is not None:
+        try:
+            sources = index.referencing_items(rids, sorted(docs))
+        except sqlite3.Error:
+            logger.warning(
+                "Requirement index %s is unavailable; scanning links of %s",
+                index.path,
+                ", ".join(sorted(rids)),
+                exc_info=True,
+            )
+        else:
+            for prefix, item_id in sources:
+                doc = docs[prefix]
+                try:
+                    data, _ = load_item(root / prefix, doc, item_id)
+                except FileNotFoundError:  # pragma: no cover - removed meanwhile
+                    continue
+                # Re-check the payload in case the file changed after the sync.
+                if _payload_links_to(data, rids):
+                    yield prefix, doc, item_id, data
+            return
+    for prefix, doc in docs.items():
+        directory = root / prefix
+        for item_id in list_item_ids(directory, doc):
+            data, _ = load_item(directory, doc, item_id)
+            if _payload_links_to(data, rids):
+                yield prefix, doc, item_id, data
+
+
+def _load_document_payloads(
+    root: Path,
+    prefix: str,
+    doc: Document,
+    index: RequirementIndex | None,
+    load_options: LoadOptions | None = None,
+) -> list[tuple[int, dict]]:
+    if index is not None:
+        return index.load_payloads(prefix, load_options=load_options)
+    files = scan_item_files(root / prefix)
+    item_ids = sorted(files)
+    revisions = revision_table(root)
+    payloads = read_json_files(
+        [files[item_id][0] for item_id in item_ids], load_options
+    )
+    for item_id, data in zip(item_ids, payloads, strict=True):
+        _path, mtime_ns, size = files[item_id]
+        revisions.record(prefix, item_id, (mtime_ns, size), _payload_revision(data))
+    return list(zip(item_ids, payloads, strict=True))
+
+
+def _load_document_requirements(
+    root: Path,
+    prefix: str,
+    doc: Document,
+    index: RequirementIndex | None,
+    requirement_cache: RequirementCache | None,
+    load_options: LoadOptions | None = None,
+) -> list[Requirement]:
+    if requirement_cache is None:
+        return [
+            Requirement.from_mapping(data, doc_prefix=prefix, rid=rid_for(doc, item_id))
+            for item_id, data in _load_document_payloads(
+                root, prefix, doc, index, load_options
+            )
+        ]
+    files = scan_item_files(root / prefix)
+    revisions = revision_table(root)
+    cached: dict[int, Requirement] = {}
+    for item_id, (_path, mtime_ns, size) in files.items():
+        req = requirement_cache.get(prefix, item_id, (mtime_ns, size))
+        if req is not None:
+            cached[item_id] = req
+    if len(cached) < len(files):
+        if index is not None:
+            payloads = dict(index.load_payloads(prefix, load_options=load_options))
+        else:
+            missing = sorted(item_id for item_id in files if item_id not in cached)
+            payloads = dict(
+                zip(
+                    missing,
+                    read_json_files(
+                        [files[item_id][0] for item_id in missing], load_options
+                    ),
+                    strict=True,
+                )
+            )
+        for item_id, (_path, mtime_ns, size) in files.items():
+            if item_id in cached or item_id not in payloads:
+                continue
+            req = Requirement.from_mapping(
+                payloads[item_id], doc_prefix=prefix, rid=rid_for(doc, item_id)
+            )
+            requirement_cache.put(prefix, item_id, (mtime_ns, size), req)
+            cached[item_id] = req
+    for item_id, (_path, mtime_ns, size) in files.items():
+        req = cached.get(item_id)
+        if req is not None:
+            revisions.record(prefix, item_id, (mtime_ns, size), req.revision)
+    return [cached[item_id] for item_id in sorted(cached)]
+
+
 def _iter_requirements(
     root: Path,
     docs: Mapping[str, Document],
     *,
     all_docs: Mapping[str, Document] | None = None,
+    index: RequirementIndex | None = None,
+    requirement_cache: RequirementCache | None = None,
+    load_options: LoadOptions | None = None,
 ) -> list[Requirement]:
     requirements: list[Requirement] = []
     cache: dict[str, int | None] = {}
+    if index is not None:
+        revision_table(root).seed(index)
     for prefix, doc in docs.items():
-        directory = root / prefix
-        for item_id in sorted(list_item_ids(directory, doc)):
-            data, _ = load_item(directory, doc, item_id)
-            rid = rid_for(doc, item_id)
-            raw_revision = data.get("revision", 1)
-            try:
-                revision = int(raw_revision)
-            except (TypeError, ValueError):
-                revision = None
-            if revision is not None and revision <= 0:
-                revision = None
-            cache[rid] = revision
-            requirements.append(
-                Requirement.from_mapping(
-                    data,
-                    doc_prefix=prefix,
-                    rid=rid,
-                )
-            )
+        for req in _load_document_requirements(
+            root, prefix, doc, index, requirement_cache, load_options
+        ):
+            cache[req.rid] = req.revision
+            requirements.append(req)
     doc_map = all_docs or docs
     for req in requirements:
         _update_link_suspicions(root, doc_map, req, cache)
@@ -312,6 +431,9 @@ def load_requirements(
     *,
     prefixes: Sequence[str] | None = None,
     docs: Mapping[str, Document] | None = None,
+    index: RequirementIndex | None = None,
+    requirement_cache: RequirementCache | None = None,
+    load_options: LoadOptions | None = None,
 ) -> list[Requirement]:
     """Return requirements for the selected document prefixes.
 
@@ -319,7 +441,10 @@ def load_requirements(
     omitted, requirements from *all* documents are returned. The function
     ensures that link metadata is refreshed (``Link.suspect`` reflects the
     current target revision state) in the same way as ``search_requirements`` and
-    other high level helpers.
+    other high level helpers. Passing ``index`` answers the read from the
+    persistent :class:`RequirementIndex` instead of decoding every item file,
+    while ``requirement_cache`` reuses requirements parsed by earlier calls.
+    ``load_options`` reads the remaining item files with a worker pool.
     """
     root_path = Path(root)
     if docs is None and not root_path.is_dir():
@@ -338,7 +463,14 @@ def load_requirements(
             seen.add(prefix)
             selected_order.append(prefix)
     selected_docs = {prefix: docs_map[prefix] for prefix in selected_order}
-    return _iter_requirements(root_path, selected_docs, all_docs=docs_map)
+    return _iter_requirements(
+        root_path,
+        selected_docs,
+        all_docs=docs_map,
+        index=index,
+        requirement_cache=requirement_cache,
+        load_options=load_options,
+    )
 
 
 def _normalize_labels(raw: Any) -> list[str]:
@@ -392,9 +524,19 @@ def list_requirements(
     per_page: int = 50,
     status: str | None = None,
     labels: Sequence[str] | None = None,
+    sort: str | None = None,
     docs: Mapping[str, Document] | None = None,
+    index: RequirementIndex | None = None,
+    requirement_cache: RequirementCache | None = None,
+    load_options: LoadOptions | None = None,
+    sort_keys: SortKeyCache | None = None,
 ) -> RequirementPage:
-    """Return a page of requirements for a single requirements document."""
+    """Return a page of requirements for a single requirements document.
+
+    ``sort`` orders the document before pagination using one of
+    :data:`~app.core.requirement_sorting.CARD_SORT_MODES`, reusing keys held
+    in ``sort_keys`` when given.
+    """
     root_path = Path(root)
     if docs is None and not root_path.is_dir():
         raise FileNotFoundError(root_path)
@@ -406,9 +548,20 @@ def list_requirements(
     except KeyError as exc:
         raise DocumentNotFoundError(prefix) from exc
     selected = {prefix: document}
-    requirements = _iter_requirements(root_path, selected, all_docs=docs_map)
+    requirements = _iter_requirements(
+        root_path,
+        selected,
+        all_docs=docs_map,
+        index=index,
+        requirement_cache=requirement_cache,
+        load_options=load_options,
+    )
     requirements = filter_by_status(requirements, status)
     requirements = filter_by_labels(requirements, list(labels or []))
+    if sort:
+        requirements = sort_requirements_for_cards(
+            requirements, sort_mode=sort, cache=sort_keys
+        )
     return _paginate_requirements(requirements, page, per_page)
 
 
@@ -421,13 +574,22 @@ def search_requirements(
     page: int = 1,
     per_page: int = 50,
     docs: Mapping[str, Document] | None = None,
+    index: RequirementIndex | None = None,
+    requirement_cache: RequirementCache | None = None,
+    load_options: LoadOptions | None = None,
 ) -> RequirementPage:
     """Run a text search across requirements and return a paginated result."""
     root_path = Path(root)
     if docs is None and not root_path.is_dir():
         raise FileNotFoundError(root_path)
     docs_map = _ensure_documents(root_path, docs)
-    all_requirements = _iter_requirements(root_path, docs_map)
+    all_requirements = _iter_requirements(
+        root_path,
+        docs_map,
+        index=index,
+        requirement_cache=requirement_cache,
+        load_options=load_options,
+    )
     filtered = filter_by_status(all_requirements, status)
     filtered = search(filtered, labels=labels, query=query)
     return _paginate_requirements(filtered, page, per_page)
@@ -438,24 +600,63 @@ def get_requirement(
     rid: str,
     *,
     docs: Mapping[str, Document] | None = None,
+    requirement_cache: RequirementCache | None = None,
 ) -> Requirement:
-    """Load requirement ``rid`` from disk ensuring suspect links are flagged."""
+    """Load requirement ``rid`` from disk ensuring suspect links are flagged.
+
+    ``requirement_cache`` skips decoding when the item file is unchanged since
+    it was cached.
+    """
     root_path = Path(root)
     docs_map = _ensure_documents(root_path, docs)
-    prefix, item_id, doc, _directory, data, canonical_rid = _resolve_requirement(
-        root_path, rid, docs_map
-    )
-    req = Requirement.from_mapping(data, doc_prefix=prefix, rid=canonical_rid)
+    if requirement_cache is None:
+        prefix, item_id, doc, _directory, data, canonical_rid = _resolve_requirement(
+            root_path, rid, docs_map
+        )
+        req = Requirement.from_mapping(data, doc_prefix=prefix, rid=canonical_rid)
+    else:
+        req = _get_cached_requirement(root_path, rid, docs_map, requirement_cache)
     _update_link_suspicions(root_path, docs_map, req)
     return req
 
 
+def _get_cached_requirement(
+    root: Path,
+    rid: str,
+    docs: Mapping[str, Document],
+    requirement_cache: RequirementCache,
+) -> Requirement:
+    prefix, item_id = parse_rid(rid)
+    doc = docs.get(prefix)
+    if doc is None:
+        raise RequirementNotFoundError(rid)
+    path = item_path(root / doc.prefix, doc, item_id)
+    try:
+        stat = path.stat()
+    except FileNotFoundError as exc:
+        raise RequirementNotFoundError(rid) from exc
+    stat_key = (stat.st_mtime_ns, stat.st_size)
+    req = requirement_cache.get(doc.prefix, item_id, stat_key)
+    if req is not None:
+        return req
+    try:
+        data = _read_json(path)
+    except FileNotFoundError as exc:  # pragma: no cover - defensive
+        raise RequirementNotFoundError(rid) from exc
+    req = Requirement.from_mapping(
+        data, doc_prefix=doc.prefix, rid=rid_for(doc, item_id)
+    )
+    requirement_cache.put(doc.prefix, item_id, stat_key, req)
+    return req
+
+
 def create_requirement(
     root: str | Path,
     *,
     prefix: str,
     data: Mapping[str, Any],
     docs: Mapping[str, Document] | None = None,
+    index: RequirementIndex | None = None,
 ) -> Requirement:
     """Create a requirement under ``prefix`` using raw JSON ``data``."""
     root_path = Path(root)
@@ -482,7 +683,7 @@ def create_requirement(
     except (TypeError, ValueError) as exc:
         raise ValidationError(str(exc)) from exc
     _update_link_suspicions(root_path, docs_map, req)
-    save_item(directory, doc, req.to_mapping(), docs=docs_map)
+    save_item(directory, doc, req.to_mapping(), docs=docs_map, index=index)
     bump_document_revision(root_path, prefix, docs_map)
     return req
 
@@ -518,6 +719,7 @@ def _update_requirement(
     rid: str,
     docs: Mapping[str, Document] | None,
     mutate: Callable[[dict[str, Any], str, Document], None],
+    index: RequirementIndex | None = None,
 ) -> Requirement:
     root_path = Path(root)
     docs_map = _ensure_documents(root_path, docs)
@@ -547,7 +749,7 @@ def _update_requirement(
     except (TypeError, ValueError) as exc:
         raise ValidationError(str(exc)) from exc
     _update_link_suspicions(root_path, docs_map, req)
-    save_item(directory, doc, req.to_mapping(), docs=docs_map)
+    save_item(directory, doc, req.to_mapping(), docs=docs_map, index=index)
     if statement_changed:
         bump_document_revision(root_path, prefix, docs_map)
     return req
@@ -560,6 +762,7 @@ def update_requirement_field(
     field: str,
     value: Any,
     docs: Mapping[str, Document] | None = None,
+    index: RequirementIndex | None = None,
 ) -> Requirement:
     """Mutate a scalar field on requirement ``rid`` and persist the update."""
     if not isinstance(field, str) or not field:
@@ -578,7 +781,7 @@ def update_requirement_field(
     def mutate(payload: dict[str, Any], _prefix: str, _doc: Document) -> None:
         payload[field] = value
 
-    return _update_requirement(root, rid, docs, mutate)
+    return _update_requirement(root, rid, docs, mutate, index)
 
 
 def set_requirement_labels(
@@ -587,6 +790,7 @@ def set_requirement_labels(
     labels: Sequence[str],
     *,
     docs: Mapping[str, Document] | None = None,
+    index: RequirementIndex | None = None,
 ) -> Requirement:
     """Replace the label list attached to requirement ``rid``."""
     def mutate(payload: dict[str, Any], _prefix: str, _doc: Document) -> None:
@@ -594,7 +798,7 @@ def set_requirement_labels(
             raise ValidationError("labels must be a list of strings")
         payload["labels"] = _normalize_labels(list(labels))
 
-    return _update_requirement(root, rid, docs, mutate)
+    return _update_requirement(root, rid, docs, mutate, index)
 
 
 def set_requirement_attachments(
@@ -603,6 +807,7 @@ def set_requirement_attachments(
     attachments: Sequence[Mapping[str, Any]],
     *,
     docs: Mapping[str, Document] | None = None,
+    index: RequirementIndex | None = None,
 ) -> Requirement:
     """Persist ``attachments`` for requirement ``rid`` after validation."""
     def mutate(payload: dict[str, Any], _prefix: str, _doc: Document) -> None:
@@ -618,7 +823,7 @@ def set_requirement_attachments(
             normalized.append(attachment.to_mapping())
         payload["attachments"] = normalized
 
-    return _update_requirement(root, rid, docs, mutate)
+    return _update_requirement(root, rid, docs, mutate, index)
 
 
 def set_requirement_links(
@@ -627,6 +832,7 @@ def set_requirement_links(
     links: Sequence[Mapping[str, Any] | str],
     *,
     docs: Mapping[str, Document] | None = None,
+    index: RequirementIndex | None = None,
 ) -> Requirement:
     """Replace requirement links with ``links`` keeping suspect markers intact."""
     def mutate(payload: dict[str, Any], _prefix: str, _doc: Document) -> None:
@@ -638,7 +844,7 @@ def set_requirement_links(
         else:
             payload["links"] = payload_links
 
-    return _update_requirement(root, rid, docs, mutate)
+    return _update_requirement(root, rid, docs, mutate, index)
 
 
 def move_requirement(
@@ -648,8 +854,13 @@ def move_requirement(
     new_prefix: str,
     payload: Mapping[str, Any] | None = None,
     docs: Mapping[str, Document] | None = None,
+    index: RequirementIndex | None = None,
 ) -> Requirement:
-    """Relocate requirement ``rid`` under ``new_prefix`` keeping referential integrity."""
+    """Relocate requirement ``rid`` under ``new_prefix`` keeping referential integrity.
+
+    ``index`` limits the rewrite of incoming links to the items it records as
+    referencing ``rid`` instead of scanning the whole repository.
+    """
     root_path = Path(root)
     docs_map = _ensure_documents(root_path, docs)
     (
@@ -696,49 +907,40 @@ def move_requirement(
     updated_payload["labels"] = labels
 
     referencing_updates: list[tuple[Path, Document, dict[str, Any]]] = []
-    for pfx, doc in docs_map.items():
-        dir_path = root_path / pfx
-        for other_id in list_item_ids(dir_path, doc):
-            if pfx == prefix and other_id == item_id:
-                continue
-            item_data, _ = load_item(dir_path, doc, other_id)
-            links = item_data.get("links")
-            if not isinstance(links, list):
+    for pfx, doc, other_id, item_data in _iter_referencing_items(
+        root_path, {rid}, docs_map, index
+    ):
+        if pfx == prefix and other_id == item_id:
+            continue
+        new_links: list[dict[str, Any]] = []
+        for entry in item_data["links"]:
+            try:
+                link = Link.from_raw(entry)
+            except (TypeError, ValueError):  # pragma: no cover - defensive
+                new_links.append(entry)
                 continue
-            changed = False
-            new_links: list[dict[str, Any]] = []
-            for entry in links:
-                try:
-                    link = Link.from_raw(entry)
-                except (TypeError, ValueError):  # pragma: no cover - defensive
-                    new_links.append(entry)
-                    continue
-                if link.rid == rid:
-                    if not is_ancestor(doc.prefix, new_prefix, docs_map):
-                        raise ValidationError(
-                            
-                                f"cannot move {rid}: link from {rid_for(doc, other_id)} would violate "
-                                "document hierarchy"
-                            
-                        )
-                    link.rid = new_rid
-                    link.revision = None
-                    link.suspect = False
-                    changed = True
-                new_links.append(link.to_dict())
-            if changed:
-                updated = dict(item_data)
-                updated["links"] = new_links
-                referencing_updates.append((dir_path, doc, updated))
+            if link.rid == rid:
+                if not is_ancestor(doc.prefix, new_prefix, docs_map):
+                    raise ValidationError(
+                        f"cannot move {rid}: link from {rid_for(doc, other_id)} "
+                        "would violate document hierarchy"
+                    )
+                link.rid = new_rid
+                link.revision = None
+                link.suspect = False
+            new_links.append(link.to_dict())
+        updated = dict(item_data)
+        updated["links"] = new_links
+        referencing_updates.append((root_path / pfx, doc, updated))
 
     req = Requirement.from_mapping(
         updated_payload, doc_prefix=new_prefix, rid=new_rid
     )
     _update_link_suspicions(root_path, docs_map, req)
-    save_item(dst_dir, dst_doc, req.to_mapping(), docs=docs_map)
+    save_item(dst_dir, dst_doc, req.to_mapping(), docs=docs_map, index=index)
 
     for directory, doc, item_payload in referencing_updates:
-        save_item(directory, doc, item_payload, docs=docs_map)
+        save_item(directory, doc, item_payload, docs=docs_map, index=index)
 
     bump_document_revision(root_path, prefix, docs_map)
     bump_document_revision(root_path, new_prefix, docs_map)
@@ -746,6 +948,8 @@ def move_requirement(
     src_path = item_path(src_directory, src_doc, item_id)
     with suppress(FileNotFoundError):  # pragma: no cover - defensive
         src_path.unlink()
+    if index is not None:
+        index.forget(prefix, item_id)
 
     return req
 
@@ -755,6 +959,7 @@ def delete_requirement(
     rid: str,
     *,
     docs: Mapping[str, Document] | None = None,
+    index: RequirementIndex | None = None,
 ) -> str:
     """Delete requirement ``rid`` and return its canonical identifier."""
     root_path = Path(root)
@@ -775,7 +980,7 @@ def delete_requirement(
         raise ValidationError("revision must be positive")
     from .links import delete_item  # local import to avoid cycle
 
-    deleted = delete_item(root_path, canonical_rid, docs_map)
+    deleted = delete_item(root_path, canonical_rid, docs_map, index=index)
     if not deleted:  # pragma: no cover - defensive
         raise RequirementNotFoundError(canonical_rid)
     prefix, _ = parse_rid(canonical_rid)
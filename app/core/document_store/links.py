@@ -10,13 +10,15 @@ from collections.abc import Iterable, Mapping
 from ..model import Link, Requirement
 from .types import Document, ValidationError
 from .documents import is_ancestor, load_documents
+from .bulk import LoadOptions, read_json_files
+from .index import RequirementIndex, scan_item_files
 from .items import (
     _ensure_documents,
+    _iter_referencing_items,
     _update_link_suspicions,
     _resolve_requirement,
     item_path,
     list_item_ids,
-    load_item,
     parse_rid,
     rid_for,
     save_item,
@@ -63,14 +65,23 @@ def validate_item_links(
             raise ValidationError(f"links[{index}].rid: linked item not found: {rid}")
 
 
-def iter_links(root: str | Path) -> Iterable[tuple[str, str]]:
-    """Yield pairs of (child_rid, parent_rid) for all links under ``root``."""
+def iter_links(
+    root: str | Path, *, load_options: LoadOptions | None = None
+) -> Iterable[tuple[str, str]]:
+    """Yield pairs of (child_rid, parent_rid) for all links under ``root``.
+
+    ``load_options`` decodes the item files of each document with a worker
+    pool; the yielded order does not depend on it.
+    """
     docs = load_documents(root)
     for prefix in sorted(docs):
         doc = docs[prefix]
-        directory = Path(root) / prefix
-        for item_id in sorted(list_item_ids(directory, doc)):
-            data, _ = load_item(directory, doc, item_id)
+        files = scan_item_files(Path(root) / prefix)
+        item_ids = sorted(files)
+        payloads = read_json_files(
+            [files[item_id][0] for item_id in item_ids], load_options
+        )
+        for item_id, data in zip(item_ids, payloads, strict=True):
             rid = rid_for(doc, item_id)
             raw_links = data.get("links")
             if not isinstance(raw_links, list):
@@ -90,8 +101,14 @@ def plan_delete_item(
     root: str | Path,
     rid: str,
     docs: Mapping[str, Document] | None = None,
+    *,
+    index: RequirementIndex | None = None,
 ) -> tuple[bool, list[str]]:
-    """Return items referencing ``rid`` without deleting anything."""
+    """Return items referencing ``rid`` without deleting anything.
+
+    ``index`` answers the lookup from its backlink table instead of reading
+    every item of every document.
+    """
     root_path = Path(root)
     if docs is None:
         docs = load_documents(root_path)
@@ -105,22 +122,12 @@ def plan_delete_item(
     if not item_path(root_path / prefix, doc, item_id).exists():
         return False, []
 
-    affected: list[str] = []
-    for pfx, d in docs.items():
-        dir_path = root_path / pfx
-        for other_id in list_item_ids(dir_path, d):
-            data, _ = load_item(dir_path, d, other_id)
-            links = data.get("links")
-            if not isinstance(links, list):
-                continue
-            for entry in links:
-                try:
-                    link = Link.from_raw(entry)
-                except (TypeError, ValueError):  # pragma: no cover - defensive
-                    continue
-                if link.rid == rid:
-                    affected.append(rid_for(d, other_id))
-                    break
+    affected = [
+        rid_for(d, other_id)
+        for _pfx, d, other_id, _data in _iter_referencing_items(
+            root_path, {rid}, docs, index
+        )
+    ]
     return True, sorted(affected)
 
 
@@ -155,8 +162,13 @@ def delete_item(
     root: str | Path,
     rid: str,
     docs: Mapping[str, Document] | None = None,
+    *,
+    index: RequirementIndex | None = None,
 ) -> bool:
-    """Remove requirement ``rid`` and drop links pointing to it."""
+    """Remove requirement ``rid`` and drop links pointing to it.
+
+    ``index`` restricts the link cleanup to the items that reference ``rid``.
+    """
     root_path = Path(root)
     if docs is None:
         docs = load_documents(root_path)
@@ -174,55 +186,67 @@ def delete_item(
     except FileNotFoundError:
         return False
 
-    for pfx, d in docs.items():
-        dir_path = root_path / pfx
-        for other_id in list_item_ids(dir_path, d):
-            data, _ = load_item(dir_path, d, other_id)
-            links = data.get("links")
-            if not isinstance(links, list):
-                continue
-            changed = False
-            new_links: list[dict[str, Any]] = []
-            for entry in links:
-                try:
-                    link = Link.from_raw(entry)
-                except (TypeError, ValueError):  # pragma: no cover - defensive
-                    new_links.append(entry)
-                    continue
-                if link.rid == rid:
-                    changed = True
-                    continue
-                new_links.append(link.to_dict())
-            if changed:
-                data["links"] = new_links
-                save_item(dir_path, d, data, docs=docs)
+    if index is not None:
+        index.forget(prefix, item_id)
+
+    _drop_links_to(root_path, {rid}, docs, docs, index)
     return True
 
 
+def _drop_links_to(
+    root: Path,
+    rids: set[str],
+    docs: Mapping[str, Document],
+    sources: Mapping[str, Document],
+    index: RequirementIndex | None,
+) -> None:
+    """Remove links to ``rids`` from the items of ``sources`` referencing them."""
+    referencing = list(_iter_referencing_items(root, rids, sources, index))
+    for pfx, d, _other_id, data in referencing:
+        new_links: list[dict[str, Any]] = []
+        for entry in data["links"]:
+            try:
+                link = Link.from_raw(entry)
+            except (TypeError, ValueError):  # pragma: no cover - defensive
+                new_links.append(entry)
+                continue
+            if link.rid in rids:
+                continue
+            new_links.append(link.to_dict())
+        data["links"] = new_links
+        save_item(root / pfx, d, data, docs=docs, index=index)
+
+
 def delete_document(
     root: str | Path,
     prefix: str,
     docs: Mapping[str, Document] | None = None,
+    *,
+    index: RequirementIndex | None = None,
 ) -> bool:
-    """Remove document ``prefix`` and all its items."""
+    """Remove document ``prefix``, its descendants and all their items.
+
+    Links to the removed items are dropped from the remaining documents in a
+    single pass: with ``index`` its backlink table is synchronised once for
+    the whole subtree, otherwise every remaining item is read once.
+    """
     root_path = Path(root)
     if docs is None:
         docs = load_documents(root_path)
-    doc = docs.get(prefix)
-    if doc is None:
+    if prefix not in docs:
         return False
 
-    for pfx, d in list(docs.items()):
-        if d.parent == prefix:
-            delete_document(root_path, pfx, docs)
-
-    directory = root_path / prefix
-    for item_id in list(list_item_ids(directory, doc)):
-        rid = rid_for(doc, item_id)
-        delete_item(root_path, rid, docs)
-
-    shutil.rmtree(directory, ignore_errors=True)
-    docs.pop(prefix, None)
+    removed_prefixes, removed_rids = plan_delete_document(root_path, prefix, docs)
+    removed = set(removed_prefixes)
+    remaining = {pfx: d for pfx, d in docs.items() if pfx not in removed}
+    if removed_rids:
+        _drop_links_to(root_path, set(removed_rids), docs, remaining, index)
+
+    for pfx in removed_prefixes:
+        shutil.rmtree(root_path / pfx, ignore_errors=True)
+        docs.pop(pfx, None)
+        if index is not None:
+            index.forget_document(pfx)
     return True
 
 
@@ -233,6 +257,7 @@ def link_requirements(
     derived_rid: str,
     link_type: str,
     docs: Mapping[str, Document] | None = None,
+    index: RequirementIndex | None = None,
 ) -> Requirement:
     """Link ``derived_rid`` to ``source_rid`` when hierarchy permits."""
     if link_type != "parent":
@@ -320,5 +345,7 @@ def link_requirements(
         rid=derived_canonical_rid,
     )
     _update_link_suspicions(root_path, docs_map, req)
-    save_item(derived_dir, derived_doc, req.to_mapping(), docs=docs_map)
+    save_item(
+        derived_dir, derived_doc, req.to_mapping(), docs=docs_map, index=index
+    )
     return req
@@ -0,0 +1,126 @@
+"""Per-root table of requirement revisions used for link suspicion checks."""
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .cache import StatKey
+from .index import _payload_revision, _read_json
+from .layout import canonical_item_name
+
+if TYPE_CHECKING:  # pragma: no cover - import for type checking only
+    from .index import RequirementIndex
+
+__all__ = ["RevisionTable", "revision_table"]
+
+
+class RevisionTable:
+    """Map ``(prefix, item_id)`` to the revision stored in the item file.
+
+    Entries remember the :data:`StatKey` of the file they were read from and
+    are re-read only when a ``stat`` shows the file changed, so resolving the
+    revision of a link target costs a single ``stat`` call once the table is
+    warm. Bulk loads and :func:`save_item` feed the table directly and a
+    :class:`RequirementIndex` can seed it with its persisted revisions.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        """Create an empty table for requirements ``root``."""
+        self.root = Path(root)
+        self._entries: dict[tuple[str, int], tuple[StatKey, int | None]] = {}
+        self._seeded: set[Path] = set()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of known revisions."""
+        with self._lock:
+            return len(self._entries)
+
+    def revision(self, prefix: str, item_id: int) -> int | None:
+        """Return the revision of ``item_id`` in ``prefix`` or ``None``.
+
+        ``None`` is returned for missing files and invalid revisions.
+        """
+        path = self.root / prefix / "items" / canonical_item_name(item_id)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            self.discard(prefix, item_id)
+            return None
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+        key = (prefix, item_id)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] == stat_key:
+            return entry[1]
+        try:
+            data = _read_json(path)
+        except FileNotFoundError:
+            self.discard(prefix, item_id)
+            return None
+        revision = _payload_revision(data)
+        with self._lock:
+            self._entries[key] = (stat_key, revision)
+        return revision
+
+    def record(
+        self, prefix: str, item_id: int, stat: StatKey, revision: int | None
+    ) -> None:
+        """Remember ``revision`` read from the item file with ``stat``."""
+        with self._lock:
+            self._entries[(prefix, item_id)] = (stat, revision)
+
+    def record_path(
+        self, prefix: str, item_id: int, path: Path, payload: Mapping[str, Any]
+    ) -> None:
+        """Remember the revision of ``payload`` just written to ``path``."""
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            self.discard(prefix, item_id)
+            return
+        self.record(
+            prefix,
+            item_id,
+            (stat.st_mtime_ns, stat.st_size),
+            _payload_revision(dict(payload)),
+        )
+
+    def discard(self, prefix: str, item_id: int) -> None:
+        """Forget the revision of ``item_id`` in ``prefix``."""
+        with self._lock:
+            self._entries.pop((prefix, item_id), None)
+
+    def seed(self, index: RequirementIndex) -> None:
+        """Load revisions persisted by ``index`` once per database."""
+        with self._lock:
+            if index.path in self._seeded:
+                return
+            self._seeded.add(index.path)
+        entries = index.revision_entries()
+        with self._lock:
+            for key, (mtime_ns, size, revision) in entries.items():
+                self._entries.setdefault(key, ((mtime_ns, size), revision))
+
+    def clear(self) -> None:
+        """Forget every known revision."""
+        with self._lock:
+            self._entries.clear()
+            self._seeded.clear()
+
+
+_TABLES: dict[str, RevisionTable] = {}
+_TABLES_LOCK = threading.Lock()
+
+
+def revision_table(root: str | Path) -> RevisionTable:
+    """Return the shared :class:`RevisionTable` of requirements ``root``."""
+    key = os.path.abspath(root)
+    with _TABLES_LOCK:
+        table = _TABLES.get(key)
+        if table is None:
+            table = _TABLES[key] = RevisionTable(key)
+        return table
@@ -1,12 +1,26 @@
-"""Sorting helpers for requirement exports."""
+"""Sorting helpers shared by requirement views, exports and the CLI."""
 from __future__ import annotations
 
-from collections.abc import Iterable, Sequence
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import asdict, is_dataclass
+from enum import Enum
+from typing import Any
 
 from .model import Requirement
+from .search_index import search_key
 from ..util.sorting import natural_sort_key
 
-__all__ = ["sort_requirements_for_cards"]
+__all__ = [
+    "CARD_SORT_MODES",
+    "SortKeyCache",
+    "card_sort_key",
+    "column_sort_value",
+    "sort_requirements_for_cards",
+]
+
+CARD_SORT_MODES = ("id", "labels", "source", "title", "context_docs")
+
+SortKeyFunc = Callable[[Requirement, str], Any]
 
 
 def _labels_sort_key(labels: Sequence[str]) -> tuple[int, tuple[str, ...]]:
@@ -16,10 +30,150 @@ def _labels_sort_key(labels: Sequence[str]) -> tuple[int, tuple[str, ...]]:
     return (1, ())
 
 
+def card_sort_key(requirement: Requirement, sort_mode: str) -> tuple:
+    """Return the card-export key of ``requirement`` for ``sort_mode``.
+
+    Modes outside :data:`CARD_SORT_MODES` sort by identifier.
+    """
+    if sort_mode == "labels":
+        marker, labels_key = _labels_sort_key(requirement.labels)
+        return (marker, labels_key, requirement.id)
+    if sort_mode == "source":
+        return (natural_sort_key(requirement.source), requirement.id)
+    if sort_mode == "title":
+        return (requirement.title.strip().lower(), requirement.id)
+    if sort_mode == "context_docs":
+        docs = getattr(requirement, "context_docs", []) or []
+        normalized = tuple(
+            natural_sort_key(str(doc).strip().lower()) for doc in docs if str(doc).strip()
+        )
+        return (normalized, requirement.id)
+    return (requirement.id,)
+
+
+def column_sort_value(
+    requirement: Requirement,
+    field: str,
+    *,
+    label_group_levels: Mapping[str, int] | None = None,
+) -> Any:
+    """Return the value used to order the requirement list by column ``field``.
+
+    ``label_group_levels`` maps label names to grouping levels 1–3; the
+    ``labels`` column sorts by the first label of each level.
+    """
+    value = getattr(requirement, field, "")
+    if isinstance(value, Enum):
+        value = value.value
+    if field == "id":
+        try:
+            return int(value)
+        except Exception:
+            return 0
+    if field == "source":
+        return natural_sort_key(value)
+    if field == "labels" and isinstance(value, list):
+        levels = label_group_levels or {}
+        by_level: dict[int, list[str]] = {1: [], 2: [], 3: []}
+        for label in value:
+            level = levels.get(str(label), 0)
+            if level in by_level:
+                by_level[level].append(str(label))
+        key_parts: list[tuple[int, str]] = []
+        for level in (1, 2, 3):
+            candidates = sorted(by_level[level], key=str.casefold)
+            if candidates:
+                key_parts.append((0, candidates[0]))
+            else:
+                key_parts.append((1, ""))
+        return tuple(key_parts)
+    if isinstance(value, list):
+        return "|".join(str(v) for v in value)
+    if is_dataclass(value):
+        return str(asdict(value))
+    return value
+
+
+class SortKeyCache:
+    """Memoize sort keys of requirements per field.
+
+    Entries are stored by ``(doc_prefix, id)`` together with the requirement
+    object and its ``revision``. A lookup with another object or revision
+    recomputes the keys, so replaced requirements never reuse stale values.
+    Owners that edit requirements in place must call :meth:`invalidate`.
+    With ``match_equal`` an equal copy of the stored requirement also hits,
+    for owners such as :class:`~app.services.requirements.RequirementsService`
+    that hand out fresh copies on every read.
+    """
+
+    def __init__(
+        self, key_func: SortKeyFunc = card_sort_key, *, match_equal: bool = False
+    ) -> None:
+        """Cache keys produced by ``key_func(requirement, field)``."""
+        self._key_func = key_func
+        self._match_equal = match_equal
+        self._entries: dict[tuple[str, int], tuple[Requirement, Any, dict[str, Any]]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of requirements with cached keys."""
+        return len(self._entries)
+
+    def key(self, requirement: Requirement, field: str) -> Any:
+        """Return the sort key of ``requirement`` for ``field``."""
+        slot = search_key(requirement)
+        revision = getattr(requirement, "revision", None)
+        entry = self._entries.get(slot)
+        if (
+            entry is None
+            or entry[1] != revision
+            or (
+                entry[0] is not requirement
+                and not (self._match_equal and entry[0] == requirement)
+            )
+        ):
+            entry = (requirement, revision, {})
+            self._entries[slot] = entry
+        keys = entry[2]
+        try:
+            return keys[field]
+        except KeyError:
+            value = keys[field] = self._key_func(requirement, field)
+            return value
+
+    def sort(
+        self,
+        requirements: Iterable[Requirement],
+        field: str,
+        *,
+        reverse: bool = False,
+    ) -> list[Requirement]:
+        """Return ``requirements`` stably sorted by their cached ``field`` keys."""
+        return sorted(
+            requirements, key=lambda req: self.key(req, field), reverse=reverse
+        )
+
+    def invalidate(self, requirement: Requirement | tuple[str, int]) -> None:
+        """Forget keys of ``requirement`` (or its ``(doc_prefix, id)``)."""
+        if isinstance(requirement, tuple):
+            self._entries.pop(requirement, None)
+        else:
+            self._entries.pop(search_key(requirement), None)
+
+    def discard_field(self, field: str) -> None:
+        """Forget keys of ``field`` for every requirement."""
+        for _requirement, _revision, keys in self._entries.values():
+            keys.pop(field, None)
+
+    def clear(self) -> None:
+        """Forget every cached key."""
+        self._entries.clear()
+
+
 def sort_requirements_for_cards(
     requirements: Iterable[Requirement],
     *,
     sort_mode: str,
+    cache: SortKeyCache | None = None,
 ) -> list[Requirement]:
     """Return requirements sorted for card-style exports.
 
@@ -29,33 +183,12 @@ def sort_requirements_for_cards(
     - ``source``: source text, then requirement identifier.
     - ``title``: title text, then requirement identifier.
     - ``context_docs``: linked context markdown paths, then requirement identifier.
-    """
-    prepared = list(requirements)
-
-    def key_by_id(requirement: Requirement) -> tuple[int]:
-        return (requirement.id,)
-
-    def key_by_labels(requirement: Requirement) -> tuple[int, tuple[str, ...], int]:
-        marker, labels_key = _labels_sort_key(requirement.labels)
-        return (marker, labels_key, requirement.id)
-
-    def key_by_source(requirement: Requirement) -> tuple[object, int]:
-        return (natural_sort_key(requirement.source), requirement.id)
-
-    def key_by_title(requirement: Requirement) -> tuple[str, int]:
-        return (requirement.title.strip().lower(), requirement.id)
 
-    def key_by_context_docs(requirement: Requirement) -> tuple[tuple[object, ...], int]:
-        docs = getattr(requirement, "context_docs", []) or []
-        normalized = tuple(natural_sort_key(str(doc).strip().lower()) for doc in docs if str(doc).strip())
-        return (normalized, requirement.id)
-
-    key_lookup = {
-        "labels": key_by_labels,
-        "source": key_by_source,
-        "title": key_by_title,
-        "context_docs": key_by_context_docs,
-        "id": key_by_id,
-    }
-    key_func = key_lookup.get(sort_mode, key_by_id)
-    return sorted(prepared, key=key_func)
+    ``cache`` reuses keys computed by earlier calls; it must have been created
+    with :func:`card_sort_key`.
+    """
+    if sort_mode not in CARD_SORT_MODES:
+        sort_mode = "id"
+    if cache is None:
+        cache = SortKeyCache(card_sort_key)
+    return cache.sort(requirements, sort_mode)
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import Collection, Iterable, Mapping, Sequence
 
 from .model import Requirement, Status
 from .markdown_utils import strip_markdown
+from .search_index import TextSearchIndex, search_key
 
 # Fields allowed for text search
 SEARCHABLE_FIELDS = {
@@ -69,11 +70,15 @@ def search_text(
     requirements: Iterable[Requirement],
     query: str,
     fields: Sequence[str],
+    *,
+    text_index: TextSearchIndex | None = None,
 ) -> list[Requirement]:
     """Perform case-insensitive text search over selected fields.
 
     ``fields`` outside of :data:`SEARCHABLE_FIELDS` are ignored. If no ``fields``
-    remain or ``query`` is empty, the original list is returned.
+    remain or ``query`` is empty, the original list is returned. When
+    ``text_index`` is supplied, requirements it covers are resolved through the
+    index and only the remaining ones are scanned.
     """
     reqs = list(requirements)
     if not query:
@@ -82,8 +87,19 @@ def search_text(
     if not fields:
         return reqs
     q = query.lower()
+    matched = (
+        text_index.match(query, fields)
+        if text_index is not None and text_index.fields.issuperset(fields)
+        else None
+    )
     result: list[Requirement] = []
     for r in reqs:
+        if matched is not None:
+            key = search_key(r)
+            if key in text_index:
+                if key in matched:
+                    result.append(r)
+                continue
         for field in fields:
             value = getattr(r, field, None)
             if not value:
@@ -100,6 +116,8 @@ def search_text(
 def filter_text_fields(
     requirements: Iterable[Requirement],
     queries: Mapping[str, str],
+    *,
+    text_index: TextSearchIndex | None = None,
 ) -> list[Requirement]:
     """Filter requirements by individual field queries.
 
@@ -107,6 +125,7 @@ def filter_text_fields(
     present in the corresponding field. Fields outside of
     :data:`SEARCHABLE_FIELDS` or empty query strings are ignored. A requirement
     must satisfy *all* provided field queries to be included in the result.
+    ``text_index`` accelerates the lookup like in :func:`search_text`.
     """
     reqs = list(requirements)
     if not queries:
@@ -115,8 +134,19 @@ def filter_text_fields(
         if not query or field not in SEARCHABLE_FIELDS:
             continue
         q = query.lower()
+        matched = (
+            text_index.match_field(field, query)
+            if text_index is not None and field in text_index.fields
+            else None
+        )
         filtered: list[Requirement] = []
         for req in reqs:
+            if matched is not None:
+                key = search_key(req)
+                if key in text_index:
+                    if key in matched:
+                        filtered.append(req)
+                    continue
             value = getattr(req, field, "")
             text = str(value)
             if field in MARKDOWN_FIELDS:
@@ -132,17 +162,30 @@ def filter_is_derived(requirements: Iterable[Requirement]) -> list[Requirement]:
     return [r for r in requirements if getattr(r, "links", [])]
 
 
-def filter_has_derived(
-    requirements: Iterable[Requirement],
-    all_requirements: Iterable[Requirement],
-) -> list[Requirement]:
-    """Return requirements that are referenced by other requirements."""
-    reqs = list(requirements)
+def linked_rids(requirements: Iterable[Requirement]) -> set[str]:
+    """Return identifiers of requirements referenced by ``requirements``."""
     sources: set[str] = set()
-    for req in all_requirements:
+    for req in requirements:
         for parent in getattr(req, "links", []):
             parent_rid = getattr(parent, "rid", parent)
             sources.add(str(parent_rid))
+    return sources
+
+
+def filter_has_derived(
+    requirements: Iterable[Requirement],
+    all_requirements: Iterable[Requirement] = (),
+    *,
+    referenced: Collection[str] | None = None,
+) -> list[Requirement]:
+    """Return requirements that are referenced by other requirements.
+
+    ``referenced`` supplies precomputed link targets (for example from
+    :meth:`RequirementIndex.linked_rids`) so ``all_requirements`` need not be
+    scanned.
+    """
+    reqs = list(requirements)
+    sources = linked_rids(all_requirements) if referenced is None else referenced
 
     result: list[Requirement] = []
     for req in reqs:
@@ -162,21 +205,26 @@ def search(
     is_derived: bool = False,
     has_derived: bool = False,
     field_queries: Mapping[str, str] | None = None,
+    text_index: TextSearchIndex | None = None,
+    referenced: Collection[str] | None = None,
 ) -> list[Requirement]:
     """Filter requirements by ``labels`` and ``query`` across ``fields``.
 
     ``fields`` defaults to :data:`SEARCHABLE_FIELDS` when ``query`` is provided.
     ``match_all`` controls whether all ``labels`` must be present or any of them
-    is sufficient.
+    is sufficient. ``text_index`` optionally accelerates the text filters and
+    ``referenced`` the ``has_derived`` filter.
     """
     all_reqs = list(requirements)
     reqs = filter_by_labels(all_reqs, labels or [], match_all=match_all)
     if query:
-        reqs = search_text(reqs, query, fields or list(SEARCHABLE_FIELDS))
+        reqs = search_text(
+            reqs, query, fields or list(SEARCHABLE_FIELDS), text_index=text_index
+        )
     if field_queries:
-        reqs = filter_text_fields(reqs, field_queries)
+        reqs = filter_text_fields(reqs, field_queries, text_index=text_index)
     if is_derived:
         reqs = filter_is_derived(reqs)
     if has_derived:
-        reqs = filter_has_derived(reqs, all_reqs)
+        reqs = filter_has_derived(reqs, all_reqs, referenced=referenced)
     return reqs
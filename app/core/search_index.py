@@ -0,0 +1,230 @@
+"""Inverted full-text index accelerating requirement substring search."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Sequence
+
+from .markdown_utils import strip_markdown
+from .model import Requirement
+
+__all__ = ["TextSearchIndex", "normalize_field_text", "search_key"]
+
+_WORD_RE = re.compile(r"\w+")
+_GRAM = 3
+
+SearchKey = tuple[str, int]
+
+
+def search_key(requirement: Requirement) -> SearchKey:
+    """Return the identity used by :class:`TextSearchIndex` for ``requirement``."""
+    return (getattr(requirement, "doc_prefix", "") or "", int(requirement.id))
+
+
+def normalize_field_text(
+    field: str, value: object, markdown_fields: Iterable[str]
+) -> str:
+    """Return case-folded searchable text of ``value`` stored in ``field``."""
+    text = str(value)
+    if field in markdown_fields:
+        text = strip_markdown(text)
+    return text.lower()
+
+
+def _grams(word: str) -> set[str]:
+    return {word[i : i + _GRAM] for i in range(len(word) - _GRAM + 1)}
+
+
+class TextSearchIndex:
+    """Map words of searchable fields to requirements for substring queries.
+
+    Field text is markdown-stripped and lower-cased once when a requirement is
+    added. Each field keeps word postings, and the shared vocabulary carries a
+    trigram index, so a query only inspects words that can contain it.
+    Candidates are verified with the same ``query in text`` test as the plain
+    scan in :mod:`app.core.search`, which keeps results identical. Callers must
+    :meth:`update` or :meth:`remove` requirements whenever they change.
+    """
+
+    def __init__(
+        self,
+        requirements: Iterable[Requirement] = (),
+        *,
+        fields: Iterable[str] | None = None,
+        markdown_fields: Iterable[str] | None = None,
+    ) -> None:
+        """Index ``requirements`` over ``fields`` (searchable fields by default)."""
+        from .search import MARKDOWN_FIELDS, SEARCHABLE_FIELDS
+
+        self.fields = frozenset(SEARCHABLE_FIELDS if fields is None else fields)
+        self._markdown_fields = frozenset(
+            MARKDOWN_FIELDS if markdown_fields is None else markdown_fields
+        )
+        self._texts: dict[SearchKey, dict[str, str]] = {}
+        self._present: dict[SearchKey, frozenset[str]] = {}
+        self._postings: dict[str, dict[str, set[SearchKey]]] = {
+            field: {} for field in self.fields
+        }
+        self._word_refs: dict[str, int] = {}
+        self._gram_words: dict[str, set[str]] = {}
+        for requirement in requirements:
+            self.update(requirement)
+
+    def __len__(self) -> int:
+        """Return the number of indexed requirements."""
+        return len(self._texts)
+
+    def __contains__(self, key: object) -> bool:
+        """Return ``True`` when ``key`` (see :func:`search_key`) is indexed."""
+        return key in self._texts
+
+    # maintenance -----------------------------------------------------
+    def update(self, requirement: Requirement) -> None:
+        """Index ``requirement`` replacing any previous entry with the same key."""
+        key = search_key(requirement)
+        self._discard(key)
+        texts: dict[str, str] = {}
+        present: set[str] = set()
+        for field in self.fields:
+            value = getattr(requirement, field, "")
+            if value:
+                present.add(field)
+            text = normalize_field_text(field, value, self._markdown_fields)
+            texts[field] = text
+            postings = self._postings[field]
+            for word in set(_WORD_RE.findall(text)):
+                keys = postings.get(word)
+                if keys is None:
+                    keys = postings[word] = set()
+                keys.add(key)
+                self._retain_word(word)
+        self._texts[key] = texts
+        self._present[key] = frozenset(present)
+
+    def remove(self, requirement: Requirement | SearchKey) -> None:
+        """Drop ``requirement`` (or its :func:`search_key`) from the index."""
+        if isinstance(requirement, tuple):
+            self._discard(requirement)
+        else:
+            self._discard(search_key(requirement))
+
+    def rebuild(self, requirements: Iterable[Requirement]) -> None:
+        """Replace the whole index content with ``requirements``."""
+        self._texts.clear()
+        self._present.clear()
+        for postings in self._postings.values():
+            postings.clear()
+        self._word_refs.clear()
+        self._gram_words.clear()
+        for requirement in requirements:
+            self.update(requirement)
+
+    # queries ---------------------------------------------------------
+    def field_text(self, key: SearchKey, field: str) -> str | None:
+        """Return normalised text indexed for ``field`` of ``key``."""
+        texts = self._texts.get(key)
+        if texts is None:
+            return None
+        return texts.get(field)
+
+    def match(self, query: str, fields: Sequence[str]) -> set[SearchKey]:
+        """Return keys whose non-empty ``fields`` contain ``query``.
+
+        Mirrors :func:`app.core.search.search_text` for indexed requirements.
+        """
+        q = query.lower()
+        matched: set[SearchKey] = set()
+        for field in fields:
+            if field not in self.fields:
+                continue
+            for key in self._candidates(field, q):
+                if key in matched or field not in self._present[key]:
+                    continue
+                if q in self._texts[key][field]:
+                    matched.add(key)
+        return matched
+
+    def match_field(self, field: str, query: str) -> set[SearchKey]:
+        """Return keys whose ``field`` text contains ``query``.
+
+        Mirrors one step of :func:`app.core.search.filter_text_fields`.
+        """
+        q = query.lower()
+        return {
+            key
+            for key in self._candidates(field, q)
+            if q in self._texts[key][field]
+        }
+
+    # internals -------------------------------------------------------
+    def _candidates(self, field: str, q: str) -> Iterable[SearchKey]:
+        tokens = set(_WORD_RE.findall(q))
+        if not tokens:
+            return self._texts.keys()
+        postings = self._postings[field]
+        candidates: set[SearchKey] | None = None
+        # Every word-character run of ``q`` lies inside one word of any text
+        # containing ``q``, so each token narrows the candidate set.
+        for token in sorted(tokens, key=len, reverse=True):
+            keys: set[SearchKey] = set()
+            for word in self._words_containing(token):
+                keys.update(postings.get(word, ()))
+            candidates = keys if candidates is None else candidates & keys
+            if not candidates:
+                return ()
+        return candidates or ()
+
+    def _words_containing(self, token: str) -> Iterable[str]:
+        if len(token) < _GRAM:
+            return [word for word in self._word_refs if token in word]
+        words: set[str] | None = None
+        grams = sorted(_grams(token), key=lambda g: len(self._gram_words.get(g, ())))
+        for gram in grams:
+            bucket = self._gram_words.get(gram)
+            if not bucket:
+                return ()
+            words = set(bucket) if words is None else words & bucket
+            if not words:
+                return ()
+        return [word for word in words or () if token in word]
+
+    def _retain_word(self, word: str) -> None:
+        count = self._word_refs.get(word, 0)
+        self._word_refs[word] = count + 1
+        if count:
+            return
+        for gram in _grams(word):
+            bucket = self._gram_words.get(gram)
+            if bucket is None:
+                bucket = self._gram_words[gram] = set()
+            bucket.add(word)
+
+    def _release_word(self, word: str) -> None:
+        count = self._word_refs.get(word, 0) - 1
+        if count > 0:
+            self._word_refs[word] = count
+            return
+        self._word_refs.pop(word, None)
+        for gram in _grams(word):
+            bucket = self._gram_words.get(gram)
+            if bucket is None:
+                continue
+            bucket.discard(word)
+            if not bucket:
+                del self._gram_words[gram]
+
+    def _discard(self, key: SearchKey) -> None:
+        texts = self._texts.pop(key, None)
+        self._present.pop(key, None)
+        if texts is None:
+            return
+        for field, text in texts.items():
+            postings = self._postings[field]
+            for word in set(_WORD_RE.findall(text)):
+                keys = postings.get(word)
+                if keys is None:
+                    continue
+                keys.discard(key)
+                if not keys:
+                    del postings[word]
+                self._release_word(word)
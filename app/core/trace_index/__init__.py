@@ -3,6 +3,7 @@
 from .builder import build_trace_index
 from .cache import (
     CACHE_RELATIVE_PATH,
+    COMPACT_CACHE_RELATIVE_PATH,
     TraceIndexCacheRead,
     cache_path,
     read_trace_index_cache,
@@ -10,21 +11,37 @@ from .cache import (
     write_trace_index_cache,
 )
 from .export import (
+    ARTIFACT_LINKS_HEADER,
+    iter_artifact_matrix_rows,
+    render_artifact_links_csv,
     render_artifact_matrix_csv,
     render_artifact_matrix_html,
     render_trace_index_report_html,
+    write_artifact_links_csv,
+    write_artifact_matrix_csv,
+    write_artifact_matrix_html,
+    write_trace_index_report_html,
 )
 from .config import (
+    CACHE_ENCODINGS,
     TraceIndexConfig,
     cache_metadata,
     collect_input_files,
     config_hash,
     input_fingerprint,
+    input_manifest,
     is_index_stale,
+    manifest_fingerprint,
+)
+from .parse_cache import (
+    PARSE_CACHE_RELATIVE_PATH,
+    TraceParseCache,
+    parse_cache_path,
 )
 from .parse_code import CodeParseResult, parse_code_file, parse_code_text
 from .parse_results import (
     ResultParseResult,
+    iter_junit_results,
     normalize_status,
     parse_junit_result_text,
     parse_result_file,
@@ -37,11 +54,14 @@ from .matrix import (
     TraceArtifactMatrixColumn,
     build_artifact_trace_matrix,
 )
+from .walk import InputFiles, walk_input_files
 from .model import (
     GENERATOR,
     GENERATOR_VERSION,
     SCHEMA_VERSION,
     CodeLocation,
+    InputFileStat,
+    LazySequence,
     TestCaseRef,
     TestResultRef,
     TestRunRef,
@@ -58,19 +78,33 @@ __all__ = [
     "GENERATOR_VERSION",
     "SCHEMA_VERSION",
     "CodeLocation",
+    "CACHE_ENCODINGS",
     "CACHE_RELATIVE_PATH",
+    "COMPACT_CACHE_RELATIVE_PATH",
+    "PARSE_CACHE_RELATIVE_PATH",
     "CodeParseResult",
+    "InputFileStat",
+    "InputFiles",
+    "LazySequence",
     "TestCaseRef",
     "ResultParseResult",
+    "ARTIFACT_LINKS_HEADER",
+    "iter_artifact_matrix_rows",
+    "render_artifact_links_csv",
     "render_artifact_matrix_csv",
     "render_artifact_matrix_html",
     "render_trace_index_report_html",
+    "write_artifact_links_csv",
+    "write_artifact_matrix_csv",
+    "write_artifact_matrix_html",
+    "write_trace_index_report_html",
     "TestParseResult",
     "TestResultRef",
     "TestRunRef",
     "TraceIndex",
     "TraceIndexCacheRead",
     "TraceIndexConfig",
+    "TraceParseCache",
     "TraceArtifactMatrix",
     "TraceArtifactMatrixCell",
     "TraceArtifactMatrixColumn",
@@ -83,13 +117,17 @@ __all__ = [
     "collect_input_files",
     "config_hash",
     "input_fingerprint",
+    "input_manifest",
     "is_index_stale",
+    "manifest_fingerprint",
     "read_trace_index_cache",
     "read_trace_index_cache_for_config",
     "write_trace_index_cache",
+    "parse_cache_path",
     "parse_code_file",
     "parse_code_text",
     "normalize_status",
+    "iter_junit_results",
     "parse_junit_result_text",
     "parse_result_file",
     "parse_result_text",
@@ -98,4 +136,5 @@ __all__ = [
     "make_code_location_key",
     "make_test_result_key",
     "make_test_run_key",
+    "walk_input_files",
 ]
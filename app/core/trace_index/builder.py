@@ -1,14 +1,23 @@
 """Build a complete trace index from requirements and external artifacts."""
 from __future__ import annotations
 
-from collections.abc import Iterable
+import logging
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import replace
+from functools import partial
 from pathlib import Path
+from typing import Any, Self
 
 from app.core.document_store import load_requirements, parse_rid
 from app.core.model import Verification, normalized_verification_methods
 
-from .config import TraceIndexConfig, cache_metadata
+from .config import (
+    UNREADABLE_HASH,
+    TraceIndexConfig,
+    cache_metadata,
+    input_manifest,
+)
 from .model import (
     CodeLocation,
     TestCaseRef,
@@ -18,21 +27,125 @@ from .model import (
     TraceIssue,
     TraceRequirementRef,
 )
+from .parse_cache import ParseKind, TraceParseCache
 from .parse_code import parse_code_file
 from .parse_results import parse_result_file
 from .parse_tests import parse_test_file
-
-
-def build_trace_index(config: TraceIndexConfig) -> TraceIndex:
-    """Build a deterministic trace index and collect all diagnostics."""
-    metadata = cache_metadata(config)
+from .walk import InputFiles, walk_input_files
+
+logger = logging.getLogger(__name__)
+
+
+# Spawning worker processes costs more than parsing a handful of files.
+_MIN_PARALLEL_FILES = 8
+
+
+class _FileParser:
+    """Parse matched input files, reusing cached results when available.
+
+    Files missing from the cache are parsed in a process pool when ``jobs``
+    is greater than one; results are always returned in input order.
+    """
+
+    def __init__(
+        self,
+        config: TraceIndexConfig,
+        cache: TraceParseCache | None,
+        hashes: dict[str, str],
+        *,
+        jobs: int = 1,
+    ) -> None:
+        self.root = Path(config.project_root)
+        self.project_root = config.project_root
+        self.cache = cache
+        self.hashes = hashes
+        self.jobs = jobs
+        self._pool: ProcessPoolExecutor | None = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def parse_all(
+        self,
+        kind: ParseKind,
+        relatives: Sequence[str],
+        parse_file: Callable[..., Any],
+    ) -> list[Any]:
+        results: list[Any] = [None] * len(relatives)
+        keys: list[tuple[str, str | None]] = []
+        missing: list[int] = []
+        for position, relative in enumerate(relatives):
+            sha256 = self.hashes.get(relative)
+            keys.append((relative, sha256))
+            if self.cache is not None:
+                results[position] = self.cache.lookup(kind, relative, sha256)
+            if results[position] is None:
+                missing.append(position)
+        parsed = self._map(
+            partial(parse_file, project_root=self.project_root),
+            [self.root / relatives[position] for position in missing],
+        )
+        for position, result in zip(missing, parsed, strict=True):
+            results[position] = result
+            if self.cache is not None:
+                relative, sha256 = keys[position]
+                self.cache.store(kind, relative, sha256, result)
+        return results
+
+    def _map(self, parse: Callable[[Path], Any], paths: list[Path]) -> list[Any]:
+        if self.jobs <= 1 or len(paths) < _MIN_PARALLEL_FILES:
+            return [parse(path) for path in paths]
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.jobs)
+        chunksize = max(1, len(paths) // (self.jobs * 4))
+        return list(self._pool.map(parse, paths, chunksize=chunksize))
+
+
+def build_trace_index(
+    config: TraceIndexConfig, *, incremental: bool = False, jobs: int = 1
+) -> TraceIndex:
+    """Build a deterministic trace index and collect all diagnostics.
+
+    With ``incremental`` per-file parse results are reused from
+    ``Req/.cookareq/trace_index.parse_cache.json`` for inputs whose content
+    hash is unchanged, and the cache is updated afterwards. Cross-file
+    validation always runs over the complete set of parsed artifacts.
+
+    ``jobs`` greater than one parses files in that many worker processes.
+    Results are merged in file order, so the index is identical to a serial
+    build.
+    """
+    if jobs < 1:
+        raise ValueError("jobs must be at least 1")
+    cache = TraceParseCache.load(config) if incremental else None
+    files = walk_input_files(config)
+    manifest = input_manifest(
+        config, cache.manifest if cache else (), files=files
+    )
+    metadata = cache_metadata(config, manifest=manifest)
     requirements, raw_requirements, issues = _load_requirement_refs(config)
     requirement_rids = {requirement.rid for requirement in requirements}
     requirement_rid_by_parts = _requirement_rid_lookup(requirement_rids)
 
-    code_locations, code_issues = _parse_code_locations(config)
-    test_cases, test_issues = _parse_test_cases(config)
-    test_runs, test_results, result_issues = _parse_results(config)
+    hashes = {
+        entry.path: entry.sha256
+        for entry in manifest
+        if entry.sha256 != UNREADABLE_HASH
+    }
+    with _FileParser(config, cache, hashes, jobs=jobs) as parser:
+        code_locations, code_issues = _parse_code_locations(files, parser)
+        test_cases, test_issues = _parse_test_cases(files, parser)
+        test_runs, test_results, result_issues = _parse_results(files, parser)
+    if cache is not None:
+        try:
+            cache.save(config.req_root, manifest)
+        except OSError as exc:
+            logger.warning("Cannot write trace parse cache: %s", exc)
     code_locations = _normalize_code_location_rids(
         code_locations, requirement_rid_by_parts
     )
@@ -53,6 +166,7 @@ def build_trace_index(config: TraceIndexConfig) -> TraceIndex:
         req_root=str(metadata["req_root"]),
         config_hash=str(metadata["config_hash"]),
         input_fingerprint=str(metadata["input_fingerprint"]),
+        input_manifest=manifest,
         requirements=tuple(sorted(requirements, key=lambda item: item.stable_key)),
         code_locations=tuple(sorted(code_locations, key=lambda item: item.stable_key)),
         test_cases=tuple(sorted(test_cases, key=lambda item: item.stable_key)),
@@ -172,38 +286,35 @@ def _load_requirement_refs(
 
 
 def _parse_code_locations(
-    config: TraceIndexConfig,
+    files: InputFiles, parser: _FileParser
 ) -> tuple[list[CodeLocation], list[TraceIssue]]:
     locations: list[CodeLocation] = []
     issues: list[TraceIssue] = []
-    for path in _matched_files(config, config.source_globs):
-        result = parse_code_file(path, project_root=config.project_root)
+    for result in parser.parse_all("code", files.sources, parse_code_file):
         locations.extend(result.code_locations)
         issues.extend(result.issues)
     return locations, issues
 
 
 def _parse_test_cases(
-    config: TraceIndexConfig,
+    files: InputFiles, parser: _FileParser
 ) -> tuple[list[TestCaseRef], list[TraceIssue]]:
     test_cases: list[TestCaseRef] = []
     issues: list[TraceIssue] = []
-    for path in _matched_files(config, config.test_globs):
-        result = parse_test_file(path, project_root=config.project_root)
+    for result in parser.parse_all("test", files.tests, parse_test_file):
         test_cases.extend(result.test_cases)
         issues.extend(result.issues)
     return test_cases, issues
 
 
 def _parse_results(
-    config: TraceIndexConfig,
+    files: InputFiles, parser: _FileParser
 ) -> tuple[list[TestRunRef], list[TestResultRef], list[TraceIssue]]:
     runs: list[TestRunRef] = []
     results: list[TestResultRef] = []
     issues: list[TraceIssue] = []
     seen_runs: set[str] = set()
-    for path in _matched_files(config, config.result_globs):
-        result = parse_result_file(path, project_root=config.project_root)
+    for result in parser.parse_all("result", files.results, parse_result_file):
         for run in result.test_runs:
             if run.stable_key not in seen_runs:
                 seen_runs.add(run.stable_key)
@@ -213,29 +324,6 @@ def _parse_results(
     return runs, results, issues
 
 
-def _matched_files(config: TraceIndexConfig, globs: tuple[str, ...]) -> tuple[Path, ...]:
-    root = Path(config.project_root)
-    paths: set[Path] = set()
-    for pattern in globs:
-        for path in root.glob(pattern):
-            if path.is_file() and not _is_excluded(path, config):
-                paths.add(path)
-    return tuple(sorted(paths, key=lambda path: path.as_posix()))
-
-
-def _is_excluded(path: Path, config: TraceIndexConfig) -> bool:
-    root = Path(config.project_root)
-    try:
-        relative = path.relative_to(root).as_posix()
-    except ValueError:
-        relative = path.as_posix()
-    from fnmatch import fnmatch
-
-    return "/.cookareq/" in f"/{relative}" or any(
-        fnmatch(relative, pattern) for pattern in config.exclude_globs
-    )
-
-
 def _validate_code_locations(
     code_locations: list[CodeLocation], requirement_rids: set[str]
 ) -> list[TraceIssue]:
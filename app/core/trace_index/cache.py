@@ -1,4 +1,9 @@
-"""Read/write helpers for generated trace-index JSON cache files."""
+"""Read/write helpers for generated trace-index JSON cache files.
+
+Two encodings are supported: the indented ``json`` cache that mirrors
+:meth:`TraceIndex.to_dict` and stays diffable, and the columnar ``compact``
+cache from :mod:`.compact`. Readers detect the encoding from the payload.
+"""
 from __future__ import annotations
 
 import json
@@ -6,11 +11,14 @@ import os
 import tempfile
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
+from .compact import decode_compact_index, encode_compact_index, is_compact_payload
 from .config import TraceIndexConfig, is_index_stale
 from .model import TraceIndex, TraceIssue
 
 CACHE_RELATIVE_PATH = Path(".cookareq") / "trace_index.generated.json"
+COMPACT_CACHE_RELATIVE_PATH = Path(".cookareq") / "trace_index.generated.compact.json"
 
 
 @dataclass(frozen=True)
@@ -22,21 +30,43 @@ class TraceIndexCacheRead:
     issues: tuple[TraceIssue, ...] = ()
 
 
-def cache_path(req_root: str | Path) -> Path:
+def cache_path(req_root: str | Path, encoding: str = "json") -> Path:
     """Return the generated trace-index cache path for a Req root."""
+    if encoding == "compact":
+        return Path(req_root) / COMPACT_CACHE_RELATIVE_PATH
     return Path(req_root) / CACHE_RELATIVE_PATH
 
 
-def write_trace_index_cache(index: TraceIndex, req_root: str | Path) -> Path:
-    """Atomically write ``index`` to ``Req/.cookareq/trace_index.generated.json``."""
-    target = cache_path(req_root)
+def write_trace_index_cache(
+    index: TraceIndex, req_root: str | Path, *, encoding: str = "json"
+) -> Path:
+    """Atomically write ``index`` under ``Req/.cookareq`` using ``encoding``."""
+    target = cache_path(req_root, encoding)
+    if encoding == "compact":
+        write_json_atomic(target, encode_compact_index(index), compact=True)
+    else:
+        write_json_atomic(target, index.to_dict(include_manifest=True), indent=2)
+    return target
+
+
+def write_json_atomic(
+    target: Path, data: Any, *, indent: int | None = None, compact: bool = False
+) -> None:
+    """Write ``data`` as JSON to ``target`` through a temporary file.
+
+    ``compact`` drops the whitespace after separators.
+    """
     target.parent.mkdir(parents=True, exist_ok=True)
-    payload = json.dumps(index.to_dict(), ensure_ascii=False, indent=2) + "\n"
+    separators = (",", ":") if compact else None
+    payload = (
+        json.dumps(data, ensure_ascii=False, indent=indent, separators=separators)
+        + "\n"
+    )
     fd = -1
     tmp_path: Path | None = None
     try:
         fd, tmp_name = tempfile.mkstemp(
-            prefix="trace_index.", suffix=".tmp", dir=target.parent
+            prefix=f"{target.stem}.", suffix=".tmp", dir=target.parent
         )
         tmp_path = Path(tmp_name)
         with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
@@ -50,19 +80,25 @@ def write_trace_index_cache(index: TraceIndex, req_root: str | Path) -> Path:
             os.close(fd)
         if tmp_path is not None and tmp_path.exists():
             tmp_path.unlink()
-    return target
 
 
 def read_trace_index_cache(path: str | Path) -> TraceIndex:
-    """Read a trace-index cache JSON file."""
+    """Read a trace-index cache file in either encoding."""
     with Path(path).open(encoding="utf-8") as fh:
         data = json.load(fh)
+    if is_compact_payload(data):
+        return decode_compact_index(data)
     return TraceIndex.from_dict(data)
 
 
-def read_trace_index_cache_for_config(config: TraceIndexConfig) -> TraceIndexCacheRead:
-    """Read the configured cache and report whether it is stale."""
-    path = cache_path(config.req_root)
+def read_trace_index_cache_for_config(
+    config: TraceIndexConfig, *, quick: bool = False
+) -> TraceIndexCacheRead:
+    """Read the configured cache and report whether it is stale.
+
+    ``quick`` compares input stats only; see :func:`is_index_stale`.
+    """
+    path = cache_path(config.req_root, config.cache_encoding)
     try:
         index = read_trace_index_cache(path)
     except OSError as exc:
@@ -91,7 +127,7 @@ def read_trace_index_cache_for_config(config: TraceIndexConfig) -> TraceIndexCac
                 ),
             ),
         )
-    stale = is_index_stale(index, config)
+    stale = is_index_stale(index, config, quick=quick)
     issues = ()
     if stale:
         issues = (
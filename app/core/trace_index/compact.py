@@ -0,0 +1,169 @@
+"""Compact columnar encoding of :class:`TraceIndex` cache payloads.
+
+Every record list is stored column by column, strings are replaced with
+indexes into one shared string table, and records are only rebuilt when a
+caller touches them (see :class:`~.model.LazySequence`).
+"""
+from __future__ import annotations
+
+from dataclasses import fields
+from typing import Any
+
+from .model import (
+    CodeLocation,
+    InputFileStat,
+    LazySequence,
+    TestCaseRef,
+    TestResultRef,
+    TestRunRef,
+    TraceIndex,
+    TraceIssue,
+    TraceRequirementRef,
+)
+
+__all__ = [
+    "COMPACT_FORMAT",
+    "decode_compact_index",
+    "encode_compact_index",
+    "is_compact_payload",
+]
+
+COMPACT_FORMAT = "cookareq-trace-index-columnar"
+COMPACT_FORMAT_VERSION = 1
+
+_SCALAR_FIELDS = (
+    "schema_version",
+    "generator",
+    "generator_version",
+    "project_root",
+    "req_root",
+    "config_hash",
+    "input_fingerprint",
+    "generated_at_utc",
+)
+
+_RECORD_TYPES: dict[str, type] = {
+    "requirements": TraceRequirementRef,
+    "code_locations": CodeLocation,
+    "test_cases": TestCaseRef,
+    "test_runs": TestRunRef,
+    "test_results": TestResultRef,
+    "issues": TraceIssue,
+    "input_manifest": InputFileStat,
+}
+
+# Column kinds: interned string, tuple of interned strings, or a raw value.
+_STRING = "s"
+_STRINGS = "t"
+_VALUE = "v"
+
+
+def is_compact_payload(data: Any) -> bool:
+    """Return whether decoded JSON ``data`` uses the compact encoding."""
+    return isinstance(data, dict) and data.get("format") == COMPACT_FORMAT
+
+
+def encode_compact_index(index: TraceIndex) -> dict[str, Any]:
+    """Return a JSON-compatible columnar payload for ``index``."""
+    strings: list[str] = []
+    lookup: dict[str, int] = {}
+
+    def intern(value: str | None) -> int | None:
+        if value is None:
+            return None
+        position = lookup.get(value)
+        if position is None:
+            position = lookup[value] = len(strings)
+            strings.append(value)
+        return position
+
+    tables: dict[str, Any] = {}
+    for name, record_type in _RECORD_TYPES.items():
+        records = getattr(index, name)
+        names, kinds = _record_layout(record_type)
+        columns: list[list[Any]] = []
+        for field_name, kind in zip(names, kinds, strict=True):
+            values = [getattr(record, field_name) for record in records]
+            if kind == _STRING:
+                columns.append([intern(value) for value in values])
+            elif kind == _STRINGS:
+                columns.append([[intern(item) for item in value] for value in values])
+            else:
+                columns.append(values)
+        tables[name] = {
+            "count": len(records),
+            "fields": list(names),
+            "kinds": "".join(kinds),
+            "columns": columns,
+        }
+
+    payload: dict[str, Any] = {
+        "format": COMPACT_FORMAT,
+        "format_version": COMPACT_FORMAT_VERSION,
+    }
+    payload.update({name: getattr(index, name) for name in _SCALAR_FIELDS})
+    payload["strings"] = strings
+    payload["tables"] = tables
+    return payload
+
+
+def decode_compact_index(data: dict[str, Any]) -> TraceIndex:
+    """Rebuild a :class:`TraceIndex` whose records materialize lazily."""
+    if data.get("format_version") != COMPACT_FORMAT_VERSION:
+        raise ValueError(
+            "Unsupported compact trace-index format version: "
+            f"{data.get('format_version')!r}"
+        )
+    strings: list[str] = data["strings"]
+    tables = data["tables"]
+    records = {
+        name: _lazy_records(record_type, tables[name], strings)
+        for name, record_type in _RECORD_TYPES.items()
+    }
+    return TraceIndex(**{name: data[name] for name in _SCALAR_FIELDS}, **records)
+
+
+def _record_layout(record_type: type) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    names: list[str] = []
+    kinds: list[str] = []
+    for item in fields(record_type):
+        annotation = str(item.type)
+        names.append(item.name)
+        if annotation.startswith("tuple[str"):
+            kinds.append(_STRINGS)
+        elif annotation.startswith("str"):
+            kinds.append(_STRING)
+        else:
+            kinds.append(_VALUE)
+    return tuple(names), tuple(kinds)
+
+
+def _lazy_records(
+    record_type: type, table: dict[str, Any], strings: list[str]
+) -> LazySequence[Any]:
+    names, kinds = _record_layout(record_type)
+    if tuple(table["fields"]) != names or table["kinds"] != "".join(kinds):
+        raise ValueError(
+            f"Compact trace-index table for {record_type.__name__} has unexpected fields"
+        )
+    count = table["count"]
+    columns = table["columns"]
+    if len(columns) != len(names) or any(len(column) != count for column in columns):
+        raise ValueError(
+            f"Compact trace-index table for {record_type.__name__} is truncated"
+        )
+
+    def build(position: int) -> Any:
+        # Values were normalized when the index was written, so bypass
+        # ``__post_init__`` and assign the stored fields directly.
+        record = object.__new__(record_type)
+        for name, kind, column in zip(names, kinds, columns, strict=True):
+            value = column[position]
+            if kind == _STRING:
+                value = None if value is None else strings[value]
+            elif kind == _STRINGS:
+                value = tuple(strings[item] for item in value)
+            object.__setattr__(record, name, value)
+        return record
+
+    return LazySequence(count, build)
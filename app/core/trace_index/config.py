@@ -1,14 +1,16 @@
 """Configuration and fingerprint helpers for trace-index scans."""
 from __future__ import annotations
 
-import fnmatch
 import hashlib
 import json
+import os
+from collections.abc import Iterable
 from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any
 
-from .model import GENERATOR_VERSION, SCHEMA_VERSION, TraceIndex
+from .model import GENERATOR_VERSION, SCHEMA_VERSION, InputFileStat, TraceIndex
+from .walk import InputFiles, walk_input_files
 
 DEFAULT_SOURCE_GLOBS = ("Vsrc/**/*.c", "Vinclude/**/*.h")
 DEFAULT_TEST_GLOBS = ("tests/test_*/src/**/*.c",)
@@ -18,6 +20,12 @@ DEFAULT_RESULT_GLOBS = (
 )
 DEFAULT_EXCLUDE_GLOBS = ("Build/coverage/**", ".git/**", "**/.cookareq/**")
 
+UNREADABLE_HASH = "UNREADABLE"
+
+# ``json`` keeps the indented, diffable cache; ``compact`` writes the columnar
+# encoding from :mod:`.compact`, which loads faster for large indexes.
+CACHE_ENCODINGS = ("json", "compact")
+
 
 @dataclass(frozen=True)
 class TraceIndexConfig:
@@ -30,8 +38,14 @@ class TraceIndexConfig:
     result_globs: tuple[str, ...] = DEFAULT_RESULT_GLOBS
     exclude_globs: tuple[str, ...] = DEFAULT_EXCLUDE_GLOBS
     module_filter: str | None = None
+    cache_encoding: str = "json"
 
     def __post_init__(self) -> None:
+        if self.cache_encoding not in CACHE_ENCODINGS:
+            raise ValueError(
+                f"Unknown trace-index cache encoding: {self.cache_encoding!r}; "
+                f"expected one of {', '.join(CACHE_ENCODINGS)}"
+            )
         project_root = _normalize_path(self.project_root)
         req_root = _normalize_path(self.req_root)
         object.__setattr__(self, "project_root", project_root)
@@ -52,6 +66,7 @@ class TraceIndexConfig:
         result_globs: tuple[str, ...] | None = None,
         exclude_globs: tuple[str, ...] | None = None,
         module_filter: str | None = None,
+        cache_encoding: str = "json",
     ) -> TraceIndexConfig:
         """Build config using project conventions and optional overrides."""
         req_path = Path(req_root)
@@ -64,6 +79,7 @@ class TraceIndexConfig:
             result_globs=DEFAULT_RESULT_GLOBS if result_globs is None else result_globs,
             exclude_globs=DEFAULT_EXCLUDE_GLOBS if exclude_globs is None else exclude_globs,
             module_filter=module_filter,
+            cache_encoding=cache_encoding,
         )
 
     @classmethod
@@ -77,6 +93,7 @@ class TraceIndexConfig:
             result_globs=tuple(data.get("result_globs", DEFAULT_RESULT_GLOBS)),
             exclude_globs=tuple(data.get("exclude_globs", DEFAULT_EXCLUDE_GLOBS)),
             module_filter=data.get("module_filter"),
+            cache_encoding=data.get("cache_encoding", "json"),
         )
 
     def to_dict(self) -> dict[str, Any]:
@@ -90,45 +107,74 @@ class TraceIndexConfig:
 
 
 def config_hash(config: TraceIndexConfig) -> str:
-    """Return a deterministic hash for a trace-index config."""
-    return _sha256_json(config.to_dict())
+    """Return a deterministic hash for a trace-index config.
 
+    The cache encoding does not change index content and is left out, so
+    switching encodings keeps existing caches fresh.
+    """
+    data = config.to_dict()
+    data.pop("cache_encoding", None)
+    return _sha256_json(data)
 
-def collect_input_files(config: TraceIndexConfig) -> tuple[str, ...]:
-    """Return sorted project-relative files matched by configured globs."""
-    root = Path(config.project_root)
-    matched: set[str] = set()
-    for pattern in (*config.source_globs, *config.test_globs, *config.result_globs):
-        for path in root.glob(pattern):
-            if path.is_file():
-                relative = path.relative_to(root).as_posix()
-                if not _is_excluded(relative, config.exclude_globs):
-                    matched.add(relative)
-    req_root = Path(config.req_root)
-    if req_root.exists():
-        req_base = req_root if req_root.is_absolute() else root / req_root
-        for path in req_base.rglob("*.json"):
-            if path.is_file():
-                try:
-                    relative = path.relative_to(root).as_posix()
-                except ValueError:
-                    relative = path.as_posix()
-                if not _is_excluded(relative, config.exclude_globs):
-                    matched.add(relative)
-    return tuple(sorted(matched))
 
+def collect_input_files(
+    config: TraceIndexConfig, files: InputFiles | None = None
+) -> tuple[str, ...]:
+    """Return sorted project-relative files matched by configured globs.
 
-def input_fingerprint(config: TraceIndexConfig) -> str:
-    """Hash matched input file paths and contents for stale detection."""
+    ``files`` reuses the result of an earlier :func:`walk_input_files` call.
+    """
+    if files is None:
+        files = walk_input_files(config)
+    return files.all()
+
+
+def input_manifest(
+    config: TraceIndexConfig,
+    previous: Iterable[InputFileStat] = (),
+    *,
+    files: InputFiles | None = None,
+) -> tuple[InputFileStat, ...]:
+    """Stat matched inputs and hash their contents.
+
+    Hashes from ``previous`` are reused for files whose size and mtime are
+    unchanged, so only new or modified files are read. ``files`` reuses an
+    earlier directory walk.
+    """
     root = Path(config.project_root)
-    entries = []
-    for relative in collect_input_files(config):
+    known = {entry.path: entry for entry in previous}
+    entries: list[InputFileStat] = []
+    for relative in collect_input_files(config, files):
         path = root / relative
+        try:
+            stat = path.stat()
+        except OSError:
+            entries.append(InputFileStat(relative, -1, -1, UNREADABLE_HASH))
+            continue
+        entry = known.get(relative)
+        if (
+            entry is not None
+            and entry.sha256 != UNREADABLE_HASH
+            and (entry.size, entry.mtime_ns) == (stat.st_size, stat.st_mtime_ns)
+        ):
+            entries.append(entry)
+            continue
         try:
             content_hash = hashlib.sha256(path.read_bytes()).hexdigest()
         except OSError:
-            content_hash = "UNREADABLE"
-        entries.append({"path": relative, "sha256": content_hash})
+            content_hash = UNREADABLE_HASH
+        entries.append(
+            InputFileStat(relative, stat.st_size, stat.st_mtime_ns, content_hash)
+        )
+    return tuple(entries)
+
+
+def manifest_fingerprint(manifest: Iterable[InputFileStat]) -> str:
+    """Hash manifest paths and content hashes for stale detection."""
+    entries = [
+        {"path": entry.path, "sha256": entry.sha256}
+        for entry in sorted(manifest, key=lambda entry: entry.path)
+    ]
     return _sha256_json(
         {
             "schema_version": SCHEMA_VERSION,
@@ -138,37 +184,81 @@ def input_fingerprint(config: TraceIndexConfig) -> str:
     )
 
 
-def cache_metadata(config: TraceIndexConfig) -> dict[str, str | int]:
-    """Build schema/config/fingerprint metadata for a generated cache."""
+def input_fingerprint(config: TraceIndexConfig) -> str:
+    """Hash matched input file paths and contents for stale detection."""
+    return manifest_fingerprint(input_manifest(config))
+
+
+def cache_metadata(
+    config: TraceIndexConfig,
+    *,
+    manifest: Iterable[InputFileStat] | None = None,
+) -> dict[str, str | int]:
+    """Build schema/config/fingerprint metadata for a generated cache.
+
+    ``manifest`` avoids hashing the inputs again when the caller already
+    built one with :func:`input_manifest`.
+    """
+    if manifest is None:
+        manifest = input_manifest(config)
     return {
         "schema_version": SCHEMA_VERSION,
         "generator_version": GENERATOR_VERSION,
         "project_root": config.project_root,
         "req_root": config.req_root,
         "config_hash": config_hash(config),
-        "input_fingerprint": input_fingerprint(config),
+        "input_fingerprint": manifest_fingerprint(manifest),
     }
 
 
-def is_index_stale(index: TraceIndex, config: TraceIndexConfig) -> bool:
-    """Return whether an index no longer matches schema, config or inputs."""
-    metadata = cache_metadata(config)
-    return any(
+def is_index_stale(
+    index: TraceIndex, config: TraceIndexConfig, *, quick: bool = False
+) -> bool:
+    """Return whether an index no longer matches schema, config or inputs.
+
+    Inputs are compared against ``index.input_manifest`` so only files whose
+    stat changed are hashed again. With ``quick`` the check never reads file
+    contents: any added, removed or re-stamped input counts as stale, even
+    when its content is unchanged. Indexes without a manifest always fall back
+    to hashing every input.
+    """
+    if any(
         (
-            index.schema_version != metadata["schema_version"],
-            index.generator_version != metadata["generator_version"],
-            index.project_root != metadata["project_root"],
-            index.req_root != metadata["req_root"],
-            index.config_hash != metadata["config_hash"],
-            index.input_fingerprint != metadata["input_fingerprint"],
+            index.schema_version != SCHEMA_VERSION,
+            index.generator_version != GENERATOR_VERSION,
+            index.project_root != config.project_root,
+            index.req_root != config.req_root,
+            index.config_hash != config_hash(config),
         )
-    )
+    ):
+        return True
+    if quick and index.input_manifest:
+        return not _manifest_matches_stat(index.input_manifest, config)
+    manifest = input_manifest(config, index.input_manifest)
+    return index.input_fingerprint != manifest_fingerprint(manifest)
 
 
-def _is_excluded(relative_path: str, exclude_globs: tuple[str, ...]) -> bool:
-    return "/.cookareq/" in f"/{relative_path}" or any(
-        fnmatch.fnmatch(relative_path, pattern) for pattern in exclude_globs
-    )
+def _manifest_matches_stat(
+    manifest: tuple[InputFileStat, ...], config: TraceIndexConfig
+) -> bool:
+    known = {entry.path: entry for entry in manifest}
+    relatives = collect_input_files(config)
+    if len(relatives) != len(known):
+        return False
+    root = Path(config.project_root)
+    for relative in relatives:
+        entry = known.get(relative)
+        if entry is None:
+            return False
+        try:
+            stat = os.stat(root / relative)
+        except OSError:
+            if entry.sha256 != UNREADABLE_HASH:
+                return False
+            continue
+        if (entry.size, entry.mtime_ns) != (stat.st_size, stat.st_mtime_ns):
+            return False
+    return True
 
 
 def _sha256_json(data: Any) -> str:
@@ -1,48 +1,50 @@
-"""Export helpers for external evidence trace-index reports."""
+"""Export helpers for external evidence trace-index reports.
+
+The ``write_*`` functions stream rows straight to a text handle so exporting
+matrices with thousands of artifact columns never holds the dense table in
+memory; ``render_*`` wrap them for callers that need a string.
+"""
 from __future__ import annotations
 
 import csv
 import html
+from collections.abc import Iterable, Iterator
 from io import StringIO
+from typing import TextIO
 
 from .matrix import TraceArtifactMatrix, TraceArtifactMatrixCell
 from .model import TraceIndex
 
+ARTIFACT_LINKS_HEADER = ("rid", "column", "marker", "status")
+
+_MATRIX_STYLE = (
+    "<style>",
+    "table { border-collapse: collapse; width: 100%; }",
+    "th, td { border: 1px solid #ccc; padding: 0.25rem 0.5rem; text-align: left; }",
+    "th { background: #f5f5f5; }",
+    "</style>",
+)
+
 
 def render_artifact_matrix_csv(matrix: TraceArtifactMatrix) -> str:
     """Render an artifact trace matrix as CSV text."""
     output = StringIO()
-    writer = csv.writer(output, lineterminator="\n")
-    writer.writerow(_headers(matrix))
-    writer.writerows(_rows(matrix))
+    write_artifact_matrix_csv(matrix, output)
     return output.getvalue()
 
 
 def render_artifact_matrix_html(matrix: TraceArtifactMatrix) -> str:
     """Render an artifact trace matrix as a standalone HTML table."""
-    lines = [
-        "<!doctype html>",
-        '<html lang="en">',
-        "<head>",
-        '<meta charset="utf-8">',
-        "<title>Trace Index Artifact Matrix</title>",
-        "<style>",
-        "table { border-collapse: collapse; width: 100%; }",
-        "th, td { border: 1px solid #ccc; padding: 0.25rem 0.5rem; text-align: left; }",
-        "th { background: #f5f5f5; }",
-        "</style>",
-        "</head>",
-        "<body>",
-        "<h1>Trace Index Artifact Matrix</h1>",
-        "<table>",
-        "<thead>",
-        _html_row("th", _headers(matrix)),
-        "</thead>",
-        "<tbody>",
-    ]
-    lines.extend(_html_row("td", row) for row in _rows(matrix))
-    lines.extend(["</tbody>", "</table>", "</body>", "</html>"])
-    return "\n".join(lines) + "\n"
+    output = StringIO()
+    write_artifact_matrix_html(matrix, output)
+    return output.getvalue()
+
+
+def render_artifact_links_csv(matrix: TraceArtifactMatrix) -> str:
+    """Render linked cells of an artifact trace matrix in long CSV format."""
+    output = StringIO()
+    write_artifact_links_csv(matrix, output)
+    return output.getvalue()
 
 
 def render_trace_index_report_html(
@@ -50,94 +52,153 @@ def render_trace_index_report_html(
     matrix: TraceArtifactMatrix,
 ) -> str:
     """Render a standalone HTML report for a TraceIndex and artifact matrix."""
-    issue_rows = [
-        [
-            issue.severity,
-            issue.code,
-            issue.path,
-            "" if issue.line is None else str(issue.line),
-            issue.rid or "",
-            issue.test_id or "",
-            issue.message,
-        ]
-        for issue in index.issues
-    ]
-    lines = [
-        "<!doctype html>",
-        '<html lang="en">',
-        "<head>",
-        '<meta charset="utf-8">',
-        "<title>Trace Index Report</title>",
-        "<style>",
-        "body { font-family: sans-serif; }",
-        "table { border-collapse: collapse; width: 100%; margin-bottom: 1rem; }",
-        "th, td { border: 1px solid #ccc; padding: 0.25rem 0.5rem; text-align: left; }",
-        "th { background: #f5f5f5; }",
-        "</style>",
-        "</head>",
-        "<body>",
-        "<h1>Trace Index Report</h1>",
-        "<h2>Summary</h2>",
-        "<table>",
-        "<tbody>",
-        _html_row("td", ["Requirements", str(len(index.requirements))]),
-        _html_row("td", ["Code locations", str(len(index.code_locations))]),
-        _html_row("td", ["Test cases", str(len(index.test_cases))]),
-        _html_row("td", ["Test runs", str(len(index.test_runs))]),
-        _html_row("td", ["Test results", str(len(index.test_results))]),
-        _html_row("td", ["Issues", str(len(index.issues))]),
-        "</tbody>",
-        "</table>",
-        "<h2>Diagnostics</h2>",
-        "<table>",
-        "<thead>",
-        _html_row(
-            "th",
-            ["Severity", "Code", "Path", "Line", "RID", "Test ID", "Message"],
+    output = StringIO()
+    write_trace_index_report_html(index, matrix, output)
+    return output.getvalue()
+
+
+def write_artifact_matrix_csv(matrix: TraceArtifactMatrix, out: TextIO) -> None:
+    """Write an artifact trace matrix as CSV to ``out`` one row at a time."""
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(_headers(matrix))
+    writer.writerows(iter_artifact_matrix_rows(matrix))
+
+
+def write_artifact_links_csv(matrix: TraceArtifactMatrix, out: TextIO) -> None:
+    """Write one ``rid, column, marker, status`` CSV row per linked cell.
+
+    Unlike the dense matrix, the output size is proportional to the number of
+    links rather than requirements x artifacts.
+    """
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(ARTIFACT_LINKS_HEADER)
+    writer.writerows(
+        (cell.rid, cell.column_id, cell.marker, cell.status) for cell in matrix.cells
+    )
+
+
+def write_artifact_matrix_html(matrix: TraceArtifactMatrix, out: TextIO) -> None:
+    """Write an artifact trace matrix as a standalone HTML table to ``out``."""
+    _write_lines(
+        out,
+        (
+            "<!doctype html>",
+            '<html lang="en">',
+            "<head>",
+            '<meta charset="utf-8">',
+            "<title>Trace Index Artifact Matrix</title>",
+            *_MATRIX_STYLE,
+            "</head>",
+            "<body>",
+            "<h1>Trace Index Artifact Matrix</h1>",
         ),
-        "</thead>",
-        "<tbody>",
-    ]
-    if issue_rows:
-        lines.extend(_html_row("td", row) for row in issue_rows)
-    else:
-        lines.append(_html_row("td", ["", "", "", "", "", "", "No diagnostics"]))
-    lines.extend(
-        [
+    )
+    _write_matrix_table(matrix, out)
+    _write_lines(out, ("</body>", "</html>"))
+
+
+def write_trace_index_report_html(
+    index: TraceIndex,
+    matrix: TraceArtifactMatrix,
+    out: TextIO,
+) -> None:
+    """Write a standalone HTML report for a TraceIndex and artifact matrix."""
+    _write_lines(
+        out,
+        (
+            "<!doctype html>",
+            '<html lang="en">',
+            "<head>",
+            '<meta charset="utf-8">',
+            "<title>Trace Index Report</title>",
+            "<style>",
+            "body { font-family: sans-serif; }",
+            "table { border-collapse: collapse; width: 100%; margin-bottom: 1rem; }",
+            "th, td { border: 1px solid #ccc; padding: 0.25rem 0.5rem; text-align: left; }",
+            "th { background: #f5f5f5; }",
+            "</style>",
+            "</head>",
+            "<body>",
+            "<h1>Trace Index Report</h1>",
+            "<h2>Summary</h2>",
+            "<table>",
+            "<tbody>",
+            _html_row("td", ["Requirements", str(len(index.requirements))]),
+            _html_row("td", ["Code locations", str(len(index.code_locations))]),
+            _html_row("td", ["Test cases", str(len(index.test_cases))]),
+            _html_row("td", ["Test runs", str(len(index.test_runs))]),
+            _html_row("td", ["Test results", str(len(index.test_results))]),
+            _html_row("td", ["Issues", str(len(index.issues))]),
             "</tbody>",
             "</table>",
-            "<h2>Artifact Matrix</h2>",
+            "<h2>Diagnostics</h2>",
             "<table>",
             "<thead>",
-            _html_row("th", _headers(matrix)),
+            _html_row(
+                "th",
+                ["Severity", "Code", "Path", "Line", "RID", "Test ID", "Message"],
+            ),
             "</thead>",
             "<tbody>",
-        ]
+        ),
     )
-    lines.extend(_html_row("td", row) for row in _rows(matrix))
-    lines.extend(["</tbody>", "</table>", "</body>", "</html>"])
-    return "\n".join(lines) + "\n"
-
-
-def _headers(matrix: TraceArtifactMatrix) -> list[str]:
-    return ["Requirement", "Title"] + [
-        f"{column.kind}: {column.label}" for column in matrix.columns
-    ]
+    if index.issues:
+        _write_lines(
+            out,
+            (
+                _html_row(
+                    "td",
+                    [
+                        issue.severity,
+                        issue.code,
+                        issue.path,
+                        "" if issue.line is None else str(issue.line),
+                        issue.rid or "",
+                        issue.test_id or "",
+                        issue.message,
+                    ],
+                )
+                for issue in index.issues
+            ),
+        )
+    else:
+        _write_lines(out, (_html_row("td", ["", "", "", "", "", "", "No diagnostics"]),))
+    _write_lines(out, ("</tbody>", "</table>", "<h2>Artifact Matrix</h2>"))
+    _write_matrix_table(matrix, out)
+    _write_lines(out, ("</body>", "</html>"))
 
 
-def _rows(matrix: TraceArtifactMatrix) -> list[list[str]]:
-    cells_by_rid: dict[str, dict[str, TraceArtifactMatrixCell]] = {}
-    for cell in matrix.cells:
-        cells_by_rid.setdefault(cell.rid, {})[cell.column_id] = cell
-    rows: list[list[str]] = []
+def iter_artifact_matrix_rows(matrix: TraceArtifactMatrix) -> Iterator[list[str]]:
+    """Yield dense matrix rows (RID, title, one value per column) lazily."""
     for requirement in matrix.requirements:
         row = [requirement.rid, requirement.title]
-        requirement_cells = cells_by_rid.get(requirement.rid, {})
         for column in matrix.columns:
-            cell = requirement_cells.get(column.column_id)
+            cell = matrix.cell(requirement.rid, column.column_id)
             row.append(_cell_text(cell) if cell is not None else "")
-        rows.append(row)
-    return rows
+        yield row
+
+
+def _write_matrix_table(matrix: TraceArtifactMatrix, out: TextIO) -> None:
+    _write_lines(
+        out,
+        ("<table>", "<thead>", _html_row("th", _headers(matrix)), "</thead>", "<tbody>"),
+    )
+    _write_lines(
+        out, (_html_row("td", row) for row in iter_artifact_matrix_rows(matrix))
+    )
+    _write_lines(out, ("</tbody>", "</table>"))
+
+
+def _write_lines(out: TextIO, lines: Iterable[str]) -> None:
+    for line in lines:
+        out.write(line)
+        out.write("\n")
+
+
+def _headers(matrix: TraceArtifactMatrix) -> list[str]:
+    return ["Requirement", "Title"] + [
+        f"{column.kind}: {column.label}" for column in matrix.columns
+    ]
 
 
 def _cell_text(cell: TraceArtifactMatrixCell) -> str:
@@ -1,11 +1,13 @@
 """Artifact trace matrix projections for external evidence TraceIndex data."""
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import asdict, dataclass
+from functools import cached_property
 from pathlib import PurePosixPath
 from typing import Any
 
-from .model import TraceIndex, TraceRequirementRef
+from .model import TraceIndex, TraceRequirementRef, _group
 
 
 @dataclass(frozen=True)
@@ -38,7 +40,10 @@ class TraceArtifactMatrixCell:
 
 @dataclass(frozen=True)
 class TraceArtifactMatrix:
-    """Requirement x external evidence artifact matrix."""
+    """Requirement x external evidence artifact matrix.
+
+    Lookup indexes are built on first use and cached on the instance.
+    """
 
     requirements: tuple[TraceRequirementRef, ...]
     columns: tuple[TraceArtifactMatrixColumn, ...]
@@ -46,7 +51,35 @@ class TraceArtifactMatrix:
 
     def cells_for(self, rid: str) -> tuple[TraceArtifactMatrixCell, ...]:
         """Return all cells for one requirement RID."""
-        return tuple(cell for cell in self.cells if cell.rid == rid)
+        return self._cells_by_rid.get(rid, ())
+
+    def cells_for_column(self, column_id: str) -> tuple[TraceArtifactMatrixCell, ...]:
+        """Return all cells for one artifact column."""
+        return self._cells_by_column.get(column_id, ())
+
+    def cell(self, rid: str, column_id: str) -> TraceArtifactMatrixCell | None:
+        """Return the cell at ``rid`` x ``column_id`` or ``None`` when empty."""
+        return self._cells_by_key.get((rid, column_id))
+
+    def column(self, column_id: str) -> TraceArtifactMatrixColumn | None:
+        """Return the column with ``column_id`` if present."""
+        return self._columns_by_id.get(column_id)
+
+    @cached_property
+    def _cells_by_rid(self) -> Mapping[str, tuple[TraceArtifactMatrixCell, ...]]:
+        return _group(self.cells, lambda cell: cell.rid)
+
+    @cached_property
+    def _cells_by_column(self) -> Mapping[str, tuple[TraceArtifactMatrixCell, ...]]:
+        return _group(self.cells, lambda cell: cell.column_id)
+
+    @cached_property
+    def _cells_by_key(self) -> Mapping[tuple[str, str], TraceArtifactMatrixCell]:
+        return {(cell.rid, cell.column_id): cell for cell in self.cells}
+
+    @cached_property
+    def _columns_by_id(self) -> Mapping[str, TraceArtifactMatrixColumn]:
+        return {column.column_id: column for column in self.columns}
 
     def to_dict(self) -> dict[str, Any]:
         return {
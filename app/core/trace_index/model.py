@@ -1,8 +1,10 @@
 """Read-only trace-index data model and JSON schema helpers."""
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
+from functools import cached_property
 from pathlib import PurePosixPath
 from typing import Any, ClassVar, Self
 
@@ -10,7 +12,6 @@ SCHEMA_VERSION = 1
 GENERATOR = "CookaReq trace-index"
 GENERATOR_VERSION = "0.1.0"
 
-
 def _clean_path(path: str) -> str:
     """Normalize a persisted path to project-relative POSIX form."""
     return str(PurePosixPath(path.replace("\\", "/")))
@@ -20,6 +21,79 @@ def _utc_now_iso() -> str:
     return datetime.now(UTC).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
 
+class LazySequence[T](Sequence[T]):
+    """Immutable sequence that builds each item on first access.
+
+    Used for records restored from the compact cache encoding, so loading a
+    large index does not construct every dataclass up front.
+    """
+
+    __slots__ = ("_build", "_items")
+
+    _MISSING: ClassVar[object] = object()
+
+    def __init__(self, size: int, build: Callable[[int], T]) -> None:
+        self._build = build
+        self._items: list[Any] = [self._MISSING] * size
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return tuple(self[position] for position in range(*index.indices(len(self))))
+        item = self._items[index]
+        if item is self._MISSING:
+            item = self._build(range(len(self._items))[index])
+            self._items[index] = item
+        return item
+
+    def __iter__(self) -> Iterator[T]:
+        for position in range(len(self._items)):
+            yield self[position]
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (tuple, LazySequence)):
+            return len(self) == len(other) and all(
+                left == right for left, right in zip(self, other, strict=True)
+            )
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __repr__(self) -> str:
+        return f"LazySequence(size={len(self)})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # The builder usually closes over decoded cache columns, so pickle the
+        # materialized records instead.
+        return (tuple, (tuple(self),))
+
+
+def _frozen[T](values: Iterable[T]) -> tuple[T, ...] | LazySequence[T]:
+    if isinstance(values, (tuple, LazySequence)):
+        return values
+    return tuple(values)
+
+
+def _group[T](items: Iterable[T], key: Callable[[T], str]) -> dict[str, tuple[T, ...]]:
+    """Group ``items`` by ``key`` preserving their order within each group."""
+    grouped: dict[str, list[T]] = {}
+    for item in items:
+        grouped.setdefault(key(item), []).append(item)
+    return {name: tuple(values) for name, values in grouped.items()}
+
+
+def _group_by_covers[T](items: Iterable[T]) -> dict[str, tuple[T, ...]]:
+    """Group ``items`` under every RID listed in their ``covers`` field."""
+    grouped: dict[str, list[T]] = {}
+    for item in items:
+        for rid in dict.fromkeys(item.covers):
+            grouped.setdefault(rid, []).append(item)
+    return {rid: tuple(values) for rid, values in grouped.items()}
+
+
 @dataclass(frozen=True)
 class TraceRequirementRef:
     """Requirement snapshot used by the external evidence index."""
@@ -193,20 +267,46 @@ class TraceIssue:
         return asdict(self)
 
 
+@dataclass(frozen=True)
+class InputFileStat:
+    """Stat snapshot and content hash of one trace-index input file."""
+
+    path: str
+    size: int
+    mtime_ns: int
+    sha256: str
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "path", _clean_path(self.path))
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Self:
+        return cls(**data)
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
 @dataclass(frozen=True)
 class TraceIndex:
-    """Generated read-only graph of requirements and external evidence."""
+    """Generated read-only graph of requirements and external evidence.
+
+    The ``*_for``/``*_in``/``*_covering`` query methods use indexes built on
+    first use and cached on the instance. Indexes read from a compact cache
+    hold their records in :class:`LazySequence` instead of tuples.
+    """
 
     project_root: str
     req_root: str
     config_hash: str
     input_fingerprint: str
-    requirements: tuple[TraceRequirementRef, ...] = ()
-    code_locations: tuple[CodeLocation, ...] = ()
-    test_cases: tuple[TestCaseRef, ...] = ()
-    test_runs: tuple[TestRunRef, ...] = ()
-    test_results: tuple[TestResultRef, ...] = ()
-    issues: tuple[TraceIssue, ...] = ()
+    requirements: Sequence[TraceRequirementRef] = ()
+    code_locations: Sequence[CodeLocation] = ()
+    test_cases: Sequence[TestCaseRef] = ()
+    test_runs: Sequence[TestRunRef] = ()
+    test_results: Sequence[TestResultRef] = ()
+    issues: Sequence[TraceIssue] = ()
+    input_manifest: Sequence[InputFileStat] = field(default=(), compare=False)
     schema_version: int = SCHEMA_VERSION
     generator: str = GENERATOR
     generator_version: str = GENERATOR_VERSION
@@ -232,12 +332,61 @@ class TraceIndex:
     def __post_init__(self) -> None:
         object.__setattr__(self, "project_root", _clean_path(self.project_root))
         object.__setattr__(self, "req_root", _clean_path(self.req_root))
-        object.__setattr__(self, "requirements", tuple(self.requirements))
-        object.__setattr__(self, "code_locations", tuple(self.code_locations))
-        object.__setattr__(self, "test_cases", tuple(self.test_cases))
-        object.__setattr__(self, "test_runs", tuple(self.test_runs))
-        object.__setattr__(self, "test_results", tuple(self.test_results))
-        object.__setattr__(self, "issues", tuple(self.issues))
+        object.__setattr__(self, "requirements", _frozen(self.requirements))
+        object.__setattr__(self, "code_locations", _frozen(self.code_locations))
+        object.__setattr__(self, "test_cases", _frozen(self.test_cases))
+        object.__setattr__(self, "test_runs", _frozen(self.test_runs))
+        object.__setattr__(self, "test_results", _frozen(self.test_results))
+        object.__setattr__(self, "issues", _frozen(self.issues))
+        object.__setattr__(self, "input_manifest", _frozen(self.input_manifest))
+
+    def requirement(self, rid: str) -> TraceRequirementRef | None:
+        """Return the requirement snapshot for ``rid`` if indexed."""
+        return self._requirements_by_rid.get(rid)
+
+    def code_locations_for(self, rid: str) -> tuple[CodeLocation, ...]:
+        """Return code markers claiming coverage for ``rid``."""
+        return self._code_locations_by_rid.get(rid, ())
+
+    def code_locations_in(self, path: str) -> tuple[CodeLocation, ...]:
+        """Return code markers found in the project-relative ``path``."""
+        return self._code_locations_by_path.get(_clean_path(path), ())
+
+    def test_cases_covering(self, rid: str) -> tuple[TestCaseRef, ...]:
+        """Return test cases that declare coverage of ``rid``."""
+        return self._test_cases_by_rid.get(rid, ())
+
+    def test_results_for(self, test_id: str) -> tuple[TestResultRef, ...]:
+        """Return all recorded results of the test ``test_id``."""
+        return self._test_results_by_test_id.get(test_id, ())
+
+    def test_results_covering(self, rid: str) -> tuple[TestResultRef, ...]:
+        """Return test results that declare coverage of ``rid``."""
+        return self._test_results_by_rid.get(rid, ())
+
+    @cached_property
+    def _requirements_by_rid(self) -> Mapping[str, TraceRequirementRef]:
+        return {requirement.rid: requirement for requirement in self.requirements}
+
+    @cached_property
+    def _code_locations_by_rid(self) -> Mapping[str, tuple[CodeLocation, ...]]:
+        return _group(self.code_locations, lambda location: location.rid)
+
+    @cached_property
+    def _code_locations_by_path(self) -> Mapping[str, tuple[CodeLocation, ...]]:
+        return _group(self.code_locations, lambda location: location.path)
+
+    @cached_property
+    def _test_cases_by_rid(self) -> Mapping[str, tuple[TestCaseRef, ...]]:
+        return _group_by_covers(self.test_cases)
+
+    @cached_property
+    def _test_results_by_test_id(self) -> Mapping[str, tuple[TestResultRef, ...]]:
+        return _group(self.test_results, lambda result: result.test_id)
+
+    @cached_property
+    def _test_results_by_rid(self) -> Mapping[str, tuple[TestResultRef, ...]]:
+        return _group_by_covers(self.test_results)
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> Self:
@@ -249,6 +398,10 @@ class TraceIndex:
             req_root=data["req_root"],
             config_hash=data["config_hash"],
             input_fingerprint=data["input_fingerprint"],
+            input_manifest=tuple(
+                InputFileStat.from_dict(item)
+                for item in data.get("input_manifest", [])
+            ),
             generated_at_utc=data["generated_at_utc"],
             requirements=tuple(
                 TraceRequirementRef.from_dict(item)
@@ -269,7 +422,13 @@ class TraceIndex:
             issues=tuple(TraceIssue.from_dict(item) for item in data.get("issues", [])),
         )
 
-    def to_dict(self) -> dict[str, Any]:
+    def to_dict(self, *, include_manifest: bool = False) -> dict[str, Any]:
+        """Return the JSON form of the index.
+
+        The per-file ``input_manifest`` (sizes and mtimes) only belongs in the
+        cache, so it is written only with ``include_manifest``; exports stay
+        deterministic across checkouts.
+        """
         data = {
             "schema_version": self.schema_version,
             "generator": self.generator,
@@ -314,9 +473,15 @@ class TraceIndex:
                 )
             ],
         }
-        return {
+        payload = {
             field_name: data[field_name] for field_name in self.TOP_LEVEL_FIELDS
         }
+        if include_manifest:
+            payload["input_manifest"] = [
+                item.to_dict()
+                for item in sorted(self.input_manifest, key=lambda x: x.path)
+            ]
+        return payload
 
 
 def make_code_location_key(path: str, rid: str, marker_ordinal: int) -> str:
@@ -0,0 +1,158 @@
+"""Persistent per-file parse results for incremental trace-index builds."""
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, Literal
+
+from .cache import write_json_atomic
+from .config import TraceIndexConfig
+from .model import GENERATOR_VERSION, SCHEMA_VERSION, InputFileStat
+from .parse_code import CodeParseResult
+from .parse_results import ResultParseResult
+from .parse_tests import TestParseResult
+
+__all__ = [
+    "PARSE_CACHE_RELATIVE_PATH",
+    "ParseKind",
+    "TraceParseCache",
+    "parse_cache_path",
+]
+
+logger = logging.getLogger(__name__)
+
+PARSE_CACHE_RELATIVE_PATH = Path(".cookareq") / "trace_index.parse_cache.json"
+PARSE_CACHE_VERSION = 1
+
+ParseKind = Literal["code", "test", "result"]
+ParseResult = CodeParseResult | TestParseResult | ResultParseResult
+
+_RESULT_TYPES: dict[str, type[ParseResult]] = {
+    "code": CodeParseResult,
+    "test": TestParseResult,
+    "result": ResultParseResult,
+}
+
+
+def parse_cache_path(req_root: str | Path) -> Path:
+    """Return the per-file parse cache path for a Req root."""
+    return Path(req_root) / PARSE_CACHE_RELATIVE_PATH
+
+
+class TraceParseCache:
+    """Parse results of individual input files keyed by content hash.
+
+    Entries are stored per ``(kind, path)`` together with the SHA-256 of the
+    parsed content, so a lookup succeeds only while the file is unchanged.
+    The input manifest of the last build is kept alongside the entries and
+    lets the next build skip hashing files whose stat did not change.
+    """
+
+    def __init__(
+        self,
+        project_root: str,
+        *,
+        entries: dict[tuple[str, str], tuple[str, dict[str, Any]]] | None = None,
+        manifest: Iterable[InputFileStat] = (),
+    ) -> None:
+        """Create a cache for ``project_root`` from previously saved data."""
+        self.project_root = project_root
+        self.manifest = tuple(manifest)
+        self._previous = dict(entries or {})
+        self._current: dict[tuple[str, str], tuple[str, dict[str, Any]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def load(cls, config: TraceIndexConfig) -> TraceParseCache:
+        """Return the saved cache for ``config`` or an empty one.
+
+        Missing, unreadable or incompatible files yield an empty cache.
+        """
+        empty = cls(config.project_root)
+        path = parse_cache_path(config.req_root)
+        try:
+            with path.open(encoding="utf-8") as fh:
+                data = json.load(fh)
+        except FileNotFoundError:
+            return empty
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable trace parse cache %s: %s", path, exc)
+            return empty
+        if not isinstance(data, dict) or any(
+            (
+                data.get("version") != PARSE_CACHE_VERSION,
+                data.get("schema_version") != SCHEMA_VERSION,
+                data.get("generator_version") != GENERATOR_VERSION,
+                data.get("project_root") != config.project_root,
+            )
+        ):
+            return empty
+        try:
+            entries = {
+                (str(item["kind"]), str(item["path"])): (
+                    str(item["sha256"]),
+                    dict(item["result"]),
+                )
+                for item in data.get("entries", [])
+                if item["kind"] in _RESULT_TYPES
+            }
+            manifest = tuple(
+                InputFileStat.from_dict(item) for item in data.get("inputs", [])
+            )
+        except (KeyError, TypeError, ValueError) as exc:
+            logger.warning("Ignoring invalid trace parse cache %s: %s", path, exc)
+            return empty
+        return cls(config.project_root, entries=entries, manifest=manifest)
+
+    def lookup(self, kind: ParseKind, path: str, sha256: str | None) -> Any:
+        """Return the cached result of ``path`` when its hash still matches."""
+        if sha256 is None:
+            return None
+        key = (kind, path)
+        entry = self._current.get(key) or self._previous.get(key)
+        if entry is None or entry[0] != sha256:
+            self.misses += 1
+            return None
+        try:
+            result = _RESULT_TYPES[kind].from_dict(entry[1])
+        except (KeyError, TypeError, ValueError):
+            self.misses += 1
+            return None
+        self._current[key] = entry
+        self.hits += 1
+        return result
+
+    def store(
+        self, kind: ParseKind, path: str, sha256: str | None, result: ParseResult
+    ) -> None:
+        """Remember ``result`` parsed from ``path`` with content ``sha256``."""
+        if sha256 is None:
+            return
+        self._current[(kind, path)] = (sha256, result.to_dict())
+
+    def save(self, req_root: str | Path, manifest: Iterable[InputFileStat]) -> Path:
+        """Persist the entries used by this build together with ``manifest``.
+
+        Entries of files that were not looked up or stored are dropped.
+        """
+        target = parse_cache_path(req_root)
+        write_json_atomic(
+            target,
+            {
+                "version": PARSE_CACHE_VERSION,
+                "schema_version": SCHEMA_VERSION,
+                "generator_version": GENERATOR_VERSION,
+                "project_root": self.project_root,
+                "inputs": [entry.to_dict() for entry in manifest],
+                "entries": [
+                    {"kind": kind, "path": path, "sha256": sha256, "result": result}
+                    for (kind, path), (sha256, result) in sorted(
+                        self._current.items()
+                    )
+                ],
+            },
+        )
+        return target
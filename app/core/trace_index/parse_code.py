@@ -4,6 +4,7 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Self
 
 from .model import CodeLocation, TraceIssue
 from .parsers import (
@@ -27,6 +28,21 @@ class CodeParseResult:
     code_locations: tuple[CodeLocation, ...] = ()
     issues: tuple[TraceIssue, ...] = ()
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            code_locations=tuple(
+                CodeLocation.from_dict(item) for item in data.get("code_locations", [])
+            ),
+            issues=tuple(TraceIssue.from_dict(item) for item in data.get("issues", [])),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "code_locations": [item.to_dict() for item in self.code_locations],
+            "issues": [item.to_dict() for item in self.issues],
+        }
+
 
 def parse_code_file(path: str | Path, *, project_root: str | Path | None = None) -> CodeParseResult:
     """Read and parse a C source/header file for block-comment ``@covers`` markers."""
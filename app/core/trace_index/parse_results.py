@@ -1,10 +1,20 @@
-"""Parsers for legacy text and JUnit XML test result files."""
+"""Parsers for legacy text and JUnit XML test result files.
+
+Result files are parsed as streams: legacy text line by line and JUnit XML
+with :func:`xml.etree.ElementTree.iterparse`, dropping each ``testcase``
+element once it has been read. Peak memory therefore follows the parsed
+records rather than the size of the file.
+"""
 from __future__ import annotations
 
 import re
 import xml.etree.ElementTree as ET
-from dataclasses import dataclass
+from collections import deque
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from io import StringIO
 from pathlib import Path
+from typing import IO, Any, Self
 
 from .model import TestResultRef, TestRunRef, TraceIssue
 from .parsers import RID_RE, display_path, rid_list_candidate, rid_list_is_valid
@@ -21,6 +31,25 @@ class ResultParseResult:
     test_results: tuple[TestResultRef, ...] = ()
     issues: tuple[TraceIssue, ...] = ()
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            test_runs=tuple(
+                TestRunRef.from_dict(item) for item in data.get("test_runs", [])
+            ),
+            test_results=tuple(
+                TestResultRef.from_dict(item) for item in data.get("test_results", [])
+            ),
+            issues=tuple(TraceIssue.from_dict(item) for item in data.get("issues", [])),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "test_runs": [item.to_dict() for item in self.test_runs],
+            "test_results": [item.to_dict() for item in self.test_results],
+            "issues": [item.to_dict() for item in self.issues],
+        }
+
 
 def parse_result_file(
     path: str | Path, *, project_root: str | Path | None = None
@@ -29,7 +58,11 @@ def parse_result_file(
     result_path = Path(path)
     path_text = display_path(result_path, project_root)
     try:
-        text = result_path.read_text(encoding="utf-8-sig")
+        if result_path.suffix.lower() == ".xml":
+            with result_path.open("rb") as fh:
+                return _parse_junit_source(fh, path_text)
+        with result_path.open(encoding="utf-8-sig") as fh:
+            return _parse_legacy_lines(fh, path_text)
     except OSError as exc:
         return ResultParseResult(
             issues=(
@@ -41,26 +74,93 @@ def parse_result_file(
                 ),
             )
         )
-    if result_path.suffix.lower() == ".xml":
-        return parse_junit_result_text(text, result_file=path_text)
-    return parse_result_text(text, result_file=path_text)
 
 
 def parse_result_text(text: str, *, result_file: str) -> ResultParseResult:
     """Parse legacy test result text into test runs, results and issues."""
-    parser = _LegacyResultParser(text, result_file)
-    parser.parse()
-    return ResultParseResult(
-        test_runs=tuple(parser.test_runs),
-        test_results=tuple(parser.test_results),
-        issues=tuple(parser.issues),
-    )
+    return _parse_legacy_lines(text.splitlines(), result_file)
 
 
 def parse_junit_result_text(text: str, *, result_file: str) -> ResultParseResult:
     """Parse JUnit XML text into test runs, results and issues."""
+    return _parse_junit_source(StringIO(text), result_file)
+
+
+def iter_junit_results(
+    source: IO[bytes] | IO[str], *, result_file: str
+) -> Iterator[TestRunRef | TestResultRef | TraceIssue]:
+    """Yield runs, results and issues from a JUnit XML stream.
+
+    Each ``testcase`` element is read and removed from the tree as soon as it
+    closes. A suite's records are held until its end tag, since its
+    ``properties`` may follow the test cases, and suites are emitted in the
+    order their start tags appear, each with the results of its own test
+    cases. Raises :class:`xml.etree.ElementTree.ParseError` for malformed XML.
+    """
+    stack: list[ET.Element] = []
+    open_suites: list[_JunitSuite] = []
+    pending: deque[_JunitSuite] = deque()
+    seen_runs: set[str] = set()
+    root_is_suite = False
+    suite_count = 0
+    block_ordinal = 0
+
+    for event, element in ET.iterparse(source, events=("start", "end")):
+        tag = _local_name(element.tag)
+        if event == "start":
+            # Under a ``testsuite`` root only the root suite is read.
+            if tag == "testsuite" and (not stack or not root_is_suite):
+                root_is_suite = root_is_suite or not stack
+                suite_count += 1
+                suite = _JunitSuite(element, suite_count, dict(element.attrib))
+                open_suites.append(suite)
+                pending.append(suite)
+            stack.append(element)
+            continue
+
+        stack.pop()
+        parent = stack[-1] if stack else None
+        open_suite = (
+            open_suites[-1]
+            if open_suites and parent is open_suites[-1].element
+            else None
+        )
+        if open_suites and element is open_suites[-1].element:
+            open_suites.pop().closed = True
+            # A nested suite waits for the suites that started before it.
+            while pending and pending[0].closed:
+                suite = pending.popleft()
+                run = suite.build_run(result_file)
+                if run.stable_key not in seen_runs:
+                    seen_runs.add(run.stable_key)
+                    yield run
+                for case in suite.cases:
+                    if case.issue is not None:
+                        yield case.issue
+                    block_ordinal += 1
+                    yield case.result(run, result_file, block_ordinal)
+        elif open_suite is not None and tag == "properties":
+            open_suite.properties.update(_property_values(element))
+        elif open_suite is not None and tag == "testcase":
+            open_suite.cases.append(_JunitCase.from_element(element, result_file))
+        if parent is None:
+            element.clear()
+        elif open_suite is not None or tag == "testsuite":
+            parent.remove(element)
+
+
+def _parse_junit_source(source: IO[bytes] | IO[str], result_file: str) -> ResultParseResult:
+    test_runs: list[TestRunRef] = []
+    test_results: list[TestResultRef] = []
+    issues: list[TraceIssue] = []
     try:
-        root = ET.fromstring(text)
+        for item in iter_junit_results(source, result_file=result_file):
+            if isinstance(item, TestResultRef):
+                test_results.append(item)
+            elif isinstance(item, TestRunRef):
+                test_runs.append(item)
+            else:
+                issues.append(item)
     except ET.ParseError as exc:
         return ResultParseResult(
             issues=(
@@ -72,91 +172,120 @@ def parse_junit_result_text(text: str, *, result_file: str) -> ResultParseResult
                 ),
             )
         )
-    suites = _junit_suites(root)
-    test_runs: list[TestRunRef] = []
-    test_results: list[TestResultRef] = []
-    issues: list[TraceIssue] = []
-    seen_runs: set[str] = set()
-    block_ordinal = 0
-    for suite_index, suite in enumerate(suites, start=1):
-        suite_properties = _junit_properties(suite)
+    return ResultParseResult(
+        test_runs=tuple(test_runs),
+        test_results=tuple(test_results),
+        issues=tuple(issues),
+    )
+
+
+@dataclass
+class _JunitCase:
+    test_id: str
+    raw_status: str
+    normalized_status: str
+    covers: tuple[str, ...]
+    diagnostics: tuple[str, ...]
+    issue: TraceIssue | None
+
+    @classmethod
+    def from_element(cls, case: ET.Element, result_file: str) -> Self:
+        case_properties = _junit_properties(case)
+        test_id = _first_property(
+            case_properties,
+            "test_id",
+            "cookareq.test_id",
+            "ИДЕНТ_ТЕСТА",
+        ) or _junit_test_id(case)
+        covers_text = _first_property(
+            case_properties,
+            "covers",
+            "requirements",
+            "requirement_ids",
+            "cookareq.covers",
+            "ПОКРЫВАЕТ_ТНУ",
+        )
+        covers, cover_issue = _parse_result_covers(
+            covers_text or "",
+            result_file,
+            test_id,
+        )
+        raw_status, normalized_status, diagnostics = _junit_status(case)
+        return cls(
+            test_id=test_id,
+            raw_status=raw_status,
+            normalized_status=normalized_status,
+            covers=covers,
+            diagnostics=diagnostics,
+            issue=cover_issue,
+        )
+
+    def result(
+        self, run: TestRunRef, result_file: str, block_ordinal: int
+    ) -> TestResultRef:
+        return TestResultRef(
+            run_id=run.run_id,
+            test_id=self.test_id,
+            result_file=result_file,
+            block_ordinal=block_ordinal,
+            raw_status=self.raw_status,
+            normalized_status=self.normalized_status,
+            covers=self.covers,
+            diagnostics=self.diagnostics,
+        )
+
+
+@dataclass
+class _JunitSuite:
+    element: ET.Element
+    index: int
+    attrib: dict[str, str]
+    properties: dict[str, str] = field(default_factory=dict)
+    cases: list[_JunitCase] = field(default_factory=list)
+    closed: bool = False
+
+    def build_run(self, result_file: str) -> TestRunRef:
         run_id = _first_property(
-            suite_properties,
+            self.properties,
             "run_id",
             "RUN_ID",
             "cookareq.run_id",
             "ИД_ПРОГОНА",
-        ) or suite.get("id") or suite.get("name") or f"junit-suite-{suite_index}"
+        ) or self.attrib.get("id") or self.attrib.get("name") or f"junit-suite-{self.index}"
         env = _first_property(
-            suite_properties,
+            self.properties,
             "env",
             "environment",
             "cookareq.env",
             "ОКРУЖЕНИЕ",
         )
         date_utc = _first_property(
-            suite_properties,
+            self.properties,
             "date_utc",
             "timestamp",
             "cookareq.date_utc",
             "ДАТА_UTC",
-        ) or suite.get("timestamp", "")
-        run = TestRunRef(
+        ) or self.attrib.get("timestamp", "")
+        return TestRunRef(
             run_id=run_id,
             result_file=result_file,
             env=env,
             date_utc=date_utc,
         )
-        if run.stable_key not in seen_runs:
-            seen_runs.add(run.stable_key)
-            test_runs.append(run)
-        for case in _direct_children(suite, "testcase"):
-            block_ordinal += 1
-            case_properties = _junit_properties(case)
-            test_id = _first_property(
-                case_properties,
-                "test_id",
-                "cookareq.test_id",
-                "ИДЕНТ_ТЕСТА",
-            ) or _junit_test_id(case)
-            covers_text = _first_property(
-                case_properties,
-                "covers",
-                "requirements",
-                "requirement_ids",
-                "cookareq.covers",
-                "ПОКРЫВАЕТ_ТНУ",
-            )
-            covers, cover_issue = _parse_result_covers(
-                covers_text or "",
-                result_file,
-                test_id,
-            )
-            if cover_issue is not None:
-                issues.append(cover_issue)
-            raw_status, normalized_status, diagnostics = _junit_status(case)
-            test_results.append(
-                TestResultRef(
-                    run_id=run.run_id,
-                    test_id=test_id,
-                    result_file=result_file,
-                    block_ordinal=block_ordinal,
-                    raw_status=raw_status,
-                    normalized_status=normalized_status,
-                    covers=covers,
-                    diagnostics=diagnostics,
-                )
-            )
+
+
+def _parse_legacy_lines(lines: Iterable[str], result_file: str) -> ResultParseResult:
+    parser = _LegacyResultParser(result_file)
+    parser.parse(line.rstrip("\r\n") for line in lines)
     return ResultParseResult(
-        test_runs=tuple(test_runs),
-        test_results=tuple(test_results),
-        issues=tuple(issues),
+        test_runs=tuple(parser.test_runs),
+        test_results=tuple(parser.test_results),
+        issues=tuple(parser.issues),
     )
 
 
 class _LegacyResultParser:
-    def __init__(self, text: str, result_file: str) -> None:
-        self.lines = text.splitlines()
+    def __init__(self, result_file: str) -> None:
         self.result_file = result_file
         self.current_run = TestRunRef(run_id="", result_file=result_file)
         self.test_runs: list[TestRunRef] = []
@@ -164,9 +293,11 @@ class _LegacyResultParser:
         self.issues: list[TraceIssue] = []
         self.block_ordinal = 0
         self.current_block: _ResultBlock | None = None
+        self._run_keys: set[str] = set()
 
-    def parse(self) -> None:
-        for line_number, line in enumerate(self.lines, start=1):
+    def parse(self, lines: Iterable[str]) -> None:
+        line_number = 0
+        for line_number, line in enumerate(lines, start=1):
             if line.startswith("ИД_ПРОГОНА:"):
                 self._finish_block(line_number - 1)
                 self._start_run(line, line_number)
@@ -198,7 +329,7 @@ class _LegacyResultParser:
                         line=line_number,
                     )
                 )
-        self._finish_block(len(self.lines))
+        self._finish_block(line_number)
 
     def _start_run(self, line: str, line_number: int) -> None:
         fields = _parse_run_fields(line)
@@ -220,7 +351,8 @@ class _LegacyResultParser:
             env=fields.get("ОКРУЖЕНИЕ", ""),
             date_utc=fields.get("ДАТА_UTC", ""),
         )
-        if self.current_run.stable_key not in {run.stable_key for run in self.test_runs}:
+        if self.current_run.stable_key not in self._run_keys:
+            self._run_keys.add(self.current_run.stable_key)
             self.test_runs.append(self.current_run)
 
     def _read_block_line(self, line: str, line_number: int) -> None:
@@ -356,20 +488,20 @@ def _parse_result_covers(
     )
 
 
-def _junit_suites(root: ET.Element) -> list[ET.Element]:
-    if _local_name(root.tag) == "testsuite":
-        return [root]
-    return [child for child in root.iter() if _local_name(child.tag) == "testsuite"]
-
-
 def _junit_properties(element: ET.Element) -> dict[str, str]:
     result: dict[str, str] = {}
     for child in _direct_children(element, "properties"):
-        for prop in _direct_children(child, "property"):
-            name = prop.get("name")
-            if not name:
-                continue
-            result[name] = prop.get("value") or (prop.text or "").strip()
+        result.update(_property_values(child))
+    return result
+
+
+def _property_values(properties: ET.Element) -> dict[str, str]:
+    result: dict[str, str] = {}
+    for prop in _direct_children(properties, "property"):
+        name = prop.get("name")
+        if not name:
+            continue
+        result[name] = prop.get("value") or (prop.text or "").strip()
     return result
 
 
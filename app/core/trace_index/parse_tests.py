@@ -5,6 +5,7 @@ import ast
 import re
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Self
 
 from .model import TestCaseRef, TraceIssue
 from .parsers import (
@@ -33,6 +34,21 @@ class TestParseResult:
     test_cases: tuple[TestCaseRef, ...] = ()
     issues: tuple[TraceIssue, ...] = ()
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Self:
+        return cls(
+            test_cases=tuple(
+                TestCaseRef.from_dict(item) for item in data.get("test_cases", [])
+            ),
+            issues=tuple(TraceIssue.from_dict(item) for item in data.get("issues", [])),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "test_cases": [item.to_dict() for item in self.test_cases],
+            "issues": [item.to_dict() for item in self.issues],
+        }
+
 
 def parse_test_file(path: str | Path, *, project_root: str | Path | None = None) -> TestParseResult:
     """Read and parse a C test source file for test-case evidence markers."""
@@ -0,0 +1,229 @@
+"""Single-pass discovery of trace-index input files."""
+from __future__ import annotations
+
+import fnmatch
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover - import for type checking only
+    from .config import TraceIndexConfig
+
+__all__ = ["InputFiles", "walk_input_files"]
+
+# ``Path.glob`` follows the case sensitivity of the platform.
+_FLAGS = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+
+
+@dataclass(frozen=True)
+class InputFiles:
+    """Sorted project-relative input files grouped by glob class.
+
+    Requirement files outside the project root are reported by their
+    absolute POSIX path.
+    """
+
+    sources: tuple[str, ...] = ()
+    tests: tuple[str, ...] = ()
+    results: tuple[str, ...] = ()
+    requirements: tuple[str, ...] = ()
+
+    def all(self) -> tuple[str, ...]:
+        """Return every distinct input file in sorted order."""
+        return tuple(
+            sorted({*self.sources, *self.tests, *self.results, *self.requirements})
+        )
+
+
+class _Glob:
+    """A ``Path.glob`` pattern split into per-segment matchers."""
+
+    def __init__(self, pattern: str) -> None:
+        parts = [part for part in pattern.replace("\\", "/").split("/") if part]
+        self.segments: tuple[re.Pattern[str] | None, ...] = tuple(
+            None if part == "**" else re.compile(fnmatch.translate(part), _FLAGS)
+            for part in parts
+        )
+
+    def matches(self, parts: tuple[str, ...]) -> bool:
+        """Return whether a file with path ``parts`` matches the pattern."""
+        # ``Path.glob`` yields only directories for a trailing ``**``.
+        if not self.segments or self.segments[-1] is None:
+            return False
+        return _match(self.segments, parts)
+
+    def may_contain(self, parts: tuple[str, ...]) -> bool:
+        """Return whether files below directory ``parts`` can match."""
+        segments = self.segments
+        for position, part in enumerate(parts):
+            if position >= len(segments):
+                return False
+            segment = segments[position]
+            if segment is None:
+                return True
+            if not segment.match(part):
+                return False
+        return len(parts) < len(segments)
+
+
+def _match(segments: tuple[re.Pattern[str] | None, ...], parts: tuple[str, ...]) -> bool:
+    if not segments:
+        return not parts
+    head = segments[0]
+    if head is None:
+        rest = segments[1:]
+        return any(_match(rest, parts[skip:]) for skip in range(len(parts) + 1))
+    return bool(parts) and head.match(parts[0]) is not None and _match(
+        segments[1:], parts[1:]
+    )
+
+
+class _Walker:
+    def __init__(self, config: TraceIndexConfig) -> None:
+        self.root = Path(config.project_root)
+        self.exclude_globs = config.exclude_globs
+        self.classes = (
+            tuple(_Glob(pattern) for pattern in config.source_globs),
+            tuple(_Glob(pattern) for pattern in config.test_globs),
+            tuple(_Glob(pattern) for pattern in config.result_globs),
+        )
+        self.globs = tuple(glob for group in self.classes for glob in group)
+        self.found: tuple[set[str], ...] = (set(), set(), set(), set())
+        self.req_parts: tuple[str, ...] | None = None
+
+    def excluded(self, relative: str) -> bool:
+        return "/.cookareq/" in f"/{relative}" or any(
+            fnmatch.fnmatch(relative, pattern) for pattern in self.exclude_globs
+        )
+
+    def prune(self, relative: str) -> bool:
+        """Return whether every file below directory ``relative`` is excluded."""
+        if relative.rsplit("/", 1)[-1] == ".cookareq":
+            return True
+        # A trailing ``*`` keeps matching whatever is appended to the prefix.
+        prefix = f"{relative}/"
+        return any(
+            pattern.endswith("*") and fnmatch.fnmatch(prefix, pattern)
+            for pattern in self.exclude_globs
+        )
+
+    def wanted(self, parts: tuple[str, ...]) -> bool:
+        if self.req_parts is not None and (
+            parts[: len(self.req_parts)] == self.req_parts
+            or self.req_parts[: len(parts)] == parts
+        ):
+            return True
+        return any(glob.may_contain(parts) for glob in self.globs)
+
+    def walk(
+        self,
+        directory: Path,
+        parts: tuple[str, ...],
+        ancestors: frozenset[tuple[int, int]] = frozenset(),
+    ) -> None:
+        """Classify files below ``directory``, following directory symlinks.
+
+        ``ancestors`` holds the ``(st_dev, st_ino)`` of every directory on the
+        current path so a symlink pointing back up the tree is not re-entered.
+        """
+        try:
+            with os.scandir(directory) as entries:
+                children = list(entries)
+        except OSError:
+            return
+        for entry in children:
+            child_parts = (*parts, entry.name)
+            relative = "/".join(child_parts)
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                continue
+            if is_dir:
+                if self.wanted(child_parts) and not self.prune(relative):
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    key = (stat.st_dev, stat.st_ino)
+                    if key not in ancestors:
+                        self.walk(Path(entry.path), child_parts, ancestors | {key})
+                continue
+            try:
+                if not entry.is_file():
+                    continue
+            except OSError:
+                continue
+            self.classify(relative, child_parts)
+
+    def classify(self, relative: str, parts: tuple[str, ...]) -> None:
+        matched = [
+            index
+            for index, group in enumerate(self.classes)
+            if any(glob.matches(parts) for glob in group)
+        ]
+        if (
+            self.req_parts is not None
+            and parts[: len(self.req_parts)] == self.req_parts
+            and len(parts) > len(self.req_parts)
+            and parts[-1].endswith(".json")
+        ):
+            matched.append(3)
+        if matched and not self.excluded(relative):
+            for index in matched:
+                self.found[index].add(relative)
+
+    def walk_requirements(self, req_base: Path) -> None:
+        """Collect ``*.json`` files of a Req root outside the project root."""
+        for dirpath, dirnames, filenames in os.walk(req_base):
+            base = Path(dirpath).as_posix()
+            dirnames[:] = [
+                name for name in dirnames if not self.prune(f"{base}/{name}")
+            ]
+            for name in filenames:
+                relative = f"{base}/{name}"
+                if (
+                    name.endswith(".json")
+                    and os.path.isfile(os.path.join(dirpath, name))
+                    and not self.excluded(relative)
+                ):
+                    self.found[3].add(relative)
+
+
+def walk_input_files(config: TraceIndexConfig) -> InputFiles:
+    """Walk the project tree once and classify every trace-index input.
+
+    Source, test and result globs keep ``Path.glob`` semantics and requirement
+    files are the ``*.json`` files below the Req root. Directory symlinks are
+    followed unless they lead back to a directory already on the current
+    path. Directories that cannot
+    contain a match, ``.cookareq`` folders and directories fully covered by an
+    ``exclude_globs`` pattern ending in ``*`` are never entered.
+    """
+    walker = _Walker(config)
+    root = walker.root
+    req_root = Path(config.req_root)
+    external_req: Path | None = None
+    if req_root.exists():
+        req_base = req_root if req_root.is_absolute() else root / req_root
+        try:
+            walker.req_parts = req_base.relative_to(root).parts
+        except ValueError:
+            external_req = req_base
+    try:
+        root_stat = root.stat()
+    except OSError:
+        ancestors: frozenset[tuple[int, int]] = frozenset()
+    else:
+        ancestors = frozenset({(root_stat.st_dev, root_stat.st_ino)})
+    walker.walk(root, (), ancestors)
+    if external_req is not None:
+        walker.walk_requirements(external_req)
+    sources, tests, results, requirements = walker.found
+    return InputFiles(
+        sources=tuple(sorted(sources)),
+        tests=tuple(sorted(tests)),
+        results=tuple(sorted(results)),
+        requirements=tuple(sorted(requirements)),
+    )
@@ -100,7 +100,13 @@ class TraceMatrixSummary:
 
 @dataclass(frozen=True)
 class TraceMatrix:
-    """Computed traceability matrix with supporting metadata."""
+    """Computed traceability matrix with supporting metadata.
+
+    ``row_links`` and ``column_links`` are sparse adjacency maps: each row RID
+    maps to its linked column RIDs (in column order) and vice versa. Only
+    linked requirements have entries. When omitted they are derived from
+    ``cells``.
+    """
 
     config: TraceMatrixConfig
     direction: TraceDirection
@@ -109,6 +115,22 @@ class TraceMatrix:
     cells: Mapping[tuple[str, str], TraceMatrixCell]
     summary: TraceMatrixSummary
     documents: Mapping[str, Document]
+    row_links: Mapping[str, tuple[str, ...]] | None = None
+    column_links: Mapping[str, tuple[str, ...]] | None = None
+
+    def __post_init__(self) -> None:
+        if self.row_links is None or self.column_links is None:
+            row_links, column_links = _build_adjacency(self.rows, self.columns, self.cells)
+            object.__setattr__(self, "row_links", row_links)
+            object.__setattr__(self, "column_links", column_links)
+
+    def linked_columns(self, row_rid: str) -> tuple[str, ...]:
+        """Return column RIDs linked to ``row_rid``."""
+        return self.row_links.get(row_rid, ())
+
+    def linked_rows(self, column_rid: str) -> tuple[str, ...]:
+        """Return row RIDs linked to ``column_rid``."""
+        return self.column_links.get(column_rid, ())
 
 
 @dataclass(frozen=True)
@@ -158,8 +180,8 @@ def build_trace_matrix(
     rows = _prepare_axis_entries(row_requirements, docs_map)
     columns = _prepare_axis_entries(column_requirements, docs_map)
 
-    cells = _build_cells(rows, columns, config.direction)
-    summary = _build_summary(rows, columns, cells)
+    cells, row_links, column_links = _build_cells(rows, columns, config.direction)
+    summary = _build_summary(rows, columns, cells, row_links, column_links)
 
     return TraceMatrix(
         config=config,
@@ -169,6 +191,8 @@ def build_trace_matrix(
         cells=cells,
         summary=summary,
         documents=dict(docs_map),
+        row_links=row_links,
+        column_links=column_links,
     )
 
 
@@ -183,14 +207,12 @@ def build_trace_views(
     rows_to_columns = _build_directional_table(
         sources=matrix.rows,
         targets=matrix.columns,
-        cells=matrix.cells,
-        reverse=False,
+        adjacency=matrix.row_links,
     )
     columns_to_rows = _build_directional_table(
         sources=matrix.columns,
         targets=matrix.rows,
-        cells=matrix.cells,
-        reverse=True,
+        adjacency=matrix.column_links,
     )
     return TraceViewsBundle(
         matrix=matrix,
@@ -203,22 +225,17 @@ def _build_directional_table(
     *,
     sources: Sequence[TraceMatrixAxisEntry],
     targets: Sequence[TraceMatrixAxisEntry],
-    cells: Mapping[tuple[str, str], TraceMatrixCell],
-    reverse: bool,
+    adjacency: Mapping[str, tuple[str, ...]],
 ) -> TraceDirectionalTable:
     targets_by_rid = {entry.rid: entry for entry in targets}
     rows: list[TraceDirectionalRow] = []
     for source in sources:
-        linked: list[TraceMatrixAxisEntry] = []
-        for target in targets:
-            key = (target.rid, source.rid) if reverse else (source.rid, target.rid)
-            cell = cells.get(key)
-            if not cell or not cell.links:
-                continue
-            resolved_target = targets_by_rid.get(target.rid)
-            if resolved_target is not None:
-                linked.append(resolved_target)
-        rows.append(TraceDirectionalRow(source=source, targets=tuple(linked)))
+        linked = tuple(
+            targets_by_rid[rid]
+            for rid in adjacency.get(source.rid, ())
+            if rid in targets_by_rid
+        )
+        rows.append(TraceDirectionalRow(source=source, targets=linked))
     return TraceDirectionalTable(rows=tuple(rows))
 
 
@@ -343,7 +360,11 @@ def _build_cells(
     rows: Sequence[TraceMatrixAxisEntry],
     columns: Sequence[TraceMatrixAxisEntry],
     direction: TraceDirection,
-) -> dict[tuple[str, str], TraceMatrixCell]:
+) -> tuple[
+    dict[tuple[str, str], TraceMatrixCell],
+    dict[str, tuple[str, ...]],
+    dict[str, tuple[str, ...]],
+]:
     row_index = {entry.rid: entry for entry in rows}
     column_index = {entry.rid: entry for entry in columns}
 
@@ -398,32 +419,60 @@ def _build_cells(
             ),
         )
         cells[key] = TraceMatrixCell(links=tuple(ordered))
-    return cells
+    row_links, column_links = _build_adjacency(rows, columns, cells)
+    return cells, row_links, column_links
+
+
+def _build_adjacency(
+    rows: Sequence[TraceMatrixAxisEntry],
+    columns: Sequence[TraceMatrixAxisEntry],
+    cells: Mapping[tuple[str, str], TraceMatrixCell],
+) -> tuple[dict[str, tuple[str, ...]], dict[str, tuple[str, ...]]]:
+    """Return row → columns and column → rows maps for linked cells.
+
+    Linked RIDs are ordered by their position on the opposite axis, so
+    walking a map yields the same order as scanning the dense matrix.
+    """
+    row_position = {entry.rid: index for index, entry in enumerate(rows)}
+    column_position = {entry.rid: index for index, entry in enumerate(columns)}
+    by_row: dict[str, list[str]] = {}
+    by_column: dict[str, list[str]] = {}
+    for (row_rid, column_rid), cell in cells.items():
+        if not cell.links or row_rid not in row_position or column_rid not in column_position:
+            continue
+        by_row.setdefault(row_rid, []).append(column_rid)
+        by_column.setdefault(column_rid, []).append(row_rid)
+    row_links = {
+        rid: tuple(sorted(linked, key=column_position.__getitem__))
+        for rid, linked in by_row.items()
+    }
+    column_links = {
+        rid: tuple(sorted(linked, key=row_position.__getitem__))
+        for rid, linked in by_column.items()
+    }
+    return row_links, column_links
 
 
 def _build_summary(
     rows: Sequence[TraceMatrixAxisEntry],
     columns: Sequence[TraceMatrixAxisEntry],
     cells: Mapping[tuple[str, str], TraceMatrixCell],
+    row_links: Mapping[str, tuple[str, ...]],
+    column_links: Mapping[str, tuple[str, ...]],
 ) -> TraceMatrixSummary:
     total_rows = len(rows)
     total_columns = len(columns)
     total_pairs = total_rows * total_columns
-    linked_pairs = sum(1 for cell in cells.values() if cell.links)
+    linked_pairs = sum(len(linked) for linked in row_links.values())
     link_count = sum(len(cell.links) for cell in cells.values())
 
-    linked_rows: set[str] = {key[0] for key, cell in cells.items() if cell.links}
-    linked_columns: set[str] = {key[1] for key, cell in cells.items() if cell.links}
-
-    row_coverage = (len(linked_rows) / total_rows) if total_rows else 0.0
-    column_coverage = (len(linked_columns) / total_columns) if total_columns else 0.0
+    row_coverage = (len(row_links) / total_rows) if total_rows else 0.0
+    column_coverage = (len(column_links) / total_columns) if total_columns else 0.0
     pair_coverage = (linked_pairs / total_pairs) if total_pairs else 0.0
 
-    orphan_rows = tuple(
-        entry.rid for entry in rows if entry.rid not in linked_rows
-    )
+    orphan_rows = tuple(entry.rid for entry in rows if entry.rid not in row_links)
     orphan_columns = tuple(
-        entry.rid for entry in columns if entry.rid not in linked_columns
+        entry.rid for entry in columns if entry.rid not in column_links
     )
 
     return TraceMatrixSummary(
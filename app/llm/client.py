@@ -4,13 +4,21 @@ from __future__ import annotations
 
 import asyncio
 import json
+import threading
 import time
-from collections.abc import Mapping, Sequence
+from collections.abc import Awaitable, Mapping, Sequence
 from contextlib import suppress
+from dataclasses import dataclass, field
 from typing import Any
 
+import httpx
+
 from ..settings import LLMSettings
-from ..util.cancellation import CancellationEvent, OperationCancelledError
+from ..util.cancellation import (
+    CancellationEvent,
+    OperationCancelledError,
+    raise_if_cancelled,
+)
 from .context import extract_selected_rids_from_messages
 from .harmony import convert_tools_for_harmony
 from .logging import log_request, log_response
@@ -26,9 +34,34 @@ from .validation import ToolValidationError
 # configured.
 NO_API_KEY = "sk-no-key"
 
+# How often asynchronous requests check the thread-safe cancellation flag.
+_CANCEL_POLL_INTERVAL = 0.05
+
+
+@dataclass(slots=True)
+class _Exchange:
+    """Request and partial response of one LLM round trip, kept for logging."""
+
+    request_args: dict[str, Any]
+    snapshot: tuple[Mapping[str, Any], ...] | None
+    stream: bool
+    start: float = 0.0
+    message_text: str = ""
+    raw_tool_calls: Any = ()
+    normalized_tool_calls: list[dict[str, Any]] = field(default_factory=list)
+    reasoning_accumulator: list[dict[str, str]] = field(default_factory=list)
+    reasoning_segments: tuple[LLMReasoningSegment, ...] = ()
+    completion_summary: str = ""
+
 
 class LLMClient:
-    """High-level client for LLM operations."""
+    """High-level client for LLM operations.
+
+    The synchronous API uses ``openai.OpenAI``. The asynchronous one uses an
+    ``openai.AsyncOpenAI`` client per running event loop, so concurrent agent
+    runs share one loop and a bounded connection pool instead of a thread each.
+    Call :meth:`aclose` from that loop to release its connections.
+    """
 
     _SUPPORTED_MESSAGE_FORMATS = frozenset({"openai-chat", "harmony", "qwen"})
 
@@ -47,24 +80,52 @@ class LLMClient:
         if not self.settings.base_url:
             raise ValueError("LLM base URL is not configured")
         self._message_format = message_format
-        api_key = self.settings.api_key or NO_API_KEY
-        self._client = openai.OpenAI(
-            base_url=self.settings.base_url,
-            api_key=api_key,
-            timeout=self.settings.timeout_minutes * 60,
-            max_retries=self.settings.max_retries,
-        )
+        self._client = openai.OpenAI(**self._client_options())
+        self._pool_lock = threading.Lock()
+        self._async_client: Any | None = None
+        self._async_loop: asyncio.AbstractEventLoop | None = None
         self._request_builder = LLMRequestBuilder(settings, message_format)
         self._response_parser = LLMResponseParser(settings, message_format)
 
+    # ------------------------------------------------------------------
+    async def aclose(self) -> None:
+        """Close the asynchronous client if it belongs to the running loop."""
+        with self._pool_lock:
+            async_client, self._async_client = self._async_client, None
+            loop, self._async_loop = self._async_loop, None
+        if async_client is not None and loop is asyncio.get_running_loop():
+            await async_client.close()
+
     # ------------------------------------------------------------------
     def check_llm(self) -> dict[str, Any]:
         """Perform a minimal request to verify connectivity."""
-        return self._check_llm()
+        request_args = self._check_request_args()
+        start = time.monotonic()
+        log_request(request_args)
+        try:
+            if self._message_format == "harmony":
+                self._client.responses.create(**request_args)
+            else:
+                self._chat_completion(**request_args)
+        except Exception as exc:  # pragma: no cover - network errors
+            return self._check_failed(exc, start)
+        log_response({"ok": True}, start_time=start)
+        return {"ok": True}
 
     async def check_llm_async(self) -> dict[str, Any]:
         """Asynchronous counterpart to :meth:`check_llm`."""
-        return await asyncio.to_thread(self._check_llm)
+        request_args = self._check_request_args()
+        start = time.monotonic()
+        log_request(request_args)
+        try:
+            if self._message_format == "harmony":
+                await self._get_async_client().responses.create(**request_args)
+            else:
+                await self._chat_completion_async(**request_args)
+        except Exception as exc:  # pragma: no cover - network errors
+            return self._check_failed(exc, start)
+        log_response({"ok": True}, start_time=start)
+        return {"ok": True}
 
     # ------------------------------------------------------------------
     def parse_command(
@@ -99,7 +160,10 @@ class LLMClient:
         cancellation: CancellationEvent | None = None,
     ) -> LLMResponse:
         """Send the full *conversation* to the model and return its reply."""
-        return self._respond(list(conversation or []), cancellation=cancellation)
+        messages = list(conversation or [])
+        if self._message_format == "harmony":
+            return self._respond_harmony(messages, cancellation=cancellation)
+        return self._respond_chat(messages, cancellation=cancellation)
 
     async def respond_async(
         self,
@@ -107,82 +171,135 @@ class LLMClient:
         *,
         cancellation: CancellationEvent | None = None,
     ) -> LLMResponse:
-        """Asynchronous counterpart to :meth:`respond`."""
-        return await asyncio.to_thread(
-            self._respond,
-            list(conversation or []),
-            cancellation=cancellation,
-        )
+        """Asynchronous counterpart to :meth:`respond`.
 
-    # ------------------------------------------------------------------
-    def _check_llm(self) -> dict[str, Any]:
+        Setting *cancellation* aborts the request within
+        ``_CANCEL_POLL_INTERVAL`` seconds, even while waiting for the next
+        streamed chunk, and raises :class:`OperationCancelledError`.
+        """
+        messages = list(conversation or [])
         if self._message_format == "harmony":
-            return self._check_llm_harmony()
-        return self._check_llm_chat()
+            request = self._respond_harmony_async(messages, cancellation=cancellation)
+        else:
+            request = self._respond_chat_async(messages, cancellation=cancellation)
+        return await _cancellable(request, cancellation)
 
-    def _check_llm_chat(self) -> dict[str, Any]:
-        request_args = self._request_builder.build_raw_request_args(
-            [{"role": "user", "content": "ping"}]
-        )
-        self._apply_temperature(request_args)
-        start = time.monotonic()
-        log_request(request_args)
-        try:
-            self._chat_completion(**request_args)
-        except Exception as exc:  # pragma: no cover - network errors
-            payload = {
-                "error": {"type": type(exc).__name__, "message": str(exc)}
+    # ------------------------------------------------------------------
+    def _client_options(self) -> dict[str, Any]:
+        """Return constructor arguments shared by the OpenAI clients."""
+        settings = self.settings
+        return {
+            "base_url": settings.base_url,
+            "api_key": settings.api_key or NO_API_KEY,
+            "timeout": settings.timeout_minutes * 60,
+            "max_retries": settings.max_retries,
+        }
+
+    def _get_async_client(self) -> Any:
+        import openai
+
+        loop = asyncio.get_running_loop()
+        with self._pool_lock:
+            # ``httpx.AsyncClient`` connections are bound to the loop that
+            # opened them; a client left behind by a finished loop is dropped.
+            if self._async_client is None or self._async_loop is not loop:
+                http_client_type = getattr(
+                    openai, "DefaultAsyncHttpxClient", httpx.AsyncClient
+                )
+                limits = httpx.Limits(
+                    max_connections=self.settings.max_connections,
+                    max_keepalive_connections=self.settings.max_connections,
+                )
+                self._async_client = openai.AsyncOpenAI(
+                    **self._client_options(),
+                    http_client=http_client_type(limits=limits),
+                )
+                self._async_loop = loop
+            return self._async_client
+
+    # ------------------------------------------------------------------
+    def _check_request_args(self) -> dict[str, Any]:
+        ping = [{"role": "user", "content": "ping"}]
+        if self._message_format == "harmony":
+            prompt = self._request_builder.build_harmony_prompt(ping)
+            request_args = {
+                "model": self.settings.model,
+                "input": prompt.prompt,
+                "tools": convert_tools_for_harmony(TOOLS),
+                "reasoning": {"effort": "high"},
             }
-            log_response(payload, start_time=start)
-            return {"ok": False, **payload}
-        log_response({"ok": True}, start_time=start)
-        return {"ok": True}
+        else:
+            request_args = self._request_builder.build_raw_request_args(ping)
+        self._apply_temperature(request_args)
+        return request_args
 
-    def _check_llm_harmony(self) -> dict[str, Any]:
-        prompt = self._request_builder.build_harmony_prompt(
-            [{"role": "user", "content": "ping"}]
-        )
-        request_args = {
-            "model": self.settings.model,
-            "input": prompt.prompt,
-            "tools": convert_tools_for_harmony(TOOLS),
-            "reasoning": {"effort": "high"},
+    def _check_failed(self, exc: Exception, start: float) -> dict[str, Any]:
+        error_payload: dict[str, Any] = {
+            "type": type(exc).__name__,
+            "message": str(exc),
         }
-        self._apply_temperature(request_args)
-        start = time.monotonic()
-        log_request(request_args)
-        try:
-            self._client.responses.create(**request_args)
-        except Exception as exc:  # pragma: no cover - network errors
-            error_payload: dict[str, Any] = {
-                "type": type(exc).__name__,
-                "message": str(exc),
-            }
+        if self._message_format == "harmony":
             hint = self._describe_harmony_check_error(exc)
             if hint:
                 error_payload["hint"] = hint
-            log_response({"error": error_payload}, start_time=start)
-            return {"ok": False, "error": error_payload}
-        log_response({"ok": True}, start_time=start)
-        return {"ok": True}
+        log_response({"error": error_payload}, start_time=start)
+        return {"ok": False, "error": error_payload}
 
     # ------------------------------------------------------------------
-    def _respond(
+    def _respond_chat(
         self,
         conversation: Sequence[Mapping[str, Any]],
         *,
         cancellation: CancellationEvent | None = None,
     ) -> LLMResponse:
-        if self._message_format == "harmony":
-            return self._respond_harmony(conversation, cancellation=cancellation)
-        return self._respond_chat(conversation, cancellation=cancellation)
+        exchange = self._prepare_chat(conversation, cancellation=cancellation)
+        try:
+            completion = self._chat_completion(**exchange.request_args)
+            exchange.completion_summary = (
+                self._response_parser.summarize_completion(completion)
+            )
+            if exchange.stream:
+                parsed = self._response_parser.consume_stream(
+                    completion, cancellation=cancellation
+                )
+            else:
+                parsed = self._response_parser.parse_chat_completion(completion)
+            response = self._build_chat_response(exchange, *parsed)
+        except BaseException as exc:
+            self._log_failure(exchange, exc)
+            raise
+        return self._log_success(exchange, response)
 
-    def _respond_chat(
+    async def _respond_chat_async(
         self,
         conversation: Sequence[Mapping[str, Any]],
         *,
         cancellation: CancellationEvent | None = None,
     ) -> LLMResponse:
+        exchange = self._prepare_chat(conversation, cancellation=cancellation)
+        try:
+            completion = await self._chat_completion_async(**exchange.request_args)
+            exchange.completion_summary = (
+                self._response_parser.summarize_completion(completion)
+            )
+            if exchange.stream:
+                parsed = await self._response_parser.consume_stream_async(
+                    completion, cancellation=cancellation
+                )
+            else:
+                parsed = self._response_parser.parse_chat_completion(completion)
+            response = self._build_chat_response(exchange, *parsed)
+        except BaseException as exc:
+            self._log_failure(exchange, exc)
+            raise
+        return self._log_success(exchange, response)
+
+    def _prepare_chat(
+        self,
+        conversation: Sequence[Mapping[str, Any]],
+        *,
+        cancellation: CancellationEvent | None,
+    ) -> _Exchange:
         use_stream = bool(cancellation) or self.settings.stream
         prepared = self._request_builder.build_chat_request(
             conversation,
@@ -191,168 +308,41 @@ class LLMClient:
         )
         self._apply_temperature(prepared.request_args)
         self._apply_reasoning_defaults(prepared.request_args)
-        start = time.monotonic()
+        exchange = _Exchange(
+            request_args=prepared.request_args,
+            snapshot=prepared.snapshot,
+            stream=bool(prepared.request_args.get("stream")),
+            start=time.monotonic(),
+        )
         log_request(prepared.request_args)
+        return exchange
 
-        llm_message_text = ""
-        normalized_tool_calls: list[dict[str, Any]] = []
-        raw_tool_calls_payload: list[Any] = []
-        parsed_tool_calls: tuple[LLMToolCall, ...] = ()
-        reasoning_accumulator: list[dict[str, str]] = []
-        reasoning_segments: tuple[LLMReasoningSegment, ...] = ()
-        completion_summary = ""
-
-        try:
-            completion = self._chat_completion(**prepared.request_args)
-            completion_summary = self._response_parser.summarize_completion(
-                completion
-            )
-            if prepared.request_args.get("stream"):
-                (
-                    message_text,
-                    raw_tool_calls_payload,
-                    stream_reasoning,
-                ) = self._response_parser.consume_stream(
-                    completion, cancellation=cancellation
-                )
-                if stream_reasoning:
-                    reasoning_accumulator.extend(stream_reasoning)
-            else:
-                (
-                    message_text,
-                    raw_tool_calls_payload,
-                    reasoning_entries,
-                ) = self._response_parser.parse_chat_completion(completion)
-                if reasoning_entries:
-                    reasoning_accumulator.extend(reasoning_entries)
-            llm_message_text = message_text
-            parsed_tool_calls = self._response_parser.parse_tool_calls(
-                raw_tool_calls_payload
-            )
-            parsed_tool_calls = self._apply_tool_call_defaults(
-                parsed_tool_calls,
-                request_messages=prepared.snapshot,
-            )
-            normalized_tool_calls = [
-                {
-                    "id": call.id,
-                    "type": "function",
-                    "function": {
-                        "name": call.name,
-                        "arguments": json.dumps(
-                            call.arguments,
-                            ensure_ascii=False,
-                            default=str,
-                        ),
-                    },
-                }
-                for call in parsed_tool_calls
-            ]
-            reasoning_segments = self._response_parser.finalize_reasoning_segments(
-                reasoning_accumulator
-            )
-            if not (message_text and message_text.strip()):
-                fallback_message = self._response_parser.render_reasoning_fallback(
-                    reasoning_segments
-                )
-                if fallback_message:
-                    message_text = fallback_message
-                    llm_message_text = message_text
-            response = LLMResponse(
-                content=message_text,
-                tool_calls=parsed_tool_calls,
-                request_messages=prepared.snapshot,
-                reasoning=reasoning_segments,
-            )
-            if not response.tool_calls and not response.content:
-                raise ToolValidationError(
-                    "LLM response did not include a tool call or message",
-                )
-        except OperationCancelledError:
-            log_response({"cancelled": True}, start_time=start)
-            raise
-        except ToolValidationError as exc:
-            if not reasoning_segments and reasoning_accumulator:
-                reasoning_segments = self._response_parser.finalize_reasoning_segments(
-                    reasoning_accumulator
-                )
-            log_payload: dict[str, Any] = {
-                "error": {
-                    "type": type(exc).__name__,
-                    "message": str(exc),
-                }
-            }
-            if llm_message_text:
-                log_payload["message"] = llm_message_text
-            if normalized_tool_calls:
-                log_payload["tool_calls"] = normalized_tool_calls
-            if reasoning_segments:
-                log_payload["reasoning"] = [
-                    {"type": segment.type, "preview": segment.preview()}
-                    for segment in reasoning_segments
-                ]
-            if completion_summary:
-                log_payload["response_summary"] = completion_summary
-            log_response(log_payload, start_time=start)
-            if not hasattr(exc, "llm_message"):
-                exc.llm_message = llm_message_text
-            if not hasattr(exc, "llm_tool_calls"):
-                tool_call_payloads: list[Any] = []
-                if raw_tool_calls_payload:
-                    if isinstance(raw_tool_calls_payload, Mapping):
-                        tool_call_payloads.append(dict(raw_tool_calls_payload))
-                    elif isinstance(raw_tool_calls_payload, Sequence) and not isinstance(
-                        raw_tool_calls_payload, (str, bytes, bytearray)
-                    ):
-                        for entry in raw_tool_calls_payload:
-                            tool_call_payloads.append(
-                                dict(entry) if isinstance(entry, Mapping) else entry
-                            )
-                if not tool_call_payloads:
-                    tool_call_payloads = list(normalized_tool_calls)
-                exc.llm_tool_calls = tuple(tool_call_payloads)
-            if prepared.snapshot and not hasattr(exc, "llm_request_messages"):
-                exc.llm_request_messages = prepared.snapshot
-            if reasoning_segments and not hasattr(exc, "llm_reasoning"):
-                exc.llm_reasoning = [
-                    {
-                        "type": segment.type,
-                        "text": segment.text_with_whitespace,
-                    }
-                    for segment in reasoning_segments
-                ]
-            if completion_summary and not hasattr(exc, "llm_response_summary"):
-                exc.llm_response_summary = completion_summary
-            raise
-        except Exception as exc:  # pragma: no cover - network errors
-            log_response(
-                {"error": {"type": type(exc).__name__, "message": str(exc)}},
-                start_time=start,
-            )
-            raise
-        else:
-            log_payload: dict[str, Any] = {"message": response.content}
-            if response.tool_calls:
-                log_payload["tool_calls"] = [
-                    {
-                        "id": call.id,
-                        "name": call.name,
-                        "arguments": call.arguments,
-                    }
-                    for call in response.tool_calls
-                ]
-            if response.reasoning:
-                log_payload["reasoning"] = [
-                    {"type": segment.type, "preview": segment.preview()}
-                    for segment in response.reasoning
-                ]
-            log_response(log_payload, start_time=start)
-            return LLMResponse(
-                content=response.content.strip(),
-                tool_calls=response.tool_calls,
-                request_messages=prepared.snapshot,
-                reasoning=response.reasoning,
+    def _build_chat_response(
+        self,
+        exchange: _Exchange,
+        message_text: str,
+        raw_tool_calls: Any,
+        reasoning_entries: Sequence[dict[str, str]] | None,
+    ) -> LLMResponse:
+        exchange.raw_tool_calls = raw_tool_calls
+        if reasoning_entries:
+            exchange.reasoning_accumulator.extend(reasoning_entries)
+        exchange.message_text = message_text
+        parsed_tool_calls = self._parse_tool_calls(exchange, raw_tool_calls)
+        exchange.reasoning_segments = (
+            self._response_parser.finalize_reasoning_segments(
+                exchange.reasoning_accumulator
             )
+        )
+        message_text = self._with_reasoning_fallback(exchange, message_text)
+        response = LLMResponse(
+            content=message_text,
+            tool_calls=parsed_tool_calls,
+            request_messages=exchange.snapshot,
+            reasoning=exchange.reasoning_segments,
+        )
+        _require_reply(response)
+        return response
 
     def _apply_temperature(self, request_args: dict[str, Any]) -> None:
         """Inject the configured temperature into ``request_args`` when set."""
@@ -387,14 +377,54 @@ class LLMClient:
         *,
         cancellation: CancellationEvent | None = None,
     ) -> LLMResponse:
+        exchange = self._prepare_harmony(conversation, cancellation=cancellation)
+        try:
+            if exchange.stream:
+                completion = self._request_harmony_stream(
+                    exchange.request_args,
+                    cancellation=cancellation,
+                )
+            else:
+                completion = self._client.responses.create(**exchange.request_args)
+            response = self._build_harmony_response(exchange, completion)
+        except BaseException as exc:
+            self._log_failure(exchange, exc)
+            raise
+        return self._log_success(exchange, response)
+
+    async def _respond_harmony_async(
+        self,
+        conversation: Sequence[Mapping[str, Any]],
+        *,
+        cancellation: CancellationEvent | None = None,
+    ) -> LLMResponse:
+        exchange = self._prepare_harmony(conversation, cancellation=cancellation)
+        try:
+            if exchange.stream:
+                completion = await self._request_harmony_stream_async(
+                    exchange.request_args,
+                    cancellation=cancellation,
+                )
+            else:
+                completion = await self._get_async_client().responses.create(
+                    **exchange.request_args
+                )
+            response = self._build_harmony_response(exchange, completion)
+        except BaseException as exc:
+            self._log_failure(exchange, exc)
+            raise
+        return self._log_success(exchange, response)
+
+    def _prepare_harmony(
+        self,
+        conversation: Sequence[Mapping[str, Any]],
+        *,
+        cancellation: CancellationEvent | None,
+    ) -> _Exchange:
         if cancellation and cancellation.is_set():
             raise OperationCancelledError()
 
         prompt = self._request_builder.build_harmony_prompt(conversation)
-        request_snapshot: tuple[Mapping[str, Any], ...] | None = (
-            prompt.snapshot(),
-        )
-        stream_requested = bool(cancellation) or self.settings.stream
         request_args = {
             "model": self.settings.model,
             "input": prompt.prompt,
@@ -402,132 +432,165 @@ class LLMClient:
             "reasoning": {"effort": "high"},
         }
         self._apply_temperature(request_args)
-        start = time.monotonic()
+        exchange = _Exchange(
+            request_args=request_args,
+            snapshot=(prompt.snapshot(),),
+            stream=bool(cancellation) or self.settings.stream,
+            start=time.monotonic(),
+        )
         log_request(request_args)
+        return exchange
 
-        llm_message_text = ""
-        normalized_tool_calls: list[dict[str, Any]] = []
-        raw_tool_calls_payload: list[Any] = []
-        parsed_tool_calls: tuple[LLMToolCall, ...] = ()
-        reasoning_segments: tuple[LLMReasoningSegment, ...] = ()
-        completion_summary = ""
+    def _build_harmony_response(
+        self, exchange: _Exchange, completion: Any
+    ) -> LLMResponse:
+        exchange.completion_summary = self._response_parser.summarize_completion(
+            completion
+        )
+        message_text, raw_tool_calls = self._response_parser.parse_harmony_output(
+            completion
+        )
+        exchange.message_text = message_text
+        parsed_tool_calls = self._parse_tool_calls(exchange, raw_tool_calls)
+        message_text = self._with_reasoning_fallback(exchange, message_text)
+        response = LLMResponse(
+            content=message_text,
+            tool_calls=parsed_tool_calls,
+            request_messages=exchange.snapshot,
+        )
+        _require_reply(response)
+        return response
 
-        try:
-            if stream_requested:
-                completion = self._request_harmony_stream(
-                    request_args,
-                    cancellation=cancellation,
-                )
-            else:
-                completion = self._client.responses.create(**request_args)
-            completion_summary = self._response_parser.summarize_completion(
-                completion
-            )
-            message_text, raw_tool_calls_payload = self._response_parser.parse_harmony_output(
-                completion
-            )
-            llm_message_text = message_text
-            parsed_tool_calls = self._response_parser.parse_tool_calls(
-                raw_tool_calls_payload
-            )
-            parsed_tool_calls = self._apply_tool_call_defaults(
-                parsed_tool_calls,
-                request_messages=request_snapshot,
-            )
-            normalized_tool_calls = [
+    # ------------------------------------------------------------------
+    def _parse_tool_calls(
+        self, exchange: _Exchange, raw_tool_calls: Any
+    ) -> tuple[LLMToolCall, ...]:
+        parsed_tool_calls = self._response_parser.parse_tool_calls(raw_tool_calls)
+        parsed_tool_calls = self._apply_tool_call_defaults(
+            parsed_tool_calls,
+            request_messages=exchange.snapshot,
+        )
+        exchange.normalized_tool_calls = [
+            {
+                "id": call.id,
+                "type": "function",
+                "function": {
+                    "name": call.name,
+                    "arguments": json.dumps(
+                        call.arguments,
+                        ensure_ascii=False,
+                        default=str,
+                    ),
+                },
+            }
+            for call in parsed_tool_calls
+        ]
+        return parsed_tool_calls
+
+    def _with_reasoning_fallback(self, exchange: _Exchange, message_text: str) -> str:
+        if message_text and message_text.strip():
+            return message_text
+        fallback_message = self._response_parser.render_reasoning_fallback(
+            exchange.reasoning_segments
+        )
+        if not fallback_message:
+            return message_text
+        exchange.message_text = fallback_message
+        return fallback_message
+
+    def _log_success(self, exchange: _Exchange, response: LLMResponse) -> LLMResponse:
+        log_payload: dict[str, Any] = {"message": response.content}
+        if response.tool_calls:
+            log_payload["tool_calls"] = [
                 {
                     "id": call.id,
-                    "type": "function",
-                    "function": {
-                        "name": call.name,
-                        "arguments": json.dumps(
-                            call.arguments,
-                            ensure_ascii=False,
-                            default=str,
-                        ),
-                    },
+                    "name": call.name,
+                    "arguments": call.arguments,
                 }
-                for call in parsed_tool_calls
+                for call in response.tool_calls
             ]
-            if not (message_text and message_text.strip()):
-                fallback_message = self._response_parser.render_reasoning_fallback(
-                    reasoning_segments
-                )
-                if fallback_message:
-                    message_text = fallback_message
-                    llm_message_text = message_text
-            response = LLMResponse(
-                content=message_text,
-                tool_calls=parsed_tool_calls,
-                request_messages=request_snapshot,
-            )
-            if not response.tool_calls and not response.content:
-                raise ToolValidationError(
-                    "LLM response did not include a tool call or message",
-                )
-        except OperationCancelledError:
-            log_response({"cancelled": True}, start_time=start)
-            raise
-        except ToolValidationError as exc:
-            log_payload: dict[str, Any] = {
-                "error": {
-                    "type": type(exc).__name__,
-                    "message": str(exc),
-                }
-            }
-            if llm_message_text:
-                log_payload["message"] = llm_message_text
-            if normalized_tool_calls:
-                log_payload["tool_calls"] = normalized_tool_calls
-            if reasoning_segments:
-                log_payload["reasoning"] = [
-                    {"type": segment.type, "preview": segment.preview()}
-                    for segment in reasoning_segments
-                ]
-            if completion_summary:
-                log_payload["response_summary"] = completion_summary
-            log_response(log_payload, start_time=start)
-            if not hasattr(exc, "llm_message"):
-                exc.llm_message = llm_message_text
-            if not hasattr(exc, "llm_tool_calls"):
-                exc.llm_tool_calls = tuple(normalized_tool_calls)
-            if request_snapshot and not hasattr(exc, "llm_request_messages"):
-                exc.llm_request_messages = request_snapshot
-            if reasoning_segments and not hasattr(exc, "llm_reasoning"):
-                exc.llm_reasoning = [
-                    {
-                        "type": segment.type,
-                        "text": segment.text_with_whitespace,
-                    }
-                    for segment in reasoning_segments
-                ]
-            if completion_summary and not hasattr(exc, "llm_response_summary"):
-                exc.llm_response_summary = completion_summary
-            raise
-        except Exception as exc:  # pragma: no cover - network errors
+        if response.reasoning:
+            log_payload["reasoning"] = [
+                {"type": segment.type, "preview": segment.preview()}
+                for segment in response.reasoning
+            ]
+        log_response(log_payload, start_time=exchange.start)
+        return LLMResponse(
+            content=response.content.strip(),
+            tool_calls=response.tool_calls,
+            request_messages=exchange.snapshot,
+            reasoning=response.reasoning,
+        )
+
+    def _log_failure(self, exchange: _Exchange, exc: BaseException) -> None:
+        """Log *exc* and attach the partial response to validation errors."""
+        if isinstance(exc, (OperationCancelledError, asyncio.CancelledError)):
+            log_response({"cancelled": True}, start_time=exchange.start)
+            return
+        if not isinstance(exc, Exception):
+            return
+        if not isinstance(exc, ToolValidationError):
             log_response(
                 {"error": {"type": type(exc).__name__, "message": str(exc)}},
-                start_time=start,
+                start_time=exchange.start,
             )
-            raise
-        else:
-            log_payload: dict[str, Any] = {"message": response.content}
-            if response.tool_calls:
-                log_payload["tool_calls"] = [
-                    {
-                        "id": call.id,
-                        "name": call.name,
-                        "arguments": call.arguments,
-                    }
-                    for call in response.tool_calls
-                ]
-            log_response(log_payload, start_time=start)
-            return LLMResponse(
-                content=response.content.strip(),
-                tool_calls=response.tool_calls,
-                request_messages=request_snapshot,
-                reasoning=reasoning_segments,
+            return
+
+        if not exchange.reasoning_segments and exchange.reasoning_accumulator:
+            exchange.reasoning_segments = (
+                self._response_parser.finalize_reasoning_segments(
+                    exchange.reasoning_accumulator
+                )
             )
+        reasoning_segments = exchange.reasoning_segments
+        log_payload: dict[str, Any] = {
+            "error": {
+                "type": type(exc).__name__,
+                "message": str(exc),
+            }
+        }
+        if exchange.message_text:
+            log_payload["message"] = exchange.message_text
+        if exchange.normalized_tool_calls:
+            log_payload["tool_calls"] = exchange.normalized_tool_calls
+        if reasoning_segments:
+            log_payload["reasoning"] = [
+                {"type": segment.type, "preview": segment.preview()}
+                for segment in reasoning_segments
+            ]
+        if exchange.completion_summary:
+            log_payload["response_summary"] = exchange.completion_summary
+        log_response(log_payload, start_time=exchange.start)
+        if not hasattr(exc, "llm_message"):
+            exc.llm_message = exchange.message_text
+        if not hasattr(exc, "llm_tool_calls"):
+            tool_call_payloads: list[Any] = []
+            raw_tool_calls = exchange.raw_tool_calls
+            if raw_tool_calls:
+                if isinstance(raw_tool_calls, Mapping):
+                    tool_call_payloads.append(dict(raw_tool_calls))
+                elif isinstance(raw_tool_calls, Sequence) and not isinstance(
+                    raw_tool_calls, (str, bytes, bytearray)
+                ):
+                    for entry in raw_tool_calls:
+                        tool_call_payloads.append(
+                            dict(entry) if isinstance(entry, Mapping) else entry
+                        )
+            if not tool_call_payloads:
+                tool_call_payloads = list(exchange.normalized_tool_calls)
+            exc.llm_tool_calls = tuple(tool_call_payloads)
+        if exchange.snapshot and not hasattr(exc, "llm_request_messages"):
+            exc.llm_request_messages = exchange.snapshot
+        if reasoning_segments and not hasattr(exc, "llm_reasoning"):
+            exc.llm_reasoning = [
+                {
+                    "type": segment.type,
+                    "text": segment.text_with_whitespace,
+                }
+                for segment in reasoning_segments
+            ]
+        if exchange.completion_summary and not hasattr(exc, "llm_response_summary"):
+            exc.llm_response_summary = exchange.completion_summary
 
     def _apply_tool_call_defaults(
         self,
@@ -598,6 +661,17 @@ class LLMClient:
                 "verify that the backend is OpenAI-compatible."
             ) from exc
 
+    async def _chat_completion_async(self, **request_args: Any) -> Any:
+        """Asynchronous counterpart to :meth:`_chat_completion`."""
+        client = self._get_async_client()
+        try:
+            return await client.chat.completions.create(**request_args)
+        except TypeError as exc:
+            raise TypeError(
+                "LLM client rejected provided arguments; "
+                "verify that the backend is OpenAI-compatible."
+            ) from exc
+
     def _request_harmony_stream(
         self,
         request_args: Mapping[str, Any],
@@ -628,6 +702,20 @@ class LLMClient:
             ensure_not_cancelled(stream)
             return stream.get_final_response()
 
+    async def _request_harmony_stream_async(
+        self,
+        request_args: Mapping[str, Any],
+        *,
+        cancellation: CancellationEvent | None,
+    ) -> Any:
+        stream_manager = self._get_async_client().responses.stream(**request_args)
+        async with stream_manager as stream:
+            raise_if_cancelled(cancellation)
+            async for _event in stream:  # pragma: no branch - no per-event handling
+                raise_if_cancelled(cancellation)
+            raise_if_cancelled(cancellation)
+            return await stream.get_final_response()
+
     def _describe_harmony_check_error(self, exc: Exception) -> str | None:
         response = getattr(exc, "response", None)
         status_code = getattr(response, "status_code", None)
@@ -652,3 +740,31 @@ class LLMClient:
                 "format for incompatible servers."
             )
         return None
+
+
+def _require_reply(response: LLMResponse) -> None:
+    if not response.tool_calls and not response.content:
+        raise ToolValidationError(
+            "LLM response did not include a tool call or message",
+        )
+
+
+async def _cancellable[T](
+    request: Awaitable[T], cancellation: CancellationEvent | None
+) -> T:
+    """Await *request*, cancelling it once *cancellation* is set."""
+    if cancellation is None:
+        return await request
+    task = asyncio.ensure_future(request)
+    try:
+        while True:
+            done, _pending = await asyncio.wait({task}, timeout=_CANCEL_POLL_INTERVAL)
+            if done:
+                return task.result()
+            if cancellation.is_set():
+                task.cancel()
+                await asyncio.wait({task})
+                raise OperationCancelledError()
+    finally:
+        if not task.done():
+            task.cancel()
@@ -355,7 +355,8 @@ class LLMRequestBuilder:
                 total_tokens=0,
                 kept_tokens=0,
             )
-        total_tokens = sum(self._count_tokens(msg["content"]) for msg in history)
+        message_tokens = [self._count_tokens(msg["content"]) for msg in history]
+        total_tokens = sum(message_tokens)
         total_messages = len(history)
         if remaining_tokens <= 0:
             return HistoryTrimResult(
@@ -368,8 +369,9 @@ class LLMRequestBuilder:
             )
         kept_rev: list[dict[str, Any]] = []
         kept_tokens = 0
-        for message in reversed(history):
-            tokens = self._count_tokens(message["content"])
+        for message, tokens in zip(
+            reversed(history), reversed(message_tokens), strict=True
+        ):
             if tokens > remaining_tokens and kept_rev:
                 break
             kept_rev.append(message)
@@ -1,14 +1,20 @@
 """Utilities for parsing LLM responses."""
 from __future__ import annotations
 
+import inspect
 import json
 import re
-from collections.abc import Iterable, Mapping, Sequence
-from dataclasses import asdict, dataclass, is_dataclass
+from collections.abc import AsyncIterable, Iterable, Mapping, Sequence
+from contextlib import suppress
+from dataclasses import asdict, dataclass, field, is_dataclass
 from typing import TYPE_CHECKING, Any
 
 from ..telemetry import log_debug_payload, log_event
-from ..util.cancellation import CancellationEvent, OperationCancelledError
+from ..util.cancellation import (
+    CancellationEvent,
+    OperationCancelledError,
+    raise_if_cancelled,
+)
 from ..util.json import make_json_safe
 from .reasoning import (
     ReasoningFragment,
@@ -30,6 +36,18 @@ __all__ = [
 ]
 
 
+@dataclass(slots=True)
+class _StreamState:
+    """Accumulated state of a streamed chat completion."""
+
+    message_parts: list[str] = field(default_factory=list)
+    tool_chunks: dict[tuple[int, object], dict[str, Any]] = field(default_factory=dict)
+    order: list[tuple[int, object]] = field(default_factory=list)
+    reasoning_segments: list[dict[str, str]] = field(default_factory=list)
+    final_messages: dict[int, str] = field(default_factory=dict)
+    chunk_level_fallback: str | None = None
+
+
 @dataclass(frozen=True, slots=True)
 class _ToolArgumentRecovery:
     """Describe a successful recovery from a malformed tool argument payload."""
@@ -280,15 +298,10 @@ class LLMResponseParser:
         cancellation: CancellationEvent | None,
     ) -> tuple[str, list[dict[str, Any]], list[dict[str, str]]]:
         """Consume streamed chat chunks into text, tool calls, and reasoning entries."""
-        message_parts: list[str] = []
-        tool_chunks: dict[tuple[int, object], dict[str, Any]] = {}
-        order: list[tuple[int, object]] = []
+        state = _StreamState()
         closer = getattr(stream, "close", None)
         cancel_event = cancellation
         closed_by_cancel = False
-        reasoning_segments: list[dict[str, str]] = []
-        final_messages: dict[int, str] = {}
-        chunk_level_fallback: str | None = None
 
         def ensure_not_cancelled() -> None:
             nonlocal closed_by_cancel
@@ -301,99 +314,12 @@ class LLMResponseParser:
                         closer()
                 raise OperationCancelledError()
 
-        from contextlib import suppress
-
         stream_error: Exception | None = None
         try:
             ensure_not_cancelled()
             for chunk in stream:  # pragma: no cover - network/streaming
                 ensure_not_cancelled()
-                chunk_map = extract_mapping(chunk)
-                choices = getattr(chunk, "choices", None)
-                if choices is None and chunk_map is not None:
-                    choices = chunk_map.get("choices")
-                if not choices:
-                    if chunk_map is not None:
-                        assistant_value = chunk_map.get("assistant")
-                        if isinstance(assistant_value, str):
-                            chunk_level_fallback = assistant_value
-                    continue
-                for choice in choices:
-                    choice_map = extract_mapping(choice)
-                    raw_choice_index = getattr(choice, "index", None)
-                    if choice_map is not None and raw_choice_index is None:
-                        raw_choice_index = choice_map.get("index")
-                    choice_index = int(raw_choice_index or 0)
-                    delta = getattr(choice, "delta", None)
-                    if delta is None and choice_map is not None:
-                        delta = choice_map.get("delta")
-                    delta_map = extract_mapping(delta)
-                    if delta_map is None:
-                        delta_map = {}
-                    reasoning = delta_map.get("reasoning") or delta_map.get("reasoning_content")
-                    if reasoning:
-                        fragments = collect_reasoning_fragments(reasoning)
-                        self._append_reasoning_fragments(reasoning_segments, fragments)
-                        tool_payloads = self._extract_reasoning_tool_calls(reasoning)
-                        for payload in tool_payloads:
-                            self._append_stream_tool_call(
-                                tool_chunks,
-                                order,
-                                payload,
-                                choice_index=choice_index,
-                            )
-                    if "content" in delta_map:
-                        content_delta = delta_map["content"]
-                    else:
-                        content_delta = getattr(delta, "content", None)
-                    if content_delta:
-                        text_fragment = self._collect_text_segments(
-                            content_delta,
-                            reasoning_accumulator=None,
-                            tool_payload_sink=None,
-                        )
-                        if text_fragment:
-                            message_parts.append(text_fragment)
-                    tool_calls = delta_map.get("tool_calls")
-                    if tool_calls:
-                        for idx, tool_call in enumerate(tool_calls):
-                            self._append_stream_tool_call(
-                                tool_chunks,
-                                order,
-                                tool_call,
-                                choice_index=choice_index,
-                                tool_index=idx,
-                            )
-                    function_call = delta_map.get("function_call")
-                    if function_call:
-                        self._append_stream_function_call(
-                            tool_chunks,
-                            order,
-                            function_call,
-                            choice_index=choice_index,
-                        )
-                    if choice_map is not None:
-                        message_value = choice_map.get("message")
-                        if message_value is not None:
-                            temp_tool_payloads: list[Any] = []
-                            message_text = self._extract_message_text(
-                                message_value,
-                                reasoning_accumulator=reasoning_segments,
-                                tool_payload_sink=temp_tool_payloads,
-                            )
-                            if message_text:
-                                final_messages[choice_index] = message_text
-                            for idx, payload in enumerate(temp_tool_payloads):
-                                self._append_stream_tool_call(
-                                    tool_chunks,
-                                    order,
-                                    payload,
-                                    choice_index=choice_index,
-                                    tool_index=idx,
-                                )
-                        assistant_value = choice_map.get("assistant")
-                        if isinstance(assistant_value, str):
-                            chunk_level_fallback = assistant_value
+                self._consume_stream_chunk(state, chunk)
             ensure_not_cancelled()
         except Exception as exc:
             if cancel_event is not None and (
@@ -405,12 +331,143 @@ class LLMResponseParser:
             if callable(closer):
                 with suppress(Exception):  # pragma: no cover - defensive
                     closer()
-        message = "".join(message_parts)
-        if not message and final_messages:
-            message = final_messages.get(0) or next(iter(final_messages.values()))
-        if not message and chunk_level_fallback:
-            message = chunk_level_fallback
-        tool_calls = [tool_chunks[key] for key in order if tool_chunks[key]["function"]["name"]]
+        return self._finish_stream(state, stream_error)
+
+    async def consume_stream_async(
+        self,
+        stream: AsyncIterable[Any],
+        *,
+        cancellation: CancellationEvent | None,
+    ) -> tuple[str, list[dict[str, Any]], list[dict[str, str]]]:
+        """Asynchronous counterpart to :meth:`consume_stream`.
+
+        The stream is closed (awaiting its ``close`` coroutine) on every exit,
+        including task cancellation, so the HTTP response is released promptly.
+        """
+        state = _StreamState()
+        closer = getattr(stream, "close", None)
+        stream_error: Exception | None = None
+        try:
+            raise_if_cancelled(cancellation)
+            async for chunk in stream:  # pragma: no cover - network/streaming
+                raise_if_cancelled(cancellation)
+                self._consume_stream_chunk(state, chunk)
+            raise_if_cancelled(cancellation)
+        except Exception as exc:
+            if cancellation is not None and cancellation.is_set():
+                raise OperationCancelledError() from exc
+            stream_error = exc
+        finally:
+            if callable(closer):
+                with suppress(Exception):  # pragma: no cover - defensive
+                    result = closer()
+                    if inspect.isawaitable(result):
+                        await result
+        return self._finish_stream(state, stream_error)
+
+    def _consume_stream_chunk(self, state: _StreamState, chunk: Any) -> None:
+        chunk_map = extract_mapping(chunk)
+        choices = getattr(chunk, "choices", None)
+        if choices is None and chunk_map is not None:
+            choices = chunk_map.get("choices")
+        if not choices:
+            if chunk_map is not None:
+                assistant_value = chunk_map.get("assistant")
+                if isinstance(assistant_value, str):
+                    state.chunk_level_fallback = assistant_value
+            return
+        for choice in choices:
+            choice_map = extract_mapping(choice)
+            raw_choice_index = getattr(choice, "index", None)
+            if choice_map is not None and raw_choice_index is None:
+                raw_choice_index = choice_map.get("index")
+            choice_index = int(raw_choice_index or 0)
+            delta = getattr(choice, "delta", None)
+            if delta is None and choice_map is not None:
+                delta = choice_map.get("delta")
+            delta_map = extract_mapping(delta)
+            if delta_map is None:
+                delta_map = {}
+            reasoning = delta_map.get("reasoning") or delta_map.get("reasoning_content")
+            if reasoning:
+                fragments = collect_reasoning_fragments(reasoning)
+                self._append_reasoning_fragments(state.reasoning_segments, fragments)
+                tool_payloads = self._extract_reasoning_tool_calls(reasoning)
+                for payload in tool_payloads:
+                    self._append_stream_tool_call(
+                        state.tool_chunks,
+                        state.order,
+                        payload,
+                        choice_index=choice_index,
+                    )
+            if "content" in delta_map:
+                content_delta = delta_map["content"]
+            else:
+                content_delta = getattr(delta, "content", None)
+            if content_delta:
+                text_fragment = self._collect_text_segments(
+                    content_delta,
+                    reasoning_accumulator=None,
+                    tool_payload_sink=None,
+                )
+                if text_fragment:
+                    state.message_parts.append(text_fragment)
+            tool_calls = delta_map.get("tool_calls")
+            if tool_calls:
+                for idx, tool_call in enumerate(tool_calls):
+                    self._append_stream_tool_call(
+                        state.tool_chunks,
+                        state.order,
+                        tool_call,
+                        choice_index=choice_index,
+                        tool_index=idx,
+                    )
+            function_call = delta_map.get("function_call")
+            if function_call:
+                self._append_stream_function_call(
+                    state.tool_chunks,
+                    state.order,
+                    function_call,
+                    choice_index=choice_index,
+                )
+            if choice_map is not None:
+                message_value = choice_map.get("message")
+                if message_value is not None:
+                    temp_tool_payloads: list[Any] = []
+                    message_text = self._extract_message_text(
+                        message_value,
+                        reasoning_accumulator=state.reasoning_segments,
+                        tool_payload_sink=temp_tool_payloads,
+                    )
+                    if message_text:
+                        state.final_messages[choice_index] = message_text
+                    for idx, payload in enumerate(temp_tool_payloads):
+                        self._append_stream_tool_call(
+                            state.tool_chunks,
+                            state.order,
+                            payload,
+                            choice_index=choice_index,
+                            tool_index=idx,
+                        )
+                assistant_value = choice_map.get("assistant")
+                if isinstance(assistant_value, str):
+                    state.chunk_level_fallback = assistant_value
+
+    def _finish_stream(
+        self, state: _StreamState, stream_error: Exception | None
+    ) -> tuple[str, list[dict[str, Any]], list[dict[str, str]]]:
+        message = "".join(state.message_parts)
+        if not message and state.final_messages:
+            message = state.final_messages.get(0) or next(
+                iter(state.final_messages.values())
+            )
+        if not message and state.chunk_level_fallback:
+            message = state.chunk_level_fallback
+        tool_calls = [
+            state.tool_chunks[key]
+            for key in state.order
+            if state.tool_chunks[key]["function"]["name"]
+        ]
         if stream_error is not None:
             log_debug_payload(
                 "llm.response_parser.stream_interrupted",
@@ -423,7 +480,7 @@ class LLMResponseParser:
                     "tool_calls": len(tool_calls),
                 },
             )
-        return message, tool_calls, reasoning_segments
+        return message, tool_calls, state.reasoning_segments
 
     # ------------------------------------------------------------------
     def parse_chat_completion(
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import hashlib
 import importlib
 import importlib.util
 import sys
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
 from collections.abc import Iterable, Mapping
+from typing import Any
 
 __all__ = [
     "TokenCountResult",
@@ -123,12 +127,80 @@ def _whitespace_count(text: str) -> int:
     return len(stripped.split())
 
 
+_ENCODING_CACHE: dict[tuple[Any, str | None], Any] = {}
+_ENCODING_CACHE_MAX_ENTRIES = 64
+
+
+def _resolve_encoding(module: Any, model: str | None) -> Any | None:
+    """Return the encoding for *model*, falling back to ``cl100k_base``.
+
+    Only resolved encodings are cached, so a transient failure such as a
+    failed BPE download is retried on the next call.
+    """
+    key = (module, model)
+    encoding = _ENCODING_CACHE.get(key)
+    if encoding is not None:
+        return encoding
+    get_encoding = getattr(module, "encoding_for_model", None)
+    if callable(get_encoding) and model:
+        try:
+            encoding = get_encoding(model)
+        except KeyError:
+            encoding = None
+    if encoding is None:
+        fallback = getattr(module, "get_encoding", None)
+        if callable(fallback):
+            try:
+                encoding = fallback("cl100k_base")
+            except KeyError:  # pragma: no cover - defensive
+                encoding = None
+            except Exception:  # pragma: no cover - defensive
+                encoding = None
+    if encoding is not None and len(_ENCODING_CACHE) < _ENCODING_CACHE_MAX_ENTRIES:
+        _ENCODING_CACHE[key] = encoding
+    return encoding
+
+
+class _TokenCountMemo:
+    """Bounded LRU of token counts keyed by a digest of the counted text."""
+
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[object, ...], TokenCountResult] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[object, ...]) -> TokenCountResult | None:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+            return result
+
+    def put(self, key: tuple[object, ...], result: TokenCountResult) -> None:
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Texts shorter than this are cheaper to encode than to hash and look up.
+_MEMO_MIN_LENGTH = 256
+_TOKEN_COUNT_MEMO = _TokenCountMemo(4096)
+
+
 def count_text_tokens(text: object, *, model: str | None = None) -> TokenCountResult:
     """Return token statistics for *text* using the provided *model*.
 
     When :mod:`tiktoken` is available the helper attempts to use the model-
     specific encoding.  Unknown models fall back to ``cl100k_base``.  If neither
     strategy works, a simple whitespace-based approximation is returned.
+    Encodings are resolved once per model and counts of long texts are
+    memoized by content hash, so re-counting an unchanged history is cheap.
     """
     try:
         text_value = "" if text is None else str(text)
@@ -139,47 +211,45 @@ def count_text_tokens(text: object, *, model: str | None = None) -> TokenCountRe
         return TokenCountResult.exact(0, model=model)
 
     module = _load_tiktoken()
-    encoding = None
-    if module is not None:
-        get_encoding = getattr(module, "encoding_for_model", None)
-        if callable(get_encoding) and model:
-            try:
-                encoding = get_encoding(model)
-            except KeyError:
-                encoding = None
-        if encoding is None:
-            fallback = getattr(module, "get_encoding", None)
-            if callable(fallback):
-                try:
-                    encoding = fallback("cl100k_base")
-                except KeyError:  # pragma: no cover - defensive
-                    encoding = None
-                except Exception:  # pragma: no cover - defensive
-                    encoding = None
-        if encoding is not None:
-            try:
-                tokens = len(encoding.encode(text_value, disallowed_special=()))
-            except Exception as exc:  # pragma: no cover - defensive
-                estimate = _whitespace_count(text_value)
-                return TokenCountResult.approximate_result(
-                    estimate,
-                    model=model,
-                    reason=f"tokenize_failed: {exc}",
-                )
-            if model and getattr(encoding, "name", None) == model:
-                return TokenCountResult.exact(tokens, model=model)
-            return TokenCountResult.approximate_result(
-                tokens,
-                model=model,
-                reason="model_approximation",
-            )
-
-    estimate = _whitespace_count(text_value)
-    return TokenCountResult.approximate_result(
-        estimate,
-        model=model,
-        reason="fallback_whitespace",
-    )
+    encoding = _resolve_encoding(module, model) if module is not None else None
+    if encoding is None:
+        estimate = _whitespace_count(text_value)
+        return TokenCountResult.approximate_result(
+            estimate,
+            model=model,
+            reason="fallback_whitespace",
+        )
+
+    memo_key: tuple[object, ...] | None = None
+    if len(text_value) >= _MEMO_MIN_LENGTH:
+        digest = hashlib.blake2b(
+            text_value.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+        memo_key = (model, getattr(encoding, "name", None), digest)
+        cached = _TOKEN_COUNT_MEMO.get(memo_key)
+        if cached is not None:
+            return cached
+
+    try:
+        tokens = len(encoding.encode(text_value, disallowed_special=()))
+    except Exception as exc:  # pragma: no cover - defensive
+        estimate = _whitespace_count(text_value)
+        return TokenCountResult.approximate_result(
+            estimate,
+            model=model,
+            reason=f"tokenize_failed: {exc}",
+        )
+    if model and getattr(encoding, "name", None) == model:
+        result = TokenCountResult.exact(tokens, model=model)
+    else:
+        result = TokenCountResult.approximate_result(
+            tokens,
+            model=model,
+            reason="model_approximation",
+        )
+    if memo_key is not None:
+        _TOKEN_COUNT_MEMO.put(memo_key, result)
+    return result
 
 
 def combine_token_counts(results: Iterable[TokenCountResult | None]) -> TokenCountResult:
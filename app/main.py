@@ -54,6 +54,7 @@ def main() -> None:
     install_exception_hooks()
     context = ApplicationContext.for_gui(app_name=APP_NAME)
     config = context.config
+    context.configure_storage(config.get_storage_settings())
     language = config.get_language()
     app = CookaReqApp()
     app.locale = init_locale(language)
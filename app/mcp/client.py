@@ -1,11 +1,16 @@
 """HTTP client for interacting with the MCP server."""
 from __future__ import annotations
 
-import logging
+import asyncio
+import importlib.util
 import json
+import logging
+import threading
 import time
-from collections.abc import Callable, Mapping
-from typing import Any
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import asdict, dataclass
+from functools import cache
+from typing import Any, Self
 
 import httpx
 
@@ -13,20 +18,30 @@ from ..confirm import (
     ConfirmDecision,
     RequirementChange,
     RequirementUpdatePrompt,
+)
+from ..confirm import (
     confirm_requirement_update as global_confirm_requirement_update,
 )
 from ..i18n import _
+from ..llm.validation import ToolValidationError
 from ..services.requirements import RequirementsService
 from ..settings import MCPSettings
 from ..telemetry import log_debug_payload, log_event
 from .events import notify_tool_success
 from .utils import ErrorCode, mcp_error
-from ..llm.validation import ToolValidationError
-
 
 logger = logging.getLogger(__name__)
 
 
+@cache
+def _http2_available() -> bool:
+    """Return whether the optional ``h2`` package needed for HTTP/2 is installed."""
+    if importlib.util.find_spec("h2") is None:
+        logger.warning("MCP HTTP/2 requested but the 'h2' package is missing")
+        return False
+    return True
+
+
 class MCPNotReadyError(ConnectionError):
     """Raised when the MCP server fails a readiness probe."""
 
@@ -39,8 +54,46 @@ class MCPNotReadyError(ConnectionError):
         self.error = payload
 
 
+@dataclass
+class MCPRequestStats:
+    """Latency statistics of requests sent to one MCP endpoint."""
+
+    requests: int = 0
+    errors: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    last_ms: float = 0.0
+
+    @property
+    def average_ms(self) -> float:
+        """Return mean request latency in milliseconds."""
+        return self.total_ms / self.requests if self.requests else 0.0
+
+    def record(self, elapsed_ms: float, *, ok: bool) -> None:
+        """Account for one request that took ``elapsed_ms``."""
+        self.requests += 1
+        if not ok:
+            self.errors += 1
+        self.total_ms += elapsed_ms
+        self.last_ms = elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def to_dict(self) -> dict[str, float | int]:
+        """Return a JSON-compatible snapshot including the average."""
+        data: dict[str, float | int] = asdict(self)
+        data["average_ms"] = self.average_ms
+        return data
+
+
 class MCPClient:
-    """Simple HTTP client for the MCP server."""
+    """HTTP client for the MCP server.
+
+    Requests share long-lived connection pools: one ``httpx.Client`` for the
+    synchronous API and one ``httpx.AsyncClient`` per running event loop for
+    the asynchronous one. Pools are created on first use and reopened after
+    :meth:`close`/:meth:`aclose`, so the client may be used as a (async)
+    context manager or kept for the lifetime of the application.
+    """
 
     _REQUEST_TIMEOUT = httpx.Timeout(5.0)
     _UPDATE_TOOLS = {
@@ -81,6 +134,58 @@ class MCPClient:
         self._last_ready_error: dict[str, Any] | None = None
         self._base_url = self._build_base_url()
         self._tool_schemas: dict[str, dict[str, Any]] | None = None
+        self._pool_lock = threading.Lock()
+        self._sync_client: httpx.Client | None = None
+        self._async_client: httpx.AsyncClient | None = None
+        self._async_loop: asyncio.AbstractEventLoop | None = None
+        self._request_stats: dict[str, MCPRequestStats] = {}
+
+    # ------------------------------------------------------------------
+    def __enter__(self) -> Self:
+        """Return ``self``; pooled connections are closed on exit."""
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        """Close pooled connections."""
+        self.close()
+
+    async def __aenter__(self) -> Self:
+        """Return ``self``; pooled connections are closed on exit."""
+        return self
+
+    async def __aexit__(self, *_exc: object) -> None:
+        """Close pooled connections."""
+        await self.aclose()
+
+    def close(self) -> None:
+        """Close the synchronous pool and forget the asynchronous one.
+
+        An asynchronous pool can only be closed from its event loop; use
+        :meth:`aclose` there to release its connections gracefully.
+        """
+        with self._pool_lock:
+            sync_client, self._sync_client = self._sync_client, None
+            self._async_client = None
+            self._async_loop = None
+        if sync_client is not None:
+            sync_client.close()
+
+    async def aclose(self) -> None:
+        """Close both pools, awaiting the one bound to the running loop."""
+        with self._pool_lock:
+            async_client, self._async_client = self._async_client, None
+            loop, self._async_loop = self._async_loop, None
+        if async_client is not None and loop is asyncio.get_running_loop():
+            await async_client.aclose()
+        self.close()
+
+    def request_metrics(self) -> dict[str, dict[str, float | int]]:
+        """Return latency statistics keyed by ``"METHOD /path"``."""
+        with self._pool_lock:
+            return {
+                endpoint: stats.to_dict()
+                for endpoint, stats in sorted(self._request_stats.items())
+            }
 
     # ------------------------------------------------------------------
     def _confirm_sensitive_tool(
@@ -249,6 +354,47 @@ class MCPClient:
             headers["Authorization"] = f"Bearer {self.settings.token}"
         return headers
 
+    def _client_options(self) -> dict[str, Any]:
+        """Return constructor arguments shared by the pooled HTTP clients."""
+        settings = self.settings
+        return {
+            "base_url": self._base_url,
+            "timeout": self._REQUEST_TIMEOUT,
+            "limits": httpx.Limits(
+                max_connections=settings.max_connections,
+                max_keepalive_connections=settings.max_keepalive_connections,
+                keepalive_expiry=settings.keepalive_expiry,
+            ),
+            "http2": settings.http2 and _http2_available(),
+        }
+
+    def _get_sync_client(self) -> httpx.Client:
+        with self._pool_lock:
+            if self._sync_client is None:
+                self._sync_client = httpx.Client(**self._client_options())
+            return self._sync_client
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        with self._pool_lock:
+            # ``httpx.AsyncClient`` connections are bound to the loop that
+            # opened them; a pool left behind by a finished loop is dropped.
+            if self._async_client is None or self._async_loop is not loop:
+                self._async_client = httpx.AsyncClient(**self._client_options())
+                self._async_loop = loop
+            return self._async_client
+
+    def _record_request(
+        self, method: str, path: str, start: float, *, ok: bool
+    ) -> None:
+        elapsed_ms = (time.monotonic() - start) * 1000.0
+        endpoint = f"{method} {path}"
+        with self._pool_lock:
+            stats = self._request_stats.get(endpoint)
+            if stats is None:
+                stats = self._request_stats[endpoint] = MCPRequestStats()
+            stats.record(elapsed_ms, ok=ok)
+
     def _request_sync(
         self,
         method: str,
@@ -257,10 +403,19 @@ class MCPClient:
         headers: Mapping[str, str] | None = None,
         json_body: Any | None = None,
     ) -> httpx.Response:
-        """Execute *method* request synchronously and return the response."""
+        """Execute *method* request on the pooled client and return the response."""
         request_headers = dict(headers or {})
-        with httpx.Client(base_url=self._base_url, timeout=self._REQUEST_TIMEOUT) as client:
-            return client.request(method, path, json=json_body, headers=request_headers)
+        client = self._get_sync_client()
+        start = time.monotonic()
+        try:
+            response = client.request(
+                method, path, json=json_body, headers=request_headers
+            )
+        except httpx.HTTPError:
+            self._record_request(method, path, start, ok=False)
+            raise
+        self._record_request(method, path, start, ok=response.status_code < 400)
+        return response
 
     async def _request_async(
         self,
@@ -270,12 +425,19 @@ class MCPClient:
         headers: Mapping[str, str] | None = None,
         json_body: Any | None = None,
     ) -> httpx.Response:
-        """Execute *method* request asynchronously and return the response."""
+        """Execute *method* request on the pooled async client."""
         request_headers = dict(headers or {})
-        async with httpx.AsyncClient(
-            base_url=self._base_url, timeout=self._REQUEST_TIMEOUT
-        ) as client:
-            return await client.request(method, path, json=json_body, headers=request_headers)
+        client = self._get_async_client()
+        start = time.monotonic()
+        try:
+            response = await client.request(
+                method, path, json=json_body, headers=request_headers
+            )
+        except httpx.HTTPError:
+            self._record_request(method, path, start, ok=False)
+            raise
+        self._record_request(method, path, start, ok=response.status_code < 400)
+        return response
 
     # ------------------------------------------------------------------
     def check_tools(self) -> dict[str, Any]:
@@ -609,6 +771,166 @@ class MCPClient:
             self._update_ready_state(False, err)
         return {"ok": False, "error": err}
 
+    # ------------------------------------------------------------------
+    def call_tools_batch(
+        self, calls: Iterable[tuple[str, Mapping[str, Any]]]
+    ) -> list[dict[str, Any]]:
+        """Invoke several ``(name, arguments)`` tool calls in one request.
+
+        Returns one :meth:`call_tool`-style result per call, in input order.
+        The server runs consecutive read-only calls concurrently and applies
+        writes in order, skipping the remaining writes once one fails.
+        Sensitive calls are confirmed up front; declined ones are not sent.
+        """
+        results, pending = self._prepare_batch(calls)
+        if not pending:
+            return results  # type: ignore[return-value]
+        headers = self._headers(json_body=True)
+        request_body = self._batch_request_body(pending, headers)
+        start = time.monotonic()
+        try:
+            resp = self._request_sync(
+                "POST", "/mcp", headers=headers, json_body=request_body
+            )
+        except httpx.HTTPError as exc:  # pragma: no cover - network errors
+            return self._fail_batch(results, pending, exc, start)
+        return self._finish_batch(results, pending, resp, start)
+
+    async def call_tools_batch_async(
+        self, calls: Iterable[tuple[str, Mapping[str, Any]]]
+    ) -> list[dict[str, Any]]:
+        """Asynchronous counterpart to :meth:`call_tools_batch`."""
+        results, pending = self._prepare_batch(calls)
+        if not pending:
+            return results  # type: ignore[return-value]
+        headers = self._headers(json_body=True)
+        request_body = self._batch_request_body(pending, headers)
+        start = time.monotonic()
+        try:
+            resp = await self._request_async(
+                "POST", "/mcp", headers=headers, json_body=request_body
+            )
+        except httpx.HTTPError as exc:  # pragma: no cover - network errors
+            return self._fail_batch(results, pending, exc, start)
+        return self._finish_batch(results, pending, resp, start)
+
+    def _prepare_batch(
+        self, calls: Iterable[tuple[str, Mapping[str, Any]]]
+    ) -> tuple[list[dict[str, Any] | None], list[tuple[int, str, dict[str, Any]]]]:
+        """Confirm sensitive calls and split out the ones to send."""
+        results: list[dict[str, Any] | None] = []
+        pending: list[tuple[int, str, dict[str, Any]]] = []
+        for position, (name, arguments) in enumerate(calls):
+            prepared_arguments = self._prepare_tool_arguments(name, arguments)
+            if (
+                name == "delete_requirement" or name in self._UPDATE_TOOLS
+            ) and not self._confirm_sensitive_tool(name, prepared_arguments):
+                err = mcp_error("CANCELLED", _("Cancelled by user"))["error"]
+                log_event("CANCELLED", {"tool": name})
+                results.append({"ok": False, "error": err})
+                continue
+            log_event(
+                "TOOL_CALL",
+                {"tool": name, "params": dict(prepared_arguments)},
+            )
+            results.append(None)
+            pending.append((position, name, dict(prepared_arguments)))
+        return results, pending
+
+    def _batch_request_body(
+        self,
+        pending: list[tuple[int, str, dict[str, Any]]],
+        headers: Mapping[str, str],
+    ) -> list[dict[str, Any]]:
+        request_body = [
+            {"id": position, "name": name, "arguments": arguments}
+            for position, name, arguments in pending
+        ]
+        log_debug_payload(
+            "MCP_REQUEST",
+            {
+                "direction": "outbound",
+                "tools": [name for _position, name, _arguments in pending],
+                "http": {
+                    "host": self.settings.host,
+                    "port": self.settings.port,
+                    "path": "/mcp",
+                    "headers": headers,
+                    "body": request_body,
+                },
+            },
+        )
+        return request_body
+
+    def _fail_batch(
+        self,
+        results: list[dict[str, Any] | None],
+        pending: list[tuple[int, str, dict[str, Any]]],
+        exc: Exception,
+        start: float,
+    ) -> list[dict[str, Any]]:
+        err = mcp_error(ErrorCode.INTERNAL, str(exc))["error"]
+        log_event("TOOL_RESULT", {"error": err}, start_time=start)
+        log_event("ERROR", {"error": err})
+        log_debug_payload("MCP_RESPONSE", {"direction": "inbound", "error": err})
+        self._update_ready_state(False, err)
+        for position, _name, _arguments in pending:
+            results[position] = {"ok": False, "error": err}
+        return results  # type: ignore[return-value]
+
+    def _finish_batch(
+        self,
+        results: list[dict[str, Any] | None],
+        pending: list[tuple[int, str, dict[str, Any]]],
+        resp: httpx.Response,
+        start: float,
+    ) -> list[dict[str, Any]]:
+        body = resp.text
+        log_debug_payload(
+            "MCP_RESPONSE",
+            {
+                "direction": "inbound",
+                "status": resp.status_code,
+                "headers": list(resp.headers.items()),
+                "body": body,
+            },
+        )
+        data = json.loads(body or "null")
+        if resp.status_code != 200 or not isinstance(data, list):
+            err = data.get("error") if isinstance(data, dict) else None
+            if not err:
+                err = {"code": str(resp.status_code), "message": "invalid batch response"}
+            log_event("TOOL_RESULT", {"error": err}, start_time=start)
+            log_event("ERROR", {"error": err})
+            self._update_ready_state(False, err)
+            for position, _name, _arguments in pending:
+                results[position] = {"ok": False, "error": err}
+            return results  # type: ignore[return-value]
+
+        self._update_ready_state(True, None)
+        by_id = {
+            entry.get("id"): entry for entry in data if isinstance(entry, dict)
+        }
+        for position, name, arguments in pending:
+            entry = by_id.get(position)
+            if entry is None:
+                err = mcp_error(
+                    ErrorCode.INTERNAL, f"missing batch result for {name}"
+                )["error"]
+            else:
+                err = entry.get("error")
+            if err:
+                log_event("TOOL_RESULT", {"error": err}, start_time=start)
+                log_event("ERROR", {"error": err})
+                results[position] = {"ok": False, "error": err}
+                continue
+            result = entry.get("result")
+            log_event("TOOL_RESULT", {"result": result}, start_time=start)
+            self._broadcast_tool_result(name, arguments, result)
+            results[position] = {"ok": True, "error": None, "result": result}
+        log_event("DONE")
+        return results  # type: ignore[return-value]
+
     # ------------------------------------------------------------------
     def ensure_ready(self, *, force: bool = False) -> None:
         """Raise :class:`MCPNotReadyError` if the MCP server is unavailable."""
@@ -0,0 +1,162 @@
+"""Thread-pool execution of MCP tools with per-root reader/writer locking."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Callable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+__all__ = ["DEFAULT_TOOL_WORKERS", "ReadWriteLock", "ToolExecutor"]
+
+DEFAULT_TOOL_WORKERS = 4
+
+
+class ReadWriteLock:
+    """Lock admitting many readers or a single writer.
+
+    Waiting writers block new readers, so a steady stream of read tools cannot
+    starve a pending write. The writing thread may re-enter the lock in
+    either mode, e.g. when a write tool calls mutators of a shared service
+    that take the same lock.
+    """
+
+    def __init__(self) -> None:
+        """Create an unlocked lock."""
+        self._condition = threading.Condition()
+        self._readers = 0
+        self._writer: int | None = None
+        self._writer_depth = 0
+        self._waiting_writers = 0
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        """Hold the lock in shared mode."""
+        if self._writer == threading.get_ident():
+            yield
+            return
+        with self._condition:
+            while self._writer is not None or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._readers -= 1
+                if not self._readers:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        """Hold the lock exclusively."""
+        me = threading.get_ident()
+        with self._condition:
+            if self._writer != me:
+                self._waiting_writers += 1
+                try:
+                    while self._writer is not None or self._readers:
+                        self._condition.wait()
+                finally:
+                    self._waiting_writers -= 1
+                self._writer = me
+            self._writer_depth += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writer_depth -= 1
+                if not self._writer_depth:
+                    self._writer = None
+                    self._condition.notify_all()
+
+
+class ToolExecutor:
+    """Run synchronous tool callables on a bounded thread pool.
+
+    Calls are serialized per requirements root through a
+    :class:`ReadWriteLock`: read-only tools share it while any other tool
+    holds it exclusively.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_TOOL_WORKERS) -> None:
+        """Create a pool of ``max_workers`` threads (at least one)."""
+        if max_workers < 1:
+            raise ValueError("max_workers must be positive")
+        self.max_workers = max_workers
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="mcp-tool"
+        )
+        self._locks: dict[str, ReadWriteLock] = {}
+        self._locks_guard = threading.Lock()
+
+    def lock_for(self, root: str | Path) -> ReadWriteLock:
+        """Return the lock guarding requirements stored under ``root``."""
+        key = _root_key(root)
+        with self._locks_guard:
+            lock = self._locks.get(key)
+            if lock is None:
+                lock = self._locks[key] = ReadWriteLock()
+            return lock
+
+    def call(
+        self,
+        func: Callable[..., Any],
+        arguments: Mapping[str, Any],
+        *,
+        root: str | Path,
+        read_only: bool,
+    ) -> Any:
+        """Invoke ``func(**arguments)`` in the calling thread under the root lock."""
+        lock = self.lock_for(root)
+        with lock.read() if read_only else lock.write():
+            return func(**arguments)
+
+    async def run(
+        self,
+        func: Callable[..., Any],
+        arguments: Mapping[str, Any],
+        *,
+        root: str | Path,
+        read_only: bool,
+    ) -> Any:
+        """Await :meth:`call` executed on the pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._pool,
+            partial(self.call, func, arguments, root=root, read_only=read_only),
+        )
+
+    async def run_exclusive(
+        self, func: Callable[[], Any], *, root: str | Path
+    ) -> Any:
+        """Await ``func()`` on the pool while holding the root lock exclusively.
+
+        Lets callers apply several mutations without other tools interleaving.
+        """
+        lock = self.lock_for(root)
+
+        def _locked() -> Any:
+            with lock.write():
+                return func()
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, _locked)
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        """Stop accepting calls and release the worker threads."""
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+
+def _root_key(root: str | Path) -> str:
+    text = str(root)
+    if not text:
+        return ""
+    try:
+        return str(Path(text).resolve())
+    except OSError:  # pragma: no cover - unusual filesystem errors
+        return text
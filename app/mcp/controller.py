@@ -7,9 +7,15 @@ from dataclasses import dataclass
 from enum import StrEnum
 from http.client import HTTPConnection
 
-from ..settings import MCPSettings
+from ..services.requirements import RequirementsService
+from ..settings import MCPSettings, StorageSettings
+from .server import (
+    configure_requirements_services,
+    register_requirements_service,
+    start_server,
+    stop_server,
+)
 from .server import is_running as server_is_running
-from .server import start_server, stop_server
 
 logger = logging.getLogger(__name__)
 
@@ -52,8 +58,17 @@ class MCPController:
             token_model=token_model,
             documents_max_read_kb=settings.documents_max_read_kb,
             log_dir=settings.log_dir,
+            tool_workers=settings.tool_workers,
         )
 
+    def share_requirements_service(self, service: RequirementsService) -> None:
+        """Serve MCP tool calls for ``service.root`` through ``service``."""
+        register_requirements_service(service)
+
+    def configure_storage(self, settings: StorageSettings) -> None:
+        """Apply requirement storage ``settings`` to services MCP tools create."""
+        configure_requirements_services(use_index=settings.use_index)
+
     def stop(self) -> None:
         """Shut down the MCP server if running."""
         if not server_is_running():
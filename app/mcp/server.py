@@ -7,10 +7,13 @@ loop remains responsive.
 """
 from __future__ import annotations
 
+import asyncio
 import threading
 import time
-from collections.abc import Mapping
-from contextlib import suppress
+from collections.abc import Callable, Mapping
+from contextlib import AbstractContextManager, suppress
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
 from typing import Any
 from uuid import uuid4
@@ -27,6 +30,7 @@ from ..services.user_documents import (
     UserDocumentsService,
 )
 from ..util.time import utc_now_iso
+from .concurrency import DEFAULT_TOOL_WORKERS, ToolExecutor
 from .paths import resolve_documents_root
 from . import request_logging
 from .service_cache import RequirementsServiceCache
@@ -49,6 +53,7 @@ app.state.max_context_tokens = 0
 app.state.token_model = None
 app.state.documents_service: UserDocumentsService | None = None
 app.state.requirements_service_cache = RequirementsServiceCache()
+app.state.tool_executor: ToolExecutor | None = None
 
 
 def get_requirements_service(base_path: str | Path) -> RequirementsService:
@@ -57,6 +62,27 @@ def get_requirements_service(base_path: str | Path) -> RequirementsService:
     return cache.get(base_path)
 
 
+def register_requirements_service(service: RequirementsService) -> None:
+    """Let MCP tools reuse ``service`` for requests targeting its root.
+
+    Mutations made through ``service`` outside MCP (e.g. from the GUI) then
+    hold the root's tool lock exclusively, like write tools do.
+    """
+    cache: RequirementsServiceCache = app.state.requirements_service_cache
+    service.set_write_guard(partial(_exclusive_root, str(service.root)))
+    cache.register(service)
+
+
+def _exclusive_root(root: str) -> AbstractContextManager[None]:
+    return _tool_executor().lock_for(root).write()
+
+
+def configure_requirements_services(*, use_index: bool) -> None:
+    """Build MCP requirements services with the persistent index when enabled."""
+    cache: RequirementsServiceCache = app.state.requirements_service_cache
+    cache.configure(use_index=use_index)
+
+
 
 
 def _configure_request_logging(log_dir: str | Path | None) -> Path:
@@ -132,6 +158,18 @@ _TOOLS, _TOOL_METADATA = build_tool_registry(
     documents_service_provider=_documents_service,
 )
 
+_executor_guard = threading.Lock()
+
+
+def _tool_executor() -> ToolExecutor:
+    """Return the executor for tool calls, creating a default one on demand."""
+    with _executor_guard:
+        executor: ToolExecutor | None = app.state.tool_executor
+        if executor is None:
+            executor = ToolExecutor(DEFAULT_TOOL_WORKERS)
+            app.state.tool_executor = executor
+        return executor
+
 
 # --------------------------- MCP metadata ---------------------------------
 
@@ -152,7 +190,13 @@ async def describe_tools() -> dict[str, Any]:
 
 @app.post("/mcp")
 async def call_tool(request: Request) -> JSONResponse:
-    """Invoke a registered MCP tool via HTTP."""
+    """Invoke a registered MCP tool via HTTP.
+
+    The tool runs on the executor's thread pool so the event loop stays free;
+    read-only tools for the same requirements root run concurrently while
+    other tools hold the root exclusively. A JSON array body is handled as a
+    batch, see :func:`_call_batch`.
+    """
     request_id = getattr(request.state, "request_id", None)
     try:
         body = await request.json()
@@ -161,6 +205,13 @@ async def call_tool(request: Request) -> JSONResponse:
             mcp_error(ErrorCode.VALIDATION_ERROR, "invalid json"),
             status_code=400,
         )
+    if isinstance(body, list):
+        return await _call_batch(body, request_id=request_id)
+    if not isinstance(body, Mapping):
+        return JSONResponse(
+            mcp_error(ErrorCode.VALIDATION_ERROR, "expected a JSON object or array"),
+            status_code=400,
+        )
 
     name = body.get("name")
     arguments = body.get("arguments") or {}
@@ -177,33 +228,171 @@ async def call_tool(request: Request) -> JSONResponse:
             status_code=404,
         )
 
-    try:
-        result = func(**arguments)
-    except TypeError as exc:
-        _log_tool_event(
-            name,
-            arguments,
-            "invalid-arguments",
-            request_id=request_id,
-            error=str(exc),
-        )
+    outcome, payload = await _tool_executor().run(
+        partial(_invoke_tool, name, func, arguments),
+        {},
+        root=_base_path(),
+        read_only=_is_read_only(name),
+    )
+    _log_tool_event(
+        name,
+        arguments,
+        outcome,
+        request_id=request_id,
+        error=_outcome_error(outcome, payload),
+    )
+    if outcome == "invalid-arguments":
+        return JSONResponse(payload, status_code=400)
+    if outcome == "error":
+        return JSONResponse(payload, status_code=500)
+    return JSONResponse(payload)
+
+
+@dataclass(slots=True)
+class _BatchCall:
+    position: int
+    call_id: Any
+    name: str
+    func: Callable[..., Any]
+    arguments: Any
+    read_only: bool
+
+
+async def _call_batch(
+    entries: list[Any], *, request_id: str | None
+) -> JSONResponse:
+    """Run a JSON-RPC-style batch of tool calls and return per-call results.
+
+    Each entry is ``{"id": ..., "name": ..., "arguments": {...}}``; the
+    response lists ``{"id": ..., "result": ...}`` or ``{"id": ..., "error":
+    ...}`` in request order, with ``id`` defaulting to the entry position.
+    A batch of read-only calls runs them concurrently. A batch containing a
+    write holds the requirements root exclusively for its whole duration and
+    applies every call in request order, so no other client can interleave
+    with it. Once a write fails, later writes in the batch are skipped.
+    """
+    if not entries:
         return JSONResponse(
-            mcp_error(ErrorCode.VALIDATION_ERROR, str(exc)),
+            mcp_error(ErrorCode.VALIDATION_ERROR, "empty batch"),
             status_code=400,
         )
-    except Exception as exc:  # pragma: no cover - defensive
-        logger.exception("Unhandled MCP tool failure for %s", name)
-        error_payload = exception_to_mcp_error(exc)
+    responses: list[dict[str, Any] | None] = [None] * len(entries)
+    calls: list[_BatchCall] = []
+    for position, entry in enumerate(entries):
+        if not isinstance(entry, Mapping):
+            responses[position] = _batch_entry(
+                position,
+                mcp_error(ErrorCode.VALIDATION_ERROR, "expected a JSON object"),
+            )
+            continue
+        call_id = entry.get("id", position)
+        name = entry.get("name")
+        if not isinstance(name, str):
+            responses[position] = _batch_entry(
+                call_id, mcp_error(ErrorCode.VALIDATION_ERROR, "missing tool name")
+            )
+            continue
+        func = _TOOLS.get(name)
+        if func is None:
+            responses[position] = _batch_entry(
+                call_id, mcp_error(ErrorCode.NOT_FOUND, f"unknown tool: {name}")
+            )
+            continue
+        calls.append(
+            _BatchCall(
+                position,
+                call_id,
+                name,
+                func,
+                entry.get("arguments") or {},
+                _is_read_only(name),
+            )
+        )
+
+    executor = _tool_executor()
+    root = _base_path()
+
+    def _apply_in_order() -> list[tuple[str, Any]]:
+        write_failed = False
+        outcomes: list[tuple[str, Any]] = []
+        for call in calls:
+            if not call.read_only and write_failed:
+                outcomes.append(
+                    (
+                        "skipped",
+                        mcp_error(
+                            ErrorCode.CONFLICT,
+                            "skipped after an earlier write in the batch failed",
+                        ),
+                    )
+                )
+                continue
+            outcome, payload = _invoke_tool(call.name, call.func, call.arguments)
+            if not call.read_only and (outcome != "ok" or _is_error_payload(payload)):
+                write_failed = True
+            outcomes.append((outcome, payload))
+        return outcomes
+
+    if all(call.read_only for call in calls):
+        outcomes = await asyncio.gather(
+            *(
+                executor.run(
+                    partial(_invoke_tool, call.name, call.func, call.arguments),
+                    {},
+                    root=root,
+                    read_only=True,
+                )
+                for call in calls
+            )
+        )
+    else:
+        outcomes = await executor.run_exclusive(_apply_in_order, root=root)
+    for call, (outcome, payload) in zip(calls, outcomes, strict=True):
         _log_tool_event(
-            name,
-            arguments,
-            "error",
+            call.name,
+            call.arguments if isinstance(call.arguments, Mapping) else None,
+            outcome,
             request_id=request_id,
-            error=str(exc),
+            error=_outcome_error(outcome, payload),
         )
-        return JSONResponse(error_payload, status_code=500)
-    _log_tool_event(name, arguments, "ok", request_id=request_id)
-    return JSONResponse(result)
+        responses[call.position] = _batch_entry(call.call_id, payload)
+    return JSONResponse(responses)
+
+
+def _is_read_only(name: str) -> bool:
+    return bool(_TOOL_METADATA[name].get("read_only"))
+
+
+def _invoke_tool(
+    name: str, func: Callable[..., Any], arguments: Any
+) -> tuple[str, Any]:
+    """Call ``func`` and return its log outcome with the response payload."""
+    try:
+        return "ok", func(**arguments)
+    except TypeError as exc:
+        return "invalid-arguments", mcp_error(ErrorCode.VALIDATION_ERROR, str(exc))
+    except Exception as exc:  # pragma: no cover - defensive
+        logger.exception("Unhandled MCP tool failure for %s", name)
+        return "error", exception_to_mcp_error(exc)
+
+
+def _is_error_payload(payload: Any) -> bool:
+    return isinstance(payload, Mapping) and "error" in payload
+
+
+def _outcome_error(outcome: str, payload: Any) -> str | None:
+    if outcome == "ok" or not _is_error_payload(payload):
+        return None
+    error = payload["error"]
+    if isinstance(error, Mapping):
+        return str(error.get("message", ""))
+    return str(error)
+
+
+def _batch_entry(call_id: Any, payload: Any) -> dict[str, Any]:
+    if _is_error_payload(payload):
+        return {"id": call_id, "error": payload["error"]}
+    return {"id": call_id, "result": payload}
 
 
 def _log_tool_event(
@@ -255,6 +444,7 @@ def start_server(
     token_model: str | None = None,
     documents_max_read_kb: int = 10,
     log_dir: str | Path | None = None,
+    tool_workers: int = DEFAULT_TOOL_WORKERS,
 ) -> None:
     """Start the HTTP server in a background thread.
 
@@ -272,6 +462,7 @@ def start_server(
             ``read_user_document`` when the agent omits ``max_bytes``.
         log_dir: Directory where request logs are stored.  Defaults to the
             application log directory under ``mcp`` when not provided.
+        tool_workers: Number of threads executing tool calls.
     """
     global _uvicorn_server, _server_thread
 
@@ -291,6 +482,11 @@ def start_server(
     cache: RequirementsServiceCache = app.state.requirements_service_cache
     cache.activate(base_path)
     app.state.base_path = base_path
+    with _executor_guard:
+        previous: ToolExecutor | None = app.state.tool_executor
+        app.state.tool_executor = ToolExecutor(tool_workers)
+    if previous is not None:
+        previous.shutdown(wait=False)
     documents_root = resolve_documents_root(base_path, documents_path)
     app.state.documents_root = str(documents_root) if documents_root else None
     app.state.max_context_tokens = int(max_context_tokens)
@@ -412,5 +608,10 @@ def stop_server() -> None:
     app.state.max_context_tokens = 0
     app.state.token_model = None
     app.state.base_path = ""
+    with _executor_guard:
+        executor: ToolExecutor | None = app.state.tool_executor
+        app.state.tool_executor = None
+    if executor is not None:
+        executor.shutdown()
     cache: RequirementsServiceCache = app.state.requirements_service_cache
     cache.deactivate()
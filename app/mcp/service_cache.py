@@ -16,6 +16,7 @@ class RequirementsServiceCache:
         self._lock = threading.RLock()
         self._services: dict[Path, RequirementsService] = {}
         self._active_base: Path | None = None
+        self._use_index = False
 
     @staticmethod
     def _normalize(base_path: str | Path) -> Path:
@@ -27,7 +28,11 @@ class RequirementsServiceCache:
         target = self._normalize(base_path)
         with self._lock:
             if self._active_base != target:
-                self._services.clear()
+                self._services = {
+                    path: service
+                    for path, service in self._services.items()
+                    if path == target
+                }
                 self._active_base = target
 
     def deactivate(self) -> None:
@@ -36,12 +41,29 @@ class RequirementsServiceCache:
             self._services.clear()
             self._active_base = None
 
+    def configure(self, *, use_index: bool) -> None:
+        """Build services with ``use_index``, dropping ones built otherwise."""
+        with self._lock:
+            if self._use_index != use_index:
+                self._use_index = use_index
+                self._services = {
+                    path: service
+                    for path, service in self._services.items()
+                    if service.use_index == use_index
+                }
+
+    def register(self, service: RequirementsService) -> None:
+        """Serve *service* for its root so other callers share its warm caches."""
+        target = self._normalize(service.root)
+        with self._lock:
+            self._services[target] = service
+
     def get(self, base_path: str | Path) -> RequirementsService:
         """Return a cached service for *base_path* creating it on demand."""
         target = self._normalize(base_path)
         with self._lock:
             service = self._services.get(target)
             if service is None:
-                service = RequirementsService(target)
+                service = RequirementsService(target, use_index=self._use_index)
                 self._services[target] = service
             return service
@@ -5,6 +5,7 @@ from __future__ import annotations
 import inspect
 from copy import deepcopy
 from collections.abc import Callable, Mapping, Sequence
+from functools import cache
 from typing import Any
 
 from ..services.user_documents import UserDocumentsService
@@ -277,7 +278,11 @@ def build_tool_registry(
     base_path_provider: BasePathProvider,
     documents_service_provider: DocumentsServiceProvider,
 ) -> tuple[dict[str, ToolCallable], dict[str, dict[str, Any]]]:
-    """Return MCP tool callables and metadata bound to runtime providers."""
+    """Return MCP tool callables and metadata bound to runtime providers.
+
+    Each metadata entry carries ``read_only``; tools flagged this way never
+    modify requirements or documents and may run concurrently.
+    """
     tools: dict[str, ToolCallable] = {}
     tool_metadata: dict[str, dict[str, Any]] = {}
 
@@ -287,6 +292,7 @@ def build_tool_registry(
         name: str | None = None,
         schema: Mapping[str, Any] | None = None,
         result_schema: Mapping[str, Any] | None = None,
+        read_only: bool = False,
     ) -> ToolCallable | Callable[[ToolCallable], ToolCallable]:
         def decorator(target: ToolCallable) -> ToolCallable:
             tool_name = name or target.__name__
@@ -294,7 +300,11 @@ def build_tool_registry(
                 raise ValueError(f"duplicate MCP tool registered: {tool_name}")
             tools[tool_name] = target
             description = inspect.getdoc(target) or ""
-            entry: dict[str, Any] = {"name": tool_name, "description": description}
+            entry: dict[str, Any] = {
+                "name": tool_name,
+                "description": description,
+                "read_only": read_only,
+            }
             schema_payload = _schema_copy(schema)
             if schema_payload is not None:
                 entry["arguments_schema"] = schema_payload
@@ -308,7 +318,7 @@ def build_tool_registry(
             return decorator(func)
         return decorator
 
-    @register_tool(schema=TOOL_ARGUMENT_SCHEMAS["list_requirements"])
+    @register_tool(schema=TOOL_ARGUMENT_SCHEMAS["list_requirements"], read_only=True)
     def list_requirements(
         *,
         prefix: str,
@@ -328,11 +338,11 @@ def build_tool_registry(
             fields=fields,
         )
 
-    @register_tool(schema=TOOL_ARGUMENT_SCHEMAS["get_requirement"])
+    @register_tool(schema=TOOL_ARGUMENT_SCHEMAS["get_requirement"], read_only=True)
     def get_requirement(rid: str | Sequence[str], fields: list[str] | None = None) -> dict:
         return _tools_read_module().get_requirement(base_path_provider(), rid, fields=fields)
 
-    @register_tool(schema=TOOL_ARGUMENT_SCHEMAS["search_requirements"])
+    @register_tool(schema=TOOL_ARGUMENT_SCHEMAS["search_requirements"], read_only=True)
     def search_requirements(
         *,
         query: str | None = None,
@@ -352,7 +362,7 @@ def build_tool_registry(
             fields=fields,
         )
 
-    @register_tool(schema=TOOL_ARGUMENT_SCHEMAS["list_labels"])
+    @register_tool(schema=TOOL_ARGUMENT_SCHEMAS["list_labels"], read_only=True)
     def list_labels(prefix: str) -> dict:
         return _tools_read_module().list_labels(base_path_provider(), prefix=prefix)
 
@@ -451,11 +461,11 @@ def build_tool_registry(
             link_type=link_type,
         )
 
-    @register_tool(schema=TOOL_ARGUMENT_SCHEMAS["list_user_documents"])
+    @register_tool(schema=TOOL_ARGUMENT_SCHEMAS["list_user_documents"], read_only=True)
     def list_user_documents() -> dict:
         return _tools_documents_module().list_user_documents(documents_service_provider())
 
-    @register_tool(schema=TOOL_ARGUMENT_SCHEMAS["read_user_document"])
+    @register_tool(schema=TOOL_ARGUMENT_SCHEMAS["read_user_document"], read_only=True)
     def read_user_document(
         path: str,
         *,
@@ -490,3 +500,15 @@ def build_tool_registry(
         return _tools_documents_module().delete_user_document(documents_service_provider(), path)
 
     return tools, tool_metadata
+
+
+@cache
+def read_only_tool_names() -> frozenset[str]:
+    """Return names of registered tools declared with ``read_only=True``."""
+    _tools, metadata = build_tool_registry(
+        base_path_provider=lambda: "",
+        documents_service_provider=lambda: None,
+    )
+    return frozenset(
+        name for name, entry in metadata.items() if entry.get("read_only")
+    )
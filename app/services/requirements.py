@@ -3,27 +3,38 @@
 from __future__ import annotations
 
 import re
-from contextlib import suppress
+from contextlib import AbstractContextManager, nullcontext, suppress
 import shutil
+import threading
 import uuid
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass, field
+from functools import wraps
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 from ..core import document_store as doc_store
+from ..core.document_store.cache import DEFAULT_REQUIREMENT_CACHE_SIZE
 from ..core.document_store import (
     Document,
     DocumentLabels,
     DocumentNotFoundError,
     LabelDef,
+    LoadOptions,
     SharedArtifact,
+    RequirementCache,
     RequirementIDCollisionError,
+    RequirementIndex,
     RequirementNotFoundError,
     RequirementPage,
     ValidationError,
 )
 from ..core.model import Requirement
+from ..core.requirement_sorting import (
+    SortKeyCache,
+    card_sort_key,
+    sort_requirements_for_cards,
+)
 from ..util.time import local_now_str
 
 MAX_REQUIREMENT_ATTACHMENT_BYTES = 10 * 1024 * 1024
@@ -97,27 +108,95 @@ def title_starts_with_rid(title: str, rid: str) -> bool:
     return same_rid(first_token, rid)
 
 
+def _exclusive[F: Callable[..., Any]](method: F) -> F:
+    """Run mutator ``method`` inside the service's write guard."""
+
+    @wraps(method)
+    def wrapper(self: RequirementsService, *args: Any, **kwargs: Any) -> Any:
+        with self._write_guard():
+            return method(self, *args, **kwargs)
+
+    return cast(F, wrapper)
+
+
 @dataclass
 class RequirementsService:
-    """High level gateway around the document store."""
+    """High level gateway around the document store.
+
+    Parsed requirements are kept in a bounded LRU
+    :class:`~app.core.document_store.RequirementCache` validated against item
+    file stats; the service's own mutators invalidate affected entries. With
+    ``use_index`` enabled bulk reads are answered from the persistent
+    :class:`~app.core.document_store.RequirementIndex` stored under
+    ``<root>/.cookareq/``. ``load_workers`` above one decodes item files of
+    bulk reads with a ``load_executor`` (``"thread"`` or ``"process"``) pool.
+    A service shared with the MCP server runs its mutators inside the write
+    guard installed with :meth:`set_write_guard`, so they exclude MCP tools
+    working on the same root while reads keep running in parallel.
+    """
 
     root: Path | str
+    use_index: bool = False
+    requirement_cache_size: int = DEFAULT_REQUIREMENT_CACHE_SIZE
+    load_workers: int = 1
+    load_executor: str = "thread"
     _documents: dict[str, Document] | None = field(default=None, init=False, repr=False)
+    _index: RequirementIndex | None = field(default=None, init=False, repr=False)
+    _requirements: RequirementCache = field(init=False, repr=False)
+    _sort_keys: SortKeyCache = field(init=False, repr=False, compare=False)
+    _load_options: LoadOptions = field(init=False, repr=False)
+    _documents_lock: threading.RLock = field(
+        default_factory=threading.RLock, init=False, repr=False, compare=False
+    )
+    _write_guard: Callable[[], AbstractContextManager[Any]] = field(
+        default=nullcontext, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
         """Normalise the configured root into a :class:`~pathlib.Path`."""
         self.root = Path(self.root)
+        self._load_options = LoadOptions(
+            workers=self.load_workers, executor=self.load_executor
+        )
+        if self.use_index:
+            self._index = RequirementIndex(self.root)
+        self._requirements = RequirementCache(self.requirement_cache_size)
+        self._sort_keys = SortKeyCache(card_sort_key, match_equal=True)
+
+    @property
+    def load_options(self) -> LoadOptions:
+        """Return options used to decode item files during bulk reads."""
+        return self._load_options
 
     # ------------------------------------------------------------------
+    def set_write_guard(
+        self, guard: Callable[[], AbstractContextManager[Any]] | None
+    ) -> None:
+        """Run mutators inside contexts returned by ``guard`` (``None`` resets)."""
+        self._write_guard = guard or nullcontext
+
     def clear_cache(self) -> None:
-        """Drop cached document metadata."""
-        self._documents = None
+        """Drop cached document metadata and parsed requirements."""
+        with self._documents_lock:
+            self._documents = None
+        self._requirements.clear()
+        self._sort_keys.clear()
+
+    def _forget_requirement(self, rid: str) -> None:
+        """Invalidate the cached copy of requirement ``rid`` if any."""
+        try:
+            prefix, item_id = doc_store.parse_rid(rid)
+        except ValueError:
+            return
+        self._requirements.invalidate(prefix, item_id)
+        self._sort_keys.invalidate((prefix, item_id))
 
     # ------------------------------------------------------------------
     def _ensure_documents(self, *, refresh: bool = False) -> dict[str, Document]:
-        if refresh or self._documents is None:
-            self._documents = doc_store.load_documents(self.root)
-        return self._documents
+        with self._documents_lock:
+            if refresh or self._documents is None:
+                self._documents = doc_store.load_documents(self.root)
+            return self._documents
 
     def load_documents(self, *, refresh: bool = False) -> dict[str, Document]:
         """Return mapping of prefix to :class:`Document` under ``root``."""
@@ -152,12 +231,14 @@ class RequirementsService:
         return cached
 
     # ------------------------------------------------------------------
+    @_exclusive
     def save_document(self, document: Document) -> Path:
         """Persist ``document`` metadata and refresh the cache."""
         path = doc_store.save_document(self.root / document.prefix, document)
         self._ensure_documents(refresh=True)
         return path
 
+    @_exclusive
     def create_document(
         self,
         *,
@@ -171,10 +252,17 @@ class RequirementsService:
         self.save_document(document)
         return document
 
+    @_exclusive
     def delete_document(self, prefix: str) -> bool:
         """Delete document ``prefix`` and refresh the cache on success."""
         docs = self._ensure_documents()
-        removed = doc_store.delete_document(self.root, prefix, docs)
+        try:
+            removed = doc_store.delete_document(
+                self.root, prefix, docs, index=self._index
+            )
+        finally:
+            self._requirements.clear()
+            self._sort_keys.clear()
         if removed:
             self._ensure_documents(refresh=True)
         return removed
@@ -203,6 +291,7 @@ class RequirementsService:
         directory = self.root / prefix
         return doc_store.next_item_id(directory, doc)
 
+    @_exclusive
     def save_requirement_payload(self, prefix: str, payload: Mapping[str, Any]) -> Path:
         """Persist raw requirement ``payload`` under document ``prefix``."""
         doc = self.get_document(prefix)
@@ -250,22 +339,36 @@ class RequirementsService:
                 bump_document_revision = statement_changed
             else:
                 bump_document_revision = True
-        path = doc_store.save_item(directory, doc, resolved_payload, docs=docs)
+        path = doc_store.save_item(
+            directory, doc, resolved_payload, docs=docs, index=self._index
+        )
+        if isinstance(item_id, int):
+            self._requirements.invalidate(prefix, item_id)
+            self._sort_keys.invalidate((prefix, item_id))
         if bump_document_revision:
             doc_store.bump_document_revision(self.root, prefix, docs)
         return path
 
+    @_exclusive
     def delete_requirement(self, rid: str) -> str:
         """Delete requirement ``rid`` enforcing revision semantics."""
         docs = self._ensure_documents()
-        return doc_store.delete_requirement(self.root, rid, docs=docs)
+        try:
+            return doc_store.delete_requirement(
+                self.root, rid, docs=docs, index=self._index
+            )
+        finally:
+            # Deleting rewrites every item that linked to ``rid``.
+            self._requirements.clear()
+            self._sort_keys.clear()
 
     def plan_delete_requirement(self, rid: str) -> tuple[bool, list[str]]:
         """Return existence flag and references for requirement ``rid``."""
         docs = self._ensure_documents()
-        return doc_store.plan_delete_item(self.root, rid, docs)
+        return doc_store.plan_delete_item(self.root, rid, docs, index=self._index)
 
     # ------------------------------------------------------------------
+    @_exclusive
     def create_requirement(self, prefix: str, data: Mapping[str, Any]) -> Requirement:
         """Create a new requirement within ``prefix``."""
         docs = self._ensure_documents()
@@ -277,12 +380,17 @@ class RequirementsService:
             promoted = self._promote_label_definitions(prefix, normalized, docs)
             if promoted:
                 docs = self._ensure_documents(refresh=True)
-        return doc_store.create_requirement(
+        requirement = doc_store.create_requirement(
             self.root,
             prefix=prefix,
             data=payload,
             docs=docs,
-)
+            index=self._index,
+        )
+        self._forget_requirement(requirement.rid)
+        return requirement
+
+    @_exclusive
     def copy_requirement(
         self,
         rid: str,
@@ -294,7 +402,9 @@ class RequirementsService:
         """Duplicate requirement ``rid`` under ``new_prefix``."""
 
         docs = self._ensure_documents()
-        original = doc_store.get_requirement(self.root, rid, docs=docs)
+        original = doc_store.get_requirement(
+            self.root, rid, docs=docs, requirement_cache=self._requirements
+        )
         payload = original.to_mapping()
 
         if reset_revision:
@@ -311,18 +421,24 @@ class RequirementsService:
             if promoted:
                 docs = self._ensure_documents(refresh=True)
 
-        return doc_store.create_requirement(
+        requirement = doc_store.create_requirement(
             self.root,
             prefix=new_prefix,
             data=payload,
             docs=docs,
+            index=self._index,
         )
+        self._forget_requirement(requirement.rid)
+        return requirement
 
     def get_requirement(self, rid: str) -> Requirement:
         """Return requirement ``rid`` using cached documents when possible."""
         docs = self._ensure_documents()
-        return doc_store.get_requirement(self.root, rid, docs=docs)
+        return doc_store.get_requirement(
+            self.root, rid, docs=docs, requirement_cache=self._requirements
+        )
 
+    @_exclusive
     def move_requirement(
         self,
         rid: str,
@@ -332,14 +448,21 @@ class RequirementsService:
     ) -> Requirement:
         """Move requirement ``rid`` to document ``new_prefix``."""
         docs = self._ensure_documents()
-        return doc_store.move_requirement(
-            self.root,
-            rid,
-            new_prefix=new_prefix,
-            payload=payload,
-            docs=docs,
-        )
+        try:
+            return doc_store.move_requirement(
+                self.root,
+                rid,
+                new_prefix=new_prefix,
+                payload=payload,
+                docs=docs,
+                index=self._index,
+            )
+        finally:
+            # Moving rewrites every item that linked to ``rid``.
+            self._requirements.clear()
+            self._sort_keys.clear()
 
+    @_exclusive
     def update_requirement_field(
         self,
         rid: str,
@@ -349,14 +472,19 @@ class RequirementsService:
     ) -> Requirement:
         """Update a single field on the requirement identified by ``rid``."""
         docs = self._ensure_documents()
-        return doc_store.update_requirement_field(
-            self.root,
-            rid,
-            field=field,
-            value=value,
-            docs=docs,
-        )
+        try:
+            return doc_store.update_requirement_field(
+                self.root,
+                rid,
+                field=field,
+                value=value,
+                docs=docs,
+                index=self._index,
+            )
+        finally:
+            self._forget_requirement(rid)
 
+    @_exclusive
     def set_requirement_labels(self, rid: str, labels: Sequence[str]) -> Requirement:
         """Replace labels associated with ``rid`` ensuring validation."""
         docs = self._ensure_documents()
@@ -366,22 +494,32 @@ class RequirementsService:
             raise ValidationError(str(exc)) from exc
         normalized = self._normalize_requirement_labels(prefix, labels, docs)
         promoted = self._promote_label_definitions(prefix, normalized, docs)
-        requirement = doc_store.set_requirement_labels(
-            self.root,
-            rid,
-            labels=normalized,
-            docs=docs,
-        )
+        try:
+            requirement = doc_store.set_requirement_labels(
+                self.root,
+                rid,
+                labels=normalized,
+                docs=docs,
+                index=self._index,
+            )
+        finally:
+            self._forget_requirement(rid)
         if promoted:
             self._ensure_documents(refresh=True)
         return requirement
 
+    @_exclusive
     def sync_labels_from_requirements(self, prefix: str) -> list[LabelDef]:
         """Promote missing labels observed on requirements for ``prefix``."""
 
         docs = self._ensure_documents()
         requirements = doc_store.load_requirements(
-            self.root, prefixes=[prefix], docs=docs
+            self.root,
+            prefixes=[prefix],
+            docs=docs,
+            index=self._index,
+            requirement_cache=self._requirements,
+            load_options=self._load_options,
         )
         observed: list[str] = []
         for requirement in requirements:
@@ -391,6 +529,7 @@ class RequirementsService:
             self._ensure_documents(refresh=True)
         return promoted
 
+    @_exclusive
     def set_requirement_attachments(
         self,
         rid: str,
@@ -398,13 +537,18 @@ class RequirementsService:
     ) -> Requirement:
         """Synchronise attachment metadata for requirement ``rid``."""
         docs = self._ensure_documents()
-        return doc_store.set_requirement_attachments(
-            self.root,
-            rid,
-            attachments=attachments,
-            docs=docs,
-        )
+        try:
+            return doc_store.set_requirement_attachments(
+                self.root,
+                rid,
+                attachments=attachments,
+                docs=docs,
+                index=self._index,
+            )
+        finally:
+            self._forget_requirement(rid)
 
+    @_exclusive
     def upload_requirement_attachment(
         self,
         prefix: str,
@@ -424,6 +568,7 @@ class RequirementsService:
         suffix = Path(source).suffix.lower()
         return suffix in ALLOWED_SHARED_ARTIFACT_EXPORT_SUFFIXES
 
+    @_exclusive
     def upload_shared_artifact(
         self,
         prefix: str,
@@ -453,6 +598,7 @@ class RequirementsService:
         self.save_document(doc)
         return artifact
 
+    @_exclusive
     def remove_shared_artifact(
         self,
         prefix: str,
@@ -480,6 +626,7 @@ class RequirementsService:
                     candidate.unlink()
         return True
 
+    @_exclusive
     def update_shared_artifact(
         self,
         prefix: str,
@@ -527,6 +674,7 @@ class RequirementsService:
                 return self.root / requirement.doc_prefix / attachment.path
         raise ValidationError(f"attachment id not found: {attachment_id}")
 
+    @_exclusive
     def set_requirement_links(
         self,
         rid: str,
@@ -534,12 +682,16 @@ class RequirementsService:
     ) -> Requirement:
         """Persist traceability links for requirement ``rid``."""
         docs = self._ensure_documents()
-        return doc_store.set_requirement_links(
-            self.root,
-            rid,
-            links=links,
-            docs=docs,
-        )
+        try:
+            return doc_store.set_requirement_links(
+                self.root,
+                rid,
+                links=links,
+                docs=docs,
+                index=self._index,
+            )
+        finally:
+            self._forget_requirement(rid)
 
     def _copy_attachment_asset(self, prefix: str, source: Path) -> str:
         self.get_document(prefix)
@@ -601,6 +753,7 @@ class RequirementsService:
         shutil.copy2(source, candidate)
         return str(Path("shared") / candidate.name)
 
+    @_exclusive
     def link_requirements(
         self,
         *,
@@ -610,13 +763,17 @@ class RequirementsService:
     ) -> Requirement:
         """Create a directional link between ``source_rid`` and ``derived_rid``."""
         docs = self._ensure_documents()
-        return doc_store.link_requirements(
-            self.root,
-            source_rid=source_rid,
-            derived_rid=derived_rid,
-            link_type=link_type,
-            docs=docs,
-        )
+        try:
+            return doc_store.link_requirements(
+                self.root,
+                source_rid=source_rid,
+                derived_rid=derived_rid,
+                link_type=link_type,
+                docs=docs,
+                index=self._index,
+            )
+        finally:
+            self._forget_requirement(derived_rid)
 
     # ------------------------------------------------------------------
     def collect_label_defs(
@@ -643,6 +800,9 @@ class RequirementsService:
             self.root,
             prefixes=prefixes,
             docs=docs,
+            index=self._index,
+            requirement_cache=self._requirements,
+            load_options=self._load_options,
         ):
             for label in getattr(requirement, "labels", []) or []:
                 counts[label] = counts.get(label, 0) + 1
@@ -669,7 +829,8 @@ class RequirementsService:
             if current is None:
                 # Reload documents to handle out-of-date caches gracefully.
                 current = doc_store.load_document(self.root / parent_prefix)
-                docs[parent_prefix] = current
+                with self._documents_lock:
+                    docs[parent_prefix] = current
 
         entries: list[dict[str, object]] = []
         for source in reversed(chain):
@@ -872,6 +1033,7 @@ class RequirementsService:
 
         return changed_any
 
+    @_exclusive
     def update_document_labels(
         self,
         prefix: str,
@@ -943,7 +1105,12 @@ class RequirementsService:
         affected_prefixes = self._descendant_prefixes(prefix, docs)
         for candidate in affected_prefixes:
             requirements = doc_store.load_requirements(
-                self.root, prefixes=[candidate], docs=docs
+                self.root,
+                prefixes=[candidate],
+                docs=docs,
+                index=self._index,
+                requirement_cache=self._requirements,
+                load_options=self._load_options,
             )
             for requirement in requirements:
                 if not requirement.labels:
@@ -967,10 +1134,13 @@ class RequirementsService:
                         requirement.rid,
                         labels=new_labels,
                         docs=docs,
+                        index=self._index,
                     )
+                    self._forget_requirement(requirement.rid)
 
         return normalized
 
+    @_exclusive
     def add_label_definition(
         self,
         prefix: str,
@@ -994,6 +1164,7 @@ class RequirementsService:
         )
         return next(defn for defn in normalized if defn.key == new_label.key)
 
+    @_exclusive
     def update_label_definition(
         self,
         prefix: str,
@@ -1037,6 +1208,7 @@ class RequirementsService:
         )
         return next(defn for defn in normalized if defn.key == (new_key or key))
 
+    @_exclusive
     def remove_label_definition(
         self,
         prefix: str,
@@ -1072,6 +1244,7 @@ class RequirementsService:
         per_page: int = 50,
         status: str | None = None,
         labels: Sequence[str] | None = None,
+        sort: str | None = None,
     ) -> RequirementPage:
         """Return a paginated view of one requirements document."""
         docs = self._ensure_documents()
@@ -1082,7 +1255,20 @@ class RequirementsService:
             per_page=per_page,
             status=status,
             labels=labels,
+            sort=sort,
             docs=docs,
+            index=self._index,
+            requirement_cache=self._requirements,
+            load_options=self._load_options,
+            sort_keys=self._sort_keys,
+        )
+
+    def sort_requirements_for_cards(
+        self, requirements: Sequence[Requirement], *, sort_mode: str
+    ) -> list[Requirement]:
+        """Return ``requirements`` in card-export order reusing cached keys."""
+        return sort_requirements_for_cards(
+            requirements, sort_mode=sort_mode, cache=self._sort_keys
         )
 
     def document_inventory(self) -> list[DocumentInventoryEntry]:
@@ -1111,6 +1297,9 @@ class RequirementsService:
             self.root,
             prefixes=prefixes,
             docs=docs,
+            index=self._index,
+            requirement_cache=self._requirements,
+            load_options=self._load_options,
         )
 
     def search_requirements(
@@ -1132,4 +1321,7 @@ class RequirementsService:
             page=page,
             per_page=per_page,
             docs=docs,
+            index=self._index,
+            requirement_cache=self._requirements,
+            load_options=self._load_options,
         )
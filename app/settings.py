@@ -11,6 +11,7 @@ import tomllib
 from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
 
 from .columns import DEFAULT_LIST_COLUMNS as BASE_DEFAULT_LIST_COLUMNS
+from .core.constants import MAX_LOAD_WORKERS
 from .llm.constants import (
     DEFAULT_LLM_BASE_URL,
     DEFAULT_LLM_MODEL,
@@ -40,6 +41,7 @@ class LLMSettings(BaseModel):
     )
     timeout_minutes: int = 60
     stream: bool = False
+    max_connections: int = Field(default=16, ge=1)
     use_custom_temperature: bool = False
     temperature: float = Field(
         DEFAULT_LLM_TEMPERATURE,
@@ -130,6 +132,11 @@ class MCPSettings(BaseModel):
     log_dir: str | None = None
     require_token: bool = False
     token: str = ""
+    http2: bool = False
+    max_connections: int = Field(default=10, ge=1)
+    max_keepalive_connections: int = Field(default=5, ge=0)
+    keepalive_expiry: float = Field(default=30.0, ge=0)
+    tool_workers: int = Field(default=4, ge=1)
 
     @field_validator("log_dir", mode="before")
     @classmethod
@@ -188,6 +195,7 @@ class AgentSettings(BaseModel):
 
     max_thought_steps: int | None = None
     max_consecutive_tool_errors: int | None = 5
+    max_parallel_tool_calls: int = Field(default=4, ge=1)
 
     @field_validator("max_thought_steps", mode="before")
     @classmethod
@@ -287,6 +295,16 @@ class UISettings(BaseModel):
         return text or None
 
 
+class StorageSettings(BaseModel):
+    """Settings controlling how requirement files are read from disk."""
+
+    model_config = ConfigDict(validate_assignment=True)
+
+    load_workers: int = Field(default=1, ge=1, le=MAX_LOAD_WORKERS)
+    load_executor: Literal["thread", "process"] = "thread"
+    use_index: bool = False
+
+
 class AppSettings(BaseModel):
     """Aggregate settings for the application."""
 
@@ -296,6 +314,7 @@ class AppSettings(BaseModel):
     mcp: MCPSettings = Field(default_factory=MCPSettings)
     ui: UISettings = Field(default_factory=UISettings)
     agent: AgentSettings = Field(default_factory=AgentSettings)
+    storage: StorageSettings = Field(default_factory=StorageSettings)
 
     def to_dict(self) -> dict:
         """Return settings as a plain dictionary."""
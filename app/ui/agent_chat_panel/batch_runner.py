@@ -59,9 +59,34 @@ class CancelMode(Enum):
 
 _METRIC_UNSET = object()
 
+MAX_BATCH_PARALLELISM = 8
+_RATE_LIMIT_MARKERS = ("rate limit", "too many requests", "error code: 429")
+
+
+def is_rate_limit_error(result: Any) -> bool:
+    """Return ``True`` when agent *result* failed because of LLM rate limiting."""
+    if not isinstance(result, Mapping) or result.get("ok", False):
+        return False
+    error = result.get("error")
+    if not isinstance(error, Mapping):
+        return False
+    if error.get("type") == "RateLimitError":
+        return True
+    details = error.get("details")
+    if isinstance(details, Mapping) and details.get("type") == "RateLimitError":
+        return True
+    message = str(error.get("message") or "").lower()
+    return any(marker in message for marker in _RATE_LIMIT_MARKERS)
+
 
 class AgentBatchRunner:
-    """Manage sequential execution of prompts for selected requirements."""
+    """Run a prompt for selected requirements, up to ``max_parallel`` at a time.
+
+    Every item gets its own conversation. Rate-limited items are queued again
+    and halve the number of concurrent runs; each successful run lets the
+    limit grow back by one. With ``schedule`` the queue also pauses for
+    ``rate_limit_delay`` seconds (doubling per retry) before starting more.
+    """
 
     def __init__(
         self,
@@ -80,6 +105,10 @@ class AgentBatchRunner:
         on_state_changed: Callable[[], None],
         context_factory: Callable[[BatchTarget], Sequence[Mapping[str, Any]] | Mapping[str, Any] | None],
         prepare_conversation: Callable[[Any, BatchTarget], None] | None = None,
+        max_parallel: int = 1,
+        schedule: Callable[[float, Callable[[], None]], object] | None = None,
+        rate_limit_delay: float = 2.0,
+        max_rate_limit_retries: int = 3,
     ) -> None:
         self._submit_prompt = submit_prompt
         self._create_conversation = create_conversation
@@ -92,6 +121,25 @@ class AgentBatchRunner:
         self._active_index: int | None = None
         self._cancel_mode = CancelMode.NONE
         self._running = False
+        self._max_parallel = min(max(1, int(max_parallel)), MAX_BATCH_PARALLELISM)
+        self._slots = self._max_parallel
+        self._schedule = schedule
+        self._rate_limit_delay = rate_limit_delay
+        self._max_rate_limit_retries = max_rate_limit_retries
+        self._rate_limit_retries: dict[int, int] = {}
+        self._cooling_down = False
+
+    # ------------------------------------------------------------------
+    @property
+    def max_parallel(self) -> int:
+        """Return the configured number of concurrently running items."""
+        return self._max_parallel
+
+    @max_parallel.setter
+    def max_parallel(self, value: int) -> None:
+        self._max_parallel = min(max(1, int(value)), MAX_BATCH_PARALLELISM)
+        self._slots = self._max_parallel
+        self._advance()
 
     # ------------------------------------------------------------------
     @property
@@ -108,12 +156,21 @@ class AgentBatchRunner:
     @property
     def active_item(self) -> BatchItem | None:
         if self._active_index is None:
-            return None
+            active = self.active_items
+            return active[0] if active else None
         try:
             return self._items[self._active_index]
         except IndexError:  # pragma: no cover - defensive
             return None
 
+    # ------------------------------------------------------------------
+    @property
+    def active_items(self) -> tuple[BatchItem, ...]:
+        """Return every item whose prompt is currently running."""
+        return tuple(
+            item for item in self._items if item.status is BatchItemStatus.RUNNING
+        )
+
     # ------------------------------------------------------------------
     def reset(self) -> None:
         """Clear the queue without notifying the controller."""
@@ -122,6 +179,7 @@ class AgentBatchRunner:
         self._active_index = None
         self._cancel_mode = CancelMode.NONE
         self._running = False
+        self._reset_backpressure()
         self._on_state_changed()
 
     # ------------------------------------------------------------------
@@ -138,6 +196,7 @@ class AgentBatchRunner:
         self._active_index = None
         self._cancel_mode = CancelMode.NONE
         self._running = bool(self._items)
+        self._reset_backpressure()
         self._on_state_changed()
         if not self._items:
             return False
@@ -176,17 +235,31 @@ class AgentBatchRunner:
         error_count: int | None = None,
         token_count: object = _METRIC_UNSET,
         tokens_approximate: bool | None = None,
+        rate_limited: bool = False,
     ) -> None:
-        """Update queue state after controller finalises the prompt."""
+        """Update queue state after controller finalises the prompt.
+
+        ``rate_limited`` marks a failure caused by LLM rate limiting; such
+        items are retried up to ``max_rate_limit_retries`` times, or marked
+        cancelled once :meth:`cancel_all` stopped the queue.
+        """
         if not conversation_id:
             return
         item = self._item_by_conversation(conversation_id)
         if item is None:
             return
+        if (
+            not success
+            and rate_limited
+            and self._retry_rate_limited(self._items.index(item), item)
+        ):
+            return
         item.finished_at = utc_now_iso()
         if success:
             item.status = BatchItemStatus.COMPLETED
             item.error = None
+            if self._slots < self._max_parallel:
+                self._slots += 1
         else:
             item.status = BatchItemStatus.FAILED
             item.error = error
@@ -216,12 +289,16 @@ class AgentBatchRunner:
         item.status = BatchItemStatus.CANCELLED
         self._active_index = None
         mode = self._cancel_mode
-        self._cancel_mode = CancelMode.NONE
-        self._on_state_changed()
         if mode is CancelMode.STOP_ALL:
+            if self.active_items:
+                self._on_state_changed()
+                return
+            self._cancel_mode = CancelMode.NONE
             self._running = False
             self._on_state_changed()
             return
+        self._cancel_mode = CancelMode.NONE
+        self._on_state_changed()
         self._advance()
 
     # ------------------------------------------------------------------
@@ -244,16 +321,75 @@ class AgentBatchRunner:
         return None
 
     # ------------------------------------------------------------------
-    def _advance(self) -> None:
-        if not self._running:
-            return
-        for index, item in enumerate(self._items):
-            if item.status is BatchItemStatus.PENDING:
-                self._start_item(index)
-                return
-        self._running = False
+    def _retry_rate_limited(self, index: int, item: BatchItem) -> bool:
+        if self._cancel_mode is CancelMode.STOP_ALL:
+            # The queue is being stopped: settle the item instead of requeuing it.
+            self.handle_cancellation(conversation_id=item.conversation_id)
+            return True
+        attempts = self._rate_limit_retries.get(index, 0)
+        if attempts >= self._max_rate_limit_retries:
+            return False
+        self._rate_limit_retries[index] = attempts + 1
+        item.status = BatchItemStatus.PENDING
+        item.conversation_id = None
+        item.started_at = None
+        item.finished_at = None
         self._active_index = None
+        self._slots = max(1, self._slots // 2)
+        logger.info(
+            "Batch item %s hit the LLM rate limit; retrying with %d parallel runs",
+            item.target.rid,
+            self._slots,
+        )
+        if self._schedule is not None and not self._cooling_down:
+            self._cooling_down = True
+            delay = self._rate_limit_delay * (2**attempts)
+            self._schedule(delay, self._end_cooldown)
         self._on_state_changed()
+        self._advance()
+        return True
+
+    # ------------------------------------------------------------------
+    def _end_cooldown(self) -> None:
+        self._cooling_down = False
+        self._advance()
+
+    # ------------------------------------------------------------------
+    def _reset_backpressure(self) -> None:
+        self._slots = self._max_parallel
+        self._rate_limit_retries.clear()
+        self._cooling_down = False
+
+    # ------------------------------------------------------------------
+    def _next_pending(self) -> int | None:
+        for index, item in enumerate(self._items):
+            if item.status is BatchItemStatus.PENDING:
+                return index
+        return None
+
+    # ------------------------------------------------------------------
+    def _advance(self) -> None:
+        """Start pending items until every free slot is busy."""
+        while (
+            self._running
+            and not self._cooling_down
+            and self._cancel_mode is not CancelMode.STOP_ALL
+            and len(self.active_items) < self._slots
+        ):
+            index = self._next_pending()
+            if index is None:
+                break
+            self._start_item(index)
+            if self._items[index].status is BatchItemStatus.PENDING:
+                break
+        if (
+            self._running
+            and not self.active_items
+            and self._next_pending() is None
+        ):
+            self._running = False
+            self._active_index = None
+            self._on_state_changed()
 
     # ------------------------------------------------------------------
     def _start_item(self, index: int) -> None:
@@ -269,7 +405,6 @@ class AgentBatchRunner:
             item.error = "failed to create conversation"
             item.finished_at = utc_now_iso()
             self._on_state_changed()
-            self._advance()
             return
 
         item = self._items[index]
@@ -282,7 +417,6 @@ class AgentBatchRunner:
             item.error = "conversation missing identifier"
             item.finished_at = utc_now_iso()
             self._on_state_changed()
-            self._advance()
             return
 
         if self._prepare_conversation is not None:
@@ -305,7 +439,6 @@ class AgentBatchRunner:
             item.error = str(exc)
             item.finished_at = utc_now_iso()
             self._on_state_changed()
-            self._advance()
             return
 
         prompt_at = item.started_at or utc_now_iso()
@@ -322,12 +455,13 @@ class AgentBatchRunner:
             item.error = "failed to submit prompt"
             item.finished_at = utc_now_iso()
             self._on_state_changed()
-            self._advance()
 
 
 __all__ = [
+    "MAX_BATCH_PARALLELISM",
     "AgentBatchRunner",
     "BatchItem",
     "BatchItemStatus",
     "BatchTarget",
+    "is_rate_limit_error",
 ]
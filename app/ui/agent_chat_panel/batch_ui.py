@@ -44,8 +44,13 @@ class AgentBatchSection:
         controls: BatchControls,
         runner: AgentBatchRunner | None = None,
         target_provider: Callable[[], Sequence[BatchTarget]] | None = None,
+        max_parallel: int = 1,
+        schedule: Callable[[float, Callable[[], None]], object] | None = None,
     ) -> None:
-        """Bind batch controls to the panel, creating a runner when needed."""
+        """Bind batch controls to the panel, creating a runner when needed.
+
+        ``max_parallel`` and ``schedule`` configure a runner created here.
+        """
         self._panel = panel
         self._controls = controls
         self._target_provider = target_provider
@@ -56,6 +61,8 @@ class AgentBatchSection:
             on_state_changed=self.update_ui,
             context_factory=panel._build_batch_context,
             prepare_conversation=panel._prepare_batch_conversation,
+            max_parallel=max_parallel,
+            schedule=schedule,
         )
         controls.run_button.Bind(wx.EVT_BUTTON, self._handle_run_request)
         controls.stop_button.Bind(wx.EVT_BUTTON, self._handle_stop_request)
@@ -102,12 +109,13 @@ class AgentBatchSection:
 
     # ------------------------------------------------------------------
     def stop_batch(self) -> None:
-        """Cancel all pending work and stop any active agent run."""
+        """Cancel all pending work and stop every active agent run."""
         runner = self._runner
         if not runner.items:
             return
         runner.cancel_all()
-        self._panel.cancel_agent_run()
+        while self._panel.cancel_agent_run() is not None:
+            pass
         self._panel.status_label.SetLabel(_("Batch cancellation requested"))
         self.update_ui()
 
@@ -147,6 +155,7 @@ class AgentBatchSection:
         error_count: int | None = None,
         token_count: int | None = None,
         tokens_approximate: bool = False,
+        rate_limited: bool = False,
     ) -> None:
         """Record completion state for ``conversation_id`` and refresh controls."""
         self._runner.handle_completion(
@@ -158,6 +167,7 @@ class AgentBatchSection:
             error_count=error_count,
             token_count=token_count,
             tokens_approximate=tokens_approximate,
+            rate_limited=rate_limited,
         )
         self.update_ui()
 
@@ -101,12 +101,23 @@ class AgentRunController:
         self._callbacks = callbacks
         self._run_counter = 0
         self._active_handle: _AgentRunHandle | None = None
+        self._running_handles: list[_AgentRunHandle] = []
 
     # ------------------------------------------------------------------
     @property
     def active_handle(self) -> _AgentRunHandle | None:
         return self._active_handle
 
+    # ------------------------------------------------------------------
+    @property
+    def running_handles(self) -> tuple[_AgentRunHandle, ...]:
+        """Return every in-flight run, oldest first.
+
+        Batch runs may execute several prompts at once; :attr:`active_handle`
+        is the most recently started of them.
+        """
+        return tuple(self._running_handles)
+
     # ------------------------------------------------------------------
     def submit_prompt(self, prompt: str, *, prompt_at: str | None = None) -> None:
         normalized_prompt = prompt.strip()
@@ -239,6 +250,7 @@ class AgentRunController:
             prompt_at=prompt_at,
         )
         self._active_handle = handle
+        self._running_handles.append(handle)
 
         history_payload = tuple(dict(message) for message in history_messages)
         context_payload = None
@@ -394,7 +406,7 @@ class AgentRunController:
         if handle is None:
             return None
         handle.cancel()
-        self._active_handle = None
+        self._release_handle(handle)
         return handle
 
     # ------------------------------------------------------------------
@@ -421,13 +433,21 @@ class AgentRunController:
     # ------------------------------------------------------------------
     def _finalize_prompt(self, prompt: str, result: Any, handle: _AgentRunHandle) -> None:
         self._callbacks.finalize_prompt(prompt, result, handle)
-        if self._active_handle is handle:
-            self._active_handle = None
+        self._release_handle(handle)
 
     # ------------------------------------------------------------------
     def reset_active_handle(self, handle: _AgentRunHandle) -> None:
+        self._release_handle(handle)
+
+    # ------------------------------------------------------------------
+    def _release_handle(self, handle: _AgentRunHandle) -> None:
+        self._running_handles = [
+            running for running in self._running_handles if running is not handle
+        ]
         if self._active_handle is handle:
-            self._active_handle = None
+            self._active_handle = (
+                self._running_handles[-1] if self._running_handles else None
+            )
 
     # ------------------------------------------------------------------
     def _token_model(self) -> str | None:
@@ -72,6 +72,12 @@ class AgentChatCoordinator:
         """Expose the controller's active handle for inspection."""
         return self._run_controller.active_handle
 
+    # ------------------------------------------------------------------
+    @property
+    def running_handles(self) -> tuple[_AgentRunHandle, ...]:
+        """Expose every in-flight run of the controller."""
+        return self._run_controller.running_handles
+
     # ------------------------------------------------------------------
     def reset_active_handle(self, handle: _AgentRunHandle) -> None:
         """Clear the active handle if it matches *handle*."""
@@ -44,7 +44,7 @@ from ..helpers import (
 )
 from ..text import normalize_for_display
 from .attachment_utils import looks_like_plain_text
-from .batch_runner import BatchTarget
+from .batch_runner import MAX_BATCH_PARALLELISM, BatchTarget, is_rate_limit_error
 from .batch_ui import AgentBatchSection
 from .components.view import AgentChatView, WaitStateCallbacks
 from .confirm_preferences import (
@@ -253,7 +253,7 @@ class AgentChatPanel(ConfirmPreferencesMixin, wx.Panel):
         self._last_batch_conversation_id: str | None = None
         if command_executor is None:
             pool = ThreadPoolExecutor(
-                max_workers=1,
+                max_workers=MAX_BATCH_PARALLELISM,
                 thread_name_prefix="AgentChatCommand",
             )
             self._executor_pool = pool
@@ -636,6 +636,10 @@ class AgentChatPanel(ConfirmPreferencesMixin, wx.Panel):
                 panel=self,
                 controls=self._batch_controls,
                 target_provider=self._batch_target_provider,
+                max_parallel=self._project_settings.batch_parallelism,
+                schedule=lambda delay, callback: wx.CallLater(
+                    int(delay * 1000), callback
+                ),
             )
         else:
             self._batch_section = None
@@ -1020,7 +1024,8 @@ class AgentChatPanel(ConfirmPreferencesMixin, wx.Panel):
         handle = coordinator.cancel_active_run()
         if handle is None:
             return None
-        self._set_wait_state(False)
+        if not self._running_handles():
+            self._set_wait_state(False)
         self._finalize_cancelled_run(handle)
         return handle
 
@@ -1848,7 +1853,10 @@ class AgentChatPanel(ConfirmPreferencesMixin, wx.Panel):
                 if conversation_token_breakdown is not None
                 else final_tokens
             )
-            self._set_wait_state(False, tokens_for_status)
+            if not any(
+                running is not handle for running in self._running_handles()
+            ):
+                self._set_wait_state(False, tokens_for_status)
             elapsed = self._session.elapsed
             if elapsed:
                 minutes, seconds = divmod(int(elapsed), 60)
@@ -1877,6 +1885,7 @@ class AgentChatPanel(ConfirmPreferencesMixin, wx.Panel):
                 error_count=error_count,
                 token_count=token_count_value,
                 tokens_approximate=token_count_approximate,
+                rate_limited=is_rate_limit_error(result),
             )
 
         if should_render:
@@ -3429,7 +3438,7 @@ class AgentChatPanel(ConfirmPreferencesMixin, wx.Panel):
         """Update transcript with in-flight tool results for *handle*."""
         if handle.is_cancelled:
             return
-        if handle is not self._active_handle():
+        if not self._is_running_handle(handle):
             return
         entry = handle.pending_entry
         if entry is None:
@@ -3499,7 +3508,7 @@ class AgentChatPanel(ConfirmPreferencesMixin, wx.Panel):
         """Update pending entry with the latest LLM step details."""
         if handle.is_cancelled:
             return
-        if handle is not self._active_handle():
+        if not self._is_running_handle(handle):
             return
         entry = handle.pending_entry
         if entry is None:
@@ -3683,6 +3692,14 @@ class AgentChatPanel(ConfirmPreferencesMixin, wx.Panel):
             self._project_settings.documents_path, update_ui=False
         )
         self._update_project_settings_ui()
+        self._sync_batch_parallelism()
+
+    def _sync_batch_parallelism(self) -> None:
+        batch_section = getattr(self, "_batch_section", None)
+        if batch_section is not None:
+            batch_section.runner.max_parallel = (
+                self._project_settings.batch_parallelism
+            )
 
     def _save_project_settings(self) -> None:
         if not should_persist_agent_project_settings(
@@ -3773,6 +3790,7 @@ class AgentChatPanel(ConfirmPreferencesMixin, wx.Panel):
         self._project_settings = normalized
         if persist:
             self._save_project_settings()
+        self._sync_batch_parallelism()
         self._set_project_documents_subdirectory(
             normalized.documents_path, update_ui=False
         )
@@ -3791,6 +3809,7 @@ class AgentChatPanel(ConfirmPreferencesMixin, wx.Panel):
                 AgentProjectSettings(
                     custom_system_prompt=prompt,
                     documents_path=documents_path,
+                    batch_parallelism=dialog.get_batch_parallelism(),
                 )
             )
         finally:
@@ -3958,6 +3977,19 @@ class AgentChatPanel(ConfirmPreferencesMixin, wx.Panel):
             return None
         return getattr(coordinator, "active_handle", None)
 
+    def _running_handles(self) -> tuple[_AgentRunHandle, ...]:
+        coordinator = self._coordinator
+        if coordinator is None:
+            return ()
+        handles = getattr(coordinator, "running_handles", None)
+        if handles is None:
+            active = self._active_handle()
+            return (active,) if active is not None else ()
+        return tuple(handles)
+
+    def _is_running_handle(self, handle: _AgentRunHandle) -> bool:
+        return any(running is handle for running in self._running_handles())
+
     @property
     def history(self) -> list[ChatEntry]:
         """Return entries for the active conversation or an empty list."""
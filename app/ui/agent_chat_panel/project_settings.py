@@ -10,6 +10,7 @@ from typing import Any
 from collections.abc import Mapping
 
 from ...mcp.paths import normalize_documents_path
+from .batch_runner import MAX_BATCH_PARALLELISM
 
 
 logger = logging.getLogger(__name__)
@@ -21,21 +22,24 @@ class AgentProjectSettings:
 
     custom_system_prompt: str = ""
     documents_path: str = ""
+    batch_parallelism: int = 1
 
     def normalized(self) -> AgentProjectSettings:
         """Return settings with whitespace-normalised fields."""
         return AgentProjectSettings(
             custom_system_prompt=self.custom_system_prompt.strip(),
             documents_path=normalize_documents_path(self.documents_path),
+            batch_parallelism=_normalize_batch_parallelism(self.batch_parallelism),
         )
 
     def to_dict(self) -> dict[str, Any]:
         """Serialise settings into a JSON-compatible mapping."""
         normalized = self.normalized()
         return {
-            "version": 4,
+            "version": 5,
             "custom_system_prompt": normalized.custom_system_prompt,
             "documents_path": normalized.documents_path,
+            "batch_parallelism": normalized.batch_parallelism,
         }
 
     @classmethod
@@ -50,9 +54,18 @@ class AgentProjectSettings:
         return cls(
             custom_system_prompt=prompt.strip(),
             documents_path=normalize_documents_path(documents_path),
+            batch_parallelism=_normalize_batch_parallelism(
+                payload.get("batch_parallelism", 1)
+            ),
         )
 
 
+def _normalize_batch_parallelism(value: Any) -> int:
+    if isinstance(value, bool) or not isinstance(value, int):
+        return 1
+    return min(max(1, value), MAX_BATCH_PARALLELISM)
+
+
 def load_agent_project_settings(path: Path) -> AgentProjectSettings:
     """Load project settings from *path* returning defaults on failure."""
     try:
@@ -8,6 +8,7 @@ import wx
 
 from ...i18n import _
 from ..helpers import dip, inherit_background
+from .batch_runner import MAX_BATCH_PARALLELISM
 from .project_settings import AgentProjectSettings
 
 
@@ -61,6 +62,20 @@ class AgentProjectSettingsDialog(wx.Dialog):
         documents_row.AddSpacer(spacing)
         documents_row.Add(self._browse_documents, 0, wx.ALIGN_CENTER_VERTICAL)
 
+        parallelism_label = wx.StaticText(
+            self, label=_("Batch requirements processed in parallel")
+        )
+        self._batch_parallelism = wx.SpinCtrl(
+            self,
+            min=1,
+            max=MAX_BATCH_PARALLELISM,
+            initial=settings.batch_parallelism,
+        )
+        parallelism_row = wx.BoxSizer(wx.HORIZONTAL)
+        parallelism_row.Add(parallelism_label, 1, wx.ALIGN_CENTER_VERTICAL)
+        parallelism_row.AddSpacer(spacing)
+        parallelism_row.Add(self._batch_parallelism, 0, wx.ALIGN_CENTER_VERTICAL)
+
         buttons = self.CreateStdDialogButtonSizer(wx.OK | wx.CANCEL)
         ok_button = self.FindWindowById(wx.ID_OK)
         if isinstance(ok_button, wx.Button):
@@ -71,6 +86,7 @@ class AgentProjectSettingsDialog(wx.Dialog):
         sizer.Add(self._prompt, 1, wx.LEFT | wx.RIGHT | wx.BOTTOM | wx.EXPAND, spacing)
         sizer.Add(documents_hint, 0, wx.LEFT | wx.RIGHT | wx.BOTTOM | wx.EXPAND, spacing)
         sizer.Add(documents_row, 0, wx.LEFT | wx.RIGHT | wx.BOTTOM | wx.EXPAND, spacing)
+        sizer.Add(parallelism_row, 0, wx.LEFT | wx.RIGHT | wx.BOTTOM | wx.EXPAND, spacing)
         if buttons is not None:
             sizer.Add(buttons, 0, wx.ALL | wx.ALIGN_RIGHT, spacing)
 
@@ -85,6 +101,10 @@ class AgentProjectSettingsDialog(wx.Dialog):
         """Return the configured documentation directory path."""
         return self._documents_path.GetValue().strip()
 
+    def get_batch_parallelism(self) -> int:
+        """Return how many batch requirements may run at the same time."""
+        return int(self._batch_parallelism.GetValue())
+
     def _on_browse_documents_path(self, _event: wx.Event) -> None:
         dialog = wx.DirDialog(self, _("Select documentation folder"))
         try:
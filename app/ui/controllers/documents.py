@@ -428,7 +428,9 @@ class DocumentsController:
     # ------------------------------------------------------------------
     def iter_links(self) -> Iterable[tuple[str, str]]:
         """Yield ``(child_rid, parent_rid)`` pairs for requirements."""
-        return iter_links(self.service.root)
+        return iter_links(
+            self.service.root, load_options=self.service.load_options
+        )
 
     @property
     def root(self) -> Path:
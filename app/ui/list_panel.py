@@ -27,7 +27,12 @@ from .helpers import dip, inherit_background
 from .label_selection_dialog import LabelSelectionDialog
 from .enums import ENUMS
 from .filter_dialog import FilterDialog
-from .requirement_model import RequirementModel
+from .requirement_model import RequirementModel, RowChange
+
+
+def _row_key(req: Requirement) -> tuple[str | None, int]:
+    """Return the identity of ``req`` that survives re-sorting and filtering."""
+    return getattr(req, "doc_prefix", None), req.id
 
 
 def _apply_item_selection(list_ctrl: wx.ListCtrl, index: int, selected: bool) -> None:
@@ -295,6 +300,39 @@ class RequirementsListCtrl(wx.ListCtrl):
             self._finish_marquee()
         event.Skip()
 
+class VirtualRequirementsListCtrl(RequirementsListCtrl):
+    """Owner-data list control that asks its panel for cell contents.
+
+    Rows are produced lazily through ``OnGetItem*`` callbacks, so populating
+    the control costs a single ``SetItemCount`` regardless of the number of
+    requirements.
+    """
+
+    def __init__(self, parent: ListPanel, *args, **kwargs) -> None:
+        """Initialise control reading rows from ``parent``."""
+        super().__init__(parent, *args, **kwargs)
+        self._rows = parent
+
+    def OnGetItemText(self, item: int, column: int) -> str:
+        """Return text of ``column`` in row ``item``."""
+        return self._rows._virtual_item_text(item, column)
+
+    def OnGetItemImage(self, item: int) -> int:
+        """Return image of the first column in row ``item``."""
+        return self._rows._virtual_item_image(item, 0)
+
+    def OnGetItemColumnImage(self, item: int, column: int) -> int:
+        """Return image of ``column`` in row ``item``."""
+        return self._rows._virtual_item_image(item, column)
+
+    def OnGetItemAttr(self, item: int) -> None:
+        """Use default attributes for every row."""
+
+    def GetItemData(self, item: int) -> int:
+        """Return requirement id shown in row ``item``."""
+        return self._rows._virtual_item_id(item)
+
+
 if TYPE_CHECKING:
     from ..config import ConfigManager
     from .controllers import DocumentsController
@@ -309,6 +347,7 @@ class ListPanel(wx.Panel, ColumnSorterMixin):
     MIN_COL_WIDTH = 50
     MAX_COL_WIDTH = 1000
     STATEMENT_PREVIEW_LIMIT = 160
+    VIRTUAL_ROW_CACHE_LIMIT = 4096
 
     def __init__(
         self,
@@ -323,8 +362,14 @@ class ListPanel(wx.Panel, ColumnSorterMixin):
         on_sort_changed: Callable[[int, bool], None] | None = None,
         on_derive: Callable[[int], None] | None = None,
         on_new_requirement: Callable[[], None] | None = None,
+        virtual: bool = False,
     ):
-        """Initialize list view and controls for requirements."""
+        """Initialize list view and controls for requirements.
+
+        ``virtual`` switches the list to owner-data mode (``wx.LC_VIRTUAL``):
+        cells are rendered on demand from :meth:`RequirementModel.get_visible`
+        and cached per row, so refreshing costs the same for any list size.
+        """
         wx.Panel.__init__(self, parent)
         inherit_background(self, parent)
         self.model = model if model is not None else RequirementModel()
@@ -355,7 +400,16 @@ class ListPanel(wx.Panel, ColumnSorterMixin):
         btn_row.Add(self.filter_summary, 0, align_center | right, vertical_pad)
         btn_row.Add(self.reset_btn, 0, right, vertical_pad)
         btn_row.Add(self.filter_btn, 0, 0, 0)
-        self.list = RequirementsListCtrl(self, style=wx.LC_REPORT)
+        self._virtual = bool(virtual) and hasattr(wx, "LC_VIRTUAL")
+        self._virtual_rows: list[Requirement] = []
+        self._virtual_cache: dict[int, tuple[list[str], list[int]]] = {}
+        self._tracks_row_changes = False
+        if self._virtual:
+            self.list = VirtualRequirementsListCtrl(
+                self, style=wx.LC_REPORT | wx.LC_VIRTUAL
+            )
+        else:
+            self.list = RequirementsListCtrl(self, style=wx.LC_REPORT)
         if hasattr(self.list, "SetExtraStyle"):
             extra = getattr(wx, "LC_EX_SUBITEMIMAGES", 0)
             if extra:
@@ -396,6 +450,16 @@ class ListPanel(wx.Panel, ColumnSorterMixin):
         self.list.Bind(wx.EVT_CONTEXT_MENU, self._on_context_menu)
         self.filter_btn.Bind(wx.EVT_BUTTON, self._on_filter)
         self.reset_btn.Bind(wx.EVT_BUTTON, lambda _evt: self.reset_filters())
+        add_row_listener = getattr(self.model, "add_row_listener", None)
+        if self._virtual and callable(add_row_listener):
+            add_row_listener(self._on_model_row_change)
+            self._tracks_row_changes = True
+            self.Bind(wx.EVT_WINDOW_DESTROY, self._on_destroy)
+
+    def _on_destroy(self, event: wx.WindowDestroyEvent) -> None:  # pragma: no cover - GUI event
+        if event.GetEventObject() is self:
+            self.model.remove_row_listener(self._on_model_row_change)
+        event.Skip()
 
     # ColumnSorterMixin requirement
     def GetListCtrl(self):  # pragma: no cover - simple forwarding
@@ -890,6 +954,9 @@ class ListPanel(wx.Panel, ColumnSorterMixin):
         """Reload list control from the model."""
         items = self.model.get_visible()
         self._update_document_summary()
+        if self._virtual:
+            self._refresh_virtual(items)
+            return
         freeze = getattr(self.list, "Freeze", None)
         thaw = getattr(self.list, "Thaw", None)
         is_frozen = False
@@ -910,73 +977,196 @@ class ListPanel(wx.Panel, ColumnSorterMixin):
                     self.list.SetItemData(index, int(req_id))
                 except Exception:
                     self.list.SetItemData(index, 0)
+                is_unsaved = self._is_unsaved(req)
                 for col, field in enumerate(self._field_order):
-                    is_unsaved = bool(getattr(self.model, "is_unsaved", None)) and self.model.is_unsaved(req)
-                    if field == "title":
-                        title = getattr(req, "title", "")
-                        derived = bool(getattr(req, "links", []))
-                        parts: list[str] = []
-                        if is_unsaved:
-                            parts.append("*")
-                        if derived:
-                            parts.append("↳")
-                        if title:
-                            parts.append(title)
-                        display = " ".join(parts)
-                        self.list.SetItem(index, col, display)
-                        continue
                     if field == "labels":
                         value = getattr(req, "labels", [])
                         self._set_label_image(index, col, value)
                         continue
-                    if field == "id":
-                        value = getattr(req, "id", "")
-                        display = f"* {value}".strip() if is_unsaved else str(value)
-                        self.list.SetItem(index, col, display)
-                        continue
-                    if field == "links":
-                        links = getattr(req, "links", [])
-                        formatted: list[str] = []
-                        for link in links:
-                            rid = getattr(link, "rid", str(link))
-                            if getattr(link, "suspect", False):
-                                formatted.append(f"{rid} ⚠")
-                            else:
-                                formatted.append(str(rid))
-                        value = ", ".join(formatted)
-                        self.list.SetItem(index, col, value)
-                        continue
-                    if field == "derived_count":
-                        rid = req.rid or str(req.id)
-                        count = len(self.derived_map.get(rid, []))
-                        self.list.SetItem(index, col, str(count))
-                        continue
-                    if field == "attachments":
-                        value = ", ".join(
-                            getattr(a, "path", "") for a in getattr(req, "attachments", [])
-                        )
-                        self.list.SetItem(index, col, value)
-                        continue
-                    if field == "context_docs":
-                        value = ", ".join(str(path) for path in getattr(req, "context_docs", []) or [])
-                        self.list.SetItem(index, col, value)
-                        continue
-                    if field == "statement":
-                        value = self._statement_preview_text(getattr(req, "statement", ""))
-                        self.list.SetItem(index, col, value)
-                        continue
-                    if field == "verification":
-                        self.list.SetItem(index, col, self._verification_display_text(req))
-                        continue
-                    value = getattr(req, field, "")
-                    if isinstance(value, Enum):
-                        value = locale.code_to_label(field, value.value)
-                    self.list.SetItem(index, col, str(value))
+                    self.list.SetItem(index, col, self._cell_text(req, field, is_unsaved))
         finally:
             if is_frozen and callable(thaw):
                 with suppress(Exception):
                     thaw()
 
+    def _refresh_virtual(
+        self,
+        items: list[Requirement],
+        *,
+        selected: set[tuple[str | None, int]] | None = None,
+    ) -> None:
+        """Point the virtual list at ``items`` and drop cached rows.
+
+        ``SetItemCount`` keeps the selection by row index, so the selected
+        requirements (``selected`` or those of the current rows) are
+        re-selected at their new positions.
+        """
+        if selected is None:
+            selected = self._selected_row_keys()
+        self._virtual_rows = items
+        self._virtual_cache.clear()
+        self.list.SetItemCount(len(items))
+        if selected or self._get_selected_indices():
+            indices = {
+                index
+                for index, req in enumerate(items)
+                if _row_key(req) in selected
+            }
+            with self._suspend_selection_events():
+                self._select_only(indices)
+        with suppress(Exception):  # pragma: no cover - backend quirks
+            self.list.Refresh()
+
+    def _selected_row_keys(self) -> set[tuple[str | None, int]]:
+        """Return ``(doc_prefix, id)`` of requirements in selected virtual rows."""
+        rows = self._virtual_rows
+        return {
+            _row_key(rows[index])
+            for index in self._get_selected_indices()
+            if 0 <= index < len(rows)
+        }
+
+    def _is_unsaved(self, req: Requirement) -> bool:
+        return bool(getattr(self.model, "is_unsaved", None)) and self.model.is_unsaved(req)
+
+    def _cell_text(self, req: Requirement, field: str, is_unsaved: bool) -> str:
+        """Return display text of ``field`` for ``req`` (labels excluded)."""
+        if field == "title":
+            title = getattr(req, "title", "")
+            derived = bool(getattr(req, "links", []))
+            parts: list[str] = []
+            if is_unsaved:
+                parts.append("*")
+            if derived:
+                parts.append("↳")
+            if title:
+                parts.append(title)
+            return " ".join(parts)
+        if field == "id":
+            value = getattr(req, "id", "")
+            return f"* {value}".strip() if is_unsaved else str(value)
+        if field == "links":
+            formatted: list[str] = []
+            for link in getattr(req, "links", []):
+                rid = getattr(link, "rid", str(link))
+                if getattr(link, "suspect", False):
+                    formatted.append(f"{rid} ⚠")
+                else:
+                    formatted.append(str(rid))
+            return ", ".join(formatted)
+        if field == "derived_count":
+            rid = req.rid or str(req.id)
+            return str(len(self.derived_map.get(rid, [])))
+        if field == "attachments":
+            return ", ".join(
+                getattr(a, "path", "") for a in getattr(req, "attachments", [])
+            )
+        if field == "context_docs":
+            return ", ".join(str(path) for path in getattr(req, "context_docs", []) or [])
+        if field == "statement":
+            return self._statement_preview_text(getattr(req, "statement", ""))
+        if field == "verification":
+            return self._verification_display_text(req)
+        value = getattr(req, field, "")
+        if isinstance(value, Enum):
+            value = locale.code_to_label(field, value.value)
+        return str(value)
+
+    # virtual mode ----------------------------------------------------
+    def _virtual_row(self, index: int) -> tuple[list[str], list[int]] | None:
+        """Return cached ``(texts, images)`` of virtual row ``index``."""
+        cached = self._virtual_cache.get(index)
+        if cached is not None:
+            return cached
+        if not 0 <= index < len(self._virtual_rows):
+            return None
+        req = self._virtual_rows[index]
+        is_unsaved = self._is_unsaved(req)
+        texts: list[str] = []
+        images: list[int] = []
+        for field in self._field_order:
+            if field == "labels":
+                labels = list(getattr(req, "labels", []) or [])
+                img_id = self._label_image_id(labels)
+                texts.append(", ".join(labels) if img_id == -1 else "")
+                images.append(img_id)
+                continue
+            texts.append(self._cell_text(req, field, is_unsaved))
+            images.append(-1)
+        if len(self._virtual_cache) >= self.VIRTUAL_ROW_CACHE_LIMIT:
+            self._virtual_cache.clear()
+        row = (texts, images)
+        self._virtual_cache[index] = row
+        return row
+
+    def _virtual_item_text(self, index: int, column: int) -> str:
+        row = self._virtual_row(index)
+        if row is None or column >= len(row[0]):
+            return ""
+        return row[0][column]
+
+    def _virtual_item_image(self, index: int, column: int) -> int:
+        row = self._virtual_row(index)
+        if row is None or column >= len(row[1]):
+            return -1
+        return row[1][column]
+
+    def _virtual_item_id(self, index: int) -> int:
+        if not 0 <= index < len(self._virtual_rows):
+            return 0
+        try:
+            return int(getattr(self._virtual_rows[index], "id", 0))
+        except (TypeError, ValueError):
+            return 0
+
+    def _on_model_row_change(self, change: RowChange | None) -> None:
+        """Mirror a single-row model edit in the virtual list."""
+        rows = self._virtual_rows
+        if change is None or (
+            change.old_index is not None and change.old_index >= len(rows)
+        ):
+            self._refresh()
+            return
+        if not change.moved:
+            rows[change.new_index] = change.requirement
+            self._refresh_row(change.new_index)
+            return
+        selected = self._selected_row_keys()
+        if change.old_index is not None:
+            del rows[change.old_index]
+        if change.new_index is not None:
+            rows.insert(change.new_index, change.requirement)
+        self._update_document_summary()
+        self._refresh_virtual(rows, selected=selected)
+
+    def _refresh_row(self, index: int) -> None:
+        """Redraw virtual row ``index`` from the current model state."""
+        self._virtual_cache.pop(index, None)
+        with suppress(Exception):  # pragma: no cover - backend quirks
+            self.list.RefreshItem(index)
+
+    def _label_image_id(self, labels: list[str]) -> int:
+        """Return image list index of the badge for ``labels`` or ``-1``."""
+        if not labels:
+            return -1
+        key = tuple(labels)
+        img_id = self._label_images.get(key)
+        if img_id is not None:
+            return img_id
+        bmp = self._create_label_bitmap(labels)
+        self._ensure_image_list_size(bmp.GetWidth(), bmp.GetHeight())
+        img_id = -1
+        if self._image_list is not None:
+            list_w, list_h = self._image_list.GetSize()
+            bmp = self._pad_bitmap(bmp, list_w, list_h)
+            try:
+                img_id = self._image_list.Add(bmp)
+            except Exception:
+                logger.exception("Failed to add labels image; using text fallback")
+                img_id = -1
+        self._label_images[key] = img_id
+        return img_id
+
     def _verification_display_text(self, req: Requirement) -> str:
         methods = normalized_verification_methods(req)
         return ", ".join(locale.code_to_label("verification", method.value) for method in methods)
@@ -1008,6 +1198,17 @@ class ListPanel(wx.Panel, ColumnSorterMixin):
         if select_id is not None:
             self.focus_requirement(select_id)
 
+    def refresh_after_edit(self, *, select_id: int | None = None) -> None:
+        """Bring the list up to date after edits applied through the model.
+
+        A virtual list already mirrored each :class:`RowChange`, so only the
+        selection is restored; other lists reload their contents.
+        """
+        if not self._tracks_row_changes:
+            self._refresh()
+        if select_id is not None:
+            self.focus_requirement(select_id)
+
     def focus_requirement(self, req_id: int) -> None:
         """Select and ensure visibility of requirement ``req_id``."""
         target_index: int | None = None
@@ -1026,8 +1227,11 @@ class ListPanel(wx.Panel, ColumnSorterMixin):
         if target_index is None:
             return
 
-        for idx in range(count):
-            self._set_item_selected(idx, idx == target_index)
+        if self._virtual:
+            self._select_only({target_index})
+        else:
+            for idx in range(count):
+                self._set_item_selected(idx, idx == target_index)
 
         if hasattr(self.list, "Focus"):
             with suppress(Exception):
@@ -1040,6 +1244,14 @@ class ListPanel(wx.Panel, ColumnSorterMixin):
         """Apply selection state without propagating backend errors."""
         _apply_item_selection(self.list, index, selected)
 
+    def _select_only(self, indices: set[int]) -> None:
+        """Select exactly ``indices`` touching only rows whose state changes."""
+        for idx in self._get_selected_indices():
+            if idx not in indices:
+                self._set_item_selected(idx, False)
+        for idx in sorted(indices):
+            self._set_item_selected(idx, True)
+
     def record_link(self, parent_rid: str, child_id: int) -> None:
         """Record that ``child_id`` links to ``parent_rid``."""
         self.derived_map.setdefault(parent_rid, []).append(child_id)
@@ -1423,11 +1635,11 @@ class ListPanel(wx.Panel, ColumnSorterMixin):
             return
         selected_ids: list[int] = []
         persisted = False
-        for idx in self._get_selected_indices():
-            items = self.model.get_visible()
-            if idx >= len(items):
-                continue
-            req = items[idx]
+        items = self.model.get_visible()
+        targets = [
+            (idx, items[idx]) for idx in self._get_selected_indices() if idx < len(items)
+        ]
+        for idx, req in targets:
             selected_ids.append(req.id)
             if field == "revision":
                 try:
@@ -1447,12 +1659,13 @@ class ListPanel(wx.Panel, ColumnSorterMixin):
                 )
             else:
                 display = value
-            self.list.SetItem(idx, column, str(display))
+            if not self._virtual:
+                self.list.SetItem(idx, column, str(display))
             saved = self._persist_requirement(req)
             if saved is not None:
                 persisted = True
         if persisted:
-            self._refresh()
+            self.refresh_after_edit()
             self._restore_selection(self._ordered_unique_ids(selected_ids))
 
     def _ordered_unique_ids(self, req_ids: Sequence[int]) -> list[int]:
@@ -1488,7 +1701,7 @@ class ListPanel(wx.Panel, ColumnSorterMixin):
         self.model.update_many(updates)
         for updated in updates:
             self._persist_requirement(updated)
-        self._refresh()
+        self.refresh_after_edit()
         self._restore_selection(unique_order)
 
     def _show_labels_dialog(self, req_ids: Sequence[int]) -> None:
@@ -1624,7 +1837,7 @@ class ListPanel(wx.Panel, ColumnSorterMixin):
         for updated in updates:
             self._persist_requirement(updated)
 
-        self._refresh()
+        self.refresh_after_edit()
         self._restore_selection(unique_order)
 
     def _restore_selection(self, req_ids: Sequence[int]) -> None:
@@ -1637,19 +1850,29 @@ class ListPanel(wx.Panel, ColumnSorterMixin):
 
         desired_set = set(desired)
         focus_index: int | None = None
-        for idx in range(self.list.GetItemCount()):
-            try:
-                raw_id = self.list.GetItemData(idx)
-            except Exception:
-                continue
-            try:
-                req_id = int(raw_id)
-            except (TypeError, ValueError):
-                continue
-            should_select = req_id in desired_set
-            self._set_item_selected(idx, should_select)
-            if should_select and focus_index is None and req_id == desired[0]:
-                focus_index = idx
+        if self._virtual:
+            selected: set[int] = set()
+            for idx, req in enumerate(self._virtual_rows):
+                req_id = getattr(req, "id", None)
+                if req_id in desired_set:
+                    selected.add(idx)
+                    if focus_index is None and req_id == desired[0]:
+                        focus_index = idx
+            self._select_only(selected)
+        else:
+            for idx in range(self.list.GetItemCount()):
+                try:
+                    raw_id = self.list.GetItemData(idx)
+                except Exception:
+                    continue
+                try:
+                    req_id = int(raw_id)
+                except (TypeError, ValueError):
+                    continue
+                should_select = req_id in desired_set
+                self._set_item_selected(idx, should_select)
+                if should_select and focus_index is None and req_id == desired[0]:
+                    focus_index = idx
 
         if focus_index is not None:
             if hasattr(self.list, "Focus"):
@@ -28,7 +28,6 @@ from ...core.requirement_export import (
     render_requirements_docx,
 )
 from ...core.requirement_text_export import render_requirement_cards_txt
-from ...core.requirement_sorting import sort_requirements_for_cards
 from ..export_helpers import prepare_export_destination, text_export_encoding
 from ...i18n import _
 from ...log import logger
@@ -470,6 +469,9 @@ class MainFrameDocumentsMixin:
         if hasattr(self, "agent_panel"):
             self.agent_panel.set_history_directory(path)
         self._sync_mcp_base_path(path)
+        share_service = getattr(self.mcp, "share_requirements_service", None)
+        if callable(share_service):
+            share_service(service)
         has_docs = bool(docs)
         if docs:
             remembered = self.config.get_last_document(path)
@@ -1250,10 +1252,11 @@ class MainFrameDocumentsMixin:
                 )
                 context_missing.extend(docs_missing)
 
+        service = self.docs_controller.service
         labels_grouped = plan.card_sort_mode == "labels"
         label_group_mode = plan.card_label_group_mode
         if len(selected_doc_prefixes) <= 1:
-            card_export_requirements = sort_requirements_for_cards(
+            card_export_requirements = service.sort_requirements_for_cards(
                 requirements,
                 sort_mode=plan.card_sort_mode,
             )
@@ -1266,13 +1269,13 @@ class MainFrameDocumentsMixin:
                     if str(getattr(req, "doc_prefix", "")) == selected_prefix
                 ]
                 card_export_requirements.extend(
-                    sort_requirements_for_cards(
+                    service.sort_requirements_for_cards(
                         document_requirements,
                         sort_mode=plan.card_sort_mode,
                     )
                 )
 
-        link_lookup = self.docs_controller.service.load_requirements()
+        link_lookup = service.load_requirements()
         title = (
             _("Requirements export — {label}").format(label=document_label)
             if len(selected_doc_prefixes) == 1
@@ -1671,7 +1674,7 @@ class MainFrameDocumentsMixin:
 
         selected_id = getattr(self, "_selected_requirement_id", None)
         model.update_many(updated)
-        panel.refresh(select_id=selected_id)
+        panel.refresh_after_edit(select_id=selected_id)
 
         # Refresh detached editors working on the current document.
         detached = list(getattr(self, "_detached_editors", {}).items())
@@ -138,16 +138,20 @@ class MainFrameSettingsMixin:
                     temperature=temperature,
                     stream=stream,
                 )
+                # Connection pool options have no dialog controls; keep them.
                 self.mcp_settings = MCPSettings(
-                    auto_start=auto_start,
-                    host=host,
-                    port=port,
-                    base_path=base_path,
-                    documents_path=documents_path,
-                    documents_max_read_kb=documents_max_read_kb,
-                    log_dir=log_dir or None,
-                    require_token=require_token,
-                    token=token,
+                    **{
+                        **self.mcp_settings.model_dump(),
+                        "auto_start": auto_start,
+                        "host": host,
+                        "port": port,
+                        "base_path": base_path,
+                        "documents_path": documents_path,
+                        "documents_max_read_kb": documents_max_read_kb,
+                        "log_dir": log_dir or None,
+                        "require_token": require_token,
+                        "token": token,
+                    }
                 )
                 self.config.set_auto_open_last(self.auto_open_last)
                 self.config.set_remember_sort(self.remember_sort)
@@ -2,22 +2,83 @@
 
 from __future__ import annotations
 
-from collections.abc import Sequence
-from dataclasses import asdict, is_dataclass
-from enum import Enum
+from bisect import bisect_left
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from operator import itemgetter
+from typing import Any
 
 from ..core.model import Requirement
-from ..core.search import filter_by_status, search
-from ..util.sorting import natural_sort_key
+from ..core.requirement_sorting import SortKeyCache, column_sort_value
+from ..core.search import filter_by_status, linked_rids, search
+from ..core.search_index import SearchKey, TextSearchIndex, search_key
+
+# Batches larger than this are applied with one full refresh instead of
+# row-by-row placement.
+BULK_REFRESH_THRESHOLD = 64
+
+
+@dataclass(frozen=True, slots=True)
+class RowChange:
+    """Position change of one requirement in the visible list.
+
+    ``old_index`` is ``None`` when the row was hidden before the change and
+    ``new_index`` when it is hidden afterwards. Both refer to the list as it
+    was before and after the change respectively.
+    """
+
+    requirement: Requirement
+    old_index: int | None
+    new_index: int | None
+
+    @property
+    def moved(self) -> bool:
+        """Return ``True`` when the row was inserted, removed or reordered."""
+        return self.old_index != self.new_index
+
+
+RowListener = Callable[[RowChange | None], None]
+
+
+class _Descending:
+    """Invert ordering of ``value`` so descending keys bisect like ascending."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _Descending) and self.value == other.value
+
+    def __lt__(self, other: _Descending) -> bool:
+        return other.value < self.value
 
 
 class RequirementModel:
-    """Maintain requirement data and apply filters/sorting."""
+    """Maintain requirement data and apply filters/sorting.
+
+    Requirements are stored by ``(doc_prefix, id)``. The visible list is kept
+    sorted together with precomputed sort keys, so :meth:`add`, :meth:`update`
+    and :meth:`delete` only evaluate the filters for the affected row and
+    place it with a binary search. Listeners registered with
+    :meth:`add_row_listener` receive a :class:`RowChange` per placed row, or
+    ``None`` when such an edit had to rebuild the whole view.
+    """
 
     def __init__(self) -> None:
         """Initialize empty requirement collections."""
-        self._all: list[Requirement] = []
+        self._all: dict[SearchKey, Requirement] = {}
+        self._order: dict[SearchKey, int] = {}
+        self._next_order = 0
+        self._text_index = TextSearchIndex()
+        self._links: dict[SearchKey, frozenset[str]] = {}
+        self._referenced: dict[str, int] = {}
         self._visible: list[Requirement] = []
+        self._visible_keys: list[tuple] = []
+        self._visible_sort: dict[SearchKey, tuple] = {}
+        self._sort_keys = SortKeyCache(self._column_sort_value)
+        self._row_listeners: list[RowListener] = []
         self._unsaved: set[tuple[str, int]] = set()
         self._labels: list[str] = []
         self._labels_match_all: bool = True
@@ -35,7 +96,15 @@ class RequirementModel:
     # data management -------------------------------------------------
     def set_requirements(self, requirements: list[Requirement]) -> None:
         """Replace all requirements."""
-        self._all = list(requirements)
+        self._all = {}
+        self._order = {}
+        self._next_order = 0
+        self._links = {}
+        self._referenced = {}
+        self._sort_keys.clear()
+        for requirement in requirements:
+            self._store(requirement)
+        self._text_index.rebuild(self._all.values())
         if self._active_doc_prefix is None:
             prefix = self._infer_common_prefix(requirements)
             if prefix is not None:
@@ -60,61 +129,47 @@ class RequirementModel:
                 parsed = 0
             normalized[str(key)] = parsed
         self._label_group_levels = normalized
+        self._sort_keys.discard_field("labels")
         self._apply_sort()
 
     def add(self, requirement: Requirement) -> None:
-        """Append ``requirement`` to the model."""
-        self._all.append(requirement)
-        self._refresh()
+        """Add ``requirement`` to the model, replacing one with the same key."""
+        self._apply([requirement])
 
     def update(self, requirement: Requirement) -> None:
-        """Replace existing requirement with same id or append new."""
-        rid = requirement.id
-        for i, req in enumerate(self._all):
-            if req.id == rid:
-                self._all[i] = requirement
-                break
-        else:  # not found
-            self._all.append(requirement)
-        self._refresh()
+        """Replace existing requirement with same key or append new."""
+        self._apply([requirement])
 
     def update_many(self, requirements: Sequence[Requirement]) -> None:
-        """Replace or append multiple ``requirements`` in one refresh."""
+        """Replace or append multiple ``requirements`` in one pass."""
         if not requirements:
             return
-
-        by_id = {req.id: req for req in requirements}
-        changed = False
-        for index, existing in enumerate(self._all):
-            replacement = by_id.pop(existing.id, None)
-            if replacement is None:
-                continue
-            self._all[index] = replacement
-            changed = True
-        if by_id:
-            self._all.extend(by_id.values())
-            changed = True
-        if changed:
-            self._refresh()
+        self._apply(requirements)
 
     def delete(self, req_id: int, *, doc_prefix: str | None = None) -> None:
         """Remove requirement with ``req_id`` scoped by optional ``doc_prefix``."""
 
         prefix = doc_prefix if doc_prefix is not None else self._active_doc_prefix
-
-        def _matches(requirement: Requirement) -> bool:
-            if requirement.id != req_id:
-                return False
-            if prefix is None:
-                return True
-            return getattr(requirement, "doc_prefix", None) == prefix
-
-        self._all = [r for r in self._all if not _matches(r)]
         if prefix is None:
+            keys = [key for key in self._all if key[1] == req_id]
             self._unsaved = {key for key in self._unsaved if key[1] != req_id}
         else:
+            keys = [(prefix, int(req_id))] if (prefix, int(req_id)) in self._all else []
             self._unsaved.discard((prefix, int(req_id)))
-        self._refresh()
+        relinked = False
+        removed: list[tuple[SearchKey, Requirement]] = []
+        for key in keys:
+            requirement = self._all.pop(key)
+            del self._order[key]
+            relinked |= self._relink(key, None)
+            self._text_index.remove(key)
+            self._sort_keys.invalidate(key)
+            removed.append((key, requirement))
+        if self._needs_rebuild(len(removed), relinked):
+            self._rebuild_view()
+            return
+        for key, requirement in removed:
+            self._place(key, requirement, keep=False)
 
     def get_by_id(
         self, req_id: int, *, doc_prefix: str | None = None
@@ -122,14 +177,27 @@ class RequirementModel:
         """Return requirement with ``req_id`` scoped to ``doc_prefix`` if provided."""
 
         prefix = doc_prefix if doc_prefix is not None else self._active_doc_prefix
-        for req in self._all:
-            if req.id != req_id:
-                continue
-            if prefix is not None and getattr(req, "doc_prefix", None) != prefix:
-                continue
-            return req
+        if prefix is not None:
+            return self._all.get((prefix, int(req_id)))
+        for req in self._all.values():
+            if req.id == req_id:
+                return req
         return None
 
+    # change notifications --------------------------------------------
+    def add_row_listener(self, listener: RowListener) -> None:
+        """Call ``listener`` whenever an edit moves or changes a visible row."""
+        if listener not in self._row_listeners:
+            self._row_listeners.append(listener)
+
+    def remove_row_listener(self, listener: RowListener) -> None:
+        """Stop notifying ``listener`` about row changes."""
+        if listener in self._row_listeners:
+            self._row_listeners.remove(listener)
+
+    def _notify(self, change: RowChange | None) -> None:
+        for listener in list(self._row_listeners):
+            listener(change)
     # unsaved tracking -----------------------------------------------
     def mark_unsaved(
         self,
@@ -241,8 +309,99 @@ class RequirementModel:
         self._apply_sort()
 
     # helpers ---------------------------------------------------------
+    def _store(self, requirement: Requirement) -> tuple[SearchKey, bool]:
+        """Insert or replace ``requirement`` and return its key.
+
+        The flag reports whether the set of referenced RIDs changed.
+        """
+        key = search_key(requirement)
+        if key not in self._order:
+            self._order[key] = self._next_order
+            self._next_order += 1
+        self._all[key] = requirement
+        self._sort_keys.invalidate(key)
+        return key, self._relink(key, requirement)
+
+    def _relink(self, key: SearchKey, requirement: Requirement | None) -> bool:
+        """Update link reference counts of ``key``; report membership changes."""
+        before = self._links.pop(key, frozenset())
+        after = frozenset(linked_rids([requirement])) if requirement else frozenset()
+        if after:
+            self._links[key] = after
+        changed = False
+        for rid in before - after:
+            count = self._referenced[rid] - 1
+            if count:
+                self._referenced[rid] = count
+            else:
+                del self._referenced[rid]
+                changed = True
+        for rid in after - before:
+            count = self._referenced.get(rid, 0)
+            self._referenced[rid] = count + 1
+            changed = changed or not count
+        return changed
+
+    def _apply(self, requirements: Sequence[Requirement]) -> None:
+        relinked = False
+        stored: list[tuple[SearchKey, Requirement]] = []
+        for requirement in requirements:
+            key, changed = self._store(requirement)
+            relinked = relinked or changed
+            self._text_index.update(requirement)
+            stored.append((key, requirement))
+        if self._needs_rebuild(len(stored), relinked):
+            self._rebuild_view()
+            return
+        for key, requirement in stored:
+            self._place(key, requirement, keep=True)
+
+    def _needs_rebuild(self, count: int, relinked: bool) -> bool:
+        # ``has_derived`` visibility of other rows depends on the link targets.
+        return count > BULK_REFRESH_THRESHOLD or (relinked and self._has_derived)
+
+    def _rebuild_view(self) -> None:
+        self._refresh()
+        self._notify(None)
+
+    def _place(self, key: SearchKey, requirement: Requirement, *, keep: bool) -> None:
+        """Move the visible row of ``key`` to where ``requirement`` belongs now."""
+        old_index: int | None = None
+        old_sort = self._visible_sort.pop(key, None)
+        if old_sort is not None:
+            old_index = bisect_left(self._visible_keys, old_sort)
+            del self._visible_keys[old_index]
+            del self._visible[old_index]
+        new_index: int | None = None
+        if keep and self._matches(requirement):
+            sort_key = self._sort_key(requirement, self._order[key])
+            new_index = bisect_left(self._visible_keys, sort_key)
+            self._visible_keys.insert(new_index, sort_key)
+            self._visible.insert(new_index, requirement)
+            self._visible_sort[key] = sort_key
+        if old_index is not None or new_index is not None:
+            self._notify(RowChange(requirement, old_index, new_index))
+
+    def _matches(self, requirement: Requirement) -> bool:
+        """Return whether ``requirement`` passes the active filters."""
+        if not filter_by_status([requirement], self._status):
+            return False
+        return bool(
+            search(
+                [requirement],
+                labels=self._labels,
+                query=self._query,
+                fields=self._fields,
+                field_queries=self._field_queries,
+                match_all=self._labels_match_all,
+                is_derived=self._is_derived,
+                has_derived=self._has_derived,
+                referenced=self._referenced,
+            )
+        )
+
     def _refresh(self) -> None:
-        base = filter_by_status(self._all, self._status)
+        base = filter_by_status(self._all.values(), self._status)
         self._visible = search(
             base,
             labels=self._labels,
@@ -252,45 +411,37 @@ class RequirementModel:
             match_all=self._labels_match_all,
             is_derived=self._is_derived,
             has_derived=self._has_derived,
+            text_index=self._text_index,
+            referenced=self._referenced,
         )
         self._apply_sort()
 
     def _apply_sort(self) -> None:
+        rows: list[tuple[tuple, SearchKey, Requirement]] = []
+        for req in self._visible:
+            key = search_key(req)
+            rows.append((self._sort_key(req, self._order[key]), key, req))
+        rows.sort(key=itemgetter(0))
+        self._visible = [req for _, _, req in rows]
+        self._visible_keys = [sort_key for sort_key, _, _ in rows]
+        self._visible_sort = {key: sort_key for sort_key, key, _ in rows}
+
+    def _sort_key(self, req: Requirement, order: int) -> tuple:
+        """Return the bisectable key of ``req``; ``order`` keeps the sort stable."""
         if not self._sort_field:
-            return
-
-        def get_value(req: Requirement):
-            value = getattr(req, self._sort_field, "")
-            if isinstance(value, Enum):
-                value = value.value
-            if self._sort_field == "id":
-                try:
-                    return int(value)
-                except Exception:
-                    return 0
-            if self._sort_field == "source":
-                return natural_sort_key(value)
-            if self._sort_field == "labels" and isinstance(value, list):
-                by_level: dict[int, list[str]] = {1: [], 2: [], 3: []}
-                for label in value:
-                    level = self._label_group_levels.get(str(label), 0)
-                    if level in by_level:
-                        by_level[level].append(str(label))
-                key_parts: list[tuple[int, str]] = []
-                for level in (1, 2, 3):
-                    candidates = sorted(by_level[level], key=str.casefold)
-                    if candidates:
-                        key_parts.append((0, candidates[0]))
-                    else:
-                        key_parts.append((1, ""))
-                return tuple(key_parts)
-            if isinstance(value, list):
-                return "|".join(str(v) for v in value)
-            if is_dataclass(value):
-                return str(asdict(value))
-            return value
-
-        self._visible.sort(key=get_value, reverse=not self._sort_ascending)
+            return (order,)
+        value = self._sort_value(req)
+        if not self._sort_ascending:
+            value = _Descending(value)
+        return (value, order)
+
+    def _sort_value(self, req: Requirement) -> Any:
+        return self._sort_keys.key(req, self._sort_field)
+
+    def _column_sort_value(self, req: Requirement, field: str) -> Any:
+        return column_sort_value(
+            req, field, label_group_levels=self._label_group_levels
+        )
 
     # access ----------------------------------------------------------
     def get_visible(self) -> list[Requirement]:
@@ -299,7 +450,7 @@ class RequirementModel:
 
     def get_all(self) -> list[Requirement]:
         """Return all requirements managed by the model."""
-        return list(self._all)
+        return list(self._all.values())
 
     @staticmethod
     def _infer_common_prefix(requirements: Sequence[Requirement]) -> str | None:
@@ -1152,8 +1152,8 @@ class SettingsDialog(wx.Dialog):
         settings = self._current_settings()
 
         def task() -> tuple[bool, str | None]:
-            client = MCPClient(settings=settings, confirm=lambda _m: True)
-            result = client.check_tools()
+            with MCPClient(settings=settings, confirm=lambda _m: True) as client:
+                result = client.check_tools()
             ok = bool(result.get("ok"))
             if ok:
                 return True, None
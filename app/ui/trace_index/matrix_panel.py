@@ -4,6 +4,7 @@ from __future__ import annotations
 import json
 from collections.abc import Callable
 from pathlib import Path
+from typing import TextIO
 
 import wx
 
@@ -11,8 +12,8 @@ from ...core.trace_index import (
     TraceArtifactMatrix,
     TraceIndex,
     build_artifact_trace_matrix,
-    render_artifact_matrix_csv,
-    render_artifact_matrix_html,
+    write_artifact_matrix_csv,
+    write_artifact_matrix_html,
 )
 from ...core.trace_index.matrix import TraceArtifactMatrixCell
 from ...i18n import _
@@ -148,22 +149,20 @@ class TraceArtifactMatrixPanel(wx.Panel):
         """Write the current artifact matrix to ``path`` in the selected format."""
         if self._matrix is None:
             raise ValueError(_("No trace index loaded."))
-        if format_id == "json":
-            payload = (
-                json.dumps(self._matrix.to_dict(), ensure_ascii=False, indent=2)
-                + "\n"
-            )
-        elif format_id == "csv":
-            payload = render_artifact_matrix_csv(self._matrix)
-        elif format_id == "html":
-            payload = render_artifact_matrix_html(self._matrix)
-        else:
+        writers = {
+            "csv": write_artifact_matrix_csv,
+            "html": write_artifact_matrix_html,
+            "json": _write_matrix_json,
+        }
+        writer = writers.get(format_id)
+        if writer is None:
             raise ValueError(
                 _("Unsupported export format: {format}").format(format=format_id)
             )
         output_path = Path(path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(payload, encoding="utf-8")
+        with output_path.open("w", encoding="utf-8") as out:
+            writer(self._matrix, out)
 
     def _export_with_dialog(
         self,
@@ -207,16 +206,13 @@ class TraceArtifactMatrixPanel(wx.Panel):
         column_positions = {
             column_id: offset + 2 for offset, column_id in enumerate(self._column_ids)
         }
-        cells_by_rid: dict[str, dict[str, TraceArtifactMatrixCell]] = {}
-        for cell in matrix.cells:
-            cells_by_rid.setdefault(cell.rid, {})[cell.column_id] = cell
         for requirement in matrix.requirements:
             row = self.matrix.GetItemCount()
             self._requirement_rids.append(requirement.rid)
             self.matrix.InsertItem(row, requirement.rid)
             self.matrix.SetItem(row, 1, requirement.title)
-            for column_id, cell in cells_by_rid.get(requirement.rid, {}).items():
-                self.matrix.SetItem(row, column_positions[column_id], _cell_text(cell))
+            for cell in matrix.cells_for(requirement.rid):
+                self.matrix.SetItem(row, column_positions[cell.column_id], _cell_text(cell))
         self.status_label.SetLabel(
             _("Matrix: {requirements} requirements x {artifacts} artifacts").format(
                 requirements=len(matrix.requirements),
@@ -239,6 +235,11 @@ class TraceArtifactMatrixPanel(wx.Panel):
         )
 
 
+def _write_matrix_json(matrix: TraceArtifactMatrix, out: TextIO) -> None:
+    json.dump(matrix.to_dict(), out, ensure_ascii=False, indent=2)
+    out.write("\n")
+
+
 def _cell_text(cell: TraceArtifactMatrixCell) -> str:
     if cell.marker == "test_result" and cell.status:
         return cell.status
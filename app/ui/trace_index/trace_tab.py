@@ -16,8 +16,8 @@ from ...core.trace_index import (
     build_trace_index,
     cache_path,
     read_trace_index_cache_for_config,
-    render_trace_index_report_html,
     write_trace_index_cache,
+    write_trace_index_report_html,
 )
 from ...i18n import _
 from .artifact_browser import TraceArtifactBrowserPanel
@@ -180,6 +180,7 @@ class TraceIndexPanel(wx.Panel):
             result_globs=_parse_globs(self.result_globs_text.GetValue()),
             exclude_globs=_parse_globs(self.exclude_globs_text.GetValue()),
             module_filter=module,
+            cache_encoding=self.config.cache_encoding,
         )
 
     def on_refresh(self, _event: wx.Event) -> None:
@@ -221,9 +222,9 @@ class TraceIndexPanel(wx.Panel):
         if self._index is None:
             raise ValueError(_("No trace index loaded."))
         matrix = build_artifact_trace_matrix(self._index)
-        payload = render_trace_index_report_html(self._index, matrix)
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(payload, encoding="utf-8")
+        with path.open("w", encoding="utf-8") as out:
+            write_trace_index_report_html(self._index, matrix, out)
 
     def refresh(self, *, background: bool = True) -> None:
         """Refresh the index, optionally in a background worker for GUI use."""
@@ -250,7 +251,7 @@ class TraceIndexPanel(wx.Panel):
 
     def _show_cache_state(self) -> None:
         self.config = self._config_from_controls()
-        cache_file = cache_path(self.req_root)
+        cache_file = cache_path(self.req_root, self.config.cache_encoding)
         self.cache_label.SetLabel(f"{_('Cache')}: {cache_file.as_posix()}")
         if not cache_file.exists():
             self.status_label.SetLabel(
@@ -262,7 +263,7 @@ class TraceIndexPanel(wx.Panel):
             self._sync_export_report_button()
             self._emit_index_changed(None)
             return
-        loaded = read_trace_index_cache_for_config(self.config)
+        loaded = read_trace_index_cache_for_config(self.config, quick=True)
         if loaded.index is None:
             self.status_label.SetLabel(_("Trace index cache is unreadable."))
             self.summary_label.SetLabel("")
@@ -299,8 +300,10 @@ class TraceIndexPanel(wx.Panel):
 
     @staticmethod
     def _refresh_index(config: TraceIndexConfig) -> TraceIndexRefreshResult:
-        index = build_trace_index(config)
-        cache_file = write_trace_index_cache(index, config.req_root)
+        index = build_trace_index(config, incremental=True)
+        cache_file = write_trace_index_cache(
+            index, config.req_root, encoding=config.cache_encoding
+        )
         return TraceIndexRefreshResult(index=index, cache_file=cache_file)
 
     def _show_refresh_result(self, result: TraceIndexRefreshResult) -> None:
@@ -181,17 +181,16 @@ def apply_display_options(matrix: TraceMatrix, options: TraceMatrixDisplayOption
     columns = tuple(sorted(matrix.columns, key=lambda entry: _entry_field_value(entry, options.column_sort_field)))
 
     if options.hide_unlinked:
+        column_rids = {column.rid for column in columns}
         rows = tuple(
-            row
-            for row in rows
-            if any((cell := matrix.cells.get((row.rid, column.rid))) is not None and cell.links for column in columns)
+            row for row in rows if any(rid in column_rids for rid in matrix.linked_columns(row.rid))
         )
+        row_rids = {row.rid for row in rows}
         columns = tuple(
-            column
-            for column in columns
-            if any((cell := matrix.cells.get((row.rid, column.rid))) is not None and cell.links for row in rows)
+            column for column in columns if any(rid in row_rids for rid in matrix.linked_rows(column.rid))
         )
 
+    # Adjacency is re-derived from ``cells`` so it follows the new axis order.
     return TraceMatrix(
         config=matrix.config,
         direction=matrix.direction,
@@ -523,6 +522,7 @@ class TraceMatrixTable(gridlib.GridTableBase):
         self.rows = matrix.rows
         self.columns = matrix.columns
         self.cells = matrix.cells
+        self._row_links = {rid: frozenset(linked) for rid, linked in matrix.row_links.items()}
 
     def GetNumberRows(self) -> int:  # noqa: N802 - wx naming
         return len(self.rows)
@@ -566,8 +566,11 @@ class TraceMatrixTable(gridlib.GridTableBase):
             return None
         if row >= len(self.rows) or col >= len(self.columns):
             return None
-        key = (self.rows[row].rid, self.columns[col].rid)
-        return self.cells.get(key)
+        row_rid = self.rows[row].rid
+        column_rid = self.columns[col].rid
+        if column_rid not in self._row_links.get(row_rid, ()):
+            return None
+        return self.cells.get((row_rid, column_rid))
 
 
 def _format_label(entry) -> str:
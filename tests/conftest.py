@@ -12,6 +12,7 @@ from collections.abc import Mapping, Sequence
 import pytest
 
 from tests.env_utils import load_dotenv_variables
+from tests.llm_utils import AsyncOpenAIAdapter
 from tests.suite_utils import auto_opt_in_real_llm_suite
 from app.application import ApplicationContext
 
@@ -24,6 +25,30 @@ if TYPE_CHECKING:  # pragma: no cover - typing hints for wx fixtures
 load_dotenv_variables(search_from=Path(__file__).resolve())
 
 
+@pytest.fixture(autouse=True)
+def _async_openai_follows_patched_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Serve ``openai.AsyncOpenAI`` from a patched ``openai.OpenAI`` fake.
+
+    Most LLM tests only replace the synchronous client; the adapter keeps the
+    asynchronous code paths of ``LLMClient`` off the network for them.
+    """
+
+    try:
+        import openai
+    except ImportError:  # pragma: no cover - optional dependency
+        return
+    real_client = openai.OpenAI
+    real_async_client = openai.AsyncOpenAI
+
+    def async_client_factory(*args, **kwargs):
+        if openai.OpenAI is real_client:
+            return real_async_client(*args, **kwargs)
+        kwargs.pop("http_client", None)
+        return AsyncOpenAIAdapter(openai.OpenAI(*args, **kwargs))
+
+    monkeypatch.setattr(openai, "AsyncOpenAI", async_client_factory)
+
+
 @pytest.fixture
 def cli_context() -> ApplicationContext:
     """Provide a fresh CLI application context for each test."""
@@ -38,7 +38,7 @@ def _req(req_id: int, title: str, **kwargs) -> Requirement:
 @pytest.mark.gui_smoke
 def test_list_panel_real_widgets(wx_app):
     wx = pytest.importorskip("wx")
-    import app.ui.list_panel as list_panel
+    from app.ui import list_panel
 
     importlib.reload(list_panel)
     frame = wx.Frame(None)
@@ -67,7 +67,7 @@ def test_list_panel_real_widgets(wx_app):
 @pytest.mark.gui_smoke
 def test_reset_button_visibility_gui(wx_app):
     wx = pytest.importorskip("wx")
-    import app.ui.list_panel as list_panel
+    from app.ui import list_panel
 
     importlib.reload(list_panel)
     frame = wx.Frame(None)
@@ -89,7 +89,7 @@ def _flush_events(wx, count: int = 5) -> None:
 @pytest.mark.gui_smoke
 def test_list_panel_marks_unsaved(wx_app):
     wx = pytest.importorskip("wx")
-    import app.ui.list_panel as list_panel
+    from app.ui import list_panel
 
     importlib.reload(list_panel)
     frame = wx.Frame(None)
@@ -112,10 +112,119 @@ def test_list_panel_marks_unsaved(wx_app):
     frame.Destroy()
 
 
+@pytest.mark.gui_smoke
+def test_virtual_list_panel_renders_rows_on_demand(wx_app):
+    wx = pytest.importorskip("wx")
+    from app.ui import list_panel
+
+    importlib.reload(list_panel)
+    frame = wx.Frame(None)
+    from app.ui.requirement_model import RequirementModel
+
+    panel = list_panel.ListPanel(frame, model=RequirementModel(), virtual=True)
+    panel.set_columns(["id", "status"])
+    panel.set_requirements([_req(i, f"Req {i}") for i in range(1, 2001)])
+
+    assert panel.list.GetItemCount() == 2000
+    assert panel._virtual_cache == {}
+    id_col = panel._field_order.index("id")
+    assert panel.list.OnGetItemText(1999, id_col) == "2000"
+    assert panel.list.GetItemData(1999) == 2000
+    assert list(panel._virtual_cache) == [1999]
+
+    panel.set_search_query("Req 7")
+    assert panel.list.GetItemCount() == len(panel.model.get_visible())
+    assert panel._virtual_cache == {}
+    panel.refresh(select_id=7)
+    assert panel.get_selected_ids() == [7]
+
+    frame.Destroy()
+
+
+@pytest.mark.gui_smoke
+def test_virtual_list_panel_follows_model_row_changes(wx_app):
+    wx = pytest.importorskip("wx")
+    from app.ui import list_panel
+
+    importlib.reload(list_panel)
+    frame = wx.Frame(None)
+    from app.ui.requirement_model import RequirementModel
+
+    panel = list_panel.ListPanel(frame, model=RequirementModel(), virtual=True)
+    panel.set_columns(["id", "title"])
+    panel.set_requirements([_req(i, f"Req {i}") for i in range(1, 6)])
+    title_col = panel._field_order.index("title")
+    panel.sort(title_col, True)
+
+    panel.model.update(_req(1, "Z last"))
+    assert panel.list.OnGetItemText(4, title_col) == "Z last"
+    assert panel.list.GetItemData(0) == 2
+
+    panel.model.delete(3)
+    assert panel.list.GetItemCount() == 4
+
+    frame.Destroy()
+
+
+@pytest.mark.gui_smoke
+def test_virtual_list_panel_keeps_selected_requirements_when_rows_move(wx_app):
+    wx = pytest.importorskip("wx")
+    from app.ui import list_panel
+
+    importlib.reload(list_panel)
+    frame = wx.Frame(None)
+    from app.ui.requirement_model import RequirementModel
+
+    panel = list_panel.ListPanel(frame, model=RequirementModel(), virtual=True)
+    panel.set_columns(["id", "title"])
+    panel.set_requirements([_req(i, f"Req {i}") for i in range(1, 5)])
+    panel._select_only({0})
+    assert panel.get_selected_ids() == [1]
+
+    title_col = panel._field_order.index("title")
+    panel.sort(title_col, False)
+    assert panel.get_selected_ids() == [1]
+
+    panel.model.update(_req(1, "A first"))
+    assert panel.get_selected_ids() == [1]
+
+    panel.model.delete(1)
+    assert panel.get_selected_ids() == []
+
+    frame.Destroy()
+
+
+@pytest.mark.gui_smoke
+def test_virtual_list_panel_bulk_edit_skips_full_refresh(wx_app):
+    wx = pytest.importorskip("wx")
+    from app.ui import list_panel
+
+    importlib.reload(list_panel)
+    frame = wx.Frame(None)
+    from app.ui.requirement_model import RequirementModel
+
+    panel = list_panel.ListPanel(frame, model=RequirementModel(), virtual=True)
+    panel.set_columns(["id", "status"])
+    panel.set_requirements([_req(i, f"Req {i}") for i in range(1, 4)])
+    refreshes: list[None] = []
+    panel._refresh = lambda: refreshes.append(None)
+
+    panel._set_status([1, 3], Status.APPROVED)
+
+    status_col = panel._field_order.index("status")
+    assert refreshes == []
+    assert panel.model.get_by_id(3).status is Status.APPROVED
+    assert panel.list.OnGetItemText(2, status_col) == list_panel.locale.code_to_label(
+        "status", Status.APPROVED.value
+    )
+
+    frame.Destroy()
+
+
 @pytest.mark.gui
 def test_select_all_suppresses_bulk_selection_events(wx_app):
     wx = pytest.importorskip("wx")
-    import app.ui.list_panel as list_panel
+    from app.ui import list_panel
 
     importlib.reload(list_panel)
     frame = wx.Frame(None)
@@ -146,7 +255,7 @@ def test_select_all_suppresses_bulk_selection_events(wx_app):
 @pytest.mark.gui
 def test_select_all_posts_single_event_when_none_selected(wx_app):
     wx = pytest.importorskip("wx")
-    import app.ui.list_panel as list_panel
+    from app.ui import list_panel
 
     importlib.reload(list_panel)
     frame = wx.Frame(None)
@@ -174,7 +283,7 @@ def test_select_all_posts_single_event_when_none_selected(wx_app):
 
 def test_list_panel_context_menu_calls_handlers(monkeypatch, wx_app):
     wx = pytest.importorskip("wx")
-    import app.ui.list_panel as list_panel
+    from app.ui import list_panel
 
     importlib.reload(list_panel)
     frame = wx.Frame(None)
@@ -232,7 +341,7 @@ def test_list_panel_context_menu_calls_handlers(monkeypatch, wx_app):
 
 def test_list_panel_context_menu_resolves_column(monkeypatch, wx_app):
     wx = pytest.importorskip("wx")
-    import app.ui.list_panel as list_panel
+    from app.ui import list_panel
 
     importlib.reload(list_panel)
     frame = wx.Frame(None)
@@ -292,7 +401,7 @@ def test_list_panel_context_menu_resolves_column(monkeypatch, wx_app):
 
 def test_list_panel_context_menu_waits_for_reset(monkeypatch, wx_app):
     wx = pytest.importorskip("wx")
-    import app.ui.list_panel as list_panel
+    from app.ui import list_panel
 
     importlib.reload(list_panel)
     frame = wx.Frame(None)
@@ -337,7 +446,7 @@ def test_list_panel_context_menu_waits_for_reset(monkeypatch, wx_app):
 
 def test_marquee_selection_starts_from_cell(wx_app):
     wx = pytest.importorskip("wx")
-    import app.ui.list_panel as list_panel
+    from app.ui import list_panel
 
     importlib.reload(list_panel)
     frame = wx.Frame(None)
@@ -391,7 +500,7 @@ def test_marquee_selection_starts_from_cell(wx_app):
 
 def test_list_panel_delete_many_uses_batch_handler(wx_app):
     wx = pytest.importorskip("wx")
-    import app.ui.list_panel as list_panel
+    from app.ui import list_panel
 
     importlib.reload(list_panel)
     frame = wx.Frame(None)
@@ -423,7 +532,7 @@ def test_list_panel_delete_many_uses_batch_handler(wx_app):
 
 def test_list_panel_delete_many_falls_back_to_single_handler(wx_app):
     wx = pytest.importorskip("wx")
-    import app.ui.list_panel as list_panel
+    from app.ui import list_panel
 
     importlib.reload(list_panel)
     frame = wx.Frame(None)
@@ -455,7 +564,7 @@ def test_list_panel_delete_many_falls_back_to_single_handler(wx_app):
 
 def test_list_panel_bulk_status_change(wx_app):
     wx = pytest.importorskip("wx")
-    import app.ui.list_panel as list_panel
+    from app.ui import list_panel
 
     importlib.reload(list_panel)
     frame = wx.Frame(None)
@@ -504,7 +613,7 @@ def test_list_panel_bulk_status_change(wx_app):
 
 def test_list_panel_bulk_labels_change(monkeypatch, wx_app):
     wx = pytest.importorskip("wx")
-    import app.ui.list_panel as list_panel
+    from app.ui import list_panel
 
     importlib.reload(list_panel)
     frame = wx.Frame(None)
@@ -586,7 +695,7 @@ def test_list_panel_bulk_labels_change(monkeypatch, wx_app):
 
 def test_list_panel_single_selection_status_menu(wx_app):
     wx = pytest.importorskip("wx")
-    import app.ui.list_panel as list_panel
+    from app.ui import list_panel
 
     importlib.reload(list_panel)
     frame = wx.Frame(None)
@@ -616,7 +725,7 @@ def test_list_panel_single_selection_status_menu(wx_app):
 
 def test_list_panel_refresh_selects_new_row(wx_app):
     wx = pytest.importorskip("wx")
-    import app.ui.list_panel as list_panel
+    from app.ui import list_panel
 
     importlib.reload(list_panel)
     frame = wx.Frame(None)
@@ -641,7 +750,7 @@ def test_list_panel_refresh_selects_new_row(wx_app):
 
 def test_context_menu_hides_single_item_actions(wx_app):
     wx = pytest.importorskip("wx")
-    import app.ui.list_panel as list_panel
+    from app.ui import list_panel
 
     importlib.reload(list_panel)
     frame = wx.Frame(None)
@@ -667,7 +776,7 @@ def test_context_menu_hides_single_item_actions(wx_app):
 
 def test_list_panel_context_menu_via_event(monkeypatch, wx_app):
     wx = pytest.importorskip("wx")
-    import app.ui.list_panel as list_panel
+    from app.ui import list_panel
 
     importlib.reload(list_panel)
     frame = wx.Frame(None)
@@ -701,7 +810,7 @@ def test_list_panel_context_menu_via_event(monkeypatch, wx_app):
 
 def test_list_panel_context_menu_event_after_right_click_is_ignored(monkeypatch, wx_app):
     wx = pytest.importorskip("wx")
-    import app.ui.list_panel as list_panel
+    from app.ui import list_panel
 
     importlib.reload(list_panel)
     frame = wx.Frame(None)
@@ -738,7 +847,7 @@ def test_list_panel_context_menu_event_after_right_click_is_ignored(monkeypatch,
 
 def test_list_panel_context_menu_does_not_change_selection(monkeypatch, wx_app):
     wx = pytest.importorskip("wx")
-    import app.ui.list_panel as list_panel
+    from app.ui import list_panel
 
     importlib.reload(list_panel)
     frame = wx.Frame(None)
@@ -766,7 +875,7 @@ def test_list_panel_context_menu_does_not_change_selection(monkeypatch, wx_app):
 
 def test_list_panel_context_menu_on_blank_space_shows_global_actions(wx_app):
     wx = pytest.importorskip("wx")
-    import app.ui.list_panel as list_panel
+    from app.ui import list_panel
 
     importlib.reload(list_panel)
     frame = wx.Frame(None)
@@ -805,7 +914,7 @@ def test_list_panel_context_menu_on_blank_space_shows_global_actions(wx_app):
 
 def test_list_panel_context_menu_via_event_allows_blank_space(monkeypatch, wx_app):
     wx = pytest.importorskip("wx")
-    import app.ui.list_panel as list_panel
+    from app.ui import list_panel
 
     importlib.reload(list_panel)
     frame = wx.Frame(None)
@@ -834,7 +943,7 @@ def test_list_panel_context_menu_via_event_allows_blank_space(monkeypatch, wx_ap
 
 def test_bulk_edit_updates_selected_items(monkeypatch, wx_app):
     wx = pytest.importorskip("wx")
-    import app.ui.list_panel as list_panel
+    from app.ui import list_panel
 
     importlib.reload(list_panel)
     frame = wx.Frame(None)
@@ -866,7 +975,7 @@ def test_bulk_edit_updates_selected_items(monkeypatch, wx_app):
 
 def test_recalc_derived_map_updates_count(wx_app):
     wx = pytest.importorskip("wx")
-    import app.ui.list_panel as list_panel
+    from app.ui import list_panel
 
     importlib.reload(list_panel)
     frame = wx.Frame(None)
@@ -886,7 +995,7 @@ def test_recalc_derived_map_updates_count(wx_app):
 
 def test_derived_marker_uses_links(wx_app):
     wx = pytest.importorskip("wx")
-    import app.ui.list_panel as list_panel
+    from app.ui import list_panel
 
     importlib.reload(list_panel)
     frame = wx.Frame(None)
@@ -905,7 +1014,7 @@ def test_derived_marker_uses_links(wx_app):
 
 def test_reload_marks_child_suspect_after_parent_change(wx_app, tmp_path):
     wx = pytest.importorskip("wx")
-    import app.ui.list_panel as list_panel
+    from app.ui import list_panel
 
     importlib.reload(list_panel)
     from app.ui.requirement_model import RequirementModel
@@ -944,7 +1053,7 @@ def test_reload_marks_child_suspect_after_parent_change(wx_app, tmp_path):
 
 def test_reorder_columns_gui(wx_app):
     wx = pytest.importorskip("wx")
-    import app.ui.list_panel as list_panel
+    from app.ui import list_panel
 
     importlib.reload(list_panel)
     frame = wx.Frame(None)
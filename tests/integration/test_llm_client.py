@@ -1260,15 +1260,16 @@ def test_respond_preserves_context_for_delete(tmp_path: Path, monkeypatch) -> No
     assert "SYS-3" in system_content
     assert "GUI selection #" not in system_content
     assert "prefix=" not in system_content
-def test_check_llm_async_uses_thread(tmp_path: Path, monkeypatch) -> None:
+def test_check_llm_async_uses_async_client(tmp_path: Path, monkeypatch) -> None:
     settings = settings_with_llm(tmp_path)
     captured: dict[str, object] = {}
     main_thread = threading.get_ident()
 
-    class FakeOpenAI:
+    class FakeAsyncOpenAI:
         def __init__(self, *a, **k):  # pragma: no cover - simple container
-            def create(*, model, messages, **kwargs):  # noqa: ANN001
-                captured.update(kwargs)
+            captured["http_client"] = k.get("http_client")
+
+            async def create(*, model, messages, **kwargs):  # noqa: ANN001
                 captured["thread"] = threading.get_ident()
                 return SimpleNamespace()
 
@@ -1276,11 +1277,66 @@ def test_check_llm_async_uses_thread(tmp_path: Path, monkeypatch) -> None:
                 completions=SimpleNamespace(create=create)
             )
 
-    monkeypatch.setattr("openai.OpenAI", FakeOpenAI)
+        async def close(self) -> None:
+            captured["closed"] = True
+
+    monkeypatch.setattr("openai.AsyncOpenAI", FakeAsyncOpenAI)
     client = LLMClient(settings.llm)
-    result = asyncio.run(client.check_llm_async())
-    assert result == {"ok": True}
-    assert captured["thread"] != main_thread
+
+    async def scenario() -> dict[str, object]:
+        try:
+            return await client.check_llm_async()
+        finally:
+            await client.aclose()
+
+    assert asyncio.run(scenario()) == {"ok": True}
+    assert captured["thread"] == main_thread
+    assert captured["http_client"] is not None
+    assert captured["closed"] is True
+
+
+def test_respond_async_cancels_stalled_stream(tmp_path: Path, monkeypatch) -> None:
+    settings = settings_with_llm(tmp_path)
+    cancel_event = CancellationEvent()
+    stream_closed = asyncio.Event()
+
+    class StalledStream:
+        def __aiter__(self):
+            return self
+
+        async def __anext__(self):
+            cancel_event.set()
+            await asyncio.sleep(60)
+            raise StopAsyncIteration
+
+        async def close(self) -> None:
+            stream_closed.set()
+
+    class FakeAsyncOpenAI:
+        def __init__(self, *a, **k):  # pragma: no cover - simple container
+            async def create(**kwargs):  # noqa: ANN001
+                assert kwargs["stream"] is True
+                return StalledStream()
+
+            self.chat = SimpleNamespace(
+                completions=SimpleNamespace(create=create)
+            )
+
+    monkeypatch.setattr("openai.AsyncOpenAI", FakeAsyncOpenAI)
+    client = LLMClient(settings.llm)
+
+    async def scenario() -> None:
+        with pytest.raises(OperationCancelledError):
+            await asyncio.wait_for(
+                client.respond_async(
+                    [{"role": "user", "content": "hi"}],
+                    cancellation=cancel_event,
+                ),
+                timeout=5,
+            )
+        assert stream_closed.is_set()
+
+    asyncio.run(scenario())
 
 
 def test_parse_command_async(tmp_path: Path, monkeypatch) -> None:
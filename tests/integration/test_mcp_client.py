@@ -1,5 +1,6 @@
 """Tests for mcp client."""
 
+import asyncio
 import json
 import logging
 from pathlib import Path
@@ -177,6 +178,56 @@ def test_check_tools_unauthorized(tmp_path: Path) -> None:
         stop_server()
 
 
+def test_requests_reuse_pooled_connections(tmp_path: Path) -> None:
+    port = 8139
+    stop_server()
+    start_server(
+        port=port,
+        base_path=str(tmp_path),
+        max_context_tokens=_TEST_CONTEXT_LIMIT,
+        token_model=_TEST_MODEL,
+    )
+    try:
+        _wait_until_ready(port)
+        settings = settings_with_mcp(
+            "127.0.0.1",
+            port,
+            str(tmp_path),
+            "",
+            tmp_path=tmp_path,
+            fmt="toml",
+        )
+        save_document(tmp_path / "SYS", Document(prefix="SYS", title="System"))
+        with MCPClient(settings.mcp, confirm=lambda _m: True) as client:
+            client.ensure_ready(force=True)
+            pool = client._sync_client
+            assert client.check_tools()["ok"] is True
+            assert client.call_tool("list_requirements", {"prefix": "SYS"})["ok"]
+            assert client._sync_client is pool
+
+            async def _run() -> None:
+                await client.ensure_ready_async(force=True)
+                first = client._async_client
+                result = await client.call_tool_async(
+                    "list_requirements", {"prefix": "SYS"}
+                )
+                assert result["ok"] is True
+                assert client._async_client is first
+                await client.aclose()
+
+            asyncio.run(_run())
+            asyncio.run(_run())
+
+            metrics = client.request_metrics()
+        assert client._sync_client is None
+        assert metrics["GET /health"]["requests"] == 3
+        assert metrics["POST /mcp"]["requests"] == 4
+        assert metrics["POST /mcp"]["errors"] == 0
+        assert metrics["POST /mcp"]["average_ms"] > 0
+    finally:
+        stop_server()
+
+
 def test_call_tool_delete_requires_confirmation(monkeypatch) -> None:
     settings = MCPSettings(
         host="127.0.0.1",
@@ -257,3 +308,74 @@ def test_call_tool_delete_confirm_yes(monkeypatch) -> None:
     assert calls and calls[0][0] == "POST"
     assert ("CONFIRM", {"tool": "delete_requirement"}) in events
     assert any(e[0] == "CONFIRM_RESULT" for e in events)
+
+
+def test_call_tools_batch_returns_per_call_results(tmp_path: Path) -> None:
+    port = 8140
+    stop_server()
+    start_server(
+        port=port,
+        base_path=str(tmp_path),
+        max_context_tokens=_TEST_CONTEXT_LIMIT,
+        token_model=_TEST_MODEL,
+    )
+    try:
+        _wait_until_ready(port)
+        settings = settings_with_mcp(
+            "127.0.0.1",
+            port,
+            str(tmp_path),
+            "",
+            tmp_path=tmp_path,
+            fmt="toml",
+        )
+        save_document(tmp_path / "SYS", Document(prefix="SYS", title="System"))
+        data = {
+            "title": "T",
+            "statement": "S",
+            "type": "requirement",
+            "status": "draft",
+            "owner": "me",
+            "priority": "low",
+            "source": "spec",
+            "verification": "analysis",
+            "labels": [],
+        }
+        with MCPClient(settings.mcp, confirm=lambda _m: True) as client:
+            client.ensure_ready(force=True)
+            created = client.call_tools_batch(
+                [
+                    ("create_requirement", {"prefix": "SYS", "data": data}),
+                    ("create_requirement", {"prefix": "SYS", "data": data}),
+                ]
+            )
+            assert [item["ok"] for item in created] == [True, True]
+            rids = [item["result"]["rid"] for item in created]
+            assert rids == ["SYS1", "SYS2"]
+
+            results = client.call_tools_batch(
+                [
+                    ("get_requirement", {"rid": "SYS1"}),
+                    ("get_requirement", {"rid": "SYS2"}),
+                    ("no_such_tool", {}),
+                    ("create_requirement", {"prefix": "SYS"}),
+                    ("create_requirement", {"prefix": "SYS", "data": data}),
+                ]
+            )
+            assert [item["ok"] for item in results] == [True, True, False, False, False]
+            assert results[0]["result"]["rid"] == "SYS1"
+            assert results[1]["result"]["rid"] == "SYS2"
+            assert results[2]["error"]["code"] == "NOT_FOUND"
+            assert results[3]["error"]["code"] == "VALIDATION_ERROR"
+            assert results[4]["error"]["code"] == "CONFLICT"
+
+            async def _run() -> list[dict]:
+                return await client.call_tools_batch_async(
+                    [("list_requirements", {"prefix": "SYS"})]
+                )
+
+            listed = asyncio.run(_run())
+        assert listed[0]["ok"] is True
+        assert len(listed[0]["result"]["items"]) == 2
+    finally:
+        stop_server()
@@ -89,6 +89,7 @@ def test_controller_start_stop(monkeypatch):
         token_model,
         documents_max_read_kb,
         log_dir=None,
+        tool_workers=None,
     ) -> None:
         calls.append(
             (
@@ -102,6 +103,7 @@ def test_controller_start_stop(monkeypatch):
                 token_model,
                 documents_max_read_kb,
                 log_dir,
+                tool_workers,
             )
         )
 
@@ -127,6 +129,7 @@ def test_controller_start_stop(monkeypatch):
             "test-mcp",
             settings.documents_max_read_kb,
             None,
+            settings.tool_workers,
         ),
         ("stop",),
     ]
@@ -1,14 +1,24 @@
 """Tests for mcp server."""
 
+import asyncio
 import json
 import logging
+import threading
 from pathlib import Path
 
 import pytest
 
 from app.core.document_store import Document, save_document
+from app.mcp import server as mcp_server
+from app.mcp.concurrency import ToolExecutor
 from app.mcp.server import app as mcp_app
-from app.mcp.server import get_requirements_service, start_server, stop_server
+from app.mcp.server import (
+    get_requirements_service,
+    register_requirements_service,
+    start_server,
+    stop_server,
+)
+from app.services.requirements import RequirementsService
 from app.log import get_log_directory
 from app.mcp.tools_read import list_requirements
 from tests.mcp_utils import _request, _wait_until_ready
@@ -178,3 +188,101 @@ def test_requirements_service_cache_reuse_and_reset(tmp_path: Path) -> None:
         assert replacement is not first
     finally:
         stop_server()
+
+
+def test_registered_requirements_service_is_shared(tmp_path: Path) -> None:
+    port = 8135
+    stop_server()
+    shared = RequirementsService(tmp_path)
+    register_requirements_service(shared)
+    start_server(
+        port=port,
+        base_path=str(tmp_path),
+        max_context_tokens=_TEST_CONTEXT_LIMIT,
+        token_model=_TEST_MODEL,
+    )
+    try:
+        _wait_until_ready(port)
+        assert get_requirements_service(tmp_path) is shared
+    finally:
+        stop_server()
+
+
+def test_batch_with_writes_holds_root_for_whole_batch(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    executor = ToolExecutor(max_workers=2)
+    events: list[str] = []
+    others: list[threading.Thread] = []
+
+    def other_write() -> None:
+        events.append("other")
+
+    def write(*, tag: str) -> dict[str, str]:
+        events.append(tag)
+        return {"tag": tag}
+
+    def read() -> dict[str, str]:
+        events.append("r")
+        other = threading.Thread(
+            target=executor.call,
+            args=(other_write, {}),
+            kwargs={"root": str(tmp_path), "read_only": False},
+        )
+        other.start()
+        others.append(other)
+        other.join(timeout=0.2)
+        return {}
+
+    monkeypatch.setattr(mcp_server, "_TOOLS", {"w": write, "r": read})
+    monkeypatch.setattr(
+        mcp_server,
+        "_TOOL_METADATA",
+        {"w": {"read_only": False}, "r": {"read_only": True}},
+    )
+    monkeypatch.setattr(mcp_server, "_log_tool_event", lambda *a, **k: None)
+    monkeypatch.setattr(mcp_app.state, "tool_executor", executor)
+    monkeypatch.setattr(mcp_app.state, "base_path", str(tmp_path))
+    try:
+        response = asyncio.run(
+            mcp_server._call_batch(
+                [
+                    {"name": "w", "arguments": {"tag": "w1"}},
+                    {"name": "r"},
+                    {"name": "w", "arguments": {"tag": "w2"}},
+                ],
+                request_id=None,
+            )
+        )
+        for other in others:
+            other.join(timeout=5)
+    finally:
+        executor.shutdown()
+
+    assert events == ["w1", "r", "w2", "other"]
+    assert [entry["id"] for entry in json.loads(response.body)] == [0, 1, 2]
+
+
+def test_shared_service_mutations_hold_root_tool_lock(tmp_path: Path) -> None:
+    save_document(tmp_path / "SYS", Document(prefix="SYS", title="System"))
+    shared = RequirementsService(tmp_path)
+    register_requirements_service(shared)
+    lock = mcp_server._tool_executor().lock_for(tmp_path)
+    events: list[str] = []
+
+    def _mutate() -> None:
+        shared.create_document(prefix="HLR", title="High", parent="SYS")
+        events.append("created")
+
+    try:
+        with lock.read():
+            writer = threading.Thread(target=_mutate)
+            writer.start()
+            writer.join(timeout=0.2)
+            events.append("read released")
+        writer.join(timeout=5)
+    finally:
+        shared.set_write_guard(None)
+
+    assert events == ["read released", "created"]
+    assert "HLR" in shared.load_documents()
@@ -27,6 +27,82 @@ def require_real_llm_tests_flag(*, env_var: str = "COOKAREQ_RUN_REAL_LLM_TESTS")
     )
 
 
+class _AsyncIterator:
+    """Iterate a synchronous stream through the async iterator protocol."""
+
+    def __init__(self, stream) -> None:
+        self._stream = stream
+        self._iterator = iter(stream)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._iterator)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+    async def close(self) -> None:
+        closer = getattr(self._stream, "close", None)
+        if callable(closer):
+            closer()
+
+
+class _AsyncResponseStream(_AsyncIterator):
+    async def get_final_response(self):
+        return self._stream.get_final_response()
+
+
+class _AsyncResponseStreamManager:
+    def __init__(self, manager) -> None:
+        self._manager = manager
+
+    async def __aenter__(self):
+        return _AsyncResponseStream(self._manager.__enter__())
+
+    async def __aexit__(self, *exc_info):
+        return self._manager.__exit__(*exc_info)
+
+
+class AsyncOpenAIAdapter:
+    """Expose a synchronous fake OpenAI client through the ``AsyncOpenAI`` API.
+
+    Lets tests that only patch ``openai.OpenAI`` drive ``LLMClient``'s async
+    methods; see the ``_async_openai_follows_patched_client`` fixture.
+    """
+
+    def __init__(self, client) -> None:
+        self._client = client
+        self.chat = SimpleNamespace(
+            completions=SimpleNamespace(create=self._create_chat_completion)
+        )
+        responses = getattr(client, "responses", None)
+        if responses is not None:
+            self.responses = SimpleNamespace(
+                create=self._wrap(responses.create),
+                stream=lambda **kwargs: _AsyncResponseStreamManager(
+                    responses.stream(**kwargs)
+                ),
+            )
+
+    @staticmethod
+    def _wrap(func):
+        async def call(*args, **kwargs):
+            return func(*args, **kwargs)
+
+        return call
+
+    async def _create_chat_completion(self, **kwargs):
+        result = self._client.chat.completions.create(**kwargs)
+        if kwargs.get("stream") and not isinstance(result, (Mapping, SimpleNamespace)):
+            return _AsyncIterator(result)
+        return result
+
+    async def close(self) -> None:
+        return None
+
+
 def make_openai_mock(responses: dict[str, object]):
     """Return a ``FakeOpenAI`` class wired with *responses*.
 
@@ -0,0 +1,78 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from app.core.document_store import Document, LoadOptions
+from app.core.document_store.bulk import read_json_files
+from app.core.document_store.documents import save_document
+from app.core.document_store.links import iter_links
+from app.services.requirements import RequirementsService
+from app.settings import AppSettings
+
+pytestmark = pytest.mark.unit
+
+
+def _write_items(directory: Path, count: int, **extra: object) -> list[Path]:
+    items = directory / "items"
+    items.mkdir(parents=True, exist_ok=True)
+    paths: list[Path] = []
+    for item_id in range(1, count + 1):
+        path = items / f"{item_id}.json"
+        payload = {
+            "id": item_id,
+            "title": f"Item {item_id}",
+            "statement": "Statement",
+            "type": "requirement",
+            "status": "draft",
+            "owner": "owner",
+            "priority": "medium",
+            "source": "source",
+            "verification": "analysis",
+            **extra,
+        }
+        path.write_text(json.dumps(payload), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_parallel_reads_keep_input_order(tmp_path: Path, executor: str) -> None:
+    paths = list(reversed(_write_items(tmp_path, 80)))
+
+    payloads = read_json_files(paths, LoadOptions(workers=4, executor=executor))
+
+    assert [payload["id"] for payload in payloads] == list(range(80, 0, -1))
+
+
+def test_invalid_options_are_rejected() -> None:
+    with pytest.raises(ValueError):
+        LoadOptions(workers=0)
+    with pytest.raises(ValueError):
+        LoadOptions(executor="fiber")  # type: ignore[arg-type]
+
+
+def test_parallel_service_and_links_match_serial(tmp_path: Path) -> None:
+    save_document(tmp_path / "SYS", Document(prefix="SYS", title="System"))
+    save_document(tmp_path / "HLR", Document(prefix="HLR", title="High", parent="SYS"))
+    _write_items(tmp_path / "SYS", 40)
+    _write_items(tmp_path / "HLR", 40, links=[{"rid": "SYS1", "revision": 1}])
+
+    serial = RequirementsService(tmp_path).load_requirements()
+    parallel = RequirementsService(tmp_path, load_workers=4).load_requirements()
+
+    assert [req.to_mapping() for req in parallel] == [
+        req.to_mapping() for req in serial
+    ]
+    assert list(iter_links(tmp_path, load_options=LoadOptions(workers=4))) == list(
+        iter_links(tmp_path)
+    )
+
+
+def test_storage_settings_default_to_serial_loads() -> None:
+    settings = AppSettings.model_validate(
+        {"storage": {"load_workers": 8, "load_executor": "process"}}
+    )
+
+    assert AppSettings().storage.load_workers == 1
+    assert settings.storage.load_executor == "process"
@@ -0,0 +1,244 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from app.application import ApplicationContext
+from app.core.document_store import Document, RequirementIndex
+from app.core.document_store.documents import load_documents, save_document
+from app.core.document_store.index import index_path
+from app.core.document_store.items import (
+    create_requirement,
+    item_path,
+    load_requirements,
+    search_requirements,
+)
+from app.mcp import server as mcp_server
+from app.mcp.service_cache import RequirementsServiceCache
+from app.services.requirements import RequirementsService
+from app.settings import StorageSettings
+
+pytestmark = pytest.mark.unit
+
+
+def _payload(title: str, **extra: object) -> dict[str, object]:
+    return {
+        "title": title,
+        "statement": f"{title} statement",
+        "type": "requirement",
+        "status": "draft",
+        "owner": "owner",
+        "priority": "medium",
+        "source": "source",
+        "verification": "analysis",
+        **extra,
+    }
+
+
+@pytest.fixture()
+def _root(tmp_path: Path) -> Path:
+    save_document(tmp_path / "SYS", Document(prefix="SYS", title="System"))
+    save_document(tmp_path / "HLR", Document(prefix="HLR", title="High", parent="SYS"))
+    docs = load_documents(tmp_path)
+    create_requirement(tmp_path, prefix="SYS", data=_payload("Alpha"), docs=docs)
+    create_requirement(tmp_path, prefix="SYS", data=_payload("Beta"), docs=docs)
+    create_requirement(
+        tmp_path,
+        prefix="HLR",
+        data=_payload("Gamma", links=["SYS1"]),
+        docs=docs,
+    )
+    return tmp_path
+
+
+def _rewrite(path: Path, **changes: object) -> None:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data.update(changes)
+    stat = path.stat()
+    path.write_text(json.dumps(data), encoding="utf-8")
+    # Guarantee a different mtime even on coarse-grained filesystems.
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_indexed_reads_match_plain_reads(_root: Path) -> None:
+    index = RequirementIndex(_root)
+
+    plain = load_requirements(_root)
+    indexed = load_requirements(_root, index=index)
+
+    assert [req.to_mapping() for req in indexed] == [req.to_mapping() for req in plain]
+    assert index_path(_root).is_file()
+    assert index.revisions() == {("HLR", 1): 1, ("SYS", 1): 1, ("SYS", 2): 1}
+
+
+def test_index_refreshes_only_changed_files(
+    _root: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    index = RequirementIndex(_root)
+    load_requirements(_root, index=index)
+    docs = load_documents(_root)
+    _rewrite(item_path(_root / "SYS", docs["SYS"], 2), title="Beta v2")
+
+    reads: list[Path] = []
+    from app.core.document_store import bulk as bulk_module
+
+    original = bulk_module._read_json
+
+    def _tracking(path: Path) -> dict:
+        reads.append(Path(path))
+        return original(path)
+
+    monkeypatch.setattr(bulk_module, "_read_json", _tracking)
+    page = search_requirements(_root, query="v2", index=RequirementIndex(_root))
+
+    assert [req.rid for req in page.items] == ["SYS2"]
+    assert reads == [item_path(_root / "SYS", docs["SYS"], 2)]
+
+
+def test_index_drops_removed_items_and_flags_suspect_links(_root: Path) -> None:
+    index = RequirementIndex(_root)
+    load_requirements(_root, index=index)
+    docs = load_documents(_root)
+    item_path(_root / "SYS", docs["SYS"], 1).unlink()
+
+    requirements = load_requirements(_root, index=index)
+
+    assert [req.rid for req in requirements] == ["HLR1", "SYS2"]
+    assert requirements[0].links[0].suspect is True
+    assert ("SYS", 1) not in index.revisions()
+
+
+def test_service_uses_index_only_when_enabled(_root: Path) -> None:
+    RequirementsService(_root).list_requirements(prefix="SYS")
+    assert not index_path(_root).exists()
+
+    page = RequirementsService(_root, use_index=True).list_requirements(prefix="SYS")
+
+    assert [req.rid for req in page.items] == ["SYS1", "SYS2"]
+    assert index_path(_root).is_file()
+
+
+def test_storage_setting_enables_index_for_factory_and_mcp_services(
+    _root: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(
+        mcp_server.app.state, "requirements_service_cache", RequirementsServiceCache()
+    )
+    context = ApplicationContext.for_cli()
+    context.configure_storage(StorageSettings(use_index=True))
+
+    assert context.requirements_service_factory(_root).use_index is True
+    assert mcp_server.get_requirements_service(_root).use_index is False
+
+    context.mcp_controller_factory()
+    mcp_service = mcp_server.get_requirements_service(_root)
+    mcp_service.search_requirements(query="Alpha")
+
+    assert mcp_service.use_index is True
+    assert index_path(_root).is_file()
+
+
+def test_backlinks_follow_saved_and_external_changes(_root: Path) -> None:
+    index = RequirementIndex(_root)
+    docs = load_documents(_root)
+
+    assert index.backlinks("SYS1", sorted(docs)) == [("HLR", 1, 1)]
+    assert index.linked_rids(sorted(docs)) == {"SYS1"}
+
+    _rewrite(item_path(_root / "HLR", docs["HLR"], 1), links=["SYS2"])
+
+    assert index.backlinks("SYS1", sorted(docs)) == []
+    assert [entry[:2] for entry in index.backlinks("SYS2", sorted(docs))] == [
+        ("HLR", 1)
+    ]
+
+
+def test_delete_and_move_read_only_referencing_items(
+    _root: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from app.core.document_store import items as items_module
+    from app.core.document_store.links import delete_item, plan_delete_item
+
+    docs = load_documents(_root)
+    index = RequirementIndex(_root)
+    index.backlinks("SYS1", sorted(docs))
+
+    loaded: list[tuple[str, int]] = []
+    original = items_module.load_item
+
+    def _tracking(directory, doc, item_id):
+        loaded.append((doc.prefix, item_id))
+        return original(directory, doc, item_id)
+
+    monkeypatch.setattr(items_module, "load_item", _tracking)
+
+    assert plan_delete_item(_root, "SYS1", docs, index=index) == (True, ["HLR1"])
+    assert loaded == [("HLR", 1)]
+
+    loaded.clear()
+    assert delete_item(_root, "SYS1", docs, index=index) is True
+    assert loaded == [("HLR", 1)]
+    hlr = json.loads(item_path(_root / "HLR", docs["HLR"], 1).read_text("utf-8"))
+    assert hlr.get("links", []) == []
+    assert index.backlinks("SYS1", sorted(docs)) == []
+
+
+def test_move_rewrites_indexed_backlinks(_root: Path) -> None:
+    from app.core.document_store.items import move_requirement
+
+    docs = load_documents(_root)
+    index = RequirementIndex(_root)
+
+    moved = move_requirement(_root, "SYS1", new_prefix="HLR", docs=docs, index=index)
+
+    assert moved.rid == "HLR2"
+    assert index.backlinks("SYS1", sorted(docs)) == []
+    assert [entry[:2] for entry in index.backlinks("HLR2", sorted(docs))] == [
+        ("HLR", 1)
+    ]
+    plain = {req.rid: req for req in load_requirements(_root)}
+    assert [link.rid for link in plain["HLR1"].links] == ["HLR2"]
+
+
+def test_service_writes_keep_index_current(_root: Path) -> None:
+    service = RequirementsService(_root, use_index=True)
+    service.list_requirements(prefix="HLR")
+    index = RequirementIndex(_root)
+    path = item_path(_root / "HLR", load_documents(_root)["HLR"], 1)
+
+    service.link_requirements(
+        source_rid="SYS2", derived_rid="HLR1", link_type="parent"
+    )
+
+    stat = path.stat()
+    assert index.revision_entries()[("HLR", 1)][:2] == (stat.st_mtime_ns, stat.st_size)
+
+
+def test_delete_document_syncs_index_once(
+    _root: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from app.core.document_store.links import delete_document
+
+    save_document(_root / "OTH", Document(prefix="OTH", title="Other"))
+    docs = load_documents(_root)
+    create_requirement(_root, prefix="OTH", data=_payload("Delta"), docs=docs)
+    other = item_path(_root / "OTH", docs["OTH"], 1)
+    _rewrite(other, links=["SYS2"])
+    index = RequirementIndex(_root)
+    syncs: list[tuple[str, ...]] = []
+    original = RequirementIndex._sync
+
+    def _tracking(self, conn, prefixes):
+        syncs.append(tuple(prefixes))
+        return original(self, conn, prefixes)
+
+    monkeypatch.setattr(RequirementIndex, "_sync", _tracking)
+
+    assert delete_document(_root, "SYS", docs, index=index) is True
+
+    assert syncs == [("OTH",)]
+    assert sorted(docs) == ["OTH"]
+    assert not (_root / "SYS").exists() and not (_root / "HLR").exists()
+    assert json.loads(other.read_text("utf-8")).get("links", []) == []
+    assert set(index.revisions()) == {("OTH", 1)}
@@ -0,0 +1,112 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from app.core.document_store import Document, RequirementIndex, revision_table
+from app.core.document_store import revisions as revisions_module
+from app.core.document_store.documents import load_documents, save_document
+from app.core.document_store.items import (
+    create_requirement,
+    get_requirement,
+    item_path,
+    load_requirements,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def _payload(title: str, **extra: object) -> dict[str, object]:
+    return {
+        "title": title,
+        "statement": f"{title} statement",
+        "type": "requirement",
+        "status": "draft",
+        "owner": "owner",
+        "priority": "medium",
+        "source": "source",
+        "verification": "analysis",
+        **extra,
+    }
+
+
+@pytest.fixture()
+def _root(tmp_path: Path) -> Path:
+    save_document(tmp_path / "SYS", Document(prefix="SYS", title="System"))
+    save_document(tmp_path / "HLR", Document(prefix="HLR", title="High", parent="SYS"))
+    docs = load_documents(tmp_path)
+    for title in ("Alpha", "Beta"):
+        create_requirement(tmp_path, prefix="SYS", data=_payload(title), docs=docs)
+    create_requirement(
+        tmp_path,
+        prefix="HLR",
+        data=_payload("Gamma", links=["SYS1", "SYS2"]),
+        docs=docs,
+    )
+    return tmp_path
+
+
+@pytest.fixture()
+def revision_reads(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    reads: list[Path] = []
+    original = revisions_module._read_json
+
+    def _tracking(path: Path) -> dict:
+        reads.append(path)
+        return original(path)
+
+    monkeypatch.setattr(revisions_module, "_read_json", _tracking)
+    return reads
+
+
+def _bump_revision(path: Path) -> None:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data["revision"] = int(data.get("revision", 1)) + 1
+    stat = path.stat()
+    path.write_text(json.dumps(data), encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def test_suspicion_checks_resolve_without_reading_targets(
+    _root: Path, revision_reads: list[Path]
+) -> None:
+    load_requirements(_root)
+
+    (hlr,) = load_requirements(_root, prefixes=["HLR"])
+    fetched = get_requirement(_root, "HLR1")
+
+    assert [link.suspect for link in hlr.links] == [False, False]
+    assert [link.suspect for link in fetched.links] == [False, False]
+    assert revision_reads == []
+
+
+def test_changed_targets_are_reread_by_stat(
+    _root: Path, revision_reads: list[Path]
+) -> None:
+    docs = load_documents(_root)
+    load_requirements(_root)
+    target = item_path(_root / "SYS", docs["SYS"], 2)
+    _bump_revision(target)
+
+    fetched = get_requirement(_root, "HLR1")
+
+    assert [(link.rid, link.suspect) for link in fetched.links] == [
+        ("SYS1", False),
+        ("SYS2", True),
+    ]
+    assert revision_reads == [target]
+
+    target.unlink()
+    assert revision_table(_root).revision("SYS", 2) is None
+
+
+def test_table_is_seeded_from_index(_root: Path) -> None:
+    index = RequirementIndex(_root)
+    load_requirements(_root, index=index)
+    table = revisions_module.RevisionTable(_root)
+
+    table.seed(index)
+
+    assert len(table) == 3
+    assert table.revision("SYS", 1) == 1
@@ -0,0 +1,141 @@
+from app.ui.agent_chat_panel.batch_runner import (
+    AgentBatchRunner,
+    BatchItemStatus,
+    BatchTarget,
+    is_rate_limit_error,
+)
+
+
+class _Harness:
+    def __init__(self, **kwargs):
+        self.submitted: list[str] = []
+        self.scheduled: list[tuple[float, object]] = []
+        self._counter = 0
+        self.runner = AgentBatchRunner(
+            submit_prompt=lambda prompt, conv_id, context, prompt_at: self.submitted.append(conv_id),
+            create_conversation=self._create_conversation,
+            ensure_conversation_id=lambda conv: conv,
+            on_state_changed=lambda: None,
+            context_factory=lambda target: None,
+            schedule=lambda delay, callback: self.scheduled.append((delay, callback)),
+            **kwargs,
+        )
+
+    def _create_conversation(self) -> str:
+        self._counter += 1
+        return f"conv-{self._counter}"
+
+
+def _targets(count: int) -> list[BatchTarget]:
+    return [
+        BatchTarget(requirement_id=index, rid=f"REQ-{index}", title=f"Item {index}")
+        for index in range(1, count + 1)
+    ]
+
+
+def test_batch_runner_starts_up_to_max_parallel_items():
+    harness = _Harness(max_parallel=3)
+    runner = harness.runner
+
+    assert runner.start("Review", _targets(5))
+    assert harness.submitted == ["conv-1", "conv-2", "conv-3"]
+    assert len(runner.active_items) == 3
+
+    runner.handle_completion(conversation_id="conv-2", success=True, error=None)
+    assert harness.submitted[-1] == "conv-4"
+
+    for conv_id in ("conv-1", "conv-3", "conv-4"):
+        runner.handle_completion(conversation_id=conv_id, success=True, error=None)
+    runner.handle_completion(conversation_id="conv-5", success=True, error=None)
+
+    assert not runner.is_running
+    assert all(item.status is BatchItemStatus.COMPLETED for item in runner.items)
+
+
+def test_batch_runner_retries_rate_limited_items_with_fewer_slots():
+    harness = _Harness(max_parallel=4, rate_limit_delay=1.5)
+    runner = harness.runner
+    runner.start("Review", _targets(6))
+    assert len(runner.active_items) == 4
+
+    runner.handle_completion(
+        conversation_id="conv-1", success=False, error="429", rate_limited=True
+    )
+
+    first = runner.items[0]
+    assert first.status is BatchItemStatus.PENDING
+    assert first.conversation_id is None
+    assert [delay for delay, _callback in harness.scheduled] == [1.5]
+    assert len(harness.submitted) == 4
+
+    for conv_id in ("conv-2", "conv-3"):
+        runner.handle_completion(conversation_id=conv_id, success=True, error=None)
+    assert len(harness.submitted) == 4
+
+    _delay, callback = harness.scheduled[0]
+    callback()
+    # Two successes grew the halved limit back from 2 to 4 slots.
+    assert len(runner.active_items) == 4
+    assert first.status is BatchItemStatus.RUNNING
+
+
+def test_batch_runner_gives_up_after_repeated_rate_limits():
+    harness = _Harness(max_parallel=1, max_rate_limit_retries=1)
+    runner = harness.runner
+    runner.start("Review", _targets(1))
+
+    runner.handle_completion(
+        conversation_id="conv-1", success=False, error="429", rate_limited=True
+    )
+    harness.scheduled.pop()[1]()
+    runner.handle_completion(
+        conversation_id="conv-2", success=False, error="429", rate_limited=True
+    )
+
+    assert runner.items[0].status is BatchItemStatus.FAILED
+    assert not runner.is_running
+
+
+def test_batch_runner_cancel_all_waits_for_every_active_item():
+    harness = _Harness(max_parallel=2)
+    runner = harness.runner
+    runner.start("Review", _targets(4))
+
+    runner.cancel_all()
+    runner.handle_cancellation(conversation_id="conv-1")
+    assert runner.is_running
+
+    runner.handle_cancellation(conversation_id="conv-2")
+    assert not runner.is_running
+    assert harness.submitted == ["conv-1", "conv-2"]
+    assert all(item.status is BatchItemStatus.CANCELLED for item in runner.items)
+
+
+def test_batch_runner_cancels_rate_limited_items_after_cancel_all():
+    harness = _Harness(max_parallel=2)
+    runner = harness.runner
+    runner.start("Review", _targets(3))
+
+    runner.cancel_all()
+    runner.handle_completion(
+        conversation_id="conv-1", success=False, error="429", rate_limited=True
+    )
+    assert runner.is_running
+    runner.handle_completion(
+        conversation_id="conv-2", success=False, error="429", rate_limited=True
+    )
+
+    assert not runner.is_running
+    assert harness.scheduled == []
+    assert all(item.status is BatchItemStatus.CANCELLED for item in runner.items)
+
+
+def test_is_rate_limit_error_detects_provider_failures():
+    assert is_rate_limit_error(
+        {"ok": False, "error": {"type": "RateLimitError", "message": "slow down"}}
+    )
+    assert is_rate_limit_error(
+        {"ok": False, "error": {"message": "Error code: 429 - Too Many Requests"}}
+    )
+    assert not is_rate_limit_error({"ok": False, "error": {"message": "boom"}})
+    assert not is_rate_limit_error({"ok": True, "result": "done"})
@@ -288,3 +288,71 @@ def test_validation_error_payloads_mirror_tool_execution():
     second_tool_message = json.loads(runner._conversation[2]["content"])
     assert first_tool_message["error"]["code"] == "VALIDATION_ERROR"
     assert second_tool_message["error"]["code"] == "VALIDATION_ERROR"
+
+
+class ConcurrencyTrackingMCP(DummyMCP):
+    def __init__(self, *, fail: set[str] | None = None) -> None:
+        self.active = 0
+        self.peak = 0
+        self.calls: list[str] = []
+        self.ready_checks = 0
+        self._fail = fail or set()
+
+    async def ensure_ready_async(self) -> None:
+        self.ready_checks += 1
+
+    async def call_tool_async(self, name: str, arguments: Mapping[str, Any]) -> Mapping[str, Any]:
+        self.calls.append(str(arguments["rid"]))
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        # Later calls finish first to expose any order dependence.
+        await asyncio.sleep(0.01 * (5 - len(self.calls)))
+        self.active -= 1
+        if arguments["rid"] in self._fail:
+            return {"ok": False, "error": {"code": "NOT_FOUND", "message": "missing"}}
+        return {"ok": True, "result": {"rid": arguments["rid"]}}
+
+
+def _tool_response(*calls: tuple[str, str]) -> LLMResponse:
+    return LLMResponse(
+        "",
+        tuple(
+            LLMToolCall(id=f"call-{index}", name=name, arguments={"rid": rid})
+            for index, (name, rid) in enumerate(calls)
+        ),
+    )
+
+
+def test_runner_runs_read_only_tools_concurrently_in_stable_order():
+    mcp = ConcurrencyTrackingMCP()
+    agent = LocalAgent(llm=DummyLLM(), mcp=mcp, max_parallel_tool_calls=2)
+    runner = _create_runner(agent)
+    response = _tool_response(*(("get_requirement", f"SYS{i}") for i in range(4)))
+
+    iteration = _run(runner._handle_response(response))
+
+    assert iteration.tool_error is None
+    assert mcp.peak == 2
+    assert mcp.ready_checks == 1
+    call_ids = [message["tool_call_id"] for message in iteration.tool_messages]
+    assert call_ids == ["call-0", "call-1", "call-2", "call-3"]
+    results = runner._recorder.to_payload().tool_results
+    assert [snapshot.call_id for snapshot in results] == call_ids
+
+
+def test_runner_keeps_writes_serial_and_stops_after_failure():
+    mcp = ConcurrencyTrackingMCP(fail={"SYS1"})
+    agent = LocalAgent(llm=DummyLLM(), mcp=mcp)
+    runner = _create_runner(agent)
+    response = _tool_response(
+        ("update_requirement_field", "SYS0"),
+        ("update_requirement_field", "SYS1"),
+        ("update_requirement_field", "SYS2"),
+    )
+
+    iteration = _run(runner._handle_response(response))
+
+    assert mcp.peak == 1
+    assert mcp.calls == ["SYS0", "SYS1"]
+    assert iteration.tool_error == {"code": "NOT_FOUND", "message": "missing"}
+    assert len(iteration.tool_messages) == 2
@@ -60,6 +60,19 @@ def test_agent_project_settings_handles_unicode_paths(tmp_path):
     assert loaded.documents_path == "../документы/Рабочие материалы"
 
 
+def test_agent_project_settings_clamps_batch_parallelism(tmp_path):
+    settings_path = tmp_path / "agent_settings.json"
+    save_agent_project_settings(
+        settings_path, AgentProjectSettings(batch_parallelism=3)
+    )
+    assert load_agent_project_settings(settings_path).batch_parallelism == 3
+
+    for raw, expected in ((0, 1), (100, 8), ("4", 1), (None, 1)):
+        payload = {"version": 5, "batch_parallelism": raw}
+        settings_path.write_text(json.dumps(payload), encoding="utf-8")
+        assert load_agent_project_settings(settings_path).batch_parallelism == expected
+
+
 def test_should_persist_agent_project_settings_skips_new_default_file(tmp_path):
     settings_path = tmp_path / ".cookareq" / "agent_settings.json"
 
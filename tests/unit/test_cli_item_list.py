@@ -54,6 +54,7 @@ def test_item_list_outputs_requirements_with_optional_links(tmp_path, capsys, cl
         per_page=50,
         status="approved",
         labels="software",
+        sort=None,
         show_links=True,
         format="text",
     )
@@ -73,6 +74,7 @@ def test_item_list_fails_for_unknown_document(tmp_path, capsys, cli_context):
         per_page=50,
         status=None,
         labels=None,
+        sort=None,
         show_links=False,
         format="text",
     )
@@ -108,6 +110,7 @@ def test_item_list_json_format(tmp_path, capsys, cli_context):
         per_page=50,
         status=None,
         labels=None,
+        sort=None,
         show_links=False,
         format="json",
     )
@@ -120,3 +123,32 @@ def test_item_list_json_format(tmp_path, capsys, cli_context):
     assert '"status": "approved"' in out
     assert '"context_docs": [' in out
     assert '"related/ctx.md"' in out
+
+
+def test_item_list_sorts_before_pagination(tmp_path, capsys, cli_context):
+    doc = Document(prefix="SYS", title="System")
+    save_document(tmp_path / "SYS", doc)
+    for item_id, title in ((1, "Beta"), (2, "alpha"), (3, "Gamma")):
+        save_item(
+            tmp_path / "SYS",
+            doc,
+            {"id": item_id, "title": title, "statement": "", "links": []},
+        )
+
+    args = argparse.Namespace(
+        directory=str(tmp_path),
+        prefix="SYS",
+        page=1,
+        per_page=2,
+        status=None,
+        labels=None,
+        sort="title",
+        show_links=False,
+        format="text",
+    )
+
+    rc = commands.cmd_item_list(args, cli_context)
+    out = capsys.readouterr().out.strip().splitlines()
+
+    assert rc == 0
+    assert out == ["SYS2 alpha", "SYS1 Beta"]
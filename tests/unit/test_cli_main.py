@@ -66,3 +66,22 @@ def test_importing_cli_main_does_not_import_wx() -> None:
 
     assert module is not None
     assert "wx" not in sys.modules
+
+
+def test_cli_use_index_flag_enables_requirement_index(monkeypatch, tmp_path):
+    import importlib
+
+    from app.core.document_store import Document
+    from app.core.document_store.documents import save_document
+    from app.core.document_store.index import index_path
+
+    cli_main = importlib.import_module("app.cli.main")
+    monkeypatch.setattr(cli_main, "configure_logging", lambda: None)
+    monkeypatch.setattr(cli_main, "log_missing_startup_dependencies", lambda: None)
+    save_document(tmp_path / "SYS", Document(prefix="SYS", title="System"))
+
+    assert cli_main.main(["item", "list", str(tmp_path), "SYS"]) == 0
+    assert not index_path(tmp_path).exists()
+
+    assert cli_main.main(["--use-index", "item", "list", str(tmp_path), "SYS"]) == 0
+    assert index_path(tmp_path).is_file()
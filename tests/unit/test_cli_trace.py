@@ -62,6 +62,15 @@ def test_trace_export_csv(tmp_path, capsys, cli_context):
     assert out[1] == "HLR1,H,High,approved,linked"
 
 
+@pytest.mark.unit
+def test_trace_export_links_csv(tmp_path, capsys, cli_context):
+    args = _make_args(tmp_path, format="links-csv")
+    _prepare(tmp_path)
+    commands.cmd_trace(args, cli_context)
+    out = capsys.readouterr().out.strip().splitlines()
+    assert out == ["rid,column,marker", "HLR1,SYS1,linked"]
+
+
 @pytest.mark.unit
 def test_trace_export_html(tmp_path, capsys, cli_context):
     args = _make_args(tmp_path, format="matrix-html")
@@ -6,6 +6,7 @@ from pathlib import Path
 import pytest
 
 from app.cli import commands
+from app.core.trace_index import parse_cache_path
 
 FIXTURE_ROOT = Path("tests/fixtures/trace_index_project")
 
@@ -27,6 +28,7 @@ def _args(root: Path, command: str, **overrides: object) -> argparse.Namespace:
         "result_glob": None,
         "exclude_glob": ["Vsrc/broken_*"],
         "fail_on": "high",
+        "jobs": 1,
         "format": "json",
         "view": "index",
         "output": None,
@@ -61,6 +63,19 @@ def test_trace_index_check_returns_zero_without_high_issues(tmp_path: Path, caps
     assert "Issues: high=0 warning=0 info=0" in capsys.readouterr().out
 
 
+@pytest.mark.unit
+def test_trace_index_check_and_export_do_not_write_parse_cache(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str], cli_context
+) -> None:
+    root = _copy_fixture(tmp_path)
+
+    assert commands.cmd_trace_index(_args(root, "check"), cli_context) == 0
+    assert commands.cmd_trace_index(_args(root, "export"), cli_context) == 0
+    capsys.readouterr()
+
+    assert not parse_cache_path(root / "Req").exists()
+
+
 @pytest.mark.unit
 def test_trace_index_check_returns_nonzero_for_high_issue(tmp_path: Path, capsys: pytest.CaptureFixture[str], cli_context) -> None:
     root = _copy_fixture(tmp_path)
@@ -125,6 +140,33 @@ def test_trace_index_export_writes_artifact_matrix_csv_to_stdout(
     assert "passed" in out
 
 
+@pytest.mark.unit
+def test_trace_index_export_writes_artifact_links_csv_to_file(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str], cli_context
+) -> None:
+    root = _copy_fixture(tmp_path)
+    output = tmp_path / "out" / "links.csv"
+    args = _args(
+        root,
+        "export",
+        view="artifact-matrix",
+        format="links-csv",
+        output=str(output),
+    )
+
+    exit_code = commands.cmd_trace_index(args, cli_context)
+
+    assert exit_code == 0
+    assert capsys.readouterr().out == ""
+    lines = output.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == "rid,column,marker,status"
+    assert len(lines) == 45
+    assert any(
+        line.startswith("LLR10,test_result:") and line.endswith(",test_result,passed")
+        for line in lines
+    )
+
+
 @pytest.mark.unit
 def test_trace_index_export_writes_artifact_matrix_html_to_file(
     tmp_path: Path, capsys: pytest.CaptureFixture[str], cli_context
@@ -277,3 +319,16 @@ def _write_minimal_req(root: Path, *, verification: str) -> None:
         ),
         encoding="utf-8",
     )
+
+
+@pytest.mark.unit
+def test_trace_index_parser_accepts_jobs() -> None:
+    parser = argparse.ArgumentParser()
+    commands.add_trace_index_arguments(parser)
+
+    args = parser.parse_args(["check", "Req", "--jobs", "4"])
+
+    assert args.jobs == 4
+    assert parser.parse_args(["check", "Req"]).jobs == 1
+    with pytest.raises(SystemExit):
+        parser.parse_args(["check", "Req", "--jobs", "0"])
@@ -16,3 +16,64 @@ def test_count_text_tokens_falls_back_when_tiktoken_encoding_download_fails(
     assert result.tokens == 3
     assert result.approximate is True
     assert result.reason == "fallback_whitespace"
+
+
+def test_count_text_tokens_memoizes_long_texts(monkeypatch):
+    encoded: list[str] = []
+
+    class CountingEncoding:
+        name = "cl100k_base"
+
+        def encode(self, text: str, *, disallowed_special=()):
+            encoded.append(text)
+            return text.split()
+
+    class CountingTiktokenModule:
+        @staticmethod
+        def get_encoding(_name: str):
+            return CountingEncoding()
+
+    module = CountingTiktokenModule()
+    monkeypatch.setattr(tokenizer, "_load_tiktoken", lambda: module)
+
+    long_text = "word " * 200
+    first = tokenizer.count_text_tokens(long_text, model="memo-test")
+    second = tokenizer.count_text_tokens(long_text, model="memo-test")
+    tokenizer.count_text_tokens("short text", model="memo-test")
+    tokenizer.count_text_tokens("short text", model="memo-test")
+
+    assert first == second
+    assert first.tokens == 200
+    assert encoded.count(long_text) == 1
+    assert encoded.count("short text") == 2
+
+
+def test_count_text_tokens_retries_encoding_after_transient_failure(monkeypatch):
+    attempts: list[str] = []
+
+    class Encoding:
+        name = "cl100k_base"
+
+        def encode(self, text: str, *, disallowed_special=()):
+            return text.split()
+
+    class FlakyTiktokenModule:
+        @staticmethod
+        def get_encoding(name: str):
+            attempts.append(name)
+            if len(attempts) == 1:
+                raise RuntimeError("network unavailable")
+            return Encoding()
+
+    module = FlakyTiktokenModule()
+    monkeypatch.setattr(tokenizer, "_load_tiktoken", lambda: module)
+
+    first = tokenizer.count_text_tokens("one two three", model="retry-test")
+    second = tokenizer.count_text_tokens("one two three", model="retry-test")
+    third = tokenizer.count_text_tokens("four five", model="retry-test")
+
+    assert first.reason == "fallback_whitespace"
+    assert second.reason == "model_approximation"
+    assert second.tokens == 3
+    assert third.tokens == 2
+    assert len(attempts) == 2
@@ -0,0 +1,116 @@
+"""Tests for MCP tool execution concurrency helpers."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.mcp.concurrency import ReadWriteLock, ToolExecutor
+
+pytestmark = pytest.mark.unit
+
+
+def test_read_tools_overlap_while_writes_are_exclusive(tmp_path) -> None:
+    executor = ToolExecutor(max_workers=4)
+    active = 0
+    peak_readers = 0
+    writer_overlap = False
+    guard = threading.Lock()
+
+    def tool(*, kind: str) -> str:
+        nonlocal active, peak_readers, writer_overlap
+        with guard:
+            active += 1
+            if kind == "write" and active > 1:
+                writer_overlap = True
+            if kind == "read":
+                peak_readers = max(peak_readers, active)
+        time.sleep(0.05)
+        with guard:
+            if kind == "write" and active > 1:
+                writer_overlap = True
+            active -= 1
+        return kind
+
+    async def _run() -> list[str]:
+        calls = [
+            executor.run(
+                tool, {"kind": kind}, root=tmp_path, read_only=kind == "read"
+            )
+            for kind in ("read", "read", "write", "read", "read")
+        ]
+        return await asyncio.gather(*calls)
+
+    try:
+        results = asyncio.run(_run())
+    finally:
+        executor.shutdown()
+
+    assert results == ["read", "read", "write", "read", "read"]
+    assert peak_readers >= 2
+    assert writer_overlap is False
+
+
+def test_roots_are_locked_independently(tmp_path) -> None:
+    executor = ToolExecutor(max_workers=2)
+    try:
+        first = executor.lock_for(tmp_path / "a")
+        assert executor.lock_for(str(tmp_path / "a")) is first
+        assert executor.lock_for(tmp_path / "b") is not first
+    finally:
+        executor.shutdown()
+    with pytest.raises(ValueError):
+        ToolExecutor(max_workers=0)
+
+
+def test_waiting_writer_blocks_new_readers() -> None:
+    lock = ReadWriteLock()
+    order: list[str] = []
+    writer_waiting = threading.Event()
+
+    def writer() -> None:
+        writer_waiting.set()
+        with lock.write():
+            order.append("write")
+
+    def late_reader() -> None:
+        with lock.read():
+            order.append("late-read")
+
+    with lock.read():
+        thread = threading.Thread(target=writer)
+        thread.start()
+        writer_waiting.wait()
+        while not lock._waiting_writers:
+            time.sleep(0.001)
+        reader = threading.Thread(target=late_reader)
+        reader.start()
+        time.sleep(0.02)
+        order.append("first-read")
+    thread.join()
+    reader.join()
+
+    assert order == ["first-read", "write", "late-read"]
+
+
+def test_writer_may_reenter_lock() -> None:
+    lock = ReadWriteLock()
+    entered: list[str] = []
+
+    def nested() -> None:
+        with lock.write():
+            with lock.write():
+                entered.append("write")
+            with lock.read():
+                entered.append("read")
+
+    worker = threading.Thread(target=nested)
+    worker.start()
+    worker.join(timeout=5)
+
+    assert entered == ["write", "read"]
+    with lock.read():
+        pass
@@ -1,9 +1,18 @@
 """Tests for requirement model."""
 
+from dataclasses import replace
+
 import pytest
 
-from app.core.model import Priority, Requirement, RequirementType, Status, Verification
-from app.ui.requirement_model import RequirementModel
+from app.core.model import (
+    Link,
+    Priority,
+    Requirement,
+    RequirementType,
+    Status,
+    Verification,
+)
+from app.ui.requirement_model import RequirementModel, RowChange
 
 pytestmark = pytest.mark.unit
 
@@ -64,3 +73,86 @@ def test_delete_scoped_to_document_prefix():
     assert remaining[0].doc_prefix == "ALT"
     assert model.is_unsaved(req_id=1, prefix="REQ") is False
     assert model.is_unsaved(req_id=1, prefix="ALT") is True
+
+
+def _rebuilt(model: RequirementModel) -> list[int]:
+    fresh = RequirementModel()
+    fresh.set_requirements(model.get_all())
+    fresh.set_status(model._status)
+    fresh.set_has_derived(model._has_derived)
+    if model._sort_field:
+        fresh.sort(model._sort_field, model._sort_ascending)
+    return [req.id for req in fresh.get_visible()]
+
+
+@pytest.mark.parametrize("ascending", [True, False])
+def test_incremental_updates_match_full_refresh(ascending):
+    model = RequirementModel()
+    reqs = [_req(i, Status.DRAFT) for i in range(1, 9)]
+    for index, req in enumerate(reqs):
+        req.title = "AB"[index % 2]
+    model.set_requirements(reqs)
+    model.sort("title", ascending)
+    model.set_status("draft")
+
+    model.update(replace(reqs[2], title="A"))
+    model.update(replace(reqs[3], status=Status.APPROVED))
+    model.add(replace(_req(9, Status.DRAFT), title="B"))
+    model.update_many([replace(reqs[0], title="B"), replace(reqs[5], title="C")])
+    model.delete(5)
+
+    assert [req.id for req in model.get_visible()] == _rebuilt(model)
+    assert [req.id for req in model.get_all()] == [1, 2, 3, 4, 6, 7, 8, 9]
+
+
+def test_update_reports_row_changes():
+    model = RequirementModel()
+    reqs = [_req(i, Status.DRAFT) for i in (1, 2, 3)]
+    model.set_requirements(reqs)
+    model.sort("id", ascending=False)
+    changes: list[RowChange | None] = []
+    model.add_row_listener(changes.append)
+
+    model.update(replace(reqs[1], title="Edited"))
+    model.set_status("draft")
+    model.update(replace(reqs[2], status=Status.APPROVED))
+    model.add(_req(4, Status.DRAFT))
+
+    assert [(c.requirement.id, c.old_index, c.new_index) for c in changes] == [
+        (2, 1, 1),
+        (3, 0, None),
+        (4, None, 0),
+    ]
+    assert [change.moved for change in changes] == [False, True, True]
+    assert model.get_by_id(2).title == "Edited"
+
+
+def test_link_change_rebuilds_has_derived_view():
+    model = RequirementModel()
+    parent = _req(1, Status.DRAFT)
+    child = _req(2, Status.DRAFT)
+    model.set_requirements([parent, child])
+    model.set_has_derived(True)
+    changes: list[RowChange | None] = []
+    model.add_row_listener(changes.append)
+
+    model.update(replace(child, links=[Link(rid="1")]))
+
+    assert changes == [None]
+    assert [req.id for req in model.get_visible()] == [1]
+
+
+def test_in_place_edit_refreshes_cached_sort_key():
+    model = RequirementModel()
+    reqs = [_req(i, Status.DRAFT) for i in (1, 2, 3)]
+    for req, source in zip(reqs, ("S1", "S2", "S10"), strict=True):
+        req.source = source
+    model.set_requirements(reqs)
+    model.sort("source")
+    assert [req.id for req in model.get_visible()] == [1, 2, 3]
+
+    reqs[0].source = "S11"
+    model.update(reqs[0])
+    model.sort("source", ascending=False)
+
+    assert [req.id for req in model.get_visible()] == [1, 3, 2]
@@ -2,8 +2,14 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
+
 from app.core.model import Priority, Requirement, RequirementType, Status, Verification
-from app.core.requirement_sorting import sort_requirements_for_cards
+from app.core.requirement_sorting import (
+    SortKeyCache,
+    card_sort_key,
+    sort_requirements_for_cards,
+)
 
 
 def _make_requirement(
@@ -64,3 +70,30 @@ def test_sort_requirements_for_cards_by_context_docs():
 
     sorted_reqs = sort_requirements_for_cards(reqs, sort_mode="context_docs")
     assert [req.id for req in sorted_reqs] == [2, 1, 3]
+
+
+def test_sort_key_cache_reuses_keys_until_requirement_changes():
+    calls: list[tuple[int, str]] = []
+
+    def key_func(requirement: Requirement, field: str) -> tuple:
+        calls.append((requirement.id, field))
+        return card_sort_key(requirement, field)
+
+    cache = SortKeyCache(key_func)
+    reqs = [
+        _make_requirement(2, title="B", source="S10", labels=[]),
+        _make_requirement(1, title="A", source="S2", labels=[]),
+    ]
+
+    assert [req.id for req in cache.sort(reqs, "source")] == [1, 2]
+    assert [req.id for req in cache.sort(reqs, "source", reverse=True)] == [2, 1]
+    assert len(calls) == 2
+
+    edited = replace(reqs[1], source="S20")
+    assert [req.id for req in cache.sort([reqs[0], edited], "source")] == [2, 1]
+    assert len(calls) == 3
+
+    reqs[0].source = "S1"
+    cache.invalidate(reqs[0])
+    assert [req.id for req in cache.sort([reqs[0], edited], "source")] == [2, 1]
+    assert len(calls) == 4
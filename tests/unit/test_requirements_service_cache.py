@@ -0,0 +1,220 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+from app.core import document_store as doc_store
+from app.core import requirement_sorting
+from app.core.document_store import Document, DocumentLabels, RequirementCache
+from app.core.document_store import bulk as bulk_module
+from app.core.document_store import items as items_module
+from app.core.document_store.documents import save_document
+from app.core.model import Requirement
+from app.services.requirements import RequirementsService
+
+pytestmark = pytest.mark.unit
+
+
+def _payload(title: str) -> dict[str, object]:
+    return {
+        "title": title,
+        "statement": f"{title} statement",
+        "type": "requirement",
+        "status": "draft",
+        "owner": "owner",
+        "priority": "medium",
+        "source": "source",
+        "verification": "analysis",
+    }
+
+
+@pytest.fixture()
+def service(tmp_path: Path) -> RequirementsService:
+    save_document(
+        tmp_path / "SYS",
+        Document(
+            prefix="SYS", title="System", labels=DocumentLabels(allow_freeform=True)
+        ),
+    )
+    service = RequirementsService(tmp_path)
+    service.create_requirement("SYS", _payload("Alpha"))
+    service.create_requirement("SYS", _payload("Beta"))
+    return service
+
+
+@pytest.fixture()
+def json_reads(monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+    reads: list[Path] = []
+    for module in (bulk_module, items_module):
+        original = module._read_json
+
+        def _tracking(path: Path, _original=original) -> dict:
+            reads.append(Path(path))
+            return _original(path)
+
+        monkeypatch.setattr(module, "_read_json", _tracking)
+    return reads
+
+
+def test_repeated_reads_reuse_parsed_requirements(
+    service: RequirementsService, json_reads: list[Path]
+) -> None:
+    first = service.list_requirements(prefix="SYS")
+    assert len(json_reads) == 2
+
+    second = service.search_requirements(query="beta")
+    fetched = service.get_requirement("SYS1")
+
+    assert [req.rid for req in first.items] == ["SYS1", "SYS2"]
+    assert [req.rid for req in second.items] == ["SYS2"]
+    assert fetched.title == "Alpha"
+    assert len(json_reads) == 2
+
+
+def test_cached_copies_are_isolated(service: RequirementsService) -> None:
+    first = service.get_requirement("SYS1")
+    first.labels.append("mutated")
+    first.title = "Changed"
+
+    again = service.get_requirement("SYS1")
+
+    assert again.labels == []
+    assert again.title == "Alpha"
+
+
+def test_external_edits_are_detected_by_stat(
+    service: RequirementsService, json_reads: list[Path]
+) -> None:
+    service.load_requirements()
+    path = service.root / "SYS" / "items" / "2.json"
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data["title"] = "Beta edited outside the service"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    json_reads.clear()
+
+    titles = [req.title for req in service.load_requirements()]
+
+    assert titles == ["Alpha", "Beta edited outside the service"]
+    assert json_reads == [path]
+
+
+def test_mutators_invalidate_write_through(service: RequirementsService) -> None:
+    assert service.get_requirement("SYS1").owner == "owner"
+
+    service.update_requirement_field("SYS1", field="owner", value="alice")
+    assert service.get_requirement("SYS1").owner == "alice"
+
+    service.set_requirement_labels("SYS1", ["ui"])
+    assert service.get_requirement("SYS1").labels == ["ui"]
+
+    service.delete_requirement("SYS2")
+    assert [req.rid for req in service.load_requirements()] == ["SYS1"]
+
+
+def test_cache_evicts_least_recently_used() -> None:
+    cache = RequirementCache(max_entries=2)
+    requirement = Requirement.from_mapping({"id": 1, **_payload("A")})
+    cache.put("SYS", 1, (1, 1), requirement)
+    cache.put("SYS", 2, (1, 1), requirement)
+    assert cache.get("SYS", 1, (1, 1)) is not None
+
+    cache.put("SYS", 3, (1, 1), requirement)
+
+    assert len(cache) == 2
+    assert cache.get("SYS", 2, (1, 1)) is None
+    assert cache.get("SYS", 1, (1, 1)) is not None
+    assert cache.get("SYS", 1, (2, 1)) is None
+
+
+def test_document_map_rebuild_is_serialized(
+    service: RequirementsService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    events: list[str] = []
+    entered = threading.Event()
+    original = doc_store.load_documents
+
+    def _slow_load(root):
+        entered.set()
+        time.sleep(0.1)
+        events.append("load")
+        return original(root)
+
+    monkeypatch.setattr(doc_store, "load_documents", _slow_load)
+    service.clear_cache()
+    reader = threading.Thread(target=service.load_documents)
+    reader.start()
+    assert entered.wait(timeout=5)
+    service.clear_cache()
+    events.append("clear")
+    reader.join(timeout=5)
+
+    assert events == ["load", "clear"]
+
+
+def test_reads_run_in_parallel_and_mutators_use_write_guard(
+    service: RequirementsService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    barrier = threading.Barrier(2, timeout=5)
+    original = doc_store.list_requirements
+
+    def _meeting_list(*args, **kwargs):
+        barrier.wait()
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(doc_store, "list_requirements", _meeting_list)
+    results: list[int] = []
+    readers = [
+        threading.Thread(
+            target=lambda: results.append(
+                service.list_requirements(prefix="SYS").total
+            )
+        )
+        for _ in range(2)
+    ]
+    for reader in readers:
+        reader.start()
+    for reader in readers:
+        reader.join(timeout=10)
+    assert results == [2, 2]
+    monkeypatch.undo()
+
+    guarded: list[str] = []
+
+    @contextmanager
+    def _guard():
+        guarded.append("enter")
+        yield
+        guarded.append("exit")
+
+    service.set_write_guard(_guard)
+    service.list_requirements(prefix="SYS")
+    service.create_requirement("SYS", _payload("Gamma"))
+    assert guarded == ["enter", "exit"]
+
+
+def test_card_sort_keys_are_shared_across_calls(
+    service: RequirementsService, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    computed: list[str] = []
+    original = requirement_sorting.natural_sort_key
+
+    def _counting(value: str):
+        computed.append(value)
+        return original(value)
+
+    monkeypatch.setattr(requirement_sorting, "natural_sort_key", _counting)
+
+    first = service.list_requirements(prefix="SYS", sort="source")
+    assert len(computed) == 2
+    service.list_requirements(prefix="SYS", sort="source")
+    exported = service.sort_requirements_for_cards(first.items, sort_mode="source")
+    assert len(computed) == 2
+    assert [req.id for req in exported] == [req.id for req in first.items]
+
+    service.update_requirement_field("SYS1", field="source", value="a first")
+    resorted = service.list_requirements(prefix="SYS", sort="source")
+    assert computed[2:] == ["a first"]
+    assert resorted.items[0].source == "a first"
@@ -0,0 +1,117 @@
+"""Tests for the inverted text search index."""
+
+import pytest
+
+from app.core.model import (
+    Priority,
+    Requirement,
+    RequirementType,
+    Status,
+    Verification,
+)
+from app.core.search import SEARCHABLE_FIELDS, filter_text_fields, search_text
+from app.core.search_index import TextSearchIndex
+from app.ui.requirement_model import RequirementModel
+
+pytestmark = pytest.mark.unit
+
+
+def _req(req_id: int, prefix: str = "SYS", **fields: object) -> Requirement:
+    data: dict[str, object] = {
+        "id": req_id,
+        "title": f"Requirement {req_id}",
+        "statement": "",
+        "type": RequirementType.REQUIREMENT,
+        "status": Status.DRAFT,
+        "owner": "",
+        "priority": Priority.MEDIUM,
+        "source": "",
+        "verification": Verification.ANALYSIS,
+        "doc_prefix": prefix,
+    }
+    data.update(fields)
+    return Requirement(**data)
+
+
+def _corpus() -> list[Requirement]:
+    return [
+        _req(1, statement="The **login** form validates user-name input"),
+        _req(2, statement="Store data in DB", owner="Bob", notes="Backup nightly"),
+        _req(3, prefix="HLR", title="Export report", rationale="Audit: 2024-01"),
+        _req(4, title="Émigré support", acceptance="Unicode names survive"),
+        _req(5, title="login", statement="", source="spec v1.2"),
+    ]
+
+
+QUERIES = [
+    "login",
+    "LOG",
+    "gin fo",
+    "user-name",
+    "-name",
+    "er-na",
+    "**",
+    " ",
+    ":",
+    "2024-0",
+    "émigré",
+    "e",
+    "v1.2",
+    "missing",
+    "report audit",
+]
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_indexed_search_matches_plain_scan(query: str) -> None:
+    corpus = _corpus()
+    index = TextSearchIndex(corpus)
+    fields = sorted(SEARCHABLE_FIELDS)
+
+    assert search_text(corpus, query, fields, text_index=index) == search_text(
+        corpus, query, fields
+    )
+
+
+@pytest.mark.parametrize("query", QUERIES)
+def test_indexed_field_filter_matches_plain_scan(query: str) -> None:
+    corpus = _corpus()
+    index = TextSearchIndex(corpus)
+    for field in ("title", "statement", "owner", "notes"):
+        queries = {field: query}
+        assert filter_text_fields(corpus, queries, text_index=index) == (
+            filter_text_fields(corpus, queries)
+        )
+
+
+def test_updates_and_removals_are_reflected() -> None:
+    corpus = _corpus()
+    index = TextSearchIndex(corpus)
+    fields = ["title", "statement"]
+
+    corpus[1] = _req(2, statement="Store telemetry in DB")
+    index.update(corpus[1])
+    index.remove(corpus[0])
+
+    assert search_text(corpus, "telemetry", fields, text_index=index) == [corpus[1]]
+    # Unindexed requirements fall back to the plain substring check.
+    assert search_text(corpus, "login", fields, text_index=index) == [
+        corpus[0],
+        corpus[4],
+    ]
+    assert ("SYS", 1) not in index
+    assert len(index) == 4
+
+
+def test_requirement_model_keeps_index_in_sync() -> None:
+    model = RequirementModel()
+    model.set_requirements(_corpus())
+    model.set_search_query("telemetry")
+    assert model.get_visible() == []
+
+    updated = _req(2, statement="Store telemetry in DB")
+    model.update(updated)
+    assert model.get_visible() == [updated]
+
+    model.delete(2, doc_prefix="SYS")
+    assert model.get_visible() == []
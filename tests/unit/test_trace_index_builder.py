@@ -1,10 +1,13 @@
 import json
+import shutil
 from pathlib import Path
 
 import pytest
 
+from app.core.trace_index import builder as builder_module
 from app.core.trace_index.builder import build_trace_index
 from app.core.trace_index.config import TraceIndexConfig
+from app.core.trace_index.parse_cache import parse_cache_path
 
 FIXTURE_ROOT = Path("tests/fixtures/trace_index_project")
 
@@ -192,3 +195,66 @@ def _write_req_item(tmp_path: Path, *, item_id: int, verification: str) -> None:
         ),
         encoding="utf-8",
     )
+
+
+@pytest.mark.unit
+def test_incremental_build_reparses_only_changed_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    root = tmp_path / "trace_index_project"
+    shutil.copytree(FIXTURE_ROOT, root)
+    config = TraceIndexConfig.from_conventions(
+        root / "Req", project_root=root, exclude_globs=("Vsrc/broken_*",)
+    )
+    full = build_trace_index(config)
+    first = build_trace_index(config, incremental=True)
+    assert parse_cache_path(config.req_root).is_file()
+
+    parsed: list[str] = []
+
+    def tracking(original):
+        def parse(path: Path, **kwargs: object) -> object:
+            parsed.append(Path(path).name)
+            return original(path, **kwargs)
+
+        return parse
+
+    for name in ("parse_code_file", "parse_test_file", "parse_result_file"):
+        monkeypatch.setattr(
+            builder_module, name, tracking(getattr(builder_module, name))
+        )
+
+    cached = build_trace_index(config, incremental=True)
+    assert parsed == []
+    assert _without_volatile(cached.to_dict()) == _without_volatile(first.to_dict())
+    assert _without_volatile(first.to_dict()) == _without_volatile(full.to_dict())
+
+    source = root / "Vsrc" / "demo.c"
+    source.write_text(
+        source.read_text(encoding="utf-8") + "/* @covers LLR404 */\n",
+        encoding="utf-8",
+    )
+    rebuilt = build_trace_index(config, incremental=True)
+
+    assert parsed == [source.name]
+    assert _without_volatile(rebuilt.to_dict()) == _without_volatile(
+        build_trace_index(config).to_dict()
+    )
+    assert any(issue.rid == "LLR404" for issue in rebuilt.issues)
+
+
+@pytest.mark.unit
+def test_parallel_build_matches_serial_build(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(builder_module, "_MIN_PARALLEL_FILES", 1)
+    config = TraceIndexConfig.from_conventions(
+        FIXTURE_ROOT / "Req",
+        project_root=FIXTURE_ROOT,
+        exclude_globs=("Vsrc/broken_*",),
+    )
+
+    serial = build_trace_index(config)
+    parallel = build_trace_index(config, jobs=2)
+
+    assert _without_volatile(parallel.to_dict()) == _without_volatile(serial.to_dict())
+    with pytest.raises(ValueError):
+        build_trace_index(config, jobs=0)
@@ -1,3 +1,4 @@
+import pickle
 from pathlib import Path
 
 import pytest
@@ -10,7 +11,7 @@ from app.core.trace_index.cache import (
     write_trace_index_cache,
 )
 from app.core.trace_index.config import TraceIndexConfig
-from app.core.trace_index.model import TraceIndex
+from app.core.trace_index.model import LazySequence, TraceIndex
 
 FIXTURE_ROOT = Path("tests/fixtures/trace_index_project")
 
@@ -42,6 +43,59 @@ def test_write_and_read_trace_index_cache_round_trips(tmp_path: Path) -> None:
     assert path.read_text(encoding="utf-8").endswith("\n")
 
 
+@pytest.mark.unit
+def test_compact_cache_round_trips_with_lazy_records(tmp_path: Path) -> None:
+    config = _fixture_config()
+    index = build_trace_index(config)
+    req_root = tmp_path / "Req"
+
+    path = write_trace_index_cache(index, req_root, encoding="compact")
+    restored = read_trace_index_cache(path)
+
+    assert path == cache_path(req_root, "compact")
+    assert path.name == "trace_index.generated.compact.json"
+    assert "\n " not in path.read_text(encoding="utf-8")
+    assert isinstance(restored.code_locations, LazySequence)
+    assert len(restored.test_results) == len(index.test_results)
+    assert restored.test_results[-1] == index.test_results[-1]
+    assert restored == index
+    assert restored.to_dict() == index.to_dict()
+
+
+@pytest.mark.unit
+def test_compact_cache_index_is_picklable(tmp_path: Path) -> None:
+    index = build_trace_index(_fixture_config())
+    path = write_trace_index_cache(index, tmp_path / "Req", encoding="compact")
+    restored = read_trace_index_cache(path)
+    restored.test_results[0]
+
+    unpickled = pickle.loads(pickle.dumps(restored))
+
+    assert isinstance(unpickled.test_results, tuple)
+    assert unpickled == index
+    assert unpickled.to_dict() == index.to_dict()
+
+
+@pytest.mark.unit
+def test_read_cache_for_config_uses_configured_encoding(tmp_path: Path) -> None:
+    req_root = tmp_path / "Req"
+    req_root.mkdir()
+    config = TraceIndexConfig.from_conventions(
+        req_root, project_root=tmp_path, cache_encoding="compact"
+    )
+    index = build_trace_index(config)
+    write_trace_index_cache(index, req_root, encoding=config.cache_encoding)
+
+    loaded = read_trace_index_cache_for_config(config)
+
+    assert not cache_path(req_root).exists()
+    assert loaded.index == index
+    assert loaded.stale is False
+    assert index.config_hash == build_trace_index(
+        TraceIndexConfig.from_conventions(req_root, project_root=tmp_path)
+    ).config_hash
+
+
 @pytest.mark.unit
 def test_read_cache_for_config_reports_fresh_cache(tmp_path: Path) -> None:
     req_root = tmp_path / "Req"
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 import pytest
@@ -11,7 +12,9 @@ from app.core.trace_index.config import (
     collect_input_files,
     config_hash,
     input_fingerprint,
+    input_manifest,
     is_index_stale,
+    manifest_fingerprint,
 )
 from app.core.trace_index.model import TraceIndex
 
@@ -139,3 +142,61 @@ def test_is_index_stale_detects_schema_config_and_input_changes(tmp_path: Path)
 
     source.write_text("/* @covers LLR2 */\n", encoding="utf-8")
     assert is_index_stale(index, config) is True
+
+
+@pytest.mark.unit
+def test_input_manifest_rehashes_only_files_with_changed_stat(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    (tmp_path / "Req").mkdir()
+    (tmp_path / "Vsrc").mkdir()
+    first = tmp_path / "Vsrc" / "a.c"
+    second = tmp_path / "Vsrc" / "b.c"
+    first.write_text("/* @covers LLR1 */\n", encoding="utf-8")
+    second.write_text("/* @covers LLR2 */\n", encoding="utf-8")
+    config = TraceIndexConfig.from_conventions(tmp_path / "Req", project_root=tmp_path)
+    previous = input_manifest(config)
+    second.write_text("/* @covers LLR22 */\n", encoding="utf-8")
+    reads: list[str] = []
+    original = Path.read_bytes
+
+    def tracking(path: Path) -> bytes:
+        reads.append(path.name)
+        return original(path)
+
+    monkeypatch.setattr(Path, "read_bytes", tracking)
+
+    manifest = input_manifest(config, previous)
+
+    assert reads == ["b.c"]
+    assert [entry.path for entry in manifest] == ["Vsrc/a.c", "Vsrc/b.c"]
+    assert manifest_fingerprint(manifest) == input_fingerprint(config)
+
+
+@pytest.mark.unit
+def test_quick_stale_check_uses_stat_only(tmp_path: Path) -> None:
+    (tmp_path / "Req").mkdir()
+    (tmp_path / "Vsrc").mkdir()
+    source = tmp_path / "Vsrc" / "demo.c"
+    source.write_text("/* @covers LLR1 */\n", encoding="utf-8")
+    config = TraceIndexConfig.from_conventions(tmp_path / "Req", project_root=tmp_path)
+    manifest = input_manifest(config)
+    metadata = cache_metadata(config, manifest=manifest)
+    index = TraceIndex(
+        project_root=str(metadata["project_root"]),
+        req_root=str(metadata["req_root"]),
+        config_hash=str(metadata["config_hash"]),
+        input_fingerprint=str(metadata["input_fingerprint"]),
+        input_manifest=manifest,
+        generated_at_utc="2026-06-25T00:00:00Z",
+    )
+
+    assert is_index_stale(index, config, quick=True) is False
+
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert is_index_stale(index, config) is False
+    assert is_index_stale(index, config, quick=True) is True
+
+    (tmp_path / "Vsrc" / "new.c").write_text("", encoding="utf-8")
+    assert is_index_stale(index, config) is True
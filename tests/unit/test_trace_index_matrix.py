@@ -53,6 +53,13 @@ def test_build_artifact_trace_matrix_from_fixture() -> None:
     }
     assert any(cell.status == "passed" for cell in llr10_cells)
     assert all(cell.rid == "LLR10" for cell in llr10_cells)
+    assert llr10_cells == tuple(cell for cell in matrix.cells if cell.rid == "LLR10")
+
+    first = llr10_cells[0]
+    assert matrix.cell("LLR10", first.column_id) == first
+    assert matrix.cell("LLR10", "code:missing") is None
+    assert first in matrix.cells_for_column(first.column_id)
+    assert matrix.column(first.column_id).kind == first.marker
 
     payload = matrix.to_dict()
 
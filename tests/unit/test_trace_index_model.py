@@ -6,6 +6,7 @@ from app.core.trace_index.model import (
     GENERATOR,
     SCHEMA_VERSION,
     CodeLocation,
+    InputFileStat,
     TestCaseRef,
     TestResultRef,
     TestRunRef,
@@ -158,3 +159,84 @@ def test_trace_index_top_level_schema_fields_and_entity_sorting() -> None:
         "UNKNOWN_RID",
         "MODULE_NOT_FOUND",
     ]
+
+
+@pytest.mark.unit
+def test_trace_index_manifest_is_cache_only_and_ignored_by_equality() -> None:
+    common = {
+        "project_root": ".",
+        "req_root": "Req",
+        "config_hash": "cfg",
+        "input_fingerprint": "fp",
+        "generated_at_utc": "2026-06-25T00:00:00Z",
+    }
+    here = TraceIndex(
+        **common, input_manifest=(InputFileStat("src\\a.c", 10, 111, "abc"),)
+    )
+    there = TraceIndex(
+        **common, input_manifest=(InputFileStat("src/a.c", 10, 222, "abc"),)
+    )
+
+    assert here == there
+    assert "input_manifest" not in here.to_dict()
+    assert here.to_dict() == there.to_dict()
+    cached = here.to_dict(include_manifest=True)
+    assert cached["input_manifest"] == [
+        {"path": "src/a.c", "size": 10, "mtime_ns": 111, "sha256": "abc"}
+    ]
+    assert TraceIndex.from_dict(cached).input_manifest == here.input_manifest
+
+
+@pytest.mark.unit
+def test_trace_index_query_methods_group_evidence() -> None:
+    location = CodeLocation(
+        rid="LLR1",
+        path="src\\demo.c",
+        line_start=3,
+        line_end=3,
+        marker_text="@covers LLR1",
+        marker_ordinal=1,
+    )
+    test_case = TestCaseRef(
+        test_id="TEST-1",
+        path="tests/test_demo.c",
+        line_start=1,
+        line_end=1,
+        covers=("LLR1", "LLR2", "LLR1"),
+    )
+    results = tuple(
+        TestResultRef(
+            run_id=run_id,
+            test_id="TEST-1",
+            result_file="results.txt",
+            block_ordinal=1,
+            raw_status="PASSED",
+            normalized_status="passed",
+            covers=("LLR2",),
+        )
+        for run_id in ("RUN-1", "RUN-2")
+    )
+    index = TraceIndex(
+        project_root=".",
+        req_root="Req",
+        config_hash="cfg",
+        input_fingerprint="fp",
+        generated_at_utc="2026-06-25T00:00:00Z",
+        requirements=(TraceRequirementRef(rid="LLR1"), TraceRequirementRef(rid="LLR2")),
+        code_locations=(location,),
+        test_cases=(test_case,),
+        test_results=results,
+    )
+
+    assert index.requirement("LLR2") == TraceRequirementRef(rid="LLR2")
+    assert index.requirement("LLR9") is None
+    assert index.code_locations_for("LLR1") == (location,)
+    assert index.code_locations_in("src\\demo.c") == (location,)
+    assert index.code_locations_for("LLR2") == ()
+    assert index.test_cases_covering("LLR1") == (test_case,)
+    assert index.test_cases_covering("LLR2") == (test_case,)
+    assert index.test_results_for("TEST-1") == results
+    assert index.test_results_covering("LLR2") == results
+    assert index.test_results_covering("LLR1") == ()
+
+    assert TraceIndex.from_dict(index.to_dict()) == index
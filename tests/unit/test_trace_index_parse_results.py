@@ -3,7 +3,9 @@ from pathlib import Path
 
 import pytest
 
+from app.core.trace_index.model import TestResultRef, TestRunRef
 from app.core.trace_index.parse_results import (
+    iter_junit_results,
     normalize_status,
     parse_junit_result_text,
     parse_result_file,
@@ -217,3 +219,76 @@ def test_parse_junit_result_text_reports_invalid_covers() -> None:
     assert len(result.issues) == 1
     assert result.issues[0].code == "INVALID_MARKER"
     assert result.issues[0].test_id == "test_bad"
+
+
+@pytest.mark.unit
+def test_iter_junit_results_streams_runs_before_their_results(tmp_path: Path) -> None:
+    path = tmp_path / "junit.xml"
+    path.write_text(
+        """<testsuites>
+  <testsuite name="first">
+    <properties><property name="run_id" value="RUN-1" /></properties>
+    <testcase classname="demo" name="test_one" />
+  </testsuite>
+  <testsuite name="second">
+    <properties><property name="run_id" value="RUN-2" /></properties>
+    <testcase classname="demo" name="test_two"><skipped /></testcase>
+  </testsuite>
+</testsuites>
+""",
+        encoding="utf-8",
+    )
+
+    with path.open("rb") as stream:
+        items = list(iter_junit_results(stream, result_file="junit.xml"))
+
+    assert [type(item) for item in items] == [
+        TestRunRef,
+        TestResultRef,
+        TestRunRef,
+        TestResultRef,
+    ]
+    assert [item.run_id for item in items] == ["RUN-1", "RUN-1", "RUN-2", "RUN-2"]
+    assert items[3].normalized_status == "skipped"
+    assert parse_result_file(path, project_root=tmp_path).test_results == tuple(
+        items[1::2]
+    )
+
+
+@pytest.mark.unit
+def test_parse_junit_result_text_reads_suite_properties_after_test_cases() -> None:
+    result = parse_junit_result_text(
+        """<testsuites>
+  <testsuite name="suite">
+    <testcase name="test_one" />
+    <properties><property name="run_id" value="R9" /></properties>
+  </testsuite>
+</testsuites>
+""",
+        result_file="junit.xml",
+    )
+
+    assert [run.run_id for run in result.test_runs] == ["R9"]
+    assert result.test_results[0].run_id == "R9"
+
+
+@pytest.mark.unit
+def test_parse_junit_result_text_numbers_nested_suites_after_their_parent() -> None:
+    result = parse_junit_result_text(
+        """<testsuites>
+  <testsuite name="outer">
+    <testcase name="A" />
+    <testsuite name="inner">
+      <testcase name="B" />
+    </testsuite>
+    <testcase name="C" />
+  </testsuite>
+</testsuites>
+""",
+        result_file="junit.xml",
+    )
+
+    ordinals = {item.test_id: item.block_ordinal for item in result.test_results}
+    assert ordinals == {"A": 1, "C": 2, "B": 3}
+    assert [run.run_id for run in result.test_runs] == ["outer", "inner"]
+    assert [item.run_id for item in result.test_results] == ["outer", "outer", "inner"]
@@ -0,0 +1,109 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from app.core.trace_index import walk as walk_module
+from app.core.trace_index.config import TraceIndexConfig
+from app.core.trace_index.walk import walk_input_files
+
+pytestmark = pytest.mark.unit
+
+
+def _touch(root: Path, *relatives: str) -> None:
+    for relative in relatives:
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("", encoding="utf-8")
+
+
+def _glob(root: Path, patterns: tuple[str, ...]) -> tuple[str, ...]:
+    return tuple(
+        sorted(
+            {
+                path.relative_to(root).as_posix()
+                for pattern in patterns
+                for path in root.glob(pattern)
+                if path.is_file()
+            }
+        )
+    )
+
+
+def test_walker_matches_path_glob_for_each_class(tmp_path: Path) -> None:
+    _touch(
+        tmp_path,
+        "Vsrc/a.c",
+        "Vsrc/nested/deep/b.c",
+        "Vsrc/readme.txt",
+        "Vinclude/a.h",
+        "tests/test_x/src/test_x.c",
+        "tests/test_x/src/sub/helper.c",
+        "tests/test_x/Build/test_results.txt",
+        "tests/test_x/Build/report.xml",
+        "tests/other/src/skip.c",
+        "Req/SYS/document.json",
+        "Req/SYS/items/1.json",
+        "Req/.cookareq/trace_index.generated.json",
+    )
+    config = TraceIndexConfig.from_conventions(tmp_path / "Req", project_root=tmp_path)
+
+    files = walk_input_files(config)
+
+    assert files.sources == _glob(tmp_path, config.source_globs)
+    assert files.tests == _glob(tmp_path, config.test_globs)
+    assert files.results == _glob(tmp_path, config.result_globs)
+    assert files.requirements == ("Req/SYS/document.json", "Req/SYS/items/1.json")
+    assert "Vsrc/readme.txt" not in files.all()
+
+
+def test_walker_prunes_excluded_and_unmatched_directories(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _touch(
+        tmp_path,
+        "Vsrc/a.c",
+        "Vsrc/generated/b.c",
+        "Build/coverage/c.c",
+        "docs/guide/page.c",
+        "Req/SYS/items/1.json",
+    )
+    config = TraceIndexConfig.from_conventions(
+        tmp_path / "Req",
+        project_root=tmp_path,
+        source_globs=("Vsrc/**/*.c", "Build/**/*.c"),
+        exclude_globs=("Vsrc/generated/*", "Build/coverage/**"),
+    )
+    scanned: list[str] = []
+    original = os.scandir
+
+    def tracking(path: os.PathLike[str]) -> object:
+        scanned.append(Path(path).relative_to(tmp_path).as_posix())
+        return original(path)
+
+    monkeypatch.setattr(walk_module.os, "scandir", tracking)
+
+    files = walk_input_files(config)
+
+    assert files.sources == ("Vsrc/a.c",)
+    assert "Vsrc/generated" not in scanned
+    assert "Build/coverage" not in scanned
+    assert "docs" not in scanned
+
+
+def test_walker_follows_directory_symlinks_without_looping(tmp_path: Path) -> None:
+    _touch(tmp_path, "real/src/a.c", "real/src/nested/b.c", "Req/SYS/items/1.json")
+    try:
+        (tmp_path / "Vsrc").symlink_to(tmp_path / "real" / "src", target_is_directory=True)
+        (tmp_path / "real" / "src" / "nested" / "loop").symlink_to(
+            tmp_path / "real" / "src", target_is_directory=True
+        )
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks are not supported on this platform")
+    config = TraceIndexConfig.from_conventions(
+        tmp_path / "Req", project_root=tmp_path, source_globs=("Vsrc/**/*.c",)
+    )
+
+    files = walk_input_files(config)
+
+    assert files.sources == ("Vsrc/a.c", "Vsrc/nested/b.c")
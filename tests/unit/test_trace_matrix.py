@@ -1,3 +1,5 @@
+import dataclasses
+
 import pytest
 from pathlib import Path
 
@@ -111,6 +113,31 @@ def test_build_trace_matrix_parent_to_child(tmp_path):
     assert matrix.summary.orphan_columns == ("HLR2",)
 
 
+@pytest.mark.unit
+def test_trace_matrix_exposes_sparse_adjacency(tmp_path):
+    _write_documents(tmp_path)
+    config = TraceMatrixConfig(
+        rows=TraceMatrixAxisConfig(documents=("HLR", "SW")),
+        columns=TraceMatrixAxisConfig(documents=("SYS", "HLR")),
+    )
+    matrix = build_trace_matrix(tmp_path, config)
+
+    assert matrix.row_links == {"HLR1": ("SYS1",), "SW1": ("HLR1",)}
+    assert matrix.column_links == {"SYS1": ("HLR1",), "HLR1": ("SW1",)}
+    assert matrix.linked_columns("HLR2") == ()
+    assert matrix.summary.orphan_rows == ("HLR2",)
+    assert matrix.summary.orphan_columns == ("HLR2",)
+
+    reordered = dataclasses.replace(
+        matrix,
+        rows=tuple(reversed(matrix.rows)),
+        row_links=None,
+        column_links=None,
+    )
+    assert reordered.row_links == matrix.row_links
+    assert reordered.linked_rows("HLR1") == ("SW1",)
+
+
 @pytest.mark.unit
 def test_axis_filters_apply(tmp_path):
     _write_documents(tmp_path)
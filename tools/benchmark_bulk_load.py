@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Benchmark serial versus parallel bulk loading of requirement files."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from app.core.document_store import LoadOptions, load_requirements
+from app.core.document_store.documents import save_document
+from app.core.document_store.links import iter_links
+from app.core.document_store.types import Document
+
+
+@dataclass(slots=True)
+class BenchmarkResult:
+    """Timings of one loader configuration."""
+
+    label: str
+    load_durations_ms: list[float]
+    links_durations_ms: list[float]
+
+
+def _build_dataset(root: Path, *, items: int, docs: int, statement_size: int) -> None:
+    """Write ``items`` requirement files spread across ``docs`` documents."""
+    prefixes = [f"D{index}" for index in range(docs)]
+    parent: str | None = None
+    for prefix in prefixes:
+        save_document(root / prefix, Document(prefix=prefix, title=prefix, parent=parent))
+        parent = prefix
+    statement = "Lorem ipsum dolor sit amet. " * max(1, statement_size // 28)
+    per_doc = max(1, items // docs)
+    for position, prefix in enumerate(prefixes):
+        items_dir = root / prefix / "items"
+        items_dir.mkdir(parents=True, exist_ok=True)
+        for item_id in range(1, per_doc + 1):
+            payload: dict[str, object] = {
+                "id": item_id,
+                "title": f"{prefix} requirement {item_id}",
+                "statement": statement,
+                "type": "requirement",
+                "status": "draft",
+                "owner": f"owner-{item_id % 7}",
+                "priority": "medium",
+                "source": "benchmark",
+                "verification": "analysis",
+                "labels": [],
+                "revision": 1,
+            }
+            if position:
+                payload["links"] = [
+                    {"rid": f"{prefixes[position - 1]}{item_id}", "revision": 1}
+                ]
+            (items_dir / f"{item_id}.json").write_text(
+                json.dumps(payload, ensure_ascii=False), encoding="utf-8"
+            )
+
+
+def _run(root: Path, label: str, options: LoadOptions, iterations: int) -> BenchmarkResult:
+    loads: list[float] = []
+    links: list[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        load_requirements(root, load_options=options)
+        loads.append((time.perf_counter() - start) * 1000)
+        start = time.perf_counter()
+        for _pair in iter_links(root, load_options=options):
+            pass
+        links.append((time.perf_counter() - start) * 1000)
+    return BenchmarkResult(label, loads, links)
+
+
+def _fmt(values: list[float]) -> str:
+    return f"median={statistics.median(values):.0f} ms, min={min(values):.0f} ms"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=50_000)
+    parser.add_argument("--docs", type=int, default=5)
+    parser.add_argument("--statement-size", type=int, default=600)
+    parser.add_argument("--iterations", type=int, default=3)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=[4, 8],
+        help="Worker counts compared against the serial loader.",
+    )
+    parser.add_argument(
+        "--root",
+        type=Path,
+        help="Reuse or create the dataset here instead of a temporary directory.",
+    )
+    args = parser.parse_args()
+
+    configs: list[tuple[str, LoadOptions]] = [("serial", LoadOptions())]
+    for workers in args.workers:
+        configs.append((f"thread x{workers}", LoadOptions(workers=workers)))
+        configs.append(
+            (
+                f"process x{workers}",
+                LoadOptions(workers=workers, executor="process"),
+            )
+        )
+
+    with tempfile.TemporaryDirectory(prefix="cookareq-load-bench-") as tmp:
+        root = args.root or Path(tmp)
+        if not any(root.glob("*/document.json")):
+            start = time.perf_counter()
+            _build_dataset(
+                root,
+                items=args.items,
+                docs=args.docs,
+                statement_size=args.statement_size,
+            )
+            print(f"Generated dataset in {time.perf_counter() - start:.1f} s")
+        print(f"Dataset: {root} (items={args.items}, docs={args.docs})")
+        baseline: float | None = None
+        for label, options in configs:
+            result = _run(root, label, options, args.iterations)
+            median = statistics.median(result.load_durations_ms)
+            baseline = baseline or median
+            print(
+                f"  {label:<12} load_requirements: {_fmt(result.load_durations_ms)}"
+                f" (x{baseline / median:.2f}); iter_links: "
+                f"{_fmt(result.links_durations_ms)}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
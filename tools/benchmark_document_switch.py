@@ -110,6 +110,7 @@ def _run_benchmark(
     iterations: int,
     sort_column: str,
     resort_each_switch: bool,
+    virtual: bool,
 ) -> BenchmarkResult:
     model = RequirementModel()
     service = RequirementsService(root)
@@ -118,7 +119,7 @@ def _run_benchmark(
 
     app = wx.App(False)
     frame = wx.Frame(None)
-    panel = ListPanel(frame, model=model)
+    panel = ListPanel(frame, model=model, virtual=virtual)
     panel.set_columns(
         ["id", "statement", "status", "owner", "rationale", "notes", "links", "derived_count"]
     )
@@ -166,7 +167,9 @@ def _run_benchmark(
     )
 
 
-def _profile_operation(root: Path, *, sort_column: str) -> tuple[str, str]:
+def _profile_operation(
+    root: Path, *, sort_column: str, virtual: bool
+) -> tuple[str, str]:
     model = RequirementModel()
     service = RequirementsService(root)
     controller = DocumentsController(service, model)
@@ -174,7 +177,7 @@ def _profile_operation(root: Path, *, sort_column: str) -> tuple[str, str]:
 
     app = wx.App(False)
     frame = wx.Frame(None)
-    panel = ListPanel(frame, model=model)
+    panel = ListPanel(frame, model=model, virtual=virtual)
     panel.set_columns(
         ["id", "statement", "status", "owner", "rationale", "notes", "links", "derived_count"]
     )
@@ -236,6 +239,11 @@ def main() -> int:
             "By default benchmark measures normal flow with one repaint per switch."
         ),
     )
+    parser.add_argument(
+        "--virtual",
+        action="store_true",
+        help="Use the owner-data (wx.LC_VIRTUAL) list control.",
+    )
     args = parser.parse_args()
 
     with tempfile.TemporaryDirectory(prefix="cookareq-switch-bench-") as tmp:
@@ -246,6 +254,7 @@ def main() -> int:
             iterations=args.iterations,
             sort_column=args.sort_column,
             resort_each_switch=args.resort_each_switch,
+            virtual=args.virtual,
         )
 
         print("Dataset:")
@@ -284,7 +293,9 @@ def main() -> int:
                 )
             )
 
-        render_profile, sort_profile = _profile_operation(root, sort_column=args.sort_column)
+        render_profile, sort_profile = _profile_operation(
+            root, sort_column=args.sort_column, virtual=args.virtual
+        )
         print("\nTop profile: switch with active sort (single repaint)")
         print(render_profile)
         print("Top profile: explicit sort call after switch (extra repaint)")